@@ -8,6 +8,13 @@ Ce package contient l'API backend principale qui gère:
 - Les middlewares d'authentification et CORS
 """
 
-from .app import create_backend_api
+__all__ = ['create_backend_api']
 
-__all__ = ['create_backend_api']
\ No newline at end of file
+
+def __getattr__(name):
+    # Import différé de l'application : routes et middlewares restent
+    # importables sans créer les services (pywin32, plugins)
+    if name == 'create_backend_api':
+        from .app import create_backend_api
+        return create_backend_api
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
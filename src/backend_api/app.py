@@ -12,14 +12,19 @@ from flask import Flask
 from datetime import datetime
 
 from ..core.config import Config, get_config
+from ..core.logging_config import add_log_handlers
+from ..core.metrics_registry import register_metrics_endpoint
+from ..core.tracing import configure_tracing, register_tracing
 from ..core.exceptions import AxiomTradeException, format_exception_response, get_http_status_for_exception
 from ..services.token_service import TokenService
 from ..services.windows_service import WindowsServiceManager
 from ..services.api_proxy_service import ApiProxyService
 from ..services.web_apps_manager import WebAppManager
-from ...customization_plugins import get_plugin_manager, initialize_plugins, activate_plugins
+from ..trading.hosting import get_bot_host
+from customization_plugins import get_plugin_manager, initialize_plugins, activate_plugins
 
 from .routes import register_all_routes
+from .routes.health_routes import create_health_registry
 from .middleware import register_middleware
 
 
@@ -54,11 +59,24 @@ def create_backend_api(config: Config = None) -> Flask:
     # Stocker les services dans l'app context
     app.services = services
     
+    # Sondes de santé exécutées en arrière-plan : /api/health et /api/status
+    # servent le dernier instantané sans interroger les services
+    app.health = create_health_registry(services, config.HEALTH_PROBE_INTERVAL, config.HEALTH_PROBE_TIMEOUT)
+    app.health.start()
+    
     # Initialiser le système de plugins
     _initialize_plugin_system(app, config)
     
+    # Exposer /metrics et mesurer toutes les requêtes, y compris celles
+    # refusées par les middlewares
+    register_metrics_endpoint(app, 'backend_api')
+    
+    # Un span par requête, rattaché à la trace de l'application appelante
+    configure_tracing('backend_api', config)
+    register_tracing(app, 'backend_api')
+    
     # Enregistrer les middlewares
-    register_middleware(app)
+    register_middleware(app, config)
     
     # Enregistrer les routes
     register_all_routes(app, services)
@@ -99,8 +117,8 @@ def _setup_logging(app: Flask, config: Config) -> None:
             formatter = logging.Formatter(logging_config['LOG_FORMAT'])
             file_handler.setFormatter(formatter)
             
-            # Ajouter le handler
-            app.logger.addHandler(file_handler)
+            # Ajouter le handler (écrit par le thread de logging asynchrone)
+            add_log_handlers(app.logger, [file_handler], config)
             app.logger.setLevel(getattr(logging, logging_config['LOG_LEVEL']))
             
             app.logger.info('Backend API logging configured')
@@ -166,6 +184,12 @@ def _create_services(config: Config, logger: logging.Logger) -> dict:
     try:
         # Service de gestion des tokens
         services['token_service'] = TokenService(config, logger)
+        # Le refresh lance un navigateur : un seul processus doit l'activer,
+        # les autres récupèrent les nouveaux tokens via la surveillance du cache
+        if config.TOKEN_AUTO_REFRESH:
+            services['token_service'].start_auto_refresh()
+        if config.TOKEN_WATCH_ENABLED:
+            services['token_service'].start_watching()
         logger.info("TokenService initialized")
         
         # Service de gestion Windows
@@ -184,6 +208,12 @@ def _create_services(config: Config, logger: logging.Logger) -> dict:
         services['web_apps_manager'] = WebAppManager(config, logger)
         logger.info("WebAppManager initialized")
         
+        # Hôte des bots de trading (global : conservé d'un rechargement à l'autre)
+        if config.BOT_HOST_ENABLED:
+            services['bot_host'] = get_bot_host()
+            services['bot_host'].start()
+            logger.info("BotHost started")
+        
     except Exception as e:
         logger.error(f"Failed to initialize services: {e}")
         raise
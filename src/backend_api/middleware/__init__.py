@@ -11,16 +11,18 @@ Ce package contient tous les middlewares pour l'API backend:
 from .auth_middleware import AuthMiddleware, require_auth, optional_auth
 from .cors_middleware import CorsMiddleware, setup_cors, create_cors_preflight_response, handle_cors_error
 from .logging_middleware import LoggingMiddleware, log_performance
+from .route_policy import RoutePolicy, OriginMatcher
 
-def register_middleware(app):
+def register_middleware(app, config=None):
     """
     Enregistre tous les middlewares sur l'application Flask
     
     Args:
         app: Instance Flask
+        config: Configuration optionnelle (utilise la config globale par défaut)
     """
     # Middleware de logging des requêtes (en premier pour capturer toutes les requêtes)
-    LoggingMiddleware(app)
+    LoggingMiddleware(app, config)
     
     # Middleware d'authentification (après logging pour avoir les logs d'auth)
     AuthMiddleware(app)
@@ -41,5 +43,6 @@ __all__ = [
     'register_middleware', 
     'AuthMiddleware', 'require_auth', 'optional_auth',
     'CorsMiddleware', 'setup_cors', 'create_cors_preflight_response', 'handle_cors_error',
-    'LoggingMiddleware', 'log_performance'
+    'LoggingMiddleware', 'log_performance',
+    'RoutePolicy', 'OriginMatcher'
 ]
\ No newline at end of file
@@ -13,6 +13,7 @@ from datetime import datetime
 
 from ...core.exceptions import TokenError, TokenValidationError, TokenExpiredError
 from ...data_models.token_model import TokenModel
+from .route_policy import RoutePolicy, ROUTE_EXEMPT, ROUTE_PROTECTED
 
 
 class AuthMiddleware:
@@ -31,6 +32,7 @@ class AuthMiddleware:
         '/api/health',
         '/api/status',
         '/service/status',  # Status du service peut être consulté sans auth
+        '/metrics',  # Exposition des métriques pour le monitoring
     ]
     
     # Routes qui nécessitent une authentification stricte
@@ -41,6 +43,7 @@ class AuthMiddleware:
         '/service/uninstall',
         '/service/start',
         '/service/stop',
+        '/api/proxy',  # Appels Axiom avec le token stocké, écritures de trading comprises
     ]
     
     def __init__(self, app=None):
@@ -52,6 +55,9 @@ class AuthMiddleware:
         """
         self.logger = logging.getLogger(__name__)
         
+        # Préfixes compilés une fois : classement en temps constant par requête
+        self.route_policy = RoutePolicy(self.EXEMPT_ROUTES, self.PROTECTED_ROUTES)
+        
         if app is not None:
             self.init_app(app)
     
@@ -69,12 +75,14 @@ class AuthMiddleware:
         """
         Fonction appelée avant chaque requête pour vérifier l'authentification
         """
+        route_class = self.route_policy.classify(request.path)
+        
         # Ignorer les routes exemptées
-        if self._is_exempt_route(request.path):
+        if route_class == ROUTE_EXEMPT:
             return None
         
         # Pour les routes protégées, vérifier l'authentification
-        if self._is_protected_route(request.path):
+        if route_class == ROUTE_PROTECTED:
             auth_result = self._validate_authentication()
             if not auth_result['success']:
                 return self._create_auth_error_response(auth_result)
@@ -95,7 +103,7 @@ class AuthMiddleware:
         Returns:
             True si la route est exemptée
         """
-        return any(path.startswith(exempt) for exempt in self.EXEMPT_ROUTES)
+        return self.route_policy.classify(path) == ROUTE_EXEMPT
     
     def _is_protected_route(self, path: str) -> bool:
         """
@@ -107,7 +115,7 @@ class AuthMiddleware:
         Returns:
             True si la route est protégée
         """
-        return any(path.startswith(protected) for protected in self.PROTECTED_ROUTES)
+        return self.route_policy.classify(path) == ROUTE_PROTECTED
     
     def _validate_authentication(self) -> Dict[str, Any]:
         """
@@ -6,10 +6,26 @@ Configure les headers CORS pour permettre l'accès depuis l'extension browser et
 """
 
 import logging
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from flask import Flask, request, make_response, current_app
 from flask_cors import CORS
 
+from .route_policy import OriginMatcher
+
+
+# Durée de cache des preflights (Chromium la plafonne à 2 heures, Firefox à 24)
+PREFLIGHT_MAX_AGE = 86400
+
+# Schémas d'origine des extensions browser
+EXTENSION_SCHEMES = (
+    'chrome-extension://',
+    'moz-extension://',
+    'brave://',
+    'edge-extension://',
+    'safari-extension://'
+)
+
 
 class CorsMiddleware:
     """
@@ -75,6 +91,7 @@ class CorsMiddleware:
             app: Instance Flask optionnelle
         """
         self.logger = logging.getLogger(__name__)
+        self.origin_matcher: Optional[OriginMatcher] = None
         
         if app is not None:
             self.init_app(app)
@@ -111,9 +128,16 @@ class CorsMiddleware:
         environment = config.get('ENVIRONMENT', 'development')
         debug = config.get('DEBUG', False)
         
+        # Origines compilées une fois ; Flask-CORS reçoit les origines exactes
+        # et une seule regex pour toutes les origines à joker
+        self.origin_matcher = OriginMatcher(self._get_allowed_origins(environment, debug))
+        origins: List[Any] = list(self.origin_matcher.exact_origins)
+        if self.origin_matcher.wildcard_pattern is not None:
+            origins.append(self.origin_matcher.wildcard_pattern)
+        
         # Configuration de base
         cors_config = {
-            'origins': self._get_allowed_origins(environment, debug),
+            'origins': origins,
             'methods': self.DEFAULT_METHODS,
             'allow_headers': self.DEFAULT_HEADERS,
             'expose_headers': [
@@ -124,13 +148,12 @@ class CorsMiddleware:
                 'Content-Range'
             ],
             'supports_credentials': True,
-            'max_age': 86400,  # 24 heures pour les preflight requests
+            'max_age': PREFLIGHT_MAX_AGE,  # Un preflight par origine et par jour au plus
         }
         
         # Ajustements par environnement
         if environment == 'production':
             # Plus restrictif en production
-            cors_config['max_age'] = 3600  # 1 heure
             cors_config['supports_credentials'] = True
             
         elif environment == 'development':
@@ -202,7 +225,6 @@ class CorsMiddleware:
                     response.headers['X-API-Name'] = 'Axiom Trade Backend API'
                     
                     # Timestamp de la réponse
-                    from datetime import datetime
                     response.headers['X-Response-Time'] = datetime.utcnow().isoformat() + 'Z'
             
             # Gestion spéciale pour les extensions browser
@@ -235,25 +257,14 @@ class CorsMiddleware:
             True si l'origine est autorisée
         """
         try:
-            allowed_origins = self._get_allowed_origins(
-                current_app.config.get('ENVIRONMENT', 'development'),
-                current_app.config.get('DEBUG', False)
-            )
+            if self.origin_matcher is None:
+                self.origin_matcher = OriginMatcher(self._get_allowed_origins(
+                    current_app.config.get('ENVIRONMENT', 'development'),
+                    current_app.config.get('DEBUG', False)
+                ))
             
-            # Vérification exacte
-            if origin in allowed_origins:
-                return True
-            
-            # Vérification avec wildcards
-            for allowed in allowed_origins:
-                if '*' in allowed:
-                    # Convertir le pattern en regex simple
-                    pattern = allowed.replace('*', '.*')
-                    import re
-                    if re.match(f'^{pattern}$', origin):
-                        return True
-            
-            return False
+            # Regex compilée au démarrage, décision mémorisée par origine
+            return self.origin_matcher.is_allowed(origin)
             
         except Exception as e:
             self.logger.error(f"Error checking origin {origin}: {e}")
@@ -269,15 +280,7 @@ class CorsMiddleware:
         Returns:
             True si c'est une extension browser
         """
-        extension_schemes = [
-            'chrome-extension://',
-            'moz-extension://',
-            'brave://',
-            'edge-extension://',
-            'safari-extension://'
-        ]
-        
-        return any(origin.startswith(scheme) for scheme in extension_schemes)
+        return origin.startswith(EXTENSION_SCHEMES)
 
 
 def setup_cors(app: Flask) -> CorsMiddleware:
@@ -306,7 +309,7 @@ def create_cors_preflight_response() -> tuple:
     response.headers.add("Access-Control-Allow-Origin", "*")
     response.headers.add('Access-Control-Allow-Headers', "*")
     response.headers.add('Access-Control-Allow-Methods', "*")
-    response.headers.add('Access-Control-Max-Age', "86400")
+    response.headers.add('Access-Control-Max-Age', str(PREFLIGHT_MAX_AGE))
     return response, 200
 
 
@@ -320,8 +323,6 @@ def handle_cors_error(error) -> tuple:
     Returns:
         Tuple (response, status_code)
     """
-    from datetime import datetime
-    
     response_data = {
         "success": False,
         "error": {
@@ -5,7 +5,9 @@ Middleware pour le logging des requêtes et réponses HTTP.
 Fournit un logging détaillé avec métriques de performance et contexte de sécurité.
 """
 
+import itertools
 import logging
+import re
 import time
 import json
 import uuid
@@ -14,6 +16,60 @@ from datetime import datetime
 from flask import Flask, request, g, current_app
 from contextlib import contextmanager
 
+from ...core.config import Config, get_config
+from ...core.tracing import current_trace_id
+
+
+# Routes de polling : 1 requête réussie loggée sur N (préfixe de route -> N)
+DEFAULT_SAMPLING_RATES: Dict[str, int] = {
+    '/api/health': 100,
+    '/api/ping': 100,
+    '/api/status': 10,
+    '/api/tokens/status': 10,
+    '/service/status': 10,
+    '/metrics': 100,
+}
+
+_SENSITIVE_KEY_PATTERN = re.compile(
+    'password|token|secret|key|auth|credential'
+)
+
+
+class RouteLogPolicy:
+    """
+    Politique de logging d'une route
+    
+    Une requête réussie sur `sample_every` est loggée (toutes si 1, aucune
+    si 0) ; les erreurs et les requêtes lentes le sont toujours.
+    """
+    
+    __slots__ = ('route', 'sample_every', '_counter')
+    
+    def __init__(self, route: Optional[str], sample_every: int):
+        """
+        Initialise la politique
+        
+        Args:
+            route: Règle de la route (None pour les requêtes sans route)
+            sample_every: Fréquence d'échantillonnage des requêtes réussies
+        """
+        self.route = route
+        self.sample_every = sample_every
+        self._counter = itertools.count()
+    
+    def should_sample(self) -> bool:
+        """
+        Indique si la requête courante doit être loggée en détail
+        
+        Returns:
+            True pour une requête sur `sample_every`
+        """
+        if self.sample_every == 1:
+            return True
+        if self.sample_every <= 0:
+            return False
+        return next(self._counter) % self.sample_every == 0
+
 
 class LoggingMiddleware:
     """
@@ -25,19 +81,38 @@ class LoggingMiddleware:
     - Contexte de sécurité (IP, User-Agent, etc.)
     - Corrélation des requêtes avec des IDs uniques
     - Logging structuré en JSON
+    - Échantillonnage par route des requêtes réussies (erreurs et requêtes
+      lentes toujours loggées)
     """
     
-    def __init__(self, app: Optional[Flask] = None):
+    def __init__(self, app: Optional[Flask] = None, config: Optional[Config] = None):
         """
         Initialise le middleware de logging
         
         Args:
             app: Instance Flask optionnelle
+            config: Configuration (utilise la config globale par défaut)
         """
         self.logger = logging.getLogger('axiom_trade.requests')
         self.performance_logger = logging.getLogger('axiom_trade.performance')
         self.security_logger = logging.getLogger('axiom_trade.security')
         
+        config = config or get_config()
+        sampling_rates = config.LOG_REQUEST_SAMPLING
+        if sampling_rates is None:
+            sampling_rates = DEFAULT_SAMPLING_RATES
+        # Préfixes les plus longs d'abord
+        self._sampling_rules = sorted(
+            ((prefix, int(rate)) for prefix, rate in sampling_rates.items()),
+            key=lambda rule: len(rule[0]),
+            reverse=True
+        )
+        self.default_sample_every = config.LOG_REQUEST_SAMPLE_DEFAULT
+        self.slow_request_ms = config.LOG_SLOW_REQUEST_MS
+        
+        # Politique par règle de route, calculée à la première requête
+        self._policies: Dict[Optional[str], RouteLogPolicy] = {}
+        
         if app is not None:
             self.init_app(app)
     
@@ -54,23 +129,55 @@ class LoggingMiddleware:
         
         self.logger.info("LoggingMiddleware initialized")
     
+    def _get_route_policy(self) -> RouteLogPolicy:
+        """
+        Retourne la politique de logging de la route courante
+        
+        Returns:
+            Politique associée à la règle de la route
+        """
+        rule = request.url_rule.rule if request.url_rule is not None else None
+        policy = self._policies.get(rule)
+        if policy is None:
+            sample_every = self.default_sample_every
+            if rule is not None:
+                for prefix, rate in self._sampling_rules:
+                    if rule.startswith(prefix):
+                        sample_every = rate
+                        break
+            policy = RouteLogPolicy(rule, sample_every)
+            self._policies[rule] = policy
+        return policy
+    
     def _before_request(self):
         """
         Fonction appelée avant chaque requête
         """
-        # Générer un ID unique pour la requête
+        # Générer un ID unique pour la requête ; l'ID de trace, commun à
+        # toutes les applications traversées, est loggé à part
         g.request_id = str(uuid.uuid4())
+        g.trace_id = current_trace_id()
         g.request_start_time = time.time()
         g.request_timestamp = datetime.utcnow()
         
-        # Extraire les informations de la requête
-        request_info = self._extract_request_info()
+        # Les requêtes non échantillonnées ne sont détaillées qu'en cas
+        # d'erreur ou de lenteur
+        g.request_sampled = (
+            self._get_route_policy().should_sample()
+            and self.logger.isEnabledFor(logging.INFO)
+        )
         
-        # Stocker les informations dans g pour utilisation ultérieure
-        g.request_info = request_info
-        
-        # Logger la requête entrante
-        self._log_incoming_request(request_info)
+        if g.request_sampled:
+            # Extraire les informations de la requête
+            request_info = self._extract_request_info()
+            
+            # Stocker les informations dans g pour utilisation ultérieure
+            g.request_info = request_info
+            
+            # Logger la requête entrante
+            self._log_incoming_request(request_info)
+        else:
+            request_info = self._extract_basic_request_info()
         
         # Vérifications de sécurité
         self._check_security_concerns(request_info)
@@ -89,12 +196,21 @@ class LoggingMiddleware:
             # Calculer le temps de réponse
             response_time = time.time() - g.request_start_time
             
-            # Extraire les informations de la réponse
-            response_info = self._extract_response_info(response, response_time)
-            
             # Ajouter l'ID de requête dans les headers de réponse
             response.headers['X-Request-ID'] = g.request_id
             
+            sampled = g.get('request_sampled', True)
+            if not (sampled
+                    or response.status_code >= 400
+                    or response_time * 1000 >= self.slow_request_ms):
+                return response
+            
+            if not sampled:
+                g.request_info = self._extract_request_info()
+            
+            # Extraire les informations de la réponse
+            response_info = self._extract_response_info(response, response_time)
+            
             # Logger la réponse
             self._log_outgoing_response(g.request_info, response_info)
             
@@ -128,6 +244,7 @@ class LoggingMiddleware:
             # Informations de base
             info = {
                 'request_id': g.request_id,
+                'trace_id': g.trace_id,
                 'timestamp': g.request_timestamp.isoformat() + 'Z',
                 'method': request.method,
                 'path': request.path,
@@ -178,6 +295,23 @@ class LoggingMiddleware:
                 'error': f'Failed to extract request info: {str(e)}'
             }
     
+    def _extract_basic_request_info(self) -> Dict[str, Any]:
+        """
+        Extrait les informations utiles aux vérifications de sécurité
+        
+        Returns:
+            Dictionnaire réduit, sans lecture du body
+        """
+        return {
+            'request_id': g.request_id,
+            'trace_id': g.trace_id,
+            'method': request.method,
+            'path': request.path,
+            'remote_addr': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent', ''),
+            'security': {'origin': request.headers.get('Origin', '')}
+        }
+    
     def _extract_response_info(self, response, response_time: float) -> Dict[str, Any]:
         """
         Extrait les informations de la réponse
@@ -213,9 +347,10 @@ class LoggingMiddleware:
             if response_headers:
                 info['headers'] = response_headers
             
-            # Preview du contenu de la réponse (pour les erreurs ou petites réponses)
-            if (response.status_code >= 400 or 
-                (response.content_length and response.content_length < 1000)):
+            # Preview du contenu de la réponse (pour les erreurs ou petites
+            # réponses ; jamais pour un flux, qui serait consommé)
+            if not response.is_streamed and (response.status_code >= 400 or
+                    (response.content_length and response.content_length < 1000)):
                 try:
                     if response.is_json:
                         response_data = response.get_json()
@@ -247,14 +382,9 @@ class LoggingMiddleware:
             return {'type': type(body).__name__, 'preview': str(body)[:100]}
         
         sanitized = {}
-        sensitive_keys = [
-            'password', 'token', 'secret', 'key', 'auth', 'credential',
-            'access_token', 'refresh_token', 'api_key', 'private_key'
-        ]
         
         for key, value in body.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in sensitive_keys):
+            if _SENSITIVE_KEY_PATTERN.search(key.lower()):
                 sanitized[key] = '[REDACTED]'
             elif isinstance(value, (dict, list)):
                 sanitized[key] = f'[{type(value).__name__}]'
@@ -318,6 +448,7 @@ class LoggingMiddleware:
         log_data = {
             'event': 'request_start',
             'request_id': request_info['request_id'],
+            'trace_id': request_info.get('trace_id'),
             'method': request_info['method'],
             'path': request_info['path'],
             'remote_addr': request_info['remote_addr'],
@@ -338,6 +469,7 @@ class LoggingMiddleware:
         log_data = {
             'event': 'request_complete',
             'request_id': request_info['request_id'],
+            'trace_id': request_info.get('trace_id'),
             'method': request_info['method'],
             'path': request_info['path'],
             'status_code': response_info['status_code'],
@@ -368,6 +500,7 @@ class LoggingMiddleware:
         metrics_data = {
             'event': 'performance_metric',
             'request_id': request_info['request_id'],
+            'trace_id': request_info.get('trace_id'),
             'endpoint': request_info.get('endpoint', 'unknown'),
             'method': request_info['method'],
             'response_time_ms': response_info['response_time_ms'],
@@ -377,7 +510,7 @@ class LoggingMiddleware:
         }
         
         # Log de performance séparé
-        if response_info['response_time_ms'] > 1000:  # Plus de 1 seconde
+        if response_info['response_time_ms'] >= self.slow_request_ms:
             self.performance_logger.warning("Slow request detected", extra={'structured': metrics_data})
         else:
             self.performance_logger.info("Performance metric", extra={'structured': metrics_data})
@@ -415,6 +548,7 @@ class LoggingMiddleware:
             security_data = {
                 'event': 'security_concern',
                 'request_id': request_info['request_id'],
+                'trace_id': request_info.get('trace_id'),
                 'issues': security_issues,
                 'request_info': {
                     'method': request_info['method'],
@@ -459,6 +593,7 @@ class LoggingMiddleware:
         exception_data = {
             'event': 'request_exception',
             'request_id': getattr(g, 'request_id', 'unknown'),
+            'trace_id': getattr(g, 'trace_id', None),
             'exception_type': type(exception).__name__,
             'exception_message': str(exception),
             'request_info': getattr(g, 'request_info', {}),
@@ -0,0 +1,160 @@
+"""
+Route Policy
+
+Politiques compilées au démarrage pour les middlewares : classement des
+routes par préfixe (trie) et décisions CORS par origine (regex unique et
+mémo LRU). Le coût par requête ne dépend plus du nombre de règles.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence
+
+
+# Classes de routes de l'AuthMiddleware, par priorité décroissante
+ROUTE_EXEMPT = 'exempt'
+ROUTE_PROTECTED = 'protected'
+ROUTE_DEFAULT = 'default'
+
+# Un joker d'origine ne déborde pas sur le chemin, la requête ou l'userinfo
+_ORIGIN_WILDCARD = r'[^/?#@\s]*'
+
+
+class PrefixTrie:
+    """
+    Trie par caractère associant une valeur à des préfixes de chemin
+
+    La recherche parcourt le chemin au plus sur la profondeur du trie et
+    retourne la valeur de plus haute priorité parmi les préfixes rencontrés.
+    """
+
+    __slots__ = ('_root', '_priorities')
+
+    def __init__(self, priorities: Sequence[str]):
+        """
+        Initialise le trie
+
+        Args:
+            priorities: Valeurs possibles, de la plus prioritaire à la moins prioritaire
+        """
+        self._root: Dict[str, dict] = {}
+        self._priorities = {value: rank for rank, value in enumerate(priorities)}
+
+    def insert(self, prefix: str, value: str) -> None:
+        """Associe une valeur à un préfixe"""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        current = node.get(None)
+        if current is None or self._priorities[value] < self._priorities[current]:
+            node[None] = value
+
+    def match(self, path: str) -> Optional[str]:
+        """
+        Retourne la valeur la plus prioritaire des préfixes de `path`
+
+        Args:
+            path: Chemin à classer
+
+        Returns:
+            Valeur associée, ou None si aucun préfixe ne correspond
+        """
+        node = self._root
+        best = node.get(None)
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            value = node.get(None)
+            if value is not None and (best is None or self._priorities[value] < self._priorities[best]):
+                best = value
+        return best
+
+
+class RoutePolicy:
+    """
+    Classement des routes pour l'authentification
+
+    Les routes exemptées l'emportent sur les routes protégées, comme avec
+    les anciennes listes de préfixes vérifiées dans cet ordre.
+    """
+
+    def __init__(self, exempt_routes: Iterable[str], protected_routes: Iterable[str]):
+        """
+        Compile les préfixes de routes
+
+        Args:
+            exempt_routes: Préfixes sans authentification
+            protected_routes: Préfixes exigeant une authentification stricte
+        """
+        self._trie = PrefixTrie((ROUTE_EXEMPT, ROUTE_PROTECTED))
+        for prefix in exempt_routes:
+            self._trie.insert(prefix, ROUTE_EXEMPT)
+        for prefix in protected_routes:
+            self._trie.insert(prefix, ROUTE_PROTECTED)
+
+    def classify(self, path: str) -> str:
+        """
+        Retourne la classe d'une route
+
+        Args:
+            path: Chemin de la requête
+
+        Returns:
+            ROUTE_EXEMPT, ROUTE_PROTECTED ou ROUTE_DEFAULT
+        """
+        return self._trie.match(path) or ROUTE_DEFAULT
+
+
+class OriginMatcher:
+    """
+    Vérification des origines CORS autorisées
+
+    Les origines exactes et à joker (`*`) sont compilées en une seule
+    expression régulière ancrée et insensible à la casse ; les décisions
+    sont mémorisées par origine dans un cache LRU borné.
+    """
+
+    def __init__(self, origins: Iterable[str], cache_size: int = 1024):
+        """
+        Compile les origines autorisées
+
+        Args:
+            origins: Origines exactes ou avec `*`
+            cache_size: Nombre d'origines dont la décision est mémorisée
+        """
+        self.origins: List[str] = list(dict.fromkeys(origins))
+        self.exact_origins: List[str] = [origin for origin in self.origins if '*' not in origin]
+        self.wildcard_origins: List[str] = [origin for origin in self.origins if '*' in origin]
+        self.pattern: Pattern = self._compile(self.origins)
+        self.wildcard_pattern: Optional[Pattern] = (
+            self._compile(self.wildcard_origins) if self.wildcard_origins else None
+        )
+        self._is_allowed = lru_cache(maxsize=cache_size)(self._match)
+
+    @staticmethod
+    def _compile(origins: Sequence[str]) -> Pattern:
+        alternatives = [
+            _ORIGIN_WILDCARD.join(re.escape(part) for part in origin.split('*'))
+            for origin in origins
+        ]
+        return re.compile('^(?:' + '|'.join(alternatives or ['(?!)']) + ')$', re.IGNORECASE)
+
+    def _match(self, origin: str) -> bool:
+        return self.pattern.match(origin) is not None
+
+    def is_allowed(self, origin: str) -> bool:
+        """
+        Indique si une origine est autorisée
+
+        Args:
+            origin: Valeur de l'en-tête Origin
+
+        Returns:
+            True si l'origine correspond à une origine autorisée
+        """
+        return self._is_allowed(origin)
+
+    def cache_info(self):
+        """Statistiques du cache des décisions"""
+        return self._is_allowed.cache_info()
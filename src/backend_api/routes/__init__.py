@@ -12,6 +12,8 @@ from .health_routes import register_health_routes
 from .service_routes import register_service_routes
 from .token_routes import register_token_routes
 from .web_apps_routes import register_web_apps_routes
+from .proxy_routes import register_proxy_routes
+from .bot_routes import register_bot_routes
 
 
 def register_all_routes(app: Flask, services: Dict[str, Any]) -> None:
@@ -39,6 +41,12 @@ def register_all_routes(app: Flask, services: Dict[str, Any]) -> None:
         # Register web apps routes (web applications management)
         register_web_apps_routes(app, services)
         
+        # Register proxy routes (batched upstream API calls)
+        register_proxy_routes(app, services)
+        
+        # Register bot routes (hosted trading bots)
+        register_bot_routes(app, services)
+        
         app.logger.info("All backend API routes registered successfully")
         
     except Exception as e:
@@ -0,0 +1,102 @@
+"""
+Bot Routes - Backend API
+
+Routes de consultation des bots de trading hébergés par le BotHost
+"""
+
+from typing import Dict, Any
+from flask import Flask, jsonify, request
+from datetime import datetime
+
+
+def register_bot_routes(app: Flask, services: Dict[str, Any]) -> None:
+    """
+    Enregistre les routes de consultation des bots
+
+    Args:
+        app: Instance Flask
+        services: Dictionnaire des services initialisés
+    """
+    bot_host = services.get('bot_host')
+
+    if not bot_host:
+        app.logger.warning("BotHost not available, skipping bot routes")
+        return
+
+    def bot_not_found(bot_id: str):
+        return jsonify({
+            "success": False,
+            "error": {
+                "code": "BOT_NOT_FOUND",
+                "message": f"Bot not found: {bot_id}",
+                "details": {}
+            },
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }), 404
+
+    @app.route('/api/bots/<bot_id>/status', methods=['GET'])
+    def get_bot_status(bot_id: str):
+        """
+        Récupère le statut d'un bot, latences par phase comprises
+
+        Returns:
+            JSON avec le statut du bot (cf. BotStatus.to_dict)
+        """
+        if bot_id not in bot_host.get_bot_ids():
+            return bot_not_found(bot_id)
+
+        try:
+            return jsonify({
+                "success": True,
+                "data": bot_host.get_status(bot_id),
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            })
+
+        except Exception as e:
+            app.logger.error(f"Failed to get status for bot {bot_id}: {e}")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "code": "BOT_STATUS_ERROR",
+                    "message": "Failed to retrieve bot status",
+                    "details": {"error": str(e)}
+                },
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }), 500
+
+    @app.route('/api/bots/<bot_id>/trades', methods=['GET'])
+    def get_bot_trades(bot_id: str):
+        """
+        Récupère une page de l'historique des trades d'un bot
+
+        Query params:
+            page: Numéro de page (à partir de 1)
+            per_page: Nombre de trades par page (500 au plus)
+
+        Returns:
+            JSON avec la page de trades, les plus récents en premier
+        """
+        if bot_id not in bot_host.get_bot_ids():
+            return bot_not_found(bot_id)
+
+        try:
+            page = max(request.args.get('page', 1, type=int), 1)
+            per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+
+            return jsonify({
+                "success": True,
+                "data": bot_host.get_trade_history_page(bot_id, page, per_page),
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            })
+
+        except Exception as e:
+            app.logger.error(f"Failed to get trades for bot {bot_id}: {e}")
+            return jsonify({
+                "success": False,
+                "error": {
+                    "code": "BOT_TRADES_ERROR",
+                    "message": "Failed to retrieve bot trades",
+                    "details": {"error": str(e)}
+                },
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }), 500
@@ -13,28 +13,45 @@ from flask import Blueprint, jsonify, current_app
 from typing import Dict, Any
 
 from ...core.exceptions import AxiomTradeException
+from ...core.health import HealthRegistry, HealthStatus
 
 
 # Create blueprint for health routes
 health_bp = Blueprint('health', __name__, url_prefix='/api')
 
+# Disponibilité exposée par /api/status pour chaque état de sonde
+_AVAILABILITY = {
+    HealthStatus.HEALTHY.value: "available",
+    HealthStatus.DEGRADED.value: "available",
+    HealthStatus.UNHEALTHY.value: "error",
+    HealthStatus.UNKNOWN.value: "pending",
+}
+
 
 @health_bp.route('/health', methods=['GET'])
 def health_check() -> Dict[str, Any]:
     """
     Basic health check endpoint
     
+    Sert le dernier instantané des sondes, sans interroger les dépendances.
+    
     Returns:
-        JSON response with health status
+        JSON response with health status (503 si une sonde critique échoue)
     """
     try:
+        report = _health_report()
+        healthy = report['status'] != HealthStatus.UNHEALTHY.value
         return jsonify({
-            "success": True,
-            "status": "healthy",
+            "success": healthy,
+            "status": report['status'],
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "service": "axiom-trade-backend-api",
-            "version": "2.0.0"
-        })
+            "version": "2.0.0",
+            "checks": {
+                name: {"status": check['status'], "age_seconds": check['age_seconds']}
+                for name, check in report['checks'].items()
+            }
+        }), 200 if healthy else 503
     except Exception as e:
         current_app.logger.error(f"Health check failed: {e}")
         return jsonify({
@@ -50,65 +67,38 @@ def detailed_status() -> Dict[str, Any]:
     """
     Detailed status endpoint with service information
     
+    L'état des services provient des sondes exécutées en arrière-plan,
+    avec l'âge de chaque résultat.
+    
     Returns:
         JSON response with detailed system status
     """
     try:
-        services = current_app.services
+        report = _health_report()
         
-        # Check service availability
         service_status = {}
-        
-        # Token service status
-        try:
-            token_service = services.get('token_service')
-            if token_service:
-                tokens = token_service.get_current_tokens()
-                service_status['token_service'] = {
-                    "status": "available",
-                    "has_tokens": tokens is not None,
-                    "tokens_valid": tokens.is_valid() if tokens else False
-                }
-            else:
-                service_status['token_service'] = {"status": "unavailable"}
-        except Exception as e:
-            service_status['token_service'] = {
-                "status": "error",
-                "error": str(e)
-            }
-        
-        # Windows service status
-        try:
-            windows_service = services.get('windows_service')
-            if windows_service:
-                status = windows_service.get_service_status()
-                service_status['windows_service'] = {
-                    "status": "available",
-                    "service_status": status.to_dict() if status else None
-                }
-            else:
-                service_status['windows_service'] = {"status": "unavailable"}
-        except Exception as e:
-            service_status['windows_service'] = {
-                "status": "error", 
-                "error": str(e)
+        for name in ('token_service', 'windows_service'):
+            check = report['checks'].get(name)
+            if check is None:
+                service_status[name] = {"status": "unavailable"}
+                continue
+            service_status[name] = {
+                "status": _AVAILABILITY[check['status']],
+                **check['details'],
+                "age_seconds": check['age_seconds']
             }
+            if check['error']:
+                service_status[name]['error'] = check['error']
         
         # API proxy status
-        try:
-            api_proxy = services.get('api_proxy')
-            service_status['api_proxy'] = {
-                "status": "available" if api_proxy else "unavailable"
-            }
-        except Exception as e:
-            service_status['api_proxy'] = {
-                "status": "error",
-                "error": str(e)
-            }
+        service_status['api_proxy'] = {
+            "status": "available" if current_app.services.get('api_proxy') else "unavailable"
+        }
         
         return jsonify({
             "success": True,
             "status": "operational",
+            "health": report['status'],
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "application": {
                 "name": "Axiom Trade Backend API",
@@ -147,6 +137,14 @@ def ping() -> Dict[str, Any]:
     })
 
 
+def _health_report() -> Dict[str, Any]:
+    """Dernier instantané des sondes de l'application"""
+    health = getattr(current_app, 'health', None)
+    if health is None:
+        return {'status': HealthStatus.HEALTHY.value, 'checks': {}}
+    return health.report()
+
+
 def _get_uptime() -> str:
     """
     Calculate application uptime
@@ -170,6 +168,44 @@ def _get_uptime() -> str:
         return "unknown"
 
 
+def create_health_registry(services: Dict[str, Any], interval: float = 15.0,
+                           timeout: float = 5.0) -> HealthRegistry:
+    """
+    Crée le registre des sondes de santé des services
+    
+    Args:
+        services: Dictionary of initialized services
+        interval: Secondes entre deux vérifications
+        timeout: Secondes avant de considérer une vérification en échec
+        
+    Returns:
+        Registre non démarré
+    """
+    health = HealthRegistry(default_interval=interval, default_timeout=timeout)
+    
+    token_service = services.get('token_service')
+    if token_service:
+        def check_tokens() -> Dict[str, Any]:
+            snapshot = token_service.get_snapshot()
+            valid = snapshot.is_valid()
+            return {
+                "status": HealthStatus.HEALTHY if valid else HealthStatus.DEGRADED,
+                "has_tokens": snapshot.model is not None,
+                "tokens_valid": valid
+            }
+        health.register('token_service', check_tokens)
+    
+    windows_service = services.get('windows_service')
+    if windows_service:
+        def check_windows_service() -> Dict[str, Any]:
+            # Interroge le gestionnaire de services et les statistiques du processus
+            status = windows_service.get_service_status()
+            return {"service_status": status.to_dict() if status else None}
+        health.register('windows_service', check_windows_service)
+    
+    return health
+
+
 def register_health_routes(app, services: Dict[str, Any]) -> None:
     """
     Register health routes with the Flask application
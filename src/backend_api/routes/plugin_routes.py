@@ -183,7 +183,7 @@ def enhance_page() -> Dict[str, Any]:
             }), 404
         
         # Check if plugin is a page enhancer
-        from ...customization_plugins.base.plugin_base import PageEnhancerPlugin
+        from customization_plugins.base.plugin_base import PageEnhancerPlugin
         if not isinstance(plugin, PageEnhancerPlugin):
             return jsonify({
                 "success": False,
@@ -388,7 +388,7 @@ def get_ui_elements() -> Dict[str, Any]:
             }), 404
         
         # Check if plugin is a UI tool
-        from ...customization_plugins.base.plugin_base import UIToolPlugin
+        from customization_plugins.base.plugin_base import UIToolPlugin
         if not isinstance(plugin, UIToolPlugin):
             return jsonify({
                 "success": False,
@@ -489,7 +489,7 @@ def enrich_data() -> Dict[str, Any]:
             }), 404
         
         # Check if plugin is a data enrichment plugin
-        from ...customization_plugins.base.plugin_base import DataEnrichmentPlugin
+        from customization_plugins.base.plugin_base import DataEnrichmentPlugin
         if not isinstance(plugin, DataEnrichmentPlugin):
             return jsonify({
                 "success": False,
@@ -0,0 +1,126 @@
+"""
+Proxy Routes - Backend API
+
+Routes de proxy vers l'API Axiom Trade, dont l'exécution groupée de requêtes
+et la transmission en flux des réponses volumineuses
+"""
+
+from typing import Dict, Any
+from flask import Flask, Response, jsonify, request, stream_with_context
+from datetime import datetime
+
+from ...core.exceptions import AxiomTradeException, get_http_status_for_exception
+
+
+def register_proxy_routes(app: Flask, services: Dict[str, Any]) -> None:
+    """
+    Enregistre les routes de proxy
+
+    Args:
+        app: Instance Flask
+        services: Dictionnaire des services initialisés
+    """
+    api_proxy = services.get('api_proxy')
+
+    if not api_proxy:
+        app.logger.warning("ApiProxyService not available, skipping proxy routes")
+        return
+
+    @app.route('/api/proxy/batch', methods=['POST'])
+    def proxy_batch():
+        """
+        Exécute un lot de requêtes proxy en parallèle
+
+        Corps attendu: {"requests": [{"id", "method", "endpoint", "params", "data", "timeout", "retry_count"}]}
+
+        Chaque élément a son propre statut : le lot réussit partiellement si
+        certains éléments échouent (HTTP 207), entièrement sinon (HTTP 200).
+
+        Returns:
+            JSON avec les résultats dans l'ordre des requêtes
+        """
+        payload = request.get_json(silent=True)
+        items = payload.get('requests') if isinstance(payload, dict) else None
+        max_items = api_proxy.config.API_BATCH_MAX_ITEMS
+
+        if not isinstance(items, list) or not items:
+            return _batch_error(
+                "INVALID_BATCH",
+                "Request body must contain a non-empty 'requests' array"
+            ), 400
+
+        if len(items) > max_items:
+            return _batch_error(
+                "BATCH_TOO_LARGE",
+                f"A batch may contain at most {max_items} requests",
+                {"max_items": max_items, "received": len(items)}
+            ), 413
+
+        try:
+            results = api_proxy.proxy_batch(items)
+        except Exception as e:
+            app.logger.error(f"Failed to execute proxy batch: {e}")
+            return _batch_error("BATCH_ERROR", "Failed to execute proxy batch", {"error": str(e)}), 500
+
+        succeeded = sum(1 for result in results if result['status'] == 'ok')
+        failed = len(results) - succeeded
+
+        return jsonify({
+            "success": failed == 0,
+            "data": {
+                "results": results,
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": failed
+            },
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }), 200 if failed == 0 else 207
+
+    @app.route('/api/proxy/stream/<path:endpoint>', methods=['GET'])
+    def proxy_stream(endpoint: str):
+        """
+        Relaie en flux une réponse de l'API Axiom Trade
+
+        Le corps amont est transmis par blocs sans être bufferisé ni parsé,
+        avec son statut ; s'il est compressé dans un encodage accepté par le
+        client (Accept-Encoding), il est relayé compressé.
+
+        Returns:
+            Réponse en flux, ou JSON d'erreur si l'API est injoignable
+        """
+        try:
+            streamed = api_proxy.proxy_stream(
+                '/' + endpoint,
+                params=request.args.to_dict(),
+                accept_encoding=request.headers.get('Accept-Encoding')
+            )
+        except AxiomTradeException as e:
+            return jsonify({
+                "success": False,
+                "error": {"code": e.code, "message": e.message, "details": e.details},
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }), get_http_status_for_exception(e)
+
+        response = Response(
+            stream_with_context(streamed.chunks),
+            status=streamed.status_code,
+            headers=streamed.headers,
+            direct_passthrough=True
+        )
+        response.call_on_close(streamed.close)
+        return response
+
+    app.logger.info("Proxy routes registered")
+
+
+def _batch_error(code: str, message: str, details: Dict[str, Any] = None):
+    """Construit une réponse d'erreur pour un lot invalide"""
+    return jsonify({
+        "success": False,
+        "error": {
+            "code": code,
+            "message": message,
+            "details": details or {}
+        },
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    })
@@ -2,6 +2,7 @@
 Configuration centralisée basée sur l'environnement
 """
 import os
+import json
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,10 +18,21 @@ class Config:
     FLASK_DEBUG: bool = False
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     
+    # Production Server Configuration (python -m src.core.wsgi_server)
+    SERVER_WORKERS: int = 0  # Processus workers (0: un par cœur, 1: sans fork)
+    SERVER_THREADS: int = 8  # Threads de traitement par worker
+    SERVER_BACKLOG: int = 2048  # Connexions en attente d'acceptation
+    SERVER_TIMEOUT: int = 30  # Secondes sans données avant fermeture d'une connexion lente
+    SERVER_MAX_REQUESTS: int = 0  # Requêtes avant recyclage d'un worker (0: jamais)
+    SERVER_MAX_REQUESTS_JITTER: int = 0  # Écart aléatoire pour ne pas recycler tous les workers ensemble
+    SERVER_GRACEFUL_TIMEOUT: int = 30  # Délai laissé aux requêtes en cours à l'arrêt d'un worker
+    
     # Service Configuration
     SERVICE_NAME: str = "AxiomTradeService"
     SERVICE_DISPLAY_NAME: str = "Axiom Trade Service"
     SERVICE_DESCRIPTION: str = "Service de gestion des tokens Axiom Trade"
+    HEALTH_PROBE_INTERVAL: int = 15  # Secondes entre deux vérifications d'une dépendance
+    HEALTH_PROBE_TIMEOUT: int = 5  # Au-delà, la vérification est considérée en échec
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -31,14 +43,58 @@ class Config:
     LOG_ENABLE_METRICS: bool = True
     LOG_ENABLE_JSON: bool = False
     LOG_ROTATION_CLEANUP_DAYS: int = 30
+    LOG_ASYNC: bool = True  # Écriture des logs par un thread dédié
+    LOG_QUEUE_SIZE: int = 10000  # Au-delà, les logs sont abandonnés et comptés
+    LOG_BATCH_SIZE: int = 256  # Logs écrits entre deux flush
+    LOG_REQUEST_SAMPLING: Optional[Dict[str, int]] = None  # Préfixe de route -> 1 requête réussie loggée sur N (JSON)
+    LOG_REQUEST_SAMPLE_DEFAULT: int = 1  # Routes sans règle : toutes les requêtes sont loggées
+    LOG_SLOW_REQUEST_MS: int = 1000  # Requêtes toujours loggées au-delà de cette durée
+    
+    # Tracing Configuration
+    TRACING_ENABLED: bool = True
+    TRACE_SAMPLE_RATE: float = 0.01  # Proportion des traces démarrées ici qui sont enregistrées
+    TRACE_EXPORT_FILE: str = "logs/traces.jsonl"  # Spans au format JSON Zipkin v2, une ligne par span
+    TRACE_COLLECTOR_URL: str = ""  # Collecteur Zipkin (ex. http://localhost:9411/api/v2/spans), prioritaire sur le fichier
+    TRACE_QUEUE_SIZE: int = 2048  # Au-delà, les spans sont abandonnés et comptés
     
     # Token Configuration
     TOKEN_CACHE_FILE: str = "data/tokens.json"
     TOKEN_REFRESH_INTERVAL: int = 3600  # 1 hour in seconds
+    TOKEN_AUTO_REFRESH: bool = False  # Rafraîchissement en arrière-plan ; à activer dans un seul processus
+    TOKEN_REFRESH_AHEAD_SECONDS: int = 300
+    TOKEN_REFRESH_RETRY_SECONDS: int = 60  # Premier délai après un échec (doublé ensuite)
+    TOKEN_WATCH_ENABLED: bool = True  # Recharge les tokens écrits par un autre processus
+    TOKEN_WATCH_INTERVAL: float = 0.05  # Intervalle entre deux stat du cache, en secondes
+    
+    # Bot Hosting Configuration
+    BOT_HOST_ENABLED: bool = False  # Héberge les bots de trading dans le processus de l'API backend
     
     # API Configuration
     AXIOM_API_BASE_URL: str = "https://api.axiomtrade.com"
     API_TIMEOUT: int = 30
+    API_RATE_LIMIT_REQUESTS: int = 100
+    API_RATE_LIMIT_WINDOW: int = 60
+    API_RATE_LIMIT_SHARED_DIR: str = ""  # Vide: budget propre à chaque processus
+    API_RATE_LIMITS: Optional[Dict[str, Any]] = None  # Budgets par classe d'endpoint (JSON)
+    API_CACHE_ENABLED: bool = True
+    API_CACHE_MAX_BYTES: int = 16777216  # 16MB
+    API_CACHE_MAX_ENTRIES: int = 1024
+    API_CACHE_NEGATIVE_TTL: int = 30  # Durée de cache des réponses 404
+    API_CACHE_POLICIES: Optional[Dict[str, Any]] = None  # Politiques par classe d'endpoint (JSON)
+    API_COALESCE_ENABLED: bool = True  # Regroupe les GET identiques simultanés
+    API_ASYNC_MAX_CONNECTIONS: int = 200  # Pool du proxy asynchrone
+    API_ASYNC_MAX_CONNECTIONS_PER_HOST: int = 50  # Requêtes simultanées par hôte
+    API_ASYNC_KEEPALIVE_TIMEOUT: int = 30
+    API_ASYNC_HTTP2: bool = True  # Utilisé si httpx et h2 sont installés
+    API_BATCH_MAX_ITEMS: int = 50  # Requêtes par appel à /api/proxy/batch
+    API_BATCH_MAX_CONCURRENCY: int = 8
+    API_CIRCUIT_FAILURE_THRESHOLD: float = 0.5  # Proportion d'échecs qui ouvre le disjoncteur
+    API_CIRCUIT_MINIMUM_CALLS: int = 10
+    API_CIRCUIT_OPEN_SECONDS: int = 30
+    API_RETRY_BUDGET_RATIO: float = 0.2  # Retries autorisés par requête
+    API_ADAPTIVE_TIMEOUT: bool = True  # Timeout déduit du p99 des latences (borné par API_TIMEOUT)
+    API_ADAPTIVE_TIMEOUT_MIN: int = 2
+    API_STREAM_CHUNK_SIZE: int = 65536  # Taille des blocs relayés par /api/proxy/stream
     
     # Web Apps Configuration
     TRADING_DASHBOARD_PORT: int = 5001
@@ -73,10 +129,21 @@ class Config:
         config.FLASK_DEBUG = os.getenv("FLASK_DEBUG", "false").lower() == "true"
         config.SECRET_KEY = os.getenv("SECRET_KEY", config.SECRET_KEY)
         
+        # Production Server Configuration
+        config.SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", str(config.SERVER_WORKERS)))
+        config.SERVER_THREADS = int(os.getenv("SERVER_THREADS", str(config.SERVER_THREADS)))
+        config.SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", str(config.SERVER_BACKLOG)))
+        config.SERVER_TIMEOUT = int(os.getenv("SERVER_TIMEOUT", str(config.SERVER_TIMEOUT)))
+        config.SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", str(config.SERVER_MAX_REQUESTS)))
+        config.SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", str(config.SERVER_MAX_REQUESTS_JITTER)))
+        config.SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", str(config.SERVER_GRACEFUL_TIMEOUT)))
+        
         # Service Configuration
         config.SERVICE_NAME = os.getenv("SERVICE_NAME", config.SERVICE_NAME)
         config.SERVICE_DISPLAY_NAME = os.getenv("SERVICE_DISPLAY_NAME", config.SERVICE_DISPLAY_NAME)
         config.SERVICE_DESCRIPTION = os.getenv("SERVICE_DESCRIPTION", config.SERVICE_DESCRIPTION)
+        config.HEALTH_PROBE_INTERVAL = int(os.getenv("HEALTH_PROBE_INTERVAL", str(config.HEALTH_PROBE_INTERVAL)))
+        config.HEALTH_PROBE_TIMEOUT = int(os.getenv("HEALTH_PROBE_TIMEOUT", str(config.HEALTH_PROBE_TIMEOUT)))
         
         # Logging Configuration
         config.LOG_LEVEL = os.getenv("LOG_LEVEL", config.LOG_LEVEL)
@@ -87,14 +154,61 @@ class Config:
         config.LOG_ENABLE_METRICS = os.getenv("LOG_ENABLE_METRICS", "true").lower() == "true"
         config.LOG_ENABLE_JSON = os.getenv("LOG_ENABLE_JSON", "false").lower() == "true"
         config.LOG_ROTATION_CLEANUP_DAYS = int(os.getenv("LOG_ROTATION_CLEANUP_DAYS", str(config.LOG_ROTATION_CLEANUP_DAYS)))
+        config.LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+        config.LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", str(config.LOG_QUEUE_SIZE)))
+        config.LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", str(config.LOG_BATCH_SIZE)))
+        if os.getenv("LOG_REQUEST_SAMPLING"):
+            config.LOG_REQUEST_SAMPLING = json.loads(os.getenv("LOG_REQUEST_SAMPLING"))
+        config.LOG_REQUEST_SAMPLE_DEFAULT = int(os.getenv("LOG_REQUEST_SAMPLE_DEFAULT", str(config.LOG_REQUEST_SAMPLE_DEFAULT)))
+        config.LOG_SLOW_REQUEST_MS = int(os.getenv("LOG_SLOW_REQUEST_MS", str(config.LOG_SLOW_REQUEST_MS)))
+        
+        # Tracing Configuration
+        config.TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+        config.TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", str(config.TRACE_SAMPLE_RATE)))
+        config.TRACE_EXPORT_FILE = os.getenv("TRACE_EXPORT_FILE", config.TRACE_EXPORT_FILE)
+        config.TRACE_COLLECTOR_URL = os.getenv("TRACE_COLLECTOR_URL", config.TRACE_COLLECTOR_URL)
+        config.TRACE_QUEUE_SIZE = int(os.getenv("TRACE_QUEUE_SIZE", str(config.TRACE_QUEUE_SIZE)))
         
         # Token Configuration
         config.TOKEN_CACHE_FILE = os.getenv("TOKEN_CACHE_FILE", config.TOKEN_CACHE_FILE)
         config.TOKEN_REFRESH_INTERVAL = int(os.getenv("TOKEN_REFRESH_INTERVAL", str(config.TOKEN_REFRESH_INTERVAL)))
+        config.TOKEN_AUTO_REFRESH = os.getenv("TOKEN_AUTO_REFRESH", "false").lower() == "true"
+        config.TOKEN_REFRESH_AHEAD_SECONDS = int(os.getenv("TOKEN_REFRESH_AHEAD_SECONDS", str(config.TOKEN_REFRESH_AHEAD_SECONDS)))
+        config.TOKEN_REFRESH_RETRY_SECONDS = int(os.getenv("TOKEN_REFRESH_RETRY_SECONDS", str(config.TOKEN_REFRESH_RETRY_SECONDS)))
+        config.TOKEN_WATCH_ENABLED = os.getenv("TOKEN_WATCH_ENABLED", "true").lower() == "true"
+        config.TOKEN_WATCH_INTERVAL = float(os.getenv("TOKEN_WATCH_INTERVAL", str(config.TOKEN_WATCH_INTERVAL)))
+        
+        # Bot Hosting Configuration
+        config.BOT_HOST_ENABLED = os.getenv("BOT_HOST_ENABLED", "false").lower() == "true"
         
         # API Configuration
         config.AXIOM_API_BASE_URL = os.getenv("AXIOM_API_BASE_URL", config.AXIOM_API_BASE_URL)
         config.API_TIMEOUT = int(os.getenv("API_TIMEOUT", str(config.API_TIMEOUT)))
+        config.API_RATE_LIMIT_REQUESTS = int(os.getenv("API_RATE_LIMIT_REQUESTS", str(config.API_RATE_LIMIT_REQUESTS)))
+        config.API_RATE_LIMIT_WINDOW = int(os.getenv("API_RATE_LIMIT_WINDOW", str(config.API_RATE_LIMIT_WINDOW)))
+        config.API_RATE_LIMIT_SHARED_DIR = os.getenv("API_RATE_LIMIT_SHARED_DIR", config.API_RATE_LIMIT_SHARED_DIR)
+        if os.getenv("API_RATE_LIMITS"):
+            config.API_RATE_LIMITS = json.loads(os.getenv("API_RATE_LIMITS"))
+        config.API_CACHE_ENABLED = os.getenv("API_CACHE_ENABLED", "true").lower() == "true"
+        config.API_CACHE_MAX_BYTES = int(os.getenv("API_CACHE_MAX_BYTES", str(config.API_CACHE_MAX_BYTES)))
+        config.API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", str(config.API_CACHE_MAX_ENTRIES)))
+        config.API_CACHE_NEGATIVE_TTL = int(os.getenv("API_CACHE_NEGATIVE_TTL", str(config.API_CACHE_NEGATIVE_TTL)))
+        if os.getenv("API_CACHE_POLICIES"):
+            config.API_CACHE_POLICIES = json.loads(os.getenv("API_CACHE_POLICIES"))
+        config.API_COALESCE_ENABLED = os.getenv("API_COALESCE_ENABLED", "true").lower() == "true"
+        config.API_ASYNC_MAX_CONNECTIONS = int(os.getenv("API_ASYNC_MAX_CONNECTIONS", str(config.API_ASYNC_MAX_CONNECTIONS)))
+        config.API_ASYNC_MAX_CONNECTIONS_PER_HOST = int(os.getenv("API_ASYNC_MAX_CONNECTIONS_PER_HOST", str(config.API_ASYNC_MAX_CONNECTIONS_PER_HOST)))
+        config.API_ASYNC_KEEPALIVE_TIMEOUT = int(os.getenv("API_ASYNC_KEEPALIVE_TIMEOUT", str(config.API_ASYNC_KEEPALIVE_TIMEOUT)))
+        config.API_ASYNC_HTTP2 = os.getenv("API_ASYNC_HTTP2", "true").lower() == "true"
+        config.API_BATCH_MAX_ITEMS = int(os.getenv("API_BATCH_MAX_ITEMS", str(config.API_BATCH_MAX_ITEMS)))
+        config.API_BATCH_MAX_CONCURRENCY = int(os.getenv("API_BATCH_MAX_CONCURRENCY", str(config.API_BATCH_MAX_CONCURRENCY)))
+        config.API_CIRCUIT_FAILURE_THRESHOLD = float(os.getenv("API_CIRCUIT_FAILURE_THRESHOLD", str(config.API_CIRCUIT_FAILURE_THRESHOLD)))
+        config.API_CIRCUIT_MINIMUM_CALLS = int(os.getenv("API_CIRCUIT_MINIMUM_CALLS", str(config.API_CIRCUIT_MINIMUM_CALLS)))
+        config.API_CIRCUIT_OPEN_SECONDS = int(os.getenv("API_CIRCUIT_OPEN_SECONDS", str(config.API_CIRCUIT_OPEN_SECONDS)))
+        config.API_RETRY_BUDGET_RATIO = float(os.getenv("API_RETRY_BUDGET_RATIO", str(config.API_RETRY_BUDGET_RATIO)))
+        config.API_ADAPTIVE_TIMEOUT = os.getenv("API_ADAPTIVE_TIMEOUT", "true").lower() == "true"
+        config.API_ADAPTIVE_TIMEOUT_MIN = int(os.getenv("API_ADAPTIVE_TIMEOUT_MIN", str(config.API_ADAPTIVE_TIMEOUT_MIN)))
+        config.API_STREAM_CHUNK_SIZE = int(os.getenv("API_STREAM_CHUNK_SIZE", str(config.API_STREAM_CHUNK_SIZE)))
         
         # Web Apps Configuration
         config.TRADING_DASHBOARD_PORT = int(os.getenv("TRADING_DASHBOARD_PORT", str(config.TRADING_DASHBOARD_PORT)))
@@ -170,7 +284,13 @@ class Config:
             'LOG_BACKUP_COUNT': self.LOG_BACKUP_COUNT,
             'LOG_ENABLE_METRICS': self.LOG_ENABLE_METRICS,
             'LOG_ENABLE_JSON': self.LOG_ENABLE_JSON,
-            'LOG_ROTATION_CLEANUP_DAYS': self.LOG_ROTATION_CLEANUP_DAYS
+            'LOG_ROTATION_CLEANUP_DAYS': self.LOG_ROTATION_CLEANUP_DAYS,
+            'LOG_ASYNC': self.LOG_ASYNC,
+            'LOG_QUEUE_SIZE': self.LOG_QUEUE_SIZE,
+            'LOG_BATCH_SIZE': self.LOG_BATCH_SIZE,
+            'LOG_REQUEST_SAMPLING': self.LOG_REQUEST_SAMPLING,
+            'LOG_REQUEST_SAMPLE_DEFAULT': self.LOG_REQUEST_SAMPLE_DEFAULT,
+            'LOG_SLOW_REQUEST_MS': self.LOG_SLOW_REQUEST_MS
         }
     
     def get_plugin_config(self) -> Dict[str, Any]:
@@ -0,0 +1,554 @@
+"""
+Structures de métriques sans verrou sur le chemin chaud : compteurs par
+thread additionnés à la lecture et tampon circulaire préalloué
+"""
+import bisect
+import itertools
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple, Any, Optional, Callable
+
+# Bornes supérieures des buckets de latence, en secondes
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.75,
+    1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0
+)
+
+
+class ShardedCounter:
+    """
+    Compteur sans verrou sur le chemin chaud
+
+    Chaque thread incrémente sa propre cellule ; seule la lecture additionne
+    les cellules. Le verrou n'est pris qu'à la première utilisation par un
+    thread et lors des lectures/remises à zéro. Les cellules des threads
+    terminés sont reportées dans une base commune pour que la mémoire ne
+    grandisse pas avec un serveur qui crée un thread par requête.
+    """
+
+    def __init__(self):
+        """Initialise le compteur"""
+        self._local = threading.local()
+        self._cells: List[Tuple[threading.Thread, List[float]]] = []
+        self._base = 0
+        self._lock = threading.Lock()
+
+    def _cell(self) -> List[float]:
+        cell = getattr(self._local, 'cell', None)
+        if cell is None:
+            cell = [0]
+            with self._lock:
+                self._collect()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+        return cell
+
+    def _collect(self) -> None:
+        # Un thread terminé n'écrit plus dans sa cellule : elle peut être reportée
+        alive = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                alive.append((thread, cell))
+            else:
+                self._base += cell[0]
+        self._cells = alive
+
+    def add(self, amount: float = 1) -> None:
+        """
+        Ajoute une valeur au compteur
+
+        Args:
+            amount: Valeur à ajouter
+        """
+        self._cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Somme de toutes les cellules"""
+        with self._lock:
+            self._collect()
+            return self._base + sum(cell[0] for _, cell in self._cells)
+
+    def reset(self) -> None:
+        """Remet le compteur à zéro"""
+        with self._lock:
+            self._base = 0
+            for _, cell in self._cells:
+                cell[0] = 0
+
+
+class ShardedCounterMap:
+    """
+    Ensemble de compteurs par clé, sans verrou sur le chemin chaud
+
+    Même principe que ShardedCounter : chaque thread incrémente son propre
+    dictionnaire, les dictionnaires sont fusionnés à la lecture et ceux des
+    threads terminés sont reportés dans une base commune.
+    """
+
+    def __init__(self):
+        """Initialise les compteurs"""
+        self._local = threading.local()
+        self._cells: List[Tuple[threading.Thread, Dict[Any, float]]] = []
+        self._base: Dict[Any, float] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _cell(self) -> Dict[Any, float]:
+        cell = getattr(self._local, 'cell', None)
+        if cell is None:
+            cell = defaultdict(int)
+            with self._lock:
+                self._collect()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+        return cell
+
+    def _collect(self) -> None:
+        alive = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                alive.append((thread, cell))
+            else:
+                for key, value in dict(cell).items():
+                    self._base[key] += value
+        self._cells = alive
+
+    def add(self, key: Any, amount: float = 1) -> None:
+        """
+        Ajoute une valeur au compteur d'une clé
+
+        Args:
+            key: Clé du compteur
+            amount: Valeur à ajouter
+        """
+        self._cell()[key] += amount
+
+    def snapshot(self) -> Dict[Any, float]:
+        """
+        Retourne la somme des cellules pour chaque clé
+
+        Returns:
+            Dictionnaire {clé: valeur}
+        """
+        with self._lock:
+            self._collect()
+            totals = dict(self._base)
+            for _, cell in self._cells:
+                # Copie atomique : le thread propriétaire peut écrire en parallèle
+                for key, value in dict(cell).items():
+                    totals[key] = totals.get(key, 0) + value
+            return totals
+
+    def reset(self) -> None:
+        """Remet tous les compteurs à zéro"""
+        with self._lock:
+            self._base.clear()
+            for _, cell in self._cells:
+                for key in list(cell):
+                    cell[key] = 0
+
+
+def estimate_percentile(buckets: Tuple[float, ...], counts: List[int], total: int,
+                        maximum: float, percentile: float) -> float:
+    """
+    Estime un percentile à partir d'un histogramme à buckets fixes
+
+    Le percentile est interpolé linéairement dans le bucket qui le contient ;
+    le dernier bucket (au-delà de la dernière borne) est borné par le maximum.
+
+    Args:
+        buckets: Bornes supérieures croissantes des buckets
+        counts: Nombre de valeurs par bucket (len(buckets) + 1)
+        total: Nombre total de valeurs
+        maximum: Valeur maximale observée
+        percentile: Percentile entre 0 et 100
+
+    Returns:
+        Valeur estimée (0 si aucune valeur)
+    """
+    if total == 0:
+        return 0.0
+
+    rank = percentile / 100.0 * total
+    cumulative = 0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            lower = buckets[index - 1] if index > 0 else 0.0
+            upper = buckets[index] if index < len(buckets) else maximum
+            upper = min(upper, maximum)
+            fraction = (rank - cumulative) / count
+            return lower + (max(upper, lower) - lower) * fraction
+        cumulative += count
+    return maximum
+
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à buckets fixes
+
+    L'enregistrement est en O(log n) sur le nombre de buckets et la mémoire
+    est constante ; les percentiles sont interpolés linéairement dans le
+    bucket qui les contient.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialise l'histogramme
+
+        Args:
+            buckets: Bornes supérieures croissantes des buckets, en secondes
+        """
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """
+        Enregistre une latence
+
+        Args:
+            latency: Latence en secondes
+        """
+        index = bisect.bisect_left(self.buckets, latency)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += latency
+            if latency > self._max:
+                self._max = latency
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Estime un percentile des latences enregistrées
+
+        Args:
+            percentile: Percentile entre 0 et 100
+
+        Returns:
+            Latence estimée en secondes (0 si aucune mesure)
+        """
+        with self._lock:
+            return self._percentile(percentile)
+
+    def _percentile(self, percentile: float) -> float:
+        return estimate_percentile(self.buckets, self._counts, self._count, self._max, percentile)
+
+    def snapshot(self) -> Tuple[List[int], int, float]:
+        """
+        Retourne une copie cohérente des compteurs
+
+        Returns:
+            Tuple (nombre de valeurs par bucket, nombre total, somme)
+        """
+        with self._lock:
+            return list(self._counts), self._count, self._sum
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retourne le résumé de l'histogramme
+
+        Returns:
+            Dictionnaire avec le nombre, la moyenne, le max et p50/p95/p99
+        """
+        with self._lock:
+            return {
+                'count': self._count,
+                'average': self._sum / self._count if self._count else 0.0,
+                'max': self._max,
+                'p50': self._percentile(50),
+                'p95': self._percentile(95),
+                'p99': self._percentile(99)
+            }
+
+
+class RingBuffer:
+    """
+    Tampon circulaire préalloué sans verrou en écriture
+
+    Chaque écriture réserve un numéro de séquence (itertools.count est
+    atomique) et écrit dans l'emplacement correspondant ; la lecture trie
+    les emplacements occupés par séquence. Une lecture concurrente à une
+    écriture peut voir l'ancien ou le nouvel élément d'un emplacement.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialise le tampon
+
+        Args:
+            capacity: Nombre maximum d'éléments conservés
+        """
+        self.capacity = max(1, capacity)
+        self._slots: List[Optional[Tuple[int, Any]]] = [None] * self.capacity
+        self._sequence = itertools.count()
+
+    def append(self, item: Any) -> None:
+        """
+        Ajoute un élément, en remplaçant le plus ancien si le tampon est plein
+
+        Args:
+            item: Élément à ajouter
+        """
+        sequence = next(self._sequence)
+        self._slots[sequence % self.capacity] = (sequence, item)
+
+    def items(self) -> List[Any]:
+        """
+        Retourne les éléments du plus ancien au plus récent
+
+        Returns:
+            Liste des éléments conservés
+        """
+        entries = [entry for entry in list(self._slots) if entry is not None]
+        entries.sort(key=lambda entry: entry[0])
+        return [item for _, item in entries]
+
+    def clear(self) -> None:
+        """Vide le tampon"""
+        self._slots = [None] * self.capacity
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._slots if entry is not None)
+
+
+class _WindowStats:
+    """Agrégats d'une série de mesures : nombre, somme, min/max et échecs"""
+
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'failures')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = 0.0
+        self.failures = 0
+
+    def add(self, value: float, success: bool) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if not success:
+            self.failures += 1
+
+    def merge(self, other: '_WindowStats') -> None:
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.failures += other.failures
+
+    def to_dict(self) -> Dict[str, Any]:
+        count = self.count
+        return {
+            'count': count,
+            'average': self.total / count if count else 0.0,
+            'min': self.minimum if count else 0.0,
+            'max': self.maximum,
+            'success_rate': (count - self.failures) / count if count else 0.0
+        }
+
+
+class _TimeBucket:
+    """Tranche de temps d'une roue : agrégats, histogramme et détail par opération"""
+
+    __slots__ = ('slot', 'stats', 'histogram', 'operations')
+
+    def __init__(self, slot: int, histogram_size: int):
+        self.slot = slot
+        self.stats = _WindowStats()
+        self.histogram = [0] * histogram_size
+        self.operations: Dict[Any, _WindowStats] = {}
+
+    def merge(self, other: '_TimeBucket') -> None:
+        self.stats.merge(other.stats)
+        for index, count in enumerate(other.histogram):
+            self.histogram[index] += count
+        for key, stats in list(other.operations.items()):
+            target = self.operations.get(key)
+            if target is None:
+                target = self.operations[key] = _WindowStats()
+            target.merge(stats)
+
+
+class TimeWheel:
+    """
+    Roue temporelle de `size` tranches de `resolution` secondes
+
+    Une tranche est créée à la première mesure de sa période et remplacée
+    quand le temps fait le tour de la roue : la mémoire est bornée et une
+    fenêtre se résume en parcourant au plus `size` tranches.
+    """
+
+    def __init__(self, resolution: float, size: int, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialise la roue
+
+        Args:
+            resolution: Durée d'une tranche en secondes
+            size: Nombre de tranches
+            buckets: Bornes de l'histogramme de chaque tranche
+        """
+        self.resolution = resolution
+        self.size = size
+        self.buckets = buckets
+        self._slots: List[Optional[_TimeBucket]] = [None] * size
+
+    def record(self, now: float, value: float, success: bool = True, key: Any = None) -> None:
+        """
+        Enregistre une mesure dans la tranche courante
+
+        Args:
+            now: Horodatage epoch de la mesure
+            value: Valeur mesurée
+            success: Issue de l'opération
+            key: Opération (détail par opération si fournie)
+        """
+        slot = int(now // self.resolution)
+        bucket = self._slots[slot % self.size]
+        if bucket is None or bucket.slot != slot:
+            bucket = _TimeBucket(slot, len(self.buckets) + 1)
+            self._slots[slot % self.size] = bucket
+        bucket.stats.add(value, success)
+        bucket.histogram[bisect.bisect_left(self.buckets, value)] += 1
+        if key is not None:
+            stats = bucket.operations.get(key)
+            if stats is None:
+                stats = bucket.operations[key] = _WindowStats()
+            stats.add(value, success)
+
+    def window(self, now: float, seconds: float) -> List[_TimeBucket]:
+        """
+        Retourne les tranches couvrant les `seconds` dernières secondes
+
+        Args:
+            now: Horodatage epoch courant
+            seconds: Durée de la fenêtre
+
+        Returns:
+            Tranches de la fenêtre (tranche courante incluse)
+        """
+        current = int(now // self.resolution)
+        count = min(self.size, max(1, -(-int(seconds) // int(self.resolution))))
+        oldest = current - count
+        return [bucket for bucket in self._slots if bucket is not None and oldest < bucket.slot <= current]
+
+
+class _WheelStripe:
+    """Roues par seconde et par minute d'une partition, avec leur verrou"""
+
+    __slots__ = ('lock', 'seconds', 'minutes')
+
+    def __init__(self, seconds: TimeWheel, minutes: TimeWheel):
+        self.lock = threading.Lock()
+        self.seconds = seconds
+        self.minutes = minutes
+
+
+class RollingAggregates:
+    """
+    Agrégats glissants de mesures (durées) par seconde et par minute
+
+    Les mesures sont réparties sur un nombre fixe de partitions (`stripes`),
+    chacune avec ses roues (une tranche par seconde sur `second_slots`
+    secondes, une par minute sur `minute_slots` minutes) et son verrou. Un
+    thread reçoit une partition à sa première mesure, sans allocation : un
+    serveur qui crée un thread par requête ne paie ni roues neuves ni
+    fusion. Les roues sont fusionnées à la lecture ; un résumé sur
+    n'importe quelle fenêtre coûte O(tranches), sans parcourir les mesures.
+    """
+
+    def __init__(self, second_slots: int = 300, minute_slots: int = 60,
+                 buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+                 clock: Optional[Callable[[], float]] = None, stripes: int = 8):
+        """
+        Initialise les agrégats
+
+        Args:
+            second_slots: Nombre de tranches d'une seconde
+            minute_slots: Nombre de tranches d'une minute
+            buckets: Bornes de l'histogramme, en secondes
+            clock: Horloge epoch en secondes (time.time par défaut)
+            stripes: Nombre de partitions partagées entre les threads
+        """
+        self.second_slots = second_slots
+        self.minute_slots = minute_slots
+        self.buckets = buckets
+        self._clock = clock or time.time
+        self._local = threading.local()
+        self._stripes = [_WheelStripe(*self._new_wheels()) for _ in range(max(1, stripes))]
+        self._next_stripe = itertools.count()
+
+    def _new_wheels(self) -> Tuple[TimeWheel, TimeWheel]:
+        return (TimeWheel(1, self.second_slots, self.buckets),
+                TimeWheel(60, self.minute_slots, self.buckets))
+
+    def _stripe(self) -> _WheelStripe:
+        stripe = getattr(self._local, 'stripe', None)
+        if stripe is None:
+            # Attribution tournante : les threads se répartissent sur les partitions
+            stripe = self._stripes[next(self._next_stripe) % len(self._stripes)]
+            self._local.stripe = stripe
+        return stripe
+
+    def record(self, value: float, success: bool = True, key: Any = None) -> None:
+        """
+        Enregistre une mesure
+
+        Args:
+            value: Valeur mesurée (durée en secondes)
+            success: Issue de l'opération
+            key: Opération, pour le détail par opération
+        """
+        now = self._clock()
+        stripe = self._stripe()
+        with stripe.lock:
+            stripe.seconds.record(now, value, success, key)
+            stripe.minutes.record(now, value, success, key)
+
+    def summary(self, window: float) -> Dict[str, Any]:
+        """
+        Résume les mesures des `window` dernières secondes
+
+        Les fenêtres jusqu'à `second_slots` secondes utilisent les tranches
+        d'une seconde, les plus longues les tranches d'une minute (la minute
+        en cours est comptée entièrement).
+
+        Args:
+            window: Durée de la fenêtre en secondes
+
+        Returns:
+            Dictionnaire avec nombre, moyenne, min/max, taux de succès,
+            p50/p95/p99 et détail par opération
+        """
+        now = self._clock()
+        use_seconds = window <= self.second_slots
+
+        merged = _TimeBucket(0, len(self.buckets) + 1)
+        for stripe in self._stripes:
+            with stripe.lock:
+                wheel = stripe.seconds if use_seconds else stripe.minutes
+                for bucket in wheel.window(now, window):
+                    merged.merge(bucket)
+
+        result = merged.stats.to_dict()
+        for percentile in (50, 95, 99):
+            result[f'p{percentile}'] = estimate_percentile(
+                self.buckets, merged.histogram, merged.stats.count, merged.stats.maximum, percentile
+            )
+        result['operations'] = {
+            key: stats.to_dict() for key, stats in merged.operations.items()
+        }
+        return result
+
+    def reset(self) -> None:
+        """Efface toutes les mesures"""
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.seconds, stripe.minutes = self._new_wheels()
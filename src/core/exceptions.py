@@ -245,6 +245,36 @@ class ApiAuthenticationError(ApiError):
         )
 
 
+class ApiDeadlineExceededError(ApiError):
+    """
+    Échéance d'une requête API dépassée
+    """
+    
+    def __init__(self, endpoint: str):
+        super().__init__(
+            f"Deadline exceeded for endpoint {endpoint}",
+            "API_DEADLINE_EXCEEDED",
+            {"endpoint": endpoint}
+        )
+
+
+class ApiCircuitOpenError(ApiError):
+    """
+    Appel refusé par le disjoncteur d'un groupe d'endpoints
+    """
+    
+    def __init__(self, endpoint_group: str, retry_after: Optional[float] = None):
+        message = f"Circuit open for endpoint group '{endpoint_group}'"
+        if retry_after:
+            message += f", retry after {retry_after:.0f} seconds"
+        
+        super().__init__(
+            message,
+            "API_CIRCUIT_OPEN",
+            {"endpoint_group": endpoint_group, "retry_after": retry_after}
+        )
+
+
 class ApiRateLimitError(ApiError):
     """
     Erreur de limite de taux API
@@ -339,6 +369,8 @@ def get_http_status_for_exception(exception: AxiomTradeException) -> int:
         ConfigurationError: 500,
         ApiConnectionError: 502,
         ApiRateLimitError: 429,
+        ApiCircuitOpenError: 503,
+        ApiDeadlineExceededError: 504,
         FileOperationError: 500,
         ServiceInstallationError: 500,
         ServiceTimeoutError: 408,
@@ -0,0 +1,291 @@
+"""
+Registre de sondes de santé exécutées en arrière-plan
+
+Chaque sonde vérifie une dépendance (service Windows, tokens...) selon son
+propre intervalle et avec un timeout ; les endpoints de santé ne lisent que
+le dernier résultat mis en cache et ne bloquent donc jamais sur une
+dépendance lente.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Any, Optional, Callable, List
+
+from .metrics_registry import MetricFamily, get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Une vérification retourne ses détails, éventuellement avec une clé 'status'
+ProbeCheck = Callable[[], Optional[Dict[str, Any]]]
+
+
+class HealthStatus(Enum):
+    """États possibles d'une sonde ou de l'application"""
+    HEALTHY = "healthy"
+    DEGRADED = "degraded"
+    UNHEALTHY = "unhealthy"
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Dernier résultat connu d'une sonde"""
+    name: str
+    status: HealthStatus
+    details: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    checked_at: Optional[float] = None  # time.time() de la fin de la vérification
+    duration: float = 0.0
+    stale_after: float = float('inf')  # Âge au-delà duquel le résultat n'est plus fiable
+
+    def age(self, now: Optional[float] = None) -> Optional[float]:
+        """Âge du résultat en secondes (None si la sonde n'a jamais abouti)"""
+        if self.checked_at is None:
+            return None
+        return max(0.0, (now or time.time()) - self.checked_at)
+
+    def effective_status(self, now: Optional[float] = None) -> HealthStatus:
+        """Statut, ramené à UNKNOWN si le résultat est trop ancien"""
+        age = self.age(now)
+        if age is not None and age > self.stale_after:
+            return HealthStatus.UNKNOWN
+        return self.status
+
+    def to_dict(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Convertit en dictionnaire avec l'âge du résultat"""
+        now = now or time.time()
+        age = self.age(now)
+        return {
+            'status': self.effective_status(now).value,
+            'details': self.details,
+            'error': self.error,
+            'checked_at': datetime.utcfromtimestamp(self.checked_at).isoformat() + "Z" if self.checked_at else None,
+            'age_seconds': round(age, 3) if age is not None else None,
+            'duration_ms': round(self.duration * 1000, 3),
+            'stale': age is not None and age > self.stale_after
+        }
+
+
+class _Probe:
+    """Sonde enregistrée et son état d'ordonnancement"""
+
+    def __init__(self, name: str, check: ProbeCheck, interval: float, timeout: float, critical: bool):
+        self.name = name
+        self.check = check
+        self.interval = interval
+        self.timeout = timeout
+        self.critical = critical
+        self.next_run = 0.0
+        self.deadline = 0.0
+        self.running = False
+        self.timed_out = False
+        self.run_id = 0
+
+
+class HealthRegistry:
+    """
+    Sondes de santé exécutées en arrière-plan et dernier instantané en cache
+
+    Un thread ordonnanceur lance chaque sonde dans un thread daemon à son
+    échéance. Une sonde qui dépasse son timeout est marquée UNHEALTHY et
+    n'est pas relancée tant que la vérification bloquée n'est pas revenue,
+    pour ne pas empiler les threads sur une dépendance figée.
+
+    Les résultats sont publiés par remplacement d'un dictionnaire immuable :
+    la lecture par les endpoints se fait sans verrou.
+    """
+
+    def __init__(self, default_interval: float = 15.0, default_timeout: float = 5.0):
+        self.default_interval = default_interval
+        self.default_timeout = default_timeout
+        self._probes: Dict[str, _Probe] = {}
+        self._results: Dict[str, ProbeResult] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, check: ProbeCheck, interval: Optional[float] = None,
+                 timeout: Optional[float] = None, critical: bool = False) -> None:
+        """
+        Enregistre (ou remplace) une sonde
+
+        Args:
+            name: Nom de la sonde
+            check: Vérification retournant ses détails ; une clé 'status'
+                (HealthStatus ou sa valeur) permet de signaler un état dégradé,
+                une exception rend la sonde UNHEALTHY
+            interval: Secondes entre deux vérifications
+            timeout: Secondes avant de considérer la vérification en échec
+            critical: Si True, l'échec de la sonde rend l'application UNHEALTHY
+        """
+        probe = _Probe(
+            name, check,
+            interval if interval is not None else self.default_interval,
+            timeout if timeout is not None else self.default_timeout,
+            critical
+        )
+        with self._lock:
+            self._probes[name] = probe
+            self._publish(ProbeResult(name, HealthStatus.UNKNOWN, stale_after=self._stale_after(probe)))
+        self._wakeup.set()
+
+    def unregister(self, name: str) -> None:
+        """Retire une sonde et son résultat"""
+        with self._lock:
+            self._probes.pop(name, None)
+            results = dict(self._results)
+            results.pop(name, None)
+            self._results = results
+
+    def start(self) -> None:
+        """Démarre l'ordonnanceur (sans effet s'il tourne déjà)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="health-probes", daemon=True)
+            self._thread.start()
+        get_metrics_registry().register_collector('health', self.collect_metrics)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Arrête l'ordonnanceur ; les vérifications en cours se terminent seules"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        get_metrics_registry().unregister_collector('health', self.collect_metrics)
+
+    def run_once(self) -> Dict[str, ProbeResult]:
+        """Exécute toutes les sondes immédiatement, dans le thread appelant"""
+        for probe in list(self._probes.values()):
+            probe.run_id += 1
+            self._execute(probe, probe.run_id)
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, ProbeResult]:
+        """Derniers résultats par sonde"""
+        return self._results
+
+    def get(self, name: str) -> Optional[ProbeResult]:
+        """Dernier résultat d'une sonde"""
+        return self._results.get(name)
+
+    def overall_status(self, results: Optional[Dict[str, ProbeResult]] = None,
+                       now: Optional[float] = None) -> HealthStatus:
+        """
+        État agrégé : UNHEALTHY si une sonde critique est en échec,
+        DEGRADED si une sonde n'est pas saine, HEALTHY sinon
+        """
+        results = self._results if results is None else results
+        now = now or time.time()
+        status = HealthStatus.HEALTHY
+        for name, result in results.items():
+            effective = result.effective_status(now)
+            if effective == HealthStatus.HEALTHY:
+                continue
+            probe = self._probes.get(name)
+            if effective == HealthStatus.UNHEALTHY and probe is not None and probe.critical:
+                return HealthStatus.UNHEALTHY
+            status = HealthStatus.DEGRADED
+        return status
+
+    def report(self) -> Dict[str, Any]:
+        """Instantané complet : état agrégé et résultat de chaque sonde avec son âge"""
+        now = time.time()
+        results = self._results
+        return {
+            'status': self.overall_status(results, now).value,
+            'checks': {name: result.to_dict(now) for name, result in results.items()}
+        }
+
+    def collect_metrics(self) -> List[MetricFamily]:
+        """Familles de métriques des sondes pour le registre unifié"""
+        now = time.time()
+        up, ages, durations = [], [], []
+        for name, result in self._results.items():
+            labels = {'probe': name}
+            up.append(('health_probe_up', labels, 1 if result.effective_status(now) == HealthStatus.HEALTHY else 0))
+            age = result.age(now)
+            if age is not None:
+                ages.append(('health_probe_age_seconds', labels, age))
+                durations.append(('health_probe_duration_seconds', labels, result.duration))
+        return [
+            MetricFamily('health_probe_up', 'gauge', 'Whether the last health probe run was healthy', up),
+            MetricFamily('health_probe_age_seconds', 'gauge', 'Age of the last health probe result', ages),
+            MetricFamily('health_probe_duration_seconds', 'gauge', 'Duration of the last health probe run', durations),
+        ]
+
+    def _run(self) -> None:
+        while not self._stopping:
+            now = time.monotonic()
+            wake_at = now + 1.0
+            for probe in list(self._probes.values()):
+                if probe.running:
+                    if not probe.timed_out:
+                        if now >= probe.deadline:
+                            self._timed_out(probe)
+                        else:
+                            wake_at = min(wake_at, probe.deadline)
+                    continue
+                if now >= probe.next_run:
+                    self._launch(probe, now)
+                    wake_at = min(wake_at, probe.deadline)
+                else:
+                    wake_at = min(wake_at, probe.next_run)
+
+            self._wakeup.wait(max(0.0, wake_at - time.monotonic()))
+            self._wakeup.clear()
+
+    def _launch(self, probe: _Probe, now: float) -> None:
+        probe.running = True
+        probe.timed_out = False
+        probe.run_id += 1
+        probe.deadline = now + probe.timeout
+        probe.next_run = now + probe.interval
+        threading.Thread(
+            target=self._execute, args=(probe, probe.run_id),
+            name=f"health-probe-{probe.name}", daemon=True
+        ).start()
+
+    def _execute(self, probe: _Probe, run_id: int) -> None:
+        started = time.perf_counter()
+        try:
+            details = dict(probe.check() or {})
+            status = HealthStatus(details.pop('status', HealthStatus.HEALTHY))
+            error = None
+        except Exception as e:
+            details, status, error = {}, HealthStatus.UNHEALTHY, str(e)
+        duration = time.perf_counter() - started
+
+        with self._lock:
+            probe.running = False
+            # Une sonde remplacée entre-temps ne publie pas son résultat
+            if self._probes.get(probe.name) is probe and probe.run_id == run_id:
+                self._publish(ProbeResult(
+                    probe.name, status, details, error, time.time(), duration, self._stale_after(probe)
+                ))
+        # L'ordonnanceur attendait l'échéance du timeout : il replanifie la sonde
+        self._wakeup.set()
+
+    def _timed_out(self, probe: _Probe) -> None:
+        probe.timed_out = True
+        logger.warning(f"Health probe '{probe.name}' timed out after {probe.timeout}s")
+        with self._lock:
+            if self._probes.get(probe.name) is probe and probe.running:
+                self._publish(ProbeResult(
+                    probe.name, HealthStatus.UNHEALTHY, error=f"Timed out after {probe.timeout}s",
+                    checked_at=time.time(), duration=probe.timeout, stale_after=self._stale_after(probe)
+                ))
+
+    def _publish(self, result: ProbeResult) -> None:
+        # Appelé sous self._lock
+        self._results = {**self._results, result.name: result}
+
+    @staticmethod
+    def _stale_after(probe: _Probe) -> float:
+        return probe.interval * 3 + probe.timeout
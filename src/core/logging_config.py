@@ -4,7 +4,10 @@ Configuration du système de logging uniforme avec monitoring des performances
 import logging
 import logging.config
 import logging.handlers
+import atexit
+import copy
 import os
+import queue
 import sys
 import time
 import json
@@ -16,6 +19,41 @@ from collections import defaultdict, deque
 from dataclasses import dataclass, asdict
 
 from .config import Config
+from .counters import ShardedCounterMap, RingBuffer, RollingAggregates
+from .metrics_registry import MetricFamily, get_metrics_registry
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """Sérialise un dictionnaire en JSON compact (ujson si disponible)"""
+    if UJSON_AVAILABLE:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False, default=str)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+# Nombre maximal de classes d'opérations exposées sur /metrics
+MAX_OPERATION_LABELS = 100
+
+
+def operation_label(operation: str) -> str:
+    """
+    Classe d'opération utilisée comme label de métrique
+    
+    Les mots à partir du premier contenant une URL, un chemin ou un nombre
+    sont retirés ("HTTP GET https://api/orders/42" -> "HTTP GET") pour que
+    le nombre de séries exposées reste borné.
+    """
+    words = []
+    for word in operation.split():
+        if any(char in '/:?=&' or char.isdigit() for char in word):
+            break
+        words.append(word)
+    return ' '.join(words) or 'other'
 
 
 @dataclass
@@ -46,68 +84,125 @@ class LogMetrics:
 
 
 class MetricsCollector:
-    """Collecteur de métriques de performance et de logging"""
+    """
+    Collecteur de métriques de performance et de logging
+    
+    Appelé pour chaque enregistrement de log : les compteurs par niveau
+    sont tenus par thread et fusionnés à la lecture, et les métriques de
+    performance sont écrites dans un tampon circulaire préalloué, sans
+    verrou global sur le chemin chaud. Les durées sont aussi agrégées par
+    seconde et par minute pour résumer n'importe quelle fenêtre sans
+    parcourir l'historique.
+    """
+    
+    # Fenêtres des résumés de performance, en secondes
+    SUMMARY_WINDOWS = {'1m': 60, '5m': 300, '1h': 3600}
     
     def __init__(self, max_metrics: int = 1000):
         self.max_metrics = max_metrics
-        self.metrics = LogMetrics()
-        self.performance_history = deque(maxlen=max_metrics)
+        self._logs_by_level = ShardedCounterMap()
+        self._performance = RingBuffer(max_metrics)
+        self._rolling = RollingAggregates()
         self.error_history = deque(maxlen=100)
-        self._lock = threading.Lock()
         
+        # Exposition sur /metrics : durées par classe d'opération et logs par niveau
+        registry = get_metrics_registry()
+        self._operation_durations = registry.histogram(
+            'operation_duration_seconds',
+            'Duration of operations timed with log_performance',
+            ('operation', 'status')
+        )
+        self._operation_labels = set()
+        registry.register_collector('logging', self.collect_metrics)
+    
+    @property
+    def metrics(self) -> LogMetrics:
+        """Instantané des métriques de logging"""
+        logs_by_level = self._logs_by_level.snapshot()
+        return LogMetrics(
+            total_logs=sum(logs_by_level.values()),
+            logs_by_level=defaultdict(int, logs_by_level),
+            errors_count=logs_by_level.get('ERROR', 0),
+            warnings_count=logs_by_level.get('WARNING', 0),
+            performance_metrics=self._performance.items()
+        )
+    
+    @property
+    def performance_history(self) -> List[PerformanceMetric]:
+        """Métriques de performance récentes, de la plus ancienne à la plus récente"""
+        return self._performance.items()
+    
     def record_log(self, level: str):
         """Enregistre une métrique de log"""
-        with self._lock:
-            self.metrics.total_logs += 1
-            self.metrics.logs_by_level[level] += 1
-            
-            if level == 'ERROR':
-                self.metrics.errors_count += 1
-            elif level == 'WARNING':
-                self.metrics.warnings_count += 1
+        self._logs_by_level.add(level)
     
     def record_performance(self, metric: PerformanceMetric):
         """Enregistre une métrique de performance"""
-        with self._lock:
-            self.performance_history.append(metric)
-            self.metrics.performance_metrics.append(metric)
+        self._performance.append(metric)
+        self._rolling.record(metric.duration, metric.success, metric.operation)
+        self._operation_durations.labels(
+            self._operation_label(metric.operation), 'success' if metric.success else 'error'
+        ).observe(metric.duration)
+    
+    def _operation_label(self, operation: str) -> str:
+        """Label borné d'une opération : au-delà de MAX_OPERATION_LABELS classes, 'other'"""
+        label = operation_label(operation)
+        if label not in self._operation_labels:
+            if len(self._operation_labels) >= MAX_OPERATION_LABELS:
+                return 'other'
+            self._operation_labels.add(label)
+        return label
+    
+    def get_performance_summary(self, window: float = 3600) -> Dict[str, Any]:
+        """
+        Résume les métriques de performance d'une fenêtre glissante
+        
+        Args:
+            window: Durée de la fenêtre en secondes
             
-            # Garder seulement les métriques récentes
-            if len(self.metrics.performance_metrics) > self.max_metrics:
-                self.metrics.performance_metrics = self.metrics.performance_metrics[-self.max_metrics:]
+        Returns:
+            Dictionnaire avec nombre, durée moyenne/min/max, taux de succès,
+            percentiles et détail par opération
+        """
+        return self._rolling.summary(window)
+    
+    def collect_metrics(self) -> List[MetricFamily]:
+        """Retourne le nombre de logs par niveau pour le registre de métriques"""
+        return [MetricFamily('log_messages_total', 'counter', 'Log records by level', [
+            ('log_messages_total', {'level': level}, count)
+            for level, count in sorted(self._logs_by_level.snapshot().items())
+        ])]
     
     def record_error(self, error_info: Dict[str, Any]):
         """Enregistre une erreur"""
-        with self._lock:
-            error_info['timestamp'] = datetime.utcnow().isoformat()
-            self.error_history.append(error_info)
+        error_info['timestamp'] = datetime.utcnow().isoformat()
+        self.error_history.append(error_info)
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Retourne un résumé des métriques"""
-        with self._lock:
-            # Calculer les statistiques de performance
-            recent_metrics = [m for m in self.performance_history 
-                            if m.timestamp > datetime.utcnow() - timedelta(hours=1)]
-            
-            avg_duration = 0
-            success_rate = 0
-            if recent_metrics:
-                avg_duration = sum(m.duration for m in recent_metrics) / len(recent_metrics)
-                success_count = sum(1 for m in recent_metrics if m.success)
-                success_rate = success_count / len(recent_metrics) * 100
-            
-            return {
-                'total_logs': self.metrics.total_logs,
-                'logs_by_level': dict(self.metrics.logs_by_level),
-                'errors_count': self.metrics.errors_count,
-                'warnings_count': self.metrics.warnings_count,
-                'performance': {
-                    'recent_operations': len(recent_metrics),
-                    'average_duration': round(avg_duration, 3),
-                    'success_rate': round(success_rate, 2)
-                },
-                'recent_errors': list(self.error_history)[-10:]  # 10 dernières erreurs
-            }
+        # Statistiques de performance pré-agrégées par fenêtre
+        windows = {
+            name: self._rolling.summary(seconds)
+            for name, seconds in self.SUMMARY_WINDOWS.items()
+        }
+        last_hour = windows['1h']
+        
+        logs_by_level = self._logs_by_level.snapshot()
+        
+        return {
+            'total_logs': sum(logs_by_level.values()),
+            'logs_by_level': logs_by_level,
+            'errors_count': logs_by_level.get('ERROR', 0),
+            'warnings_count': logs_by_level.get('WARNING', 0),
+            'performance': {
+                'recent_operations': last_hour['count'],
+                'average_duration': round(last_hour['average'], 3),
+                'success_rate': round(last_hour['success_rate'] * 100, 2),
+                'operations': last_hour['operations'],
+                'windows': windows
+            },
+            'recent_errors': list(self.error_history)[-10:]  # 10 dernières erreurs
+        }
     
     def export_metrics(self, filepath: str):
         """Exporte les métriques vers un fichier JSON"""
@@ -124,7 +219,7 @@ class MetricsCollector:
                         'error_message': m.error_message,
                         'context': m.context
                     }
-                    for m in list(self.performance_history)
+                    for m in self.performance_history
                 ]
             }
             
@@ -164,42 +259,103 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+# Horodatage : préfixe à la seconde mis en cache, microsecondes ajoutées
+_timestamp_cache = (None, '')
+
+
+def format_timestamp(created: float) -> str:
+    """
+    Formate un horodatage epoch en ISO 8601 UTC avec microsecondes
+    
+    Le préfixe à la seconde n'est recalculé qu'une fois par seconde.
+    
+    Args:
+        created: Horodatage epoch (LogRecord.created)
+        
+    Returns:
+        Horodatage au format AAAA-MM-JJTHH:MM:SS.ffffff
+    """
+    global _timestamp_cache
+    second = int(created)
+    microseconds = round((created - second) * 1000000)
+    if microseconds >= 1000000:
+        second += 1
+        microseconds -= 1000000
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    return '%s.%06d' % (prefix, microseconds)
+
+
 class JsonFormatter(logging.Formatter):
     """
     Formatter JSON pour les logs structurés
+    
+    Les champs propres au processus sont encodés une seule fois et ajoutés
+    tels quels à chaque ligne ; le reste est sérialisé avec ujson s'il est
+    disponible.
     """
     
+    # Champs personnalisés repris des attributs du record
+    EXTRA_FIELDS = ('user_id', 'request_id', 'operation', 'duration')
+    
+    def __init__(self, static_fields: Optional[Dict[str, Any]] = None, **kwargs):
+        """
+        Initialise le formatter
+        
+        Args:
+            static_fields: Champs constants ajoutés à chaque ligne (ex: nom de l'application)
+        """
+        super().__init__(**kwargs)
+        self.static_fields = dict(static_fields or {})
+        self._static_pid = None
+        self._static_suffix = '}'
+    
+    def _get_static_suffix(self, pid: int) -> str:
+        # Recalculé seulement si le processus change (fork)
+        if pid != self._static_pid:
+            fields = dict(self.static_fields, process_id=pid)
+            encoded = _json_dumps(fields)
+            self._static_suffix = ',' + encoded[1:]
+            self._static_pid = pid
+        return self._static_suffix
+    
     def format(self, record):
         """
         Formate le message en JSON
         """
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': format_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
             'module': record.module,
             'function': record.funcName,
             'line': record.lineno,
-            'process_id': os.getpid(),
-            'thread_name': threading.current_thread().name
+            'thread_name': record.threadName
         }
         
-        # Ajouter les informations d'exception si présentes
-        if record.exc_info:
-            log_entry['exception'] = self.formatException(record.exc_info)
+        # Ajouter les informations d'exception si présentes (déjà formatées
+        # quand l'enregistrement vient de la file asynchrone)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_entry['exception'] = record.exc_text
         
         # Ajouter des champs personnalisés
-        if hasattr(record, 'user_id'):
-            log_entry['user_id'] = record.user_id
-        if hasattr(record, 'request_id'):
-            log_entry['request_id'] = record.request_id
-        if hasattr(record, 'operation'):
-            log_entry['operation'] = record.operation
-        if hasattr(record, 'duration'):
-            log_entry['duration'] = record.duration
+        record_fields = record.__dict__
+        for field_name in self.EXTRA_FIELDS:
+            if field_name in record_fields:
+                log_entry[field_name] = record_fields[field_name]
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _json_dumps(log_entry)[:-1] + self._get_static_suffix(record.process)
+    
+    def format_bytes(self, record) -> bytes:
+        """
+        Formate l'enregistrement en ligne JSON encodée en UTF-8
+        """
+        return (self.format(record) + '\n').encode('utf-8')
 
 
 class ContextFilter(logging.Filter):
@@ -215,21 +371,19 @@ class ContextFilter(logging.Filter):
         """
         Ajoute des informations de contexte au record
         """
-        # Ajouter l'ID de processus
-        record.process_id = os.getpid()
-        
-        # Ajouter le nom du thread
-        record.thread_name = threading.current_thread().name
+        # ID de processus et nom du thread, déjà relevés par le LogRecord
+        record.process_id = record.process
+        record.thread_name = record.threadName
         
         # Ajouter un timestamp plus précis
-        record.precise_time = datetime.utcnow().isoformat()
+        record.precise_time = format_timestamp(record.created)
         
         # Enregistrer la métrique si le collecteur est disponible
         if self.metrics_collector:
             self.metrics_collector.record_log(record.levelname)
             
             # Enregistrer les erreurs avec plus de détails
-            if record.levelname in ['ERROR', 'CRITICAL']:
+            if record.levelno >= logging.ERROR:
                 error_info = {
                     'level': record.levelname,
                     'message': record.getMessage(),
@@ -275,6 +429,378 @@ class MetricsHandler(logging.Handler):
             pass
 
 
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler sans flush à chaque enregistrement
+
+    Le listener asynchrone appelle flush() une fois par lot ; le message
+    n'est formaté qu'une fois, y compris pour le test de rotation.
+    """
+    
+    def emit(self, record):
+        """
+        Écrit l'enregistrement dans le tampon du fichier
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+        except Exception:
+            self.handleError(record)
+
+
+class JsonLinesRotatingFileHandler(BatchedRotatingFileHandler):
+    """
+    Handler de fichier JSON lines écrivant des octets déjà encodés
+    
+    Le fichier est ouvert en binaire : les lignes produites par
+    JsonFormatter.format_bytes() sont écrites sans couche d'encodage texte.
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode + 'b')
+    
+    def emit(self, record):
+        """
+        Écrit la ligne JSON encodée dans le tampon du fichier
+        """
+        try:
+            formatter = self.formatter
+            if hasattr(formatter, 'format_bytes'):
+                data = formatter.format_bytes(record)
+            else:
+                data = (self.format(record) + self.terminator).encode('utf-8')
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(data)
+        except Exception:
+            self.handleError(record)
+
+
+_STOP = object()
+
+
+def _dispatch(records) -> None:
+    """
+    Transmet des enregistrements à leurs handlers puis flush chaque handler une fois
+    
+    Args:
+        records: Liste de tuples (handlers, record)
+    """
+    touched = {}
+    for handlers, record in records:
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    handler.handleError(record)
+                touched[handler] = None
+    for handler in touched:
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+
+class AsyncLogListener:
+    """
+    Thread d'écriture des logs, unique par processus
+    
+    Les handlers AsyncLogHandler déposent les enregistrements dans une file
+    bornée ; le listener les dépile par lots d'au plus `batch_size`, les
+    transmet aux handlers cibles et ne flush chaque handler qu'une fois par
+    lot. Quand la file est pleine, les enregistrements sont abandonnés et
+    comptés plutôt que de bloquer le thread appelant.
+    """
+    
+    def __init__(self, queue_size: int = 10000, batch_size: int = 256):
+        self.queue_size = queue_size
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._reset()
+    
+    def _reset(self):
+        self.queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._dropped = 0
+        self._processed = 0
+        self._batches = 0
+    
+    @property
+    def is_running(self) -> bool:
+        """Indique si le thread d'écriture est actif"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    @property
+    def stopped(self) -> bool:
+        """Indique si le listener a été arrêté explicitement"""
+        return self._stopped
+    
+    def start(self) -> None:
+        """Démarre le thread d'écriture s'il ne tourne pas"""
+        with self._lock:
+            if self.is_running:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+    
+    def enqueue(self, handlers, record: logging.LogRecord) -> None:
+        """
+        Dépose un enregistrement sans jamais bloquer
+        
+        Args:
+            handlers: Handlers cibles
+            record: Enregistrement préparé
+        """
+        try:
+            self.queue.put_nowait((handlers, record))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Attend l'écriture des enregistrements déjà en file
+        
+        Args:
+            timeout: Attente maximum en secondes
+            
+        Returns:
+            True si la file a été vidée dans le délai
+        """
+        if not self.is_running:
+            return True
+        marker = threading.Event()
+        try:
+            self.queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Écrit les enregistrements restants puis arrête le thread
+        
+        Args:
+            timeout: Attente maximum en secondes
+        """
+        self._stopped = True
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+    
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            records = []
+            markers = []
+            stop = False
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    records.append(item)
+            
+            _dispatch(records)
+            self._processed += len(records)
+            self._batches += 1
+            
+            for marker in markers:
+                marker.set()
+            if stop:
+                break
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du listener
+        
+        Returns:
+            Dictionnaire avec la taille de la file et les compteurs
+        """
+        return {
+            'running': self.is_running,
+            'queue_size': self.queue.qsize(),
+            'queue_capacity': self.queue_size,
+            'processed': self._processed,
+            'batches': self._batches,
+            'dropped': self._dropped
+        }
+
+
+class AsyncLogHandler(logging.handlers.QueueHandler):
+    """
+    Handler qui délègue l'écriture au listener asynchrone
+    
+    Le message et la trace d'exception sont calculés dans le thread
+    appelant ; seules les entrées/sorties sont faites par le listener. Si
+    le listener a été arrêté (fin de processus), les enregistrements sont
+    écrits directement.
+    """
+    
+    def __init__(self, handlers: List[logging.Handler], listener: 'AsyncLogListener'):
+        super().__init__(listener.queue)
+        self.handlers = tuple(handlers)
+        self.listener = listener
+    
+    def prepare(self, record):
+        """
+        Fige le message de l'enregistrement avant sa mise en file
+        """
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+    
+    def emit(self, record):
+        """
+        Met l'enregistrement en file, ou l'écrit si le listener est arrêté
+        """
+        try:
+            record = self.prepare(record)
+            listener = self.listener
+            if not listener.is_running and not listener.stopped:
+                # Premier log dans un processus enfant : relancer le thread
+                listener.start()
+            if listener.is_running:
+                listener.enqueue(self.handlers, record)
+            else:
+                _dispatch([(self.handlers, record)])
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        """
+        Ferme le handler et ses handlers cibles
+        """
+        for handler in self.handlers:
+            handler.close()
+        super().close()
+
+
+_exception_formatter = logging.Formatter()
+
+# Listener asynchrone du processus
+_log_listener: Optional[AsyncLogListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def get_log_listener(config: Optional[Config] = None) -> AsyncLogListener:
+    """
+    Retourne le listener asynchrone du processus, démarré
+    
+    Args:
+        config: Configuration (taille de file et de lot) utilisée à la création
+        
+    Returns:
+        Listener asynchrone
+    """
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            _log_listener = AsyncLogListener(
+                queue_size=config.LOG_QUEUE_SIZE if config else 10000,
+                batch_size=config.LOG_BATCH_SIZE if config else 256
+            )
+            atexit.register(shutdown_logging)
+    _log_listener.start()
+    return _log_listener
+
+
+def add_log_handlers(logger: logging.Logger, handlers: List[logging.Handler],
+                     config: Optional[Config] = None,
+                     filters: Optional[List[logging.Filter]] = None) -> None:
+    """
+    Attache des handlers à un logger, derrière la file asynchrone si activée
+    
+    Args:
+        logger: Logger cible
+        handlers: Handlers d'écriture
+        config: Configuration (LOG_ASYNC, LOG_QUEUE_SIZE, LOG_BATCH_SIZE)
+        filters: Filtres appliqués une fois par enregistrement, avant les handlers
+    """
+    filters = filters or []
+    if config is not None and not config.LOG_ASYNC:
+        for handler in handlers:
+            logger.addHandler(handler)
+        if handlers:
+            for log_filter in filters:
+                handlers[0].addFilter(log_filter)
+        return
+    
+    front_handler = AsyncLogHandler(handlers, get_log_listener(config))
+    for log_filter in filters:
+        front_handler.addFilter(log_filter)
+    logger.addHandler(front_handler)
+
+
+def flush_logging(timeout: float = 5.0) -> bool:
+    """
+    Attend l'écriture des logs en attente
+    
+    Args:
+        timeout: Attente maximum en secondes
+        
+    Returns:
+        True si tous les logs en attente ont été écrits
+    """
+    if _log_listener is None:
+        return True
+    return _log_listener.flush(timeout)
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """
+    Écrit les logs en attente et arrête le listener (appelé à la sortie)
+    
+    Args:
+        timeout: Attente maximum en secondes
+    """
+    if _log_listener is not None:
+        _log_listener.stop(timeout)
+
+
+def _reset_log_listener_after_fork() -> None:
+    # Le thread d'écriture n'existe pas dans le processus enfant : nouvelle file
+    global _log_listener_lock
+    _log_listener_lock = threading.Lock()
+    if _log_listener is not None:
+        _log_listener._lock = threading.Lock()
+        _log_listener._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_log_listener_after_fork)
+
+
 # Instance globale du collecteur de métriques
 _metrics_collector: Optional[MetricsCollector] = None
 
@@ -328,9 +854,18 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
     
     simple_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Avec la file asynchrone, les fichiers ne sont flushés qu'une fois par lot
+    file_handler_class = (
+        BatchedRotatingFileHandler if config.LOG_ASYNC else logging.handlers.RotatingFileHandler
+    )
+    handlers: List[logging.Handler] = []
+    
+    # Filtre de contexte avec métriques (exécuté dans le thread appelant)
+    context_filter = ContextFilter(metrics_collector)
+    
     # Handler pour fichier principal avec rotation
     try:
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = file_handler_class(
             config.LOG_FILE,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
@@ -345,11 +880,7 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
         )
         file_handler.setFormatter(file_formatter)
         
-        # Ajouter le filtre de contexte avec métriques
-        context_filter = ContextFilter(metrics_collector)
-        file_handler.addFilter(context_filter)
-        
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
         
     except Exception as e:
         print(f"Warning: Could not setup file logging: {e}", file=sys.stderr)
@@ -357,7 +888,7 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
     # Handler pour fichier d'erreurs séparé
     try:
         error_log_file = config.LOG_FILE.replace('.log', '_errors.log')
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = file_handler_class(
             error_log_file,
             maxBytes=5 * 1024 * 1024,  # 5 MB
             backupCount=3,
@@ -368,7 +899,7 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
             detailed_format,
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
-        logger.addHandler(error_handler)
+        handlers.append(error_handler)
         
     except Exception as e:
         print(f"Warning: Could not setup error file logging: {e}", file=sys.stderr)
@@ -377,7 +908,10 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
     if config.ENVIRONMENT == "production":
         try:
             json_log_file = config.LOG_FILE.replace('.log', '_structured.log')
-            json_handler = logging.handlers.RotatingFileHandler(
+            json_handler_class = (
+                JsonLinesRotatingFileHandler if config.LOG_ASYNC else logging.handlers.RotatingFileHandler
+            )
+            json_handler = json_handler_class(
                 json_log_file,
                 maxBytes=20 * 1024 * 1024,  # 20 MB
                 backupCount=10,
@@ -385,7 +919,7 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
             )
             json_handler.setLevel(logging.INFO)
             json_handler.setFormatter(JsonFormatter())
-            logger.addHandler(json_handler)
+            handlers.append(json_handler)
             
         except Exception as e:
             print(f"Warning: Could not setup JSON logging: {e}", file=sys.stderr)
@@ -412,13 +946,15 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
         )
     
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Handler pour métriques de performance
     if metrics_collector:
         metrics_handler = MetricsHandler(metrics_collector)
         metrics_handler.setLevel(logging.DEBUG)
-        logger.addHandler(metrics_handler)
+        handlers.append(metrics_handler)
+    
+    add_log_handlers(logger, handlers, config, filters=[context_filter])
     
     # Configurer les loggers des bibliothèques externes
     _configure_external_loggers(config)
@@ -427,6 +963,8 @@ def setup_logging(config: Config, logger_name: Optional[str] = None, enable_metr
     logger.info(f"Logging initialized - Level: {config.LOG_LEVEL}, File: {config.LOG_FILE}")
     logger.info(f"Environment: {config.ENVIRONMENT}, Debug: {config.FLASK_DEBUG}")
     logger.info(f"Process ID: {os.getpid()}, Thread: {threading.current_thread().name}")
+    if config.LOG_ASYNC:
+        logger.info(f"Async logging enabled - Queue size: {config.LOG_QUEUE_SIZE}, Batch size: {config.LOG_BATCH_SIZE}")
     
     if metrics_collector:
         logger.info("Performance metrics collection enabled")
@@ -970,6 +1508,9 @@ def get_logger_stats() -> Dict[str, Any]:
             level_name = logging.getLevelName(logger.level)
             stats['log_levels'][level_name] = stats['log_levels'].get(level_name, 0) + 1
     
+    if _log_listener is not None:
+        stats['async_logging'] = _log_listener.get_stats()
+    
     return stats
 
 
@@ -1058,7 +1599,7 @@ def create_application_logger(app_name: str, config: Config) -> logging.Logger:
             )
             app_handler.setFormatter(formatter)
             
-            logger.addHandler(app_handler)
+            add_log_handlers(logger, [app_handler], config)
             
         except Exception as e:
             print(f"Warning: Could not setup app-specific logging for {app_name}: {e}")
@@ -0,0 +1,538 @@
+"""
+Registre de métriques unifié : compteurs, jauges et histogrammes avec labels,
+exposés au format texte Prometheus (version 0.0.4)
+"""
+import logging
+import math
+import re
+import threading
+import time
+from typing import Dict, List, Tuple, Any, Optional, Callable, Iterable, NamedTuple
+
+from .counters import ShardedCounter, LatencyHistogram, DEFAULT_LATENCY_BUCKETS
+
+CONTENT_TYPE_LATEST = 'text/plain; version=0.0.4; charset=utf-8'
+
+_METRIC_NAME = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*$')
+_LABEL_NAME = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+logger = logging.getLogger(__name__)
+
+
+class MetricFamily(NamedTuple):
+    """
+    Famille de métriques produite par un collecteur au moment de l'exposition
+
+    Les échantillons sont des tuples (nom complet, labels, valeur) ; un simple
+    tuple (name, type, documentation, samples) est accepté à la place.
+    """
+    name: str
+    type: str
+    documentation: str
+    samples: List[Tuple[str, Dict[str, Any], float]]
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, Any]) -> str:
+    """Formate des labels pour l'exposition ('' si aucun label)"""
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()) + '}'
+
+
+def format_value(value: float) -> str:
+    """Formate une valeur d'échantillon (entiers sans décimale, infinis et NaN)"""
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _help_lines(name: str, metric_type: str, documentation: str) -> List[str]:
+    documentation = documentation.replace('\\', '\\\\').replace('\n', '\\n')
+    return [f'# HELP {name} {documentation}', f'# TYPE {name} {metric_type}']
+
+
+class _CounterChild:
+    """Série d'un compteur, incrémentée sans verrou"""
+
+    def __init__(self):
+        self._value = ShardedCounter()
+
+    def inc(self, amount: float = 1) -> None:
+        """Incrémente le compteur (amount doit être positif)"""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        self._value.add(amount)
+
+    @property
+    def value(self) -> float:
+        return self._value.value
+
+
+class _GaugeChild:
+    """Série d'une jauge, éventuellement calculée à l'exposition"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Fixe la valeur de la jauge"""
+        self._value = float(value)
+
+    def inc(self, amount: float = 1) -> None:
+        """Augmente la jauge"""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Diminue la jauge"""
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Calcule la valeur de la jauge à chaque exposition"""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+
+class _HistogramChild:
+    """Série d'un histogramme, adossée à un LatencyHistogram"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._histogram = LatencyHistogram(buckets)
+
+    def observe(self, value: float) -> None:
+        """Enregistre une observation"""
+        self._histogram.record(value)
+
+    def snapshot(self) -> Tuple[List[int], int, float]:
+        return self._histogram.snapshot()
+
+
+class _Metric:
+    """
+    Métrique nommée avec ses séries par combinaison de labels
+
+    Le libellé formaté de chaque série est calculé à sa création pour que
+    l'exposition ne fasse que concaténer des chaînes.
+    """
+
+    TYPE = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        if not _METRIC_NAME.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        labelnames = tuple(labelnames)
+        for labelname in labelnames:
+            if not _LABEL_NAME.match(labelname) or labelname.startswith('__'):
+                raise ValueError(f"Invalid label name: {labelname}")
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._label_strings: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._header = _help_lines(name, self.TYPE, documentation)
+
+    def labels(self, *values: Any, **labels: Any):
+        """
+        Retourne la série correspondant à des valeurs de labels
+
+        Args:
+            values: Valeurs des labels dans l'ordre de labelnames
+            labels: Valeurs des labels par nom
+
+        Returns:
+            Série de la métrique (créée au premier appel)
+        """
+        if labels:
+            if values:
+                raise ValueError("Cannot mix positional and keyword label values")
+            try:
+                values = tuple(labels[name] for name in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"Missing label {e} for metric {self.name}") from None
+            if len(labels) != len(self.labelnames):
+                raise ValueError(f"Unexpected labels for metric {self.name}")
+        key = tuple(str(value) for value in values)
+
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"Metric {self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._label_strings[key] = self._format_child_labels(dict(zip(self.labelnames, key)))
+                    self._children[key] = child
+        return child
+
+    def _default_child(self):
+        if self.labelnames:
+            raise ValueError(f"Metric {self.name} has labels, use labels() first")
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _format_child_labels(self, labels: Dict[str, str]) -> Dict[str, Any]:
+        return {'': format_labels(labels)}
+
+    def clear(self) -> None:
+        """Supprime toutes les séries"""
+        with self._lock:
+            self._children.clear()
+            self._label_strings.clear()
+
+    def _series(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        with self._lock:
+            return [(child, self._label_strings[key]) for key, child in self._children.items()]
+
+    def render(self, lines: List[str]) -> None:
+        """Ajoute les lignes d'exposition de la métrique"""
+        series = self._series()
+        if not series:
+            return
+        lines.extend(self._header)
+        for child, label_strings in series:
+            self._render_child(lines, child, label_strings)
+
+    def _render_child(self, lines: List[str], child, label_strings: Dict[str, Any]) -> None:
+        lines.append(f"{self.name}{label_strings['']} {format_value(child.value)}")
+
+
+class Counter(_Metric):
+    """Compteur monotone ; le nom se termine par convention par '_total'"""
+
+    TYPE = 'counter'
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """Incrémente un compteur sans labels"""
+        self._default_child().inc(amount)
+
+
+class Gauge(_Metric):
+    """Valeur instantanée pouvant monter ou descendre"""
+
+    TYPE = 'gauge'
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Fixe la valeur d'une jauge sans labels"""
+        self._default_child().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        """Augmente une jauge sans labels"""
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        """Diminue une jauge sans labels"""
+        self._default_child().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Calcule une jauge sans labels à chaque exposition"""
+        self._default_child().set_function(function)
+
+    def _render_child(self, lines: List[str], child, label_strings: Dict[str, Any]) -> None:
+        try:
+            value = child.value
+        except Exception as e:
+            logger.warning(f"Failed to compute gauge {self.name}: {e}")
+            return
+        lines.append(f"{self.name}{label_strings['']} {format_value(value)}")
+
+
+class Histogram(_Metric):
+    """Distribution de valeurs (durées en secondes) à buckets fixes"""
+
+    TYPE = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        labelnames = tuple(labelnames)
+        if 'le' in labelnames:
+            raise ValueError("'le' is a reserved label for histograms")
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _format_child_labels(self, labels: Dict[str, str]) -> Dict[str, Any]:
+        strings = {'': format_labels(labels)}
+        strings['le'] = [
+            format_labels(dict(labels, le=format_value(float(bound))))
+            for bound in self.buckets + (math.inf,)
+        ]
+        return strings
+
+    def observe(self, value: float) -> None:
+        """Enregistre une observation sur un histogramme sans labels"""
+        self._default_child().observe(value)
+
+    def _render_child(self, lines: List[str], child, label_strings: Dict[str, Any]) -> None:
+        counts, count, total = child.snapshot()
+        bucket_name = self.name + '_bucket'
+        cumulative = 0
+        for bucket_labels, bucket_count in zip(label_strings['le'], counts):
+            cumulative += bucket_count
+            lines.append(f"{bucket_name}{bucket_labels} {cumulative}")
+        labels = label_strings['']
+        lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+
+
+class MetricsRegistry:
+    """
+    Registre des métriques d'un processus
+
+    Les métriques sont créées à la demande (un même nom retourne la même
+    métrique) et mises à jour sur le chemin chaud ; les collecteurs sont
+    appelés à l'exposition pour les valeurs que leurs composants tiennent
+    déjà (caches, proxys, bots), sans double comptage.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricFamily]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, metric_class, name: str, documentation: str,
+                       labelnames: Iterable[str], **kwargs) -> _Metric:
+        labelnames = tuple(labelnames)
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = metric_class(name, documentation, labelnames, **kwargs)
+                    self._metrics[name] = metric
+                    return metric
+        if type(metric) is not metric_class or metric.labelnames != labelnames:
+            raise ValueError(f"Metric {name} already registered with another type or labels")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Retourne le compteur nommé, créé au premier appel"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Retourne la jauge nommée, créée au premier appel"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        """Retourne l'histogramme nommé, créé au premier appel"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Retourne une métrique enregistrée par son nom"""
+        return self._metrics.get(name)
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """
+        Enregistre un collecteur appelé à chaque exposition
+
+        Un collecteur enregistré sous un nom déjà utilisé remplace le
+        précédent (ex: service recréé). Les composants pouvant coexister en
+        plusieurs instances s'enregistrent sous un nom par instance.
+
+        Args:
+            name: Nom du collecteur
+            collector: Fonction retournant des MetricFamily
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def unregister_collector(self, name: str,
+                             collector: Optional[Callable[[], Iterable[MetricFamily]]] = None) -> None:
+        """
+        Retire un collecteur
+
+        Args:
+            name: Nom du collecteur
+            collector: Collecteur à retirer ; s'il a été remplacé entre-temps
+                sous ce nom, le collecteur en place est conservé
+        """
+        with self._lock:
+            if collector is None or self._collectors.get(name) == collector:
+                self._collectors.pop(name, None)
+
+    def render(self) -> str:
+        """
+        Produit l'exposition texte de toutes les métriques
+
+        Les familles de même nom produites par plusieurs collecteurs sont
+        fusionnées sous un seul en-tête HELP/TYPE.
+
+        Returns:
+            Texte au format Prometheus 0.0.4
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+
+        lines: List[str] = []
+        for metric in metrics:
+            metric.render(lines)
+
+        families: Dict[str, Tuple[str, str, list]] = {}
+        for name, collector in collectors:
+            try:
+                collected = list(collector())
+            except Exception as e:
+                logger.warning(f"Metrics collector {name} failed: {e}")
+                continue
+            for family_name, metric_type, documentation, samples in collected:
+                families.setdefault(family_name, (metric_type, documentation, []))[2].extend(samples)
+
+        for family_name, (metric_type, documentation, samples) in families.items():
+            if not samples:
+                continue
+            lines.extend(_help_lines(family_name, metric_type, documentation))
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{format_labels(labels)} {format_value(value)}")
+
+        lines.append('')
+        return '\n'.join(lines)
+
+    def clear(self) -> None:
+        """Retire toutes les métriques et tous les collecteurs"""
+        with self._lock:
+            self._metrics.clear()
+            self._collectors.clear()
+
+
+def histogram_family(name: str, documentation: str, buckets: Tuple[float, ...],
+                     series: Iterable[Tuple[Dict[str, Any], Tuple[List[int], int, float]]]) -> MetricFamily:
+    """
+    Construit une famille d'histogrammes à partir d'instantanés de LatencyHistogram
+
+    Args:
+        name: Nom de la métrique
+        documentation: Description
+        buckets: Bornes supérieures des buckets
+        series: Couples (labels, LatencyHistogram.snapshot())
+
+    Returns:
+        Famille de métriques de type histogram
+    """
+    bounds = [format_value(float(bound)) for bound in buckets] + ['+Inf']
+    samples = []
+    for labels, (counts, count, total) in series:
+        cumulative = 0
+        for bound, bucket_count in zip(bounds, counts):
+            cumulative += bucket_count
+            samples.append((name + '_bucket', dict(labels, le=bound), cumulative))
+        samples.append((name + '_sum', labels, total))
+        samples.append((name + '_count', labels, count))
+    return MetricFamily(name, 'histogram', documentation, samples)
+
+
+def with_labels(families: Iterable[MetricFamily], labels: Dict[str, Any]) -> List[MetricFamily]:
+    """
+    Ajoute des labels constants à tous les échantillons de familles
+
+    Distingue les séries des collecteurs enregistrés par instance.
+
+    Args:
+        families: Familles produites par un collecteur
+        labels: Labels à ajouter (ex: {'proxy': '2'})
+
+    Returns:
+        Familles avec les labels ajoutés
+    """
+    return [
+        MetricFamily(name, metric_type, documentation,
+                     [(sample_name, dict(sample_labels, **labels), value)
+                      for sample_name, sample_labels, value in samples])
+        for name, metric_type, documentation, samples in families
+    ]
+
+
+def register_metrics_endpoint(app, app_name: str, registry: Optional['MetricsRegistry'] = None) -> None:
+    """
+    Expose GET /metrics et mesure la durée des requêtes d'une application Flask
+
+    Les durées sont enregistrées par application, méthode, règle de route
+    (et non chemin, pour borner le nombre de séries) et statut.
+
+    Args:
+        app: Application Flask
+        app_name: Nom de l'application (label 'app')
+        registry: Registre à utiliser (registre global par défaut)
+    """
+    from flask import Response, g, request
+
+    registry = registry or get_metrics_registry()
+    durations = registry.histogram(
+        'http_request_duration_seconds',
+        'Duration of HTTP requests handled by the web applications',
+        ('app', 'method', 'endpoint', 'status')
+    )
+    in_progress = registry.gauge(
+        'http_requests_in_progress', 'HTTP requests being handled', ('app',)
+    ).labels(app_name)
+
+    @app.before_request
+    def _start_request_timer():
+        g.metrics_started = time.perf_counter()
+        in_progress.inc()
+
+    @app.after_request
+    def _record_request_duration(response):
+        started = g.get('metrics_started')
+        if started is not None:
+            rule = request.url_rule
+            durations.labels(
+                app_name,
+                request.method,
+                rule.rule if rule is not None else 'unmatched',
+                response.status_code
+            ).observe(time.perf_counter() - started)
+        return response
+
+    @app.teardown_request
+    def _end_request(exc):
+        if g.pop('metrics_started', None) is not None:
+            in_progress.dec()
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics_endpoint():
+        """Exposition des métriques au format texte Prometheus"""
+        return Response(registry.render(), content_type=CONTENT_TYPE_LATEST)
+
+
+# Instance globale du registre
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Retourne l'instance globale du registre de métriques"""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
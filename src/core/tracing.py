@@ -0,0 +1,548 @@
+"""
+Traçage distribué léger entre les applications
+
+Un span est créé pour chaque requête Flask, appel HTTP sortant, tentative du
+proxy API et analyse de stratégie. Le contexte circule entre les processus
+par l'en-tête W3C ``traceparent`` ; la décision d'échantillonnage est prise
+à la racine de la trace puis suivie par tous les processus traversés, de
+sorte qu'une trace est complète ou absente. Les spans échantillonnés sont
+exportés par lots au format JSON Zipkin v2, vers un fichier JSON lines ou
+un collecteur HTTP.
+"""
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, List, NamedTuple, Mapping, MutableMapping
+
+from .config import Config
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = 'traceparent'
+TRACE_ID_HEADER = 'X-Trace-ID'
+
+SPAN_KIND_SERVER = 'SERVER'
+SPAN_KIND_CLIENT = 'CLIENT'
+SPAN_KIND_INTERNAL = None
+
+_TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+_INVALID_TRACE_ID = '0' * 32
+_INVALID_SPAN_ID = '0' * 16
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('current_span', default=None)
+
+
+class SpanContext(NamedTuple):
+    """Identité d'un span, propagée entre les processus"""
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    def to_traceparent(self) -> str:
+        """Valeur de l'en-tête traceparent"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    @classmethod
+    def from_traceparent(cls, value: Optional[str]) -> Optional['SpanContext']:
+        """Analyse un en-tête traceparent (None s'il est absent ou invalide)"""
+        if not value:
+            return None
+        match = _TRACEPARENT.match(value.strip().lower())
+        if match is None:
+            return None
+        trace_id, span_id, flags = match.groups()
+        if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+            return None
+        return cls(trace_id, span_id, bool(int(flags, 16) & 1))
+
+
+def _new_trace_id() -> str:
+    return f'{random.getrandbits(128):032x}'
+
+
+def _new_span_id() -> str:
+    return f'{random.getrandbits(64):016x}'
+
+
+class Span:
+    """
+    Opération chronométrée d'une trace
+
+    Utilisable comme context manager : le span devient le span courant
+    pendant le bloc, une exception le marque en erreur et il est terminé à
+    la sortie. Un span non échantillonné ne garde ni tags ni durée.
+    """
+
+    __slots__ = ('tracer', 'context', 'parent_id', 'name', 'kind', 'timestamp',
+                 '_started', 'duration', 'tags', '_token')
+
+    def __init__(self, tracer: 'Tracer', context: SpanContext, parent_id: Optional[str],
+                 name: str, kind: Optional[str], tags: Optional[Dict[str, Any]] = None):
+        self.tracer = tracer
+        self.context = context
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.timestamp = time.time()
+        self._started = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.tags: Dict[str, str] = {}
+        self._token = None
+        if tags and context.sampled:
+            for key, value in tags.items():
+                self.tags[key] = str(value)
+
+    @property
+    def trace_id(self) -> str:
+        return self.context.trace_id
+
+    @property
+    def sampled(self) -> bool:
+        return self.context.sampled
+
+    def set_tag(self, key: str, value: Any) -> None:
+        """Ajoute un tag (ignoré si le span n'est pas échantillonné)"""
+        if self.context.sampled:
+            self.tags[key] = str(value)
+
+    def set_error(self, error: Any) -> None:
+        """Marque le span en erreur"""
+        if self.context.sampled:
+            self.tags['error'] = str(error) or type(error).__name__
+
+    def activate(self) -> None:
+        """Fait de ce span le span courant du contexte"""
+        self._token = _current_span.set(self)
+
+    def end(self) -> None:
+        """Termine le span, restaure le span parent et l'exporte s'il est échantillonné"""
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Terminé depuis un autre contexte que celui qui l'a activé
+                pass
+            self._token = None
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._started
+        if self.context.sampled:
+            self.tracer._export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit au format JSON Zipkin v2"""
+        data = {
+            'traceId': self.context.trace_id,
+            'id': self.context.span_id,
+            'name': self.name,
+            'timestamp': int(self.timestamp * 1e6),
+            'duration': max(1, int((self.duration or 0.0) * 1e6)),
+            'localEndpoint': {'serviceName': self.tracer.service_name},
+            'tags': self.tags
+        }
+        if self.parent_id:
+            data['parentId'] = self.parent_id
+        if self.kind:
+            data['kind'] = self.kind
+        return data
+
+    def __enter__(self) -> 'Span':
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.set_error(exc)
+        self.end()
+
+
+class SpanExporter:
+    """Destination des spans terminés"""
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter(SpanExporter):
+    """Ajoute les spans à un fichier JSON lines"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(span, separators=(',', ':')) + '\n' for span in spans))
+
+
+class HttpSpanExporter(SpanExporter):
+    """
+    Envoie les spans à un collecteur compatible Zipkin (POST /api/v2/spans)
+
+    urllib est utilisé plutôt qu'une session tracée pour que l'export ne
+    produise pas lui-même de spans.
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        body = json.dumps(spans, separators=(',', ':')).encode()
+        req = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+            response.read()
+
+
+_FLUSH = object()
+
+
+class BatchSpanProcessor:
+    """
+    Thread d'export des spans, par lots
+
+    Les spans sont déposés dans une file bornée sans jamais bloquer le
+    thread appelant ; au-delà de la capacité ils sont abandonnés et comptés.
+    """
+
+    def __init__(self, exporter: SpanExporter, queue_size: int = 2048,
+                 batch_size: int = 256, interval: float = 1.0):
+        self.exporter = exporter
+        self.queue_size = queue_size
+        self.batch_size = max(1, batch_size)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.dropped = 0
+        self.exported = 0
+        self.failed = 0
+
+    def on_end(self, span: Span) -> None:
+        """Dépose un span terminé"""
+        if self._thread is None:
+            self._start()
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Attend l'export des spans déjà en file"""
+        if self._thread is None or not self._thread.is_alive():
+            return self.queue.empty()
+        marker = threading.Event()
+        try:
+            self.queue.put((_FLUSH, marker), timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Exporte les spans restants puis arrête le thread"""
+        self.flush(timeout)
+        self._stopped = True
+        self.exporter.shutdown()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._stopped:
+                self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            batch: List[Span] = []
+            markers = []
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if isinstance(item, tuple):
+                    markers.append(item[1])
+                    break
+                batch.append(item)
+
+            if batch:
+                try:
+                    self.exporter.export([span.to_dict() for span in batch])
+                    self.exported += len(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    logger.warning(f"Failed to export {len(batch)} spans: {e}")
+            for marker in markers:
+                marker.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques d'export"""
+        return {
+            'queue_size': self.queue.qsize(),
+            'exported': self.exported,
+            'dropped': self.dropped,
+            'failed': self.failed
+        }
+
+
+class Tracer:
+    """
+    Crée les spans d'un service et propage leur contexte
+
+    Les traces racines sont échantillonnées avec la probabilité
+    `sample_rate` ; les spans enfants, locaux ou distants, héritent de la
+    décision de leur parent.
+    """
+
+    def __init__(self, service_name: str, sample_rate: float = 1.0,
+                 exporter: Optional[SpanExporter] = None, queue_size: int = 2048):
+        self.service_name = service_name
+        self.sample_rate = sample_rate if exporter is not None else 0.0
+        self.processor = BatchSpanProcessor(exporter, queue_size) if exporter is not None else None
+
+    def start_span(self, name: str, kind: Optional[str] = SPAN_KIND_INTERNAL,
+                   parent: Optional[SpanContext] = None, tags: Optional[Dict[str, Any]] = None) -> Span:
+        """
+        Crée un span, enfant du span courant par défaut
+
+        Args:
+            name: Nom de l'opération (de faible cardinalité)
+            kind: SPAN_KIND_SERVER, SPAN_KIND_CLIENT ou SPAN_KIND_INTERNAL
+            parent: Contexte parent explicite (extrait d'un en-tête)
+            tags: Tags initiaux
+
+        Returns:
+            Span démarré, à utiliser comme context manager ou à terminer par end()
+        """
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+
+        if parent is None:
+            context = SpanContext(_new_trace_id(), _new_span_id(), random.random() < self.sample_rate)
+            return Span(self, context, None, name, kind, tags)
+        context = SpanContext(parent.trace_id, _new_span_id(), parent.sampled)
+        return Span(self, context, parent.span_id, name, kind, tags)
+
+    def inject(self, headers: Optional[MutableMapping[str, str]] = None) -> MutableMapping[str, str]:
+        """Ajoute l'en-tête traceparent du span courant"""
+        headers = {} if headers is None else headers
+        span = _current_span.get()
+        if span is not None:
+            headers[TRACEPARENT_HEADER] = span.context.to_traceparent()
+        return headers
+
+    @staticmethod
+    def extract(headers: Mapping[str, str]) -> Optional[SpanContext]:
+        """Contexte parent porté par les en-têtes d'une requête entrante"""
+        return SpanContext.from_traceparent(headers.get(TRACEPARENT_HEADER))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Attend l'export des spans terminés"""
+        return self.processor.flush(timeout) if self.processor is not None else True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Exporte les spans restants et arrête l'export"""
+        if self.processor is not None:
+            self.processor.shutdown(timeout)
+
+    def _export(self, span: Span) -> None:
+        if self.processor is not None:
+            self.processor.on_end(span)
+
+
+def current_span() -> Optional[Span]:
+    """Span courant du contexte d'exécution"""
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """Identifiant de la trace courante"""
+    span = _current_span.get()
+    return span.context.trace_id if span is not None else None
+
+
+def traced(name: str, tags: Optional[Callable[..., Dict[str, Any]]] = None):
+    """
+    Décorateur créant un span autour de chaque appel d'une fonction ou coroutine
+
+    Args:
+        name: Nom du span (de faible cardinalité)
+        tags: Fonction recevant les arguments de l'appel et retournant les tags initiaux
+    """
+    def decorator(func):
+        def start(args, kwargs) -> Span:
+            return get_tracer().start_span(name, tags=tags(*args, **kwargs) if tags else None)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with start(args, kwargs):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start(args, kwargs):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_tracing(app, app_name: str, tracer: Optional[Tracer] = None) -> None:
+    """
+    Crée un span serveur pour chaque requête d'une application Flask
+
+    Le span reprend le contexte de l'en-tête traceparent entrant ; l'ID de
+    trace est renvoyé dans l'en-tête X-Trace-ID des requêtes échantillonnées.
+
+    Args:
+        app: Application Flask
+        app_name: Nom de l'application (tag 'app')
+        tracer: Traceur à utiliser (traceur global par défaut)
+    """
+    from flask import g, request
+
+    @app.before_request
+    def _start_request_span():
+        active = tracer or get_tracer()
+        rule = request.url_rule
+        span = active.start_span(
+            f"{request.method} {rule.rule if rule is not None else 'unmatched'}",
+            kind=SPAN_KIND_SERVER,
+            parent=active.extract(request.headers),
+            tags={'app': app_name, 'http.method': request.method, 'http.path': request.path}
+        )
+        span.activate()
+        g.trace_span = span
+
+    @app.after_request
+    def _tag_request_span(response):
+        span = g.get('trace_span')
+        if span is not None and span.sampled:
+            span.set_tag('http.status_code', response.status_code)
+            if response.status_code >= 500:
+                span.set_tag('error', response.status)
+            response.headers[TRACE_ID_HEADER] = span.trace_id
+        return response
+
+    @app.teardown_request
+    def _end_request_span(exc):
+        span = g.pop('trace_span', None)
+        if span is not None:
+            if exc is not None:
+                span.set_error(exc)
+            span.end()
+
+
+if REQUESTS_AVAILABLE:
+    class TracedSession(requests.Session):
+        """
+        Session requests créant un span client par appel et propageant le
+        contexte de trace au service appelé
+
+        Réutiliser une même session conserve aussi les connexions ouvertes
+        entre deux appels, contrairement à requests.get().
+        """
+
+        def request(self, method, url, **kwargs):
+            span = get_tracer().start_span(
+                f"HTTP {method.upper()}",
+                kind=SPAN_KIND_CLIENT,
+                tags={'http.method': method.upper(), 'http.url': url}
+            )
+            with span:
+                kwargs['headers'] = span.tracer.inject(dict(kwargs.get('headers') or {}))
+                response = super().request(method, url, **kwargs)
+                span.set_tag('http.status_code', response.status_code)
+                if response.status_code >= 500:
+                    span.set_tag('error', response.status_code)
+                return response
+
+
+# Instances globales du traceur et de la session tracée
+_tracer: Optional[Tracer] = None
+_traced_session = None
+
+
+def configure_tracing(service_name: str, config: Optional[Config] = None) -> Tracer:
+    """
+    Configure le traceur global du processus
+
+    Args:
+        service_name: Nom du service dans les traces
+        config: Configuration (TRACING_*, TRACE_*)
+
+    Returns:
+        Traceur global
+    """
+    global _tracer
+    config = config or Config()
+    exporter = None
+    if config.TRACING_ENABLED:
+        if config.TRACE_COLLECTOR_URL:
+            exporter = HttpSpanExporter(config.TRACE_COLLECTOR_URL)
+        elif config.TRACE_EXPORT_FILE:
+            exporter = FileSpanExporter(config.TRACE_EXPORT_FILE)
+
+    previous = _tracer
+    _tracer = Tracer(service_name, config.TRACE_SAMPLE_RATE, exporter, config.TRACE_QUEUE_SIZE)
+    if previous is not None:
+        previous.shutdown(timeout=1.0)
+    return _tracer
+
+
+def get_tracer() -> Tracer:
+    """Retourne le traceur global (inactif tant qu'il n'est pas configuré)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer('axiom-trade', 0.0)
+    return _tracer
+
+
+def get_traced_session():
+    """Retourne la session HTTP tracée partagée du processus"""
+    global _traced_session
+    if _traced_session is None:
+        if not REQUESTS_AVAILABLE:
+            raise ImportError("requests is required for traced HTTP calls. Install with: pip install requests")
+        _traced_session = TracedSession()
+    return _traced_session
+
+
+def _reset_tracing_after_fork() -> None:
+    # Ni le thread d'export ni les connexions de la session ne sont utilisables
+    # dans le processus enfant
+    global _traced_session
+    _traced_session = None
+    if _tracer is not None and _tracer.processor is not None:
+        _tracer.processor._lock = threading.Lock()
+        _tracer.processor._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_tracing_after_fork)
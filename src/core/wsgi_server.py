@@ -0,0 +1,647 @@
+"""
+Serveur WSGI de production : pool de threads borné par worker et, sous
+Linux, workers pré-forkés avec rechargement sans interruption et recyclage
+après N requêtes
+
+Usage :
+    python -m src.core.wsgi_server [module:factory] [--workers N] [--threads N] ...
+
+Par défaut l'application servie est celle de create_backend_api. La
+fabrique est importée dans chaque worker après le fork, pour qu'un
+rechargement (SIGHUP) prenne en compte le nouveau code et la nouvelle
+configuration.
+"""
+import argparse
+import importlib
+import itertools
+import logging
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from .config import Config, get_config
+
+DEFAULT_APP = 'src.backend_api.app:create_backend_api'
+
+# Code de sortie d'un worker dont l'application n'a pas pu être créée
+WORKER_BOOT_ERROR = 3
+
+# Échecs de démarrage consécutifs avant d'abandonner (démarrage ou rechargement)
+MAX_BOOT_FAILURES = 5
+
+# Attente maximale d'un thread libre avant de rendre la main à serve_forever
+_ACCEPT_WAIT = 0.5
+
+AppFactory = Union[str, Callable[[], Any]]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ServerOptions:
+    """Options du serveur de production"""
+    host: str = "127.0.0.1"
+    port: int = 5000
+    workers: int = 1
+    threads: int = 8
+    backlog: int = 2048
+    timeout: int = 30
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+    graceful_timeout: int = 30
+
+    @classmethod
+    def from_config(cls, config: Config) -> 'ServerOptions':
+        """
+        Crée les options à partir de la configuration
+
+        Args:
+            config: Configuration (SERVER_WORKERS à 0 : un worker par cœur)
+
+        Returns:
+            Options du serveur
+        """
+        return cls(
+            host=config.FLASK_HOST,
+            port=config.FLASK_PORT,
+            workers=config.SERVER_WORKERS or os.cpu_count() or 1,
+            threads=config.SERVER_THREADS,
+            backlog=config.SERVER_BACKLOG,
+            timeout=config.SERVER_TIMEOUT,
+            max_requests=config.SERVER_MAX_REQUESTS,
+            max_requests_jitter=config.SERVER_MAX_REQUESTS_JITTER,
+            graceful_timeout=config.SERVER_GRACEFUL_TIMEOUT
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les options en dictionnaire"""
+        return asdict(self)
+
+
+def load_app_factory(app_factory: AppFactory) -> Callable[[], Any]:
+    """
+    Résout une fabrique d'application
+
+    Args:
+        app_factory: Fabrique, ou chemin 'module:fonction'
+
+    Returns:
+        Fonction sans argument créant l'application WSGI
+
+    Raises:
+        ValueError: Si le chemin est invalide
+    """
+    if callable(app_factory):
+        return app_factory
+    module_name, _, attribute = app_factory.partition(':')
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid application factory '{app_factory}', expected 'module:function'")
+    factory = getattr(importlib.import_module(module_name), attribute, None)
+    if not callable(factory):
+        raise ValueError(f"{app_factory} is not callable")
+    return factory
+
+
+class _PooledRequestHandler(WSGIRequestHandler):
+    """
+    Gestionnaire de connexion comptant les requêtes traitées
+
+    Les requêtes sont journalisées par les middlewares des applications,
+    pas par le serveur. werkzeug ferme la connexion après chaque réponse
+    (il vide le socket pour ignorer un corps non lu) : le keep-alive est
+    assuré par le reverse proxy placé devant.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def handle_one_request(self):
+        self.raw_requestline = b''
+        super().handle_one_request()
+        if self.raw_requestline:
+            self.server.request_finished()
+
+    def log_request(self, code: Union[int, str] = "-", size: Union[int, str] = "-") -> None:
+        pass
+
+    def log_error(self, format: str, *args: Any) -> None:
+        # Connexion ouverte sans requête (sonde, pré-connexion) fermée à l'expiration du délai
+        if not self.raw_requestline and format.startswith("Request timed out"):
+            return
+        super().log_error(format, *args)
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    Serveur WSGI traitant les connexions dans un pool de threads borné
+
+    Contrairement au serveur de développement (un thread par connexion),
+    le nombre de threads est fixe ; une connexion n'est acceptée que si un
+    thread est libre, les connexions en excès attendent dans le backlog du
+    socket (où un autre worker peut les prendre). Après max_requests
+    requêtes, le serveur cesse d'accepter des connexions et termine celles
+    en cours (recyclage du worker).
+    """
+
+    multithread = True
+
+    def __init__(self, host: str, port: int, app: Any, threads: int = 8, backlog: int = 2048,
+                 timeout: int = 30, max_requests: int = 0, fd: Optional[int] = None):
+        """
+        Initialise le serveur
+
+        Args:
+            host: Adresse d'écoute
+            port: Port d'écoute (0 : port libre)
+            app: Application WSGI
+            threads: Nombre de threads de traitement
+            backlog: Connexions en attente d'acceptation (ignoré avec fd)
+            timeout: Secondes sans données avant fermeture d'une connexion lente
+            max_requests: Requêtes avant l'arrêt du serveur (0 : jamais)
+            fd: Socket d'écoute déjà ouvert (workers pré-forkés)
+        """
+        self.request_queue_size = backlog
+        self.max_requests = max_requests
+        self.draining = False
+        self._handled = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="wsgi")
+        # Un jeton par thread, pris avant accept() et rendu à la fermeture de la connexion
+        self._slots = threading.BoundedSemaphore(max(1, threads))
+        self._in_flight: set = set()
+        self._in_flight_lock = threading.Lock()
+        handler = type('PooledRequestHandler', (_PooledRequestHandler,), {'timeout': timeout or None})
+        super().__init__(host, port, app, handler=handler, fd=fd)
+
+    def get_request(self):
+        # Sans thread libre, la connexion reste dans le backlog ; OSError fait
+        # revenir serve_forever à sa boucle (et à sa vérification d'arrêt)
+        if not self._slots.acquire(timeout=_ACCEPT_WAIT):
+            raise OSError("No free request thread")
+        try:
+            return super().get_request()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request(self, request, client_address):
+        with self._in_flight_lock:
+            future = self._executor.submit(self._process_request_thread, request, client_address)
+            self._in_flight.add(future)
+        future.add_done_callback(self._connection_done)
+
+    def _connection_done(self, future) -> None:
+        with self._in_flight_lock:
+            self._in_flight.discard(future)
+
+    def shutdown_request(self, request):
+        # Appelé une fois par connexion acceptée, y compris si elle est refusée
+        try:
+            super().shutdown_request(request)
+        finally:
+            self._slots.release()
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def request_finished(self) -> None:
+        """Compte une requête traitée et déclenche le recyclage au seuil"""
+        if next(self._handled) == self.max_requests:
+            logger.info(f"Worker {os.getpid()} reached {self.max_requests} requests, recycling")
+            self.stop()
+
+    def stop(self) -> None:
+        """Cesse d'accepter des connexions (appelable depuis n'importe quel thread)"""
+        if not self.draining:
+            self.draining = True
+            threading.Thread(target=self.shutdown, name="wsgi-stop", daemon=True).start()
+
+    def swap_app(self, app: Any, timeout: float) -> bool:
+        """
+        Substitue l'application servie et attend la fin des connexions en cours
+
+        Les connexions acceptées avant la substitution peuvent encore
+        utiliser l'ancienne application ; les suivantes utilisent la nouvelle.
+
+        Args:
+            app: Nouvelle application WSGI
+            timeout: Délai maximum d'attente en secondes
+
+        Returns:
+            True si les connexions en cours se sont terminées à temps
+        """
+        with self._in_flight_lock:
+            self.app = app
+            pending = list(self._in_flight)
+        return not wait(pending, timeout).not_done
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Attend la fin des connexions en cours
+
+        Args:
+            timeout: Délai maximum en secondes
+
+        Returns:
+            True si toutes les connexions se sont terminées à temps
+        """
+        self.draining = True
+        waiter = threading.Thread(target=self._executor.shutdown, name="wsgi-drain", daemon=True)
+        waiter.start()
+        waiter.join(timeout)
+        return not waiter.is_alive()
+
+
+class _Worker:
+    """Worker pré-forké vu par le processus maître"""
+
+    def __init__(self, pid: int, generation: int, ready_fd: int):
+        self.pid = pid
+        self.generation = generation
+        self.ready_fd = ready_fd
+        self.ready = False
+        self.terminating = False
+
+
+class PreforkServer:
+    """
+    Processus maître partageant un socket d'écoute entre des workers forkés
+
+    Chaque worker crée sa propre application et la sert avec un
+    PooledWSGIServer. Signaux du maître :
+        SIGHUP: rechargement - une nouvelle génération de workers est
+            démarrée et l'ancienne n'est arrêtée qu'une fois la nouvelle
+            prête, sans fermer le socket d'écoute
+        SIGTERM/SIGINT: arrêt gracieux de tous les workers
+    Un worker qui se termine (recyclage, crash) est remplacé.
+    """
+
+    def __init__(self, app_factory: AppFactory, options: ServerOptions):
+        """
+        Initialise le serveur
+
+        Args:
+            app_factory: Fabrique de l'application, ou chemin 'module:fonction'
+                importé dans chaque worker
+            options: Options du serveur
+        """
+        self.app_factory = app_factory
+        self.options = options
+        self.address = None
+
+        self._socket: Optional[socket.socket] = None
+        self._workers: Dict[int, _Worker] = {}
+        self._generation = 0
+        self._boot_failures = 0
+        self._next_spawn = 0.0
+        self._actions: List[str] = []
+        self._exit_code = 0
+
+    def bind(self) -> None:
+        """Ouvre le socket d'écoute partagé"""
+        family = socket.AF_INET6 if ':' in self.options.host else socket.AF_INET
+        self._socket = socket.create_server((self.options.host, self.options.port), family=family,
+                                            backlog=self.options.backlog)
+        self.address = self._socket.getsockname()
+
+    def reload(self) -> None:
+        """Demande le remplacement de tous les workers"""
+        # Appelé depuis un gestionnaire de signal : pas de verrou ici
+        self._actions.append('reload')
+
+    def stop(self) -> None:
+        """Demande l'arrêt gracieux du serveur"""
+        self._actions.append('stop')
+
+    def run(self) -> int:
+        """
+        Démarre les workers et les supervise jusqu'à l'arrêt
+
+        Returns:
+            Code de sortie (0 si l'arrêt a été demandé)
+        """
+        if self._socket is None:
+            self.bind()
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        signal.signal(signal.SIGINT, lambda signum, frame: self.stop())
+        signal.signal(signal.SIGHUP, lambda signum, frame: self.reload())
+
+        logger.info(f"Serving on {self.address[0]}:{self.address[1]} with {self.options.workers} "
+                    f"workers x {self.options.threads} threads (master pid {os.getpid()})")
+        try:
+            while True:
+                self._reap()
+                actions, self._actions = self._actions, []
+                if 'stop' in actions:
+                    break
+                if actions:
+                    self._start_reload()
+                self._check_ready()
+                self._retire_old_generations()
+                self._spawn_missing()
+                if self._exit_code:
+                    break
+                time.sleep(0.1)
+        finally:
+            self._shutdown()
+        return self._exit_code
+
+    def _start_reload(self) -> None:
+        logger.info("Reloading workers")
+        self._generation += 1
+        self._boot_failures = 0
+
+    def _current(self) -> List[_Worker]:
+        return [w for w in self._workers.values() if w.generation == self._generation and not w.terminating]
+
+    def _spawn_missing(self) -> None:
+        if time.monotonic() < self._next_spawn:
+            return
+        for _ in range(self.options.workers - len(self._current())):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        max_requests = self.options.max_requests
+        if max_requests and self.options.max_requests_jitter:
+            max_requests += random.randint(0, self.options.max_requests_jitter)
+
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(ready_read)
+                for worker in self._workers.values():
+                    os.close(worker.ready_fd)
+                code = _run_worker(self.app_factory, self.options, self._socket.fileno(),
+                                   ready_write, max_requests)
+            except BaseException:
+                logger.exception("Worker failed")
+            finally:
+                os._exit(code)
+
+        os.close(ready_write)
+        os.set_blocking(ready_read, False)
+        self._workers[pid] = _Worker(pid, self._generation, ready_read)
+
+    def _check_ready(self) -> None:
+        pending = [w for w in self._workers.values() if not w.ready]
+        if not pending:
+            return
+        readable, _, _ = select.select([w.ready_fd for w in pending], [], [], 0)
+        for worker in pending:
+            if worker.ready_fd in readable:
+                try:
+                    worker.ready = bool(os.read(worker.ready_fd, 1))
+                except BlockingIOError:
+                    continue
+                if worker.ready:
+                    self._boot_failures = 0
+
+    def _retire_old_generations(self) -> None:
+        """Arrête l'ancienne génération dès que la nouvelle est entièrement prête"""
+        current = self._current()
+        if len(current) < self.options.workers or not all(w.ready for w in current):
+            return
+        for worker in self._workers.values():
+            if worker.generation != self._generation and not worker.terminating:
+                self._terminate(worker)
+
+    def _terminate(self, worker: _Worker) -> None:
+        worker.terminating = True
+        try:
+            os.kill(worker.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _reap(self) -> None:
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            if not worker.ready:
+                # Un worker recyclé peut quitter avant la lecture de son octet de démarrage
+                try:
+                    worker.ready = bool(os.read(worker.ready_fd, 1))
+                except BlockingIOError:
+                    pass
+            os.close(worker.ready_fd)
+            code = os.waitstatus_to_exitcode(status)
+
+            if not worker.ready and not worker.terminating and code != 0:
+                self._boot_failed(worker, code)
+            elif not worker.terminating and code != 0:
+                logger.error(f"Worker {pid} exited with code {code}")
+
+    def _boot_failed(self, worker: _Worker, code: int) -> None:
+        """Temporise les redémarrages et abandonne après trop d'échecs"""
+        self._boot_failures += 1
+        self._next_spawn = time.monotonic() + min(self._boot_failures, 5)
+        logger.error(f"Worker {worker.pid} failed to boot (code {code})")
+        if self._boot_failures < MAX_BOOT_FAILURES or worker.generation != self._generation:
+            return
+
+        previous = [w for w in self._workers.values() if w.generation < self._generation and w.ready]
+        if previous:
+            # Rechargement abandonné : l'ancienne génération continue de servir
+            logger.error("Reload aborted, keeping the previous workers")
+            for current in self._current():
+                self._terminate(current)
+            self._generation = max(w.generation for w in previous)
+            self._boot_failures = 0
+            self._next_spawn = 0.0
+        else:
+            logger.error("Workers keep failing to boot, stopping")
+            self._exit_code = 1
+
+    def _shutdown(self) -> None:
+        """Arrête tous les workers, de force après graceful_timeout"""
+        for worker in list(self._workers.values()):
+            self._terminate(worker)
+
+        deadline = time.monotonic() + self.options.graceful_timeout + 5
+        while self._workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.05)
+        for worker in list(self._workers.values()):
+            logger.warning(f"Killing worker {worker.pid} after graceful timeout")
+            try:
+                os.kill(worker.pid, signal.SIGKILL)
+                os.waitpid(worker.pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            os.close(worker.ready_fd)
+        self._workers.clear()
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        logger.info("Server stopped")
+
+
+def _run_worker(app_factory: AppFactory, options: ServerOptions, listen_fd: int,
+                ready_fd: int, max_requests: int) -> int:
+    """Corps d'un worker forké ; retourne son code de sortie"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    try:
+        app = load_app_factory(app_factory)()
+        server = PooledWSGIServer(options.host, options.port, app, threads=options.threads,
+                                  timeout=options.timeout, max_requests=max_requests, fd=listen_fd)
+    except Exception:
+        logger.exception("Failed to create the application")
+        return WORKER_BOOT_ERROR
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+    os.write(ready_fd, b'1')
+    os.close(ready_fd)
+
+    server.serve_forever()
+    if not server.drain(options.graceful_timeout):
+        logger.warning(f"Worker {os.getpid()} stopped with requests still running")
+    _flush_logs()
+    return 0
+
+
+def _flush_logs() -> None:
+    try:
+        from .logging_config import flush_logging
+        flush_logging()
+    except Exception:
+        pass
+
+
+def release_app(app: Any) -> None:
+    """
+    Libère les ressources d'une application qui n'est plus servie
+
+    Arrête son ordonnanceur de santé (attribut health) et nettoie ses
+    services (attribut services, méthode cleanup) ; une application sans
+    ces attributs n'a rien à libérer. Les erreurs sont journalisées.
+
+    Args:
+        app: Application remplacée
+    """
+    health = getattr(app, 'health', None)
+    if health is not None:
+        try:
+            health.stop()
+        except Exception:
+            logger.exception("Failed to stop the health probes of the previous application")
+
+    for name, service in (getattr(app, 'services', None) or {}).items():
+        cleanup = getattr(service, 'cleanup', None)
+        if callable(cleanup):
+            try:
+                cleanup()
+            except Exception:
+                logger.exception(f"Failed to clean up service {name} of the previous application")
+
+
+def serve_threaded(app_factory: AppFactory, options: ServerOptions) -> int:
+    """
+    Sert l'application dans un seul processus (Windows, ou un seul worker)
+
+    SIGHUP recrée l'application et la substitue à l'ancienne sans fermer
+    le socket ; les requêtes en cours terminent sur l'ancienne, dont les
+    ressources sont ensuite libérées (release_app).
+
+    Args:
+        app_factory: Fabrique de l'application, ou chemin 'module:fonction'
+        options: Options du serveur (workers et max_requests ignorés)
+
+    Returns:
+        Code de sortie
+    """
+    factory = load_app_factory(app_factory)
+    server = PooledWSGIServer(options.host, options.port, factory(), threads=options.threads,
+                              backlog=options.backlog, timeout=options.timeout)
+
+    def reload_app(signum, frame):
+        def swap():
+            previous = server.app
+            try:
+                app = load_app_factory(app_factory)()
+            except Exception:
+                logger.exception("Reload failed, keeping the current application")
+                return
+            if not server.swap_app(app, options.graceful_timeout):
+                logger.warning(f"Requests still running on the previous application after "
+                               f"{options.graceful_timeout}s, releasing it anyway")
+            release_app(previous)
+            logger.info("Application reloaded")
+        threading.Thread(target=swap, name="wsgi-reload", daemon=True).start()
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: server.stop())
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, reload_app)
+
+    logger.info(f"Serving on {options.host}:{server.port} with {options.threads} threads")
+    server.serve_forever()
+    server.drain(options.graceful_timeout)
+    _flush_logs()
+    return 0
+
+
+def serve(app_factory: AppFactory = DEFAULT_APP, options: Optional[ServerOptions] = None) -> int:
+    """
+    Sert une application avec des workers pré-forkés si possible
+
+    Args:
+        app_factory: Fabrique de l'application, ou chemin 'module:fonction'
+        options: Options du serveur (configuration globale par défaut)
+
+    Returns:
+        Code de sortie
+    """
+    options = options or ServerOptions.from_config(get_config())
+    if options.workers > 1 and hasattr(os, 'fork'):
+        return PreforkServer(app_factory, options).run()
+    return serve_threaded(app_factory, options)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande"""
+    defaults = ServerOptions.from_config(get_config())
+    parser = argparse.ArgumentParser(description="Production WSGI server for the Axiom Trade apps")
+    parser.add_argument('app', nargs='?', default=DEFAULT_APP, help="Application factory (module:function)")
+    parser.add_argument('--host', default=defaults.host)
+    parser.add_argument('--port', type=int, default=defaults.port)
+    parser.add_argument('--workers', type=int, default=defaults.workers)
+    parser.add_argument('--threads', type=int, default=defaults.threads)
+    parser.add_argument('--backlog', type=int, default=defaults.backlog)
+    parser.add_argument('--timeout', type=int, default=defaults.timeout)
+    parser.add_argument('--max-requests', type=int, default=defaults.max_requests)
+    parser.add_argument('--max-requests-jitter', type=int, default=defaults.max_requests_jitter)
+    parser.add_argument('--graceful-timeout', type=int, default=defaults.graceful_timeout)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    options = ServerOptions(**{key: getattr(args, key) for key in defaults.to_dict()})
+    return serve(args.app, options)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,28 +2,29 @@
 Services métier de l'application Axiom Trade
 """
 from .token_service import TokenService
-from .windows_service import WindowsServiceManager
 from .api_proxy_service import ApiProxyService, create_api_proxy, test_api_connection
-
-# CLI functions for convenience
-from .service_cli import (
-    install_service, uninstall_service, start_service, stop_service, 
-    restart_service, get_service_status, get_service_health, monitor_service
+from .async_api_proxy_service import (
+    AsyncApiProxyService, request_deadline, acquire_async_api_proxy, release_async_api_proxy
 )
 
+# Gestion du service Windows : requiert pywin32, les autres services restent
+# importables sans lui (tests, outils hors Windows)
+try:
+    from .windows_service import WindowsServiceManager
+    WINDOWS_SERVICE_AVAILABLE = True
+except ImportError:
+    WindowsServiceManager = None
+    WINDOWS_SERVICE_AVAILABLE = False
+
 __all__ = [
     'TokenService',
     'WindowsServiceManager',
     'ApiProxyService',
     'create_api_proxy',
     'test_api_connection',
-    # CLI functions
-    'install_service',
-    'uninstall_service', 
-    'start_service',
-    'stop_service',
-    'restart_service',
-    'get_service_status',
-    'get_service_health',
-    'monitor_service'
+    'AsyncApiProxyService',
+    'request_deadline',
+    'acquire_async_api_proxy',
+    'release_async_api_proxy',
+    'WINDOWS_SERVICE_AVAILABLE'
 ]
\ No newline at end of file
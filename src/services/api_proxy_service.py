@@ -4,22 +4,34 @@ Service proxy pour l'API Axiom Trade avec gestion avancée
 import requests
 import time
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Callable
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Callable, Hashable, Iterator
 from urllib.parse import urljoin, urlparse
 import json
 from dataclasses import dataclass, field
 from enum import Enum
+import contextvars
+import itertools
 import threading
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core.config import Config
 from ..core.exceptions import (
     ApiError, ApiConnectionError, ApiAuthenticationError, 
-    ApiRateLimitError, TokenError
+    ApiRateLimitError, ApiCircuitOpenError, TokenError, AxiomTradeException, ValidationError
 )
 from ..services.token_service import TokenService
 from ..core.logging_config import log_performance
+from ..core.metrics_registry import MetricFamily, get_metrics_registry, with_labels
+from ..core.tracing import get_tracer, SPAN_KIND_CLIENT
+from .rate_limiter import RateLimiter, ApiRateLimits  # RateLimiter réexporté pour les appelants existants
+from .response_cache import (
+    ResponseCache, CacheEntry, DEFAULT_CACHE_POLICIES, CACHE_FRESH, CACHE_STALE, CACHE_EXPIRED
+)
+from .single_flight import SingleFlight
+from .circuit_breaker import CircuitBreaker, CircuitState, AdaptiveTimeout, RetryBudget
+from .proxy_metrics import ProxyMetrics, RequestRecord
 
 
 class RequestMethod(Enum):
@@ -67,6 +79,8 @@ class ApiResponse:
     response_time: Optional[float] = None
     request: Optional[ApiRequest] = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    bytes_in: int = 0
+    bytes_out: int = 0
     
     def is_success(self) -> bool:
         """Vérifie si la réponse est un succès"""
@@ -92,61 +106,48 @@ class ApiResponse:
             'is_client_error': self.is_client_error(),
             'is_server_error': self.is_server_error(),
             'timestamp': self.timestamp.isoformat(),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
             'request': self.request.to_dict() if self.request else None
         }
 
 
-class RateLimiter:
-    """Gestionnaire de limitation de taux"""
+# Headers de la réponse amont transmis tels quels en mode flux
+STREAM_PASSTHROUGH_HEADERS = (
+    'content-type', 'content-encoding', 'content-length',
+    'etag', 'last-modified', 'cache-control'
+)
+
+# Identifiants des instances de proxy (label 'proxy' des métriques)
+_proxy_ids = itertools.count(1)
+
+
+def is_relative_endpoint(endpoint: Any) -> bool:
+    """Vérifie qu'un endpoint est un chemin relatif à l'URL de base (sans schéma ni hôte)"""
+    return (isinstance(endpoint, str) and endpoint.startswith('/')
+            and not endpoint.startswith('//') and '://' not in endpoint)
+
+
+@dataclass
+class StreamedResponse:
+    """Réponse API transmise en flux, sans mise en mémoire ni parsing du corps"""
+    status_code: int
+    headers: Dict[str, str]
+    chunks: Iterator[bytes]
+    request: Optional[ApiRequest] = None
+    release: Optional[Callable[[], None]] = field(default=None, repr=False)
     
-    def __init__(self, max_requests: int = 100, time_window: int = 60):
-        """
-        Initialise le limiteur de taux
-        
-        Args:
-            max_requests: Nombre maximum de requêtes
-            time_window: Fenêtre de temps en secondes
-        """
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.requests: List[datetime] = []
-        self._lock = threading.RLock()
-    
-    def can_make_request(self) -> bool:
-        """Vérifie si une requête peut être faite"""
-        with self._lock:
-            now = datetime.utcnow()
-            cutoff = now - timedelta(seconds=self.time_window)
-            
-            # Nettoyer les anciennes requêtes
-            self.requests = [req_time for req_time in self.requests if req_time > cutoff]
-            
-            return len(self.requests) < self.max_requests
-    
-    def record_request(self) -> None:
-        """Enregistre une nouvelle requête"""
-        with self._lock:
-            self.requests.append(datetime.utcnow())
-    
-    def get_wait_time(self) -> float:
-        """Retourne le temps d'attente avant la prochaine requête"""
-        with self._lock:
-            if self.can_make_request():
-                return 0.0
-            
-            # Trouver la requête la plus ancienne dans la fenêtre
-            now = datetime.utcnow()
-            cutoff = now - timedelta(seconds=self.time_window)
-            valid_requests = [req_time for req_time in self.requests if req_time > cutoff]
-            
-            if not valid_requests:
-                return 0.0
-            
-            oldest_request = min(valid_requests)
-            wait_until = oldest_request + timedelta(seconds=self.time_window)
-            wait_time = (wait_until - now).total_seconds()
-            
-            return max(0.0, wait_time)
+    def is_success(self) -> bool:
+        """Vérifie si la réponse est un succès"""
+        return 200 <= self.status_code < 300
+    
+    def close(self) -> None:
+        """Libère la connexion amont, y compris si le flux n'a pas été consommé"""
+        close = getattr(self.chunks, 'close', None)
+        if close is not None:
+            close()
+        if self.release is not None:
+            self.release()
 
 
 class ApiProxyService:
@@ -156,14 +157,18 @@ class ApiProxyService:
     Fonctionnalités:
     - Gestion automatique de l'authentification avec tokens
     - Limitation de taux configurable
-    - Retry automatique avec backoff exponentiel
+    - Retry automatique avec backoff exponentiel, limité par un budget de retry
+    - Disjoncteur et timeout adaptatif par groupe d'endpoints
     - Logging détaillé des requêtes/réponses
-    - Cache des réponses (optionnel)
-    - Métriques de performance
+    - Cache des réponses GET (TTL, ETag/Last-Modified, stale-while-revalidate)
+    - Regroupement des requêtes identiques simultanées (single-flight)
+    - Transmission en flux des réponses volumineuses
+    - Métriques de performance (percentiles de latence par endpoint, octets échangés)
     """
     
     def __init__(self, config: Config, token_service: TokenService, 
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 coalesce_key: Optional[Callable[[ApiRequest, bool], Optional[Hashable]]] = None):
         """
         Initialise le service proxy API
         
@@ -171,6 +176,8 @@ class ApiProxyService:
             config: Configuration de l'application
             token_service: Service de gestion des tokens
             logger: Logger optionnel
+            coalesce_key: Fonction (requête, use_auth) -> clé de regroupement,
+                None pour ne pas regrouper la requête (clé par défaut si omis)
         """
         self.config = config
         self.token_service = token_service
@@ -180,8 +187,37 @@ class ApiProxyService:
         self.base_url = config.AXIOM_API_BASE_URL
         self.timeout = config.API_TIMEOUT
         
-        # Limitation de taux
-        self.rate_limiter = RateLimiter(max_requests=100, time_window=60)
+        # Limitation de taux : budget global + budgets par classe d'endpoint,
+        # partagés entre processus si un répertoire de partage est configuré
+        self.rate_limits = ApiRateLimits.from_config(config)
+        
+        # Cache des réponses GET
+        self.response_cache: Optional[ResponseCache] = None
+        if config.API_CACHE_ENABLED:
+            self.response_cache = ResponseCache(
+                policies=config.API_CACHE_POLICIES or DEFAULT_CACHE_POLICIES,
+                max_bytes=config.API_CACHE_MAX_BYTES,
+                max_entries=config.API_CACHE_MAX_ENTRIES,
+                negative_ttl=config.API_CACHE_NEGATIVE_TTL
+            )
+        
+        # Résilience : disjoncteurs et timeouts adaptatifs par groupe d'endpoints
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.adaptive_timeouts: Dict[str, AdaptiveTimeout] = {}
+        self.retry_budget = RetryBudget(ratio=config.API_RETRY_BUDGET_RATIO)
+        self._resilience_lock = threading.Lock()
+        
+        # Regroupement des requêtes idempotentes identiques en cours
+        self.coalesce_methods = {RequestMethod.GET}
+        self.coalesce_key = coalesce_key or self._default_coalesce_key
+        self._single_flight: Optional[SingleFlight] = (
+            SingleFlight() if config.API_COALESCE_ENABLED else None
+        )
+        
+        # Pool de threads des requêtes groupées (créé à la première utilisation)
+        self.batch_max_concurrency = config.API_BATCH_MAX_CONCURRENCY
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_lock = threading.Lock()
         
         # Session HTTP réutilisable
         self.session = requests.Session()
@@ -191,16 +227,13 @@ class ApiProxyService:
             'Content-Type': 'application/json'
         })
         
-        # Métriques
-        self._request_count = 0
-        self._error_count = 0
-        self._total_response_time = 0.0
-        self._last_request_time: Optional[datetime] = None
-        
-        # Historique des requêtes (limité)
-        self._request_history: List[ApiResponse] = []
-        self._max_history_size = 100
-        self._history_lock = threading.RLock()
+        # Métriques (compteurs par thread, latences par endpoint) et historique
+        # limité aux métadonnées des derniers appels
+        self.metrics = ProxyMetrics(history_size=100)
+        # Un collecteur par instance (label 'proxy') : un proxy temporaire ne
+        # masque ni ne retire celui du service
+        self._proxy_id = str(next(_proxy_ids))
+        get_metrics_registry().register_collector(f'api_proxy:{self._proxy_id}', self.collect_metrics)
         
         self.logger.info(f"ApiProxyService initialized for base URL: {self.base_url}")
     
@@ -208,19 +241,19 @@ class ApiProxyService:
     def _request_context(self, request: ApiRequest):
         """Context manager pour traquer les requêtes"""
         start_time = time.time()
-        self._request_count += 1
-        self._last_request_time = datetime.utcnow()
+        self.metrics.requests.add()
+        self.metrics.last_request_time = datetime.utcnow()
         
         try:
             self.logger.debug(f"Starting API request: {request.method.value} {request.endpoint}")
             yield
         except Exception as e:
-            self._error_count += 1
+            self.metrics.errors.add()
             self.logger.error(f"API request failed: {e}")
             raise
         finally:
             response_time = time.time() - start_time
-            self._total_response_time += response_time
+            self.metrics.response_time.add(response_time)
             self.logger.debug(f"API request completed in {response_time:.3f}s")
     
     def proxy_request(self, endpoint: str, method: str = "GET", 
@@ -244,7 +277,8 @@ class ApiProxyService:
             use_auth: Utiliser l'authentification
             
         Returns:
-            ApiResponse avec la réponse de l'API
+            ApiResponse avec la réponse de l'API (les données servies depuis
+            le cache sont partagées et ne doivent pas être modifiées)
             
         Raises:
             ApiError: Si la requête échoue définitivement
@@ -257,70 +291,527 @@ class ApiProxyService:
             data=data,
             params=params,
             headers=headers,
-            timeout=timeout or self.timeout,
+            timeout=timeout or self._get_request_timeout(endpoint),
             retry_count=retry_count
         )
         
-        with self._request_context(api_request):
-            return self._execute_request_with_retry(api_request, use_auth)
+        # Clé de regroupement calculée avant l'ajout des headers conditionnels
+        flight_key = None
+        if self._single_flight is not None and request_method in self.coalesce_methods:
+            flight_key = self.coalesce_key(api_request, use_auth)
+        
+        # Consulter le cache pour les GET d'endpoints ayant une politique
+        cache_key = None
+        if (self.response_cache is not None and request_method == RequestMethod.GET
+                and self.response_cache.is_cacheable(endpoint)):
+            identity = self._get_cache_identity() if use_auth else None
+            cache_key = self.response_cache.make_key(request_method.value, endpoint, params, identity)
+            
+            bypass = 'no-cache' in {k.lower(): v for k, v in (headers or {}).items()}.get('cache-control', '')
+            if not bypass:
+                entry, state = self.response_cache.lookup(cache_key)
+                if state == CACHE_FRESH:
+                    return self._response_from_cache(entry, api_request, "HIT")
+                if state == CACHE_STALE:
+                    self._schedule_revalidation(cache_key, api_request, entry, use_auth)
+                    return self._response_from_cache(entry, api_request, "STALE")
+                if state == CACHE_EXPIRED:
+                    api_request.headers = dict(headers or {}, **entry.conditional_headers())
+        
+        if flight_key is None:
+            return self._fetch(api_request, use_auth, cache_key)
+        
+        response, shared = self._single_flight.do(
+            flight_key, lambda: self._fetch(api_request, use_auth, cache_key)
+        )
+        if shared:
+            self.logger.debug(f"Coalesced request: {request_method.value} {endpoint}")
+        return response
+    
+    def _fetch(self, request: ApiRequest, use_auth: bool, cache_key: Optional[str]) -> ApiResponse:
+        """Envoie la requête vers l'API et met à jour le cache"""
+        with self._request_context(request):
+            response = self._execute_request_with_retry(request, use_auth)
+        
+        if cache_key is not None:
+            response = self._update_cache(cache_key, request, response)
+        return response
+    
+    def _default_coalesce_key(self, request: ApiRequest, use_auth: bool) -> Optional[Hashable]:
+        """
+        Clé de regroupement par défaut
+        
+        Les requêtes sont regroupées si elles ont la même méthode, le même
+        endpoint, les mêmes paramètres et headers et la même identité
+        d'authentification. Les requêtes avec un corps ne sont pas regroupées.
+        """
+        if request.data:
+            return None
+        
+        identity = self._get_cache_identity() if use_auth else None
+        return (
+            ResponseCache.make_key(request.method.value, request.endpoint, request.params, identity),
+            tuple(sorted((request.headers or {}).items()))
+        )
+    
+    def proxy_stream(self, endpoint: str, method: str = "GET",
+                     data: Optional[Dict[str, Any]] = None,
+                     params: Optional[Dict[str, str]] = None,
+                     headers: Optional[Dict[str, str]] = None,
+                     timeout: Optional[int] = None,
+                     use_auth: bool = True,
+                     accept_encoding: Optional[str] = None) -> StreamedResponse:
+        """
+        Effectue une requête proxy dont le corps est transmis en flux
+        
+        Le corps amont n'est ni bufferisé ni parsé : il est relu par blocs de
+        API_STREAM_CHUNK_SIZE octets au fil de la consommation de `chunks`.
+        Si `accept_encoding` est fourni (Accept-Encoding du client), il est
+        transmis en amont et le corps compressé (gzip, br...) est relayé tel
+        quel avec son Content-Encoding ; sinon le corps est décompressé.
+        Il n'y a ni cache ni retry : proxy_request reste le mode à utiliser
+        quand la réponse doit être lue ou transformée.
+        
+        Args:
+            endpoint: Endpoint de l'API (relatif à base_url)
+            method: Méthode HTTP
+            data: Données à envoyer (pour POST/PUT)
+            params: Paramètres de requête
+            headers: Headers additionnels
+            timeout: Timeout spécifique (connexion et entre deux blocs)
+            use_auth: Utiliser l'authentification
+            accept_encoding: Encodages acceptés par le client final
+            
+        Returns:
+            StreamedResponse dont le flux doit être consommé ou fermé
+            
+        Raises:
+            ValidationError: Si l'endpoint ne désigne pas un chemin de l'API
+            ApiCircuitOpenError: Si le disjoncteur du groupe d'endpoints est ouvert
+            ApiError: Si la connexion à l'API échoue
+        """
+        # L'endpoint vient du client : il ne doit pas sortir de base_url, sous
+        # peine d'envoyer le token d'authentification à un hôte arbitraire
+        url = self._build_url(endpoint)
+        api_request = ApiRequest(
+            method=RequestMethod(method.upper()),
+            endpoint=endpoint,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=timeout or self._get_request_timeout(endpoint)
+        )
+        
+        group = self._get_endpoint_group(endpoint)
+        breaker = self._get_circuit_breaker(group)
+        if not breaker.allow_request():
+            raise ApiCircuitOpenError(group, breaker.retry_after())
+        
+        wait_time = self.rate_limits.reserve(endpoint)
+        if wait_time > 0:
+            self.logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
+            time.sleep(wait_time)
+        
+        request_headers = self._build_headers(api_request, use_auth)
+        decode_content = accept_encoding is None
+        if not decode_content:
+            request_headers['Accept-Encoding'] = accept_encoding
+        
+        # Le contexte de requête reste ouvert jusqu'à la fin du flux
+        request_context = ExitStack()
+        request_context.enter_context(self._request_context(api_request))
+        start_time = time.time()
+        
+        try:
+            upstream = self.session.request(
+                method=api_request.method.value,
+                url=url,
+                json=self._json_body(api_request),
+                params=params,
+                headers=request_headers,
+                timeout=api_request.timeout,
+                stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            breaker.record_failure()
+            error = self._handle_request_exception(e, endpoint)
+            with request_context:
+                raise error
+        
+        time_to_headers = time.time() - start_time
+        if not upstream.ok:
+            self.metrics.errors.add()
+        if upstream.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            if upstream.ok:
+                self._get_adaptive_timeout(group).record(time_to_headers)
+        
+        response_headers = {
+            name: value for name, value in upstream.headers.items()
+            if name.lower() in STREAM_PASSTHROUGH_HEADERS
+        }
+        if decode_content:
+            # Corps décompressé : taille et encodage amont ne s'appliquent plus
+            response_headers = {
+                name: value for name, value in response_headers.items()
+                if name.lower() not in ('content-encoding', 'content-length')
+            }
+        
+        def chunks() -> Iterator[bytes]:
+            received = 0
+            with request_context:
+                try:
+                    for chunk in upstream.raw.stream(self.config.API_STREAM_CHUNK_SIZE,
+                                                     decode_content=decode_content):
+                        received += len(chunk)
+                        yield chunk
+                except Exception as e:
+                    self.logger.error(f"Streaming from {endpoint} interrupted: {e}")
+                    raise
+                finally:
+                    upstream.close()
+                    self._add_to_history(ApiResponse(
+                        status_code=upstream.status_code,
+                        response_time=time.time() - start_time,
+                        request=api_request,
+                        bytes_in=received,
+                        bytes_out=self._body_size(getattr(upstream.request, 'body', None))
+                    ))
+        
+        def release() -> None:
+            # Flux jamais consommé : libérer la connexion et clore le contexte
+            upstream.close()
+            request_context.close()
+        
+        return StreamedResponse(
+            status_code=upstream.status_code,
+            headers=response_headers,
+            chunks=chunks(),
+            request=api_request,
+            release=release
+        )
+    
+    def proxy_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Exécute plusieurs requêtes proxy en parallèle
+        
+        Chaque élément passe par proxy_request (limitation de taux, cache,
+        regroupement) ; l'échec d'un élément n'affecte pas les autres.
+        
+        Args:
+            items: Requêtes ({'id', 'endpoint', 'method', 'params', 'data', 'timeout', 'retry_count'})
+            
+        Returns:
+            Résultats dans l'ordre des requêtes, chacun avec son statut
+            ('ok' ou 'error'), son code HTTP et ses données ou son erreur
+        """
+        if not items:
+            return []
+        
+        if len(items) == 1:
+            return [self._run_batch_item(0, items[0])]
+        
+        # Chaque élément s'exécute dans une copie du contexte courant : ses
+        # spans restent rattachés à la trace de la requête appelante
+        executor = self._get_batch_executor()
+        futures = [
+            executor.submit(contextvars.copy_context().run, self._run_batch_item, index, item)
+            for index, item in enumerate(items)
+        ]
+        return [future.result() for future in futures]
+    
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        """Retourne le pool de threads partagé des requêtes groupées"""
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=self.batch_max_concurrency,
+                    thread_name_prefix="api-batch"
+                )
+            return self._batch_executor
+    
+    def _run_batch_item(self, index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Exécute un élément d'une requête groupée et formate son résultat"""
+        item_id = item.get('id', index) if isinstance(item, dict) else index
+        result: Dict[str, Any] = {'id': item_id}
+        
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Batch item must be an object")
+            
+            endpoint = item.get('endpoint')
+            if not is_relative_endpoint(endpoint):
+                raise ValueError("'endpoint' must be a path relative to the API base URL")
+            
+            method = str(item.get('method', 'GET')).upper()
+            if method not in RequestMethod.__members__:
+                raise ValueError(f"Unsupported method: {method}")
+            
+            params = item.get('params')
+            data = item.get('data')
+            if params is not None and not isinstance(params, dict):
+                raise ValueError("'params' must be an object")
+            if data is not None and not isinstance(data, dict):
+                raise ValueError("'data' must be an object")
+            
+            timeout = item.get('timeout')
+            if timeout is not None:
+                timeout = min(float(timeout), self.timeout)
+            retry_count = max(0, min(int(item.get('retry_count', 3)), 3))
+            
+        except (ValueError, TypeError) as e:
+            result.update({
+                'status': 'error',
+                'status_code': None,
+                'error': {'code': 'INVALID_REQUEST', 'message': str(e)}
+            })
+            return result
+        
+        try:
+            response = self.proxy_request(
+                endpoint, method, data=data, params=params, timeout=timeout, retry_count=retry_count
+            )
+        except AxiomTradeException as e:
+            result.update({
+                'status': 'error',
+                'status_code': None,
+                'error': {'code': e.code, 'message': e.message}
+            })
+            return result
+        except Exception as e:
+            self.logger.error(f"Batch item {item_id} failed: {e}")
+            result.update({
+                'status': 'error',
+                'status_code': None,
+                'error': {'code': 'PROXY_ERROR', 'message': str(e)}
+            })
+            return result
+        
+        result.update({
+            'status': 'ok' if response.is_success() else 'error',
+            'status_code': response.status_code,
+            'data': response.data,
+            'response_time': response.response_time
+        })
+        if not response.is_success():
+            result['error'] = {
+                'code': 'UPSTREAM_ERROR',
+                'message': response.error_message or f"HTTP {response.status_code}"
+            }
+        if response.headers and 'X-Cache' in response.headers:
+            result['cache'] = response.headers['X-Cache']
+        return result
+    
+    def _build_url(self, endpoint: str) -> str:
+        """
+        Construit l'URL amont d'un endpoint fourni par un client
+        
+        Raises:
+            ValidationError: Si l'endpoint n'est pas un chemin relatif à base_url
+        """
+        url = urljoin(self.base_url, endpoint.lstrip('/')) if is_relative_endpoint(endpoint) else None
+        if url is None or urlparse(url).netloc != urlparse(self.base_url).netloc:
+            raise ValidationError('endpoint', endpoint, "must be a path relative to the API base URL")
+        return url
+    
+    def _get_cache_identity(self) -> Optional[str]:
+        """
+        Retourne l'identité d'authentification utilisée dans les clés de cache
+        
+        Elle est dérivée du token d'accès courant : après un changement de
+        token, les réponses mises en cache pour le précédent ne sont plus servies.
+        """
+        try:
+            return ResponseCache.make_identity(self._get_full_access_token())
+        except ApiAuthenticationError:
+            return None
+    
+    def _response_from_cache(self, entry: CacheEntry, request: ApiRequest, cache_status: str,
+                             response_time: float = 0.0) -> ApiResponse:
+        """Construit une réponse à partir d'une entrée du cache"""
+        error_message = None
+        if entry.status_code >= 400:
+            error_message = (entry.data or {}).get('message') or "Not Found"
+        
+        return ApiResponse(
+            status_code=entry.status_code,
+            data=entry.data,
+            headers=dict(entry.headers, **{'X-Cache': cache_status}),
+            error_message=error_message,
+            response_time=response_time,
+            request=request
+        )
+    
+    def _update_cache(self, cache_key: str, request: ApiRequest, response: ApiResponse) -> ApiResponse:
+        """
+        Met à jour le cache avec la réponse de l'API
+        
+        Returns:
+            La réponse à renvoyer (l'entrée rafraîchie en cas de 304)
+        """
+        if response.status_code == 304:
+            entry = self.response_cache.refresh(cache_key, request.endpoint, response.headers)
+            if entry is not None:
+                return self._response_from_cache(entry, request, "REVALIDATED", response.response_time)
+            return response
+        
+        self.response_cache.store(
+            cache_key, request.endpoint, response.status_code, response.data, response.headers
+        )
+        return response
+    
+    def _schedule_revalidation(self, cache_key: str, request: ApiRequest,
+                               entry: CacheEntry, use_auth: bool) -> None:
+        """Revalide une entrée périmée en arrière-plan (une seule revalidation par clé)"""
+        if not self.response_cache.begin_revalidation(cache_key):
+            return
+        
+        revalidation_request = ApiRequest(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=request.params,
+            headers=dict(request.headers or {}, **entry.conditional_headers()),
+            timeout=request.timeout,
+            retry_count=0
+        )
+        
+        def revalidate():
+            try:
+                with self._request_context(revalidation_request):
+                    response = self._execute_request_with_retry(revalidation_request, use_auth)
+                self._update_cache(cache_key, revalidation_request, response)
+            except Exception as e:
+                self.logger.warning(f"Background revalidation failed for {request.endpoint}: {e}")
+            finally:
+                self.response_cache.end_revalidation(cache_key)
+        
+        threading.Thread(target=revalidate, name="api-cache-revalidate", daemon=True).start()
     
     def _execute_request_with_retry(self, request: ApiRequest, use_auth: bool) -> ApiResponse:
-        """Exécute une requête avec retry automatique"""
+        """
+        Exécute une requête avec retry automatique
+        
+        Le disjoncteur du groupe d'endpoints refuse immédiatement les appels
+        quand l'API est dégradée, et les retries sont limités par le budget
+        de retry partagé.
+        """
+        group = self._get_endpoint_group(request.endpoint)
+        breaker = self._get_circuit_breaker(group)
+        self.retry_budget.record_request()
         last_exception = None
         
-        for attempt in range(request.retry_count + 1):
-            try:
-                # Vérifier la limitation de taux
-                if not self.rate_limiter.can_make_request():
-                    wait_time = self.rate_limiter.get_wait_time()
+        # Un span par requête proxy ; chaque tentative, attente du rate limiter
+        # et backoff y apparaît comme span enfant
+        tracer = get_tracer()
+        with tracer.start_span(f"proxy {request.method.value} {group}",
+                               tags={'endpoint': request.endpoint, 'group': group}) as span:
+            for attempt in range(request.retry_count + 1):
+                if not breaker.allow_request():
+                    if last_exception is None:
+                        raise ApiCircuitOpenError(group, breaker.retry_after())
+                    break
+                
+                try:
+                    # Réserver un jeton dans chaque budget concerné
+                    wait_time = self.rate_limits.reserve(request.endpoint)
                     if wait_time > 0:
                         self.logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
-                        time.sleep(wait_time)
+                        with tracer.start_span('proxy.rate_limit_wait', tags={'seconds': round(wait_time, 3)}):
+                            time.sleep(wait_time)
+                    
+                    # Exécuter la requête
+                    response = self._execute_single_request(request, use_auth)
+                    
+                    # Ajouter à l'historique
+                    self._add_to_history(response)
+                    
+                    # Informer le disjoncteur et le timeout adaptatif
+                    if response.is_server_error():
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                        if response.is_success() and response.response_time is not None:
+                            self._get_adaptive_timeout(group).record(response.response_time)
+                    
+                    # Vérifier si on doit retry
+                    if response.is_success() or not self._should_retry(response, attempt):
+                        return response
+                    
+                    last_exception = ApiError(f"Request failed with status {response.status_code}")
+                    
+                except requests.exceptions.RequestException as e:
+                    breaker.record_failure()
+                    last_exception = self._handle_request_exception(e, request.endpoint)
                 
-                # Exécuter la requête
-                response = self._execute_single_request(request, use_auth)
+                except Exception as e:
+                    last_exception = ApiError(f"Unexpected error during request: {e}")
+                    break
                 
-                # Enregistrer la requête
-                self.rate_limiter.record_request()
-                
-                # Ajouter à l'historique
-                self._add_to_history(response)
-                
-                # Vérifier si on doit retry
-                if response.is_success() or not self._should_retry(response, attempt):
-                    return response
-                
-                # Préparer le retry
+                # Préparer le retry, sauf si le disjoncteur s'est ouvert ou si le budget est épuisé
                 if attempt < request.retry_count:
+                    if breaker.state == CircuitState.OPEN:
+                        self.logger.warning(f"Circuit opened for '{group}', not retrying {request.endpoint}")
+                        break
+                    if not self.retry_budget.try_retry():
+                        self.logger.warning(f"Retry budget exhausted, not retrying {request.endpoint}")
+                        break
+                    
                     wait_time = self._calculate_backoff_time(attempt)
                     self.logger.warning(
                         f"Request failed (attempt {attempt + 1}/{request.retry_count + 1}), "
-                        f"retrying in {wait_time:.1f}s. Status: {response.status_code}"
+                        f"retrying in {wait_time:.1f}s: {last_exception}"
                     )
-                    time.sleep(wait_time)
-                
-                last_exception = ApiError(f"Request failed with status {response.status_code}")
-                
-            except requests.exceptions.RequestException as e:
-                last_exception = self._handle_request_exception(e, request.endpoint)
-                
-                if attempt < request.retry_count:
-                    wait_time = self._calculate_backoff_time(attempt)
-                    self.logger.warning(
-                        f"Request exception (attempt {attempt + 1}/{request.retry_count + 1}), "
-                        f"retrying in {wait_time:.1f}s: {e}"
-                    )
-                    time.sleep(wait_time)
+                    span.set_tag('retries', attempt + 1)
+                    with tracer.start_span('proxy.backoff', tags={'seconds': round(wait_time, 3)}):
+                        time.sleep(wait_time)
             
-            except Exception as e:
-                last_exception = ApiError(f"Unexpected error during request: {e}")
-                break
-        
-        # Toutes les tentatives ont échoué
-        if last_exception:
-            raise last_exception
-        else:
-            raise ApiError("Request failed after all retry attempts")
+            # Toutes les tentatives ont échoué
+            if last_exception:
+                raise last_exception
+            else:
+                raise ApiError("Request failed after all retry attempts")
+    
+    def _get_endpoint_group(self, endpoint: str) -> str:
+        """Retourne le groupe d'endpoints (classe de budget ou 'default')"""
+        return self.rate_limits.classify(endpoint) or "default"
+    
+    def _get_circuit_breaker(self, group: str) -> CircuitBreaker:
+        """Retourne le disjoncteur d'un groupe d'endpoints"""
+        breaker = self.circuit_breakers.get(group)
+        if breaker is None:
+            with self._resilience_lock:
+                breaker = self.circuit_breakers.get(group)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        group,
+                        failure_threshold=self.config.API_CIRCUIT_FAILURE_THRESHOLD,
+                        minimum_calls=self.config.API_CIRCUIT_MINIMUM_CALLS,
+                        open_duration=self.config.API_CIRCUIT_OPEN_SECONDS
+                    )
+                    self.circuit_breakers[group] = breaker
+        return breaker
+    
+    def _get_adaptive_timeout(self, group: str) -> AdaptiveTimeout:
+        """Retourne le timeout adaptatif d'un groupe d'endpoints"""
+        adaptive = self.adaptive_timeouts.get(group)
+        if adaptive is None:
+            with self._resilience_lock:
+                adaptive = self.adaptive_timeouts.get(group)
+                if adaptive is None:
+                    adaptive = AdaptiveTimeout(
+                        max_timeout=self.timeout,
+                        min_timeout=self.config.API_ADAPTIVE_TIMEOUT_MIN
+                    )
+                    self.adaptive_timeouts[group] = adaptive
+        return adaptive
+    
+    def _get_request_timeout(self, endpoint: str) -> float:
+        """Retourne le timeout à appliquer à un endpoint"""
+        if not self.config.API_ADAPTIVE_TIMEOUT:
+            return self.timeout
+        return self._get_adaptive_timeout(self._get_endpoint_group(endpoint)).timeout
     
     def _execute_single_request(self, request: ApiRequest, use_auth: bool) -> ApiResponse:
         """Exécute une seule requête"""
@@ -329,31 +820,24 @@ class ApiProxyService:
         # Construire l'URL complète
         url = urljoin(self.base_url, request.endpoint.lstrip('/'))
         
-        # Préparer les headers
-        headers = dict(self.session.headers)
-        if request.headers:
-            headers.update(request.headers)
+        # Préparer les headers et les données
+        headers = self._build_headers(request, use_auth)
+        json_data = self._json_body(request)
         
-        # Ajouter l'authentification si nécessaire
-        if use_auth:
-            auth_headers = self._get_auth_headers()
-            headers.update(auth_headers)
-        
-        # Préparer les données
-        json_data = None
-        if request.data and request.method in [RequestMethod.POST, RequestMethod.PUT, RequestMethod.PATCH]:
-            json_data = request.data
-        
-        # Effectuer la requête
-        with log_performance(self.logger, f"HTTP {request.method.value} {url}"):
-            response = self.session.request(
-                method=request.method.value,
-                url=url,
-                json=json_data,
-                params=request.params,
-                headers=headers,
-                timeout=request.timeout
-            )
+        # Effectuer la requête (une tentative = un span client)
+        with get_tracer().start_span(f"HTTP {request.method.value}", kind=SPAN_KIND_CLIENT,
+                                     tags={'http.url': url}) as span:
+            operation = f"HTTP {request.method.value} {self._get_endpoint_group(request.endpoint)}"
+            with log_performance(self.logger, operation, {'url': url}):
+                response = self.session.request(
+                    method=request.method.value,
+                    url=url,
+                    json=json_data,
+                    params=request.params,
+                    headers=headers,
+                    timeout=request.timeout
+                )
+            span.set_tag('http.status_code', response.status_code)
         
         response_time = time.time() - start_time
         
@@ -377,9 +861,43 @@ class ApiProxyService:
             headers=dict(response.headers),
             error_message=error_message,
             response_time=response_time,
-            request=request
+            request=request,
+            bytes_in=self._content_size(response),
+            bytes_out=self._body_size(getattr(response.request, 'body', None))
         )
     
+    def _build_headers(self, request: ApiRequest, use_auth: bool) -> Dict[str, str]:
+        """Construit les headers d'une requête (session, requête, authentification)"""
+        headers = dict(self.session.headers)
+        if request.headers:
+            headers.update(request.headers)
+        
+        # Ajouter l'authentification si nécessaire
+        if use_auth:
+            headers.update(self._get_auth_headers())
+        return headers
+    
+    @staticmethod
+    def _json_body(request: ApiRequest) -> Optional[Dict[str, Any]]:
+        """Retourne le corps JSON de la requête pour les méthodes qui en ont un"""
+        if request.data and request.method in [RequestMethod.POST, RequestMethod.PUT, RequestMethod.PATCH]:
+            return request.data
+        return None
+    
+    @staticmethod
+    def _content_size(response: requests.Response) -> int:
+        """Taille du corps de réponse reçu, en octets"""
+        length = response.headers.get('content-length')
+        if length is not None and str(length).isdigit():
+            return int(length)
+        content = getattr(response, 'content', None)
+        return len(content) if isinstance(content, (bytes, str)) else 0
+    
+    @staticmethod
+    def _body_size(body: Any) -> int:
+        """Taille du corps de requête envoyé, en octets"""
+        return len(body) if isinstance(body, (bytes, str)) else 0
+    
     def _get_auth_headers(self) -> Dict[str, str]:
         """
         Récupère les headers d'authentification
@@ -400,10 +918,6 @@ class ApiProxyService:
             if not tokens or not tokens.get('access_token_preview'):
                 raise ApiAuthenticationError("", 401)
             
-            # Récupérer le token complet depuis le service
-            # Note: Dans un vrai scénario, il faudrait une méthode pour récupérer le token complet
-            # Pour l'instant, on utilise une approche simplifiée
-            
             return {
                 'Authorization': f'Bearer {self._get_full_access_token()}'
             }
@@ -417,14 +931,15 @@ class ApiProxyService:
         Récupère le token d'accès complet
         
         Returns:
-            Token d'accès complet
+            Token d'accès du snapshot courant du TokenService
             
-        Note: Cette méthode devrait être implémentée pour récupérer
-              le token complet depuis le TokenService
+        Raises:
+            ApiAuthenticationError: Si aucun token n'est disponible
         """
-        # TODO: Implémenter la récupération du token complet
-        # Pour l'instant, on retourne un placeholder
-        return "placeholder_token"
+        model = self.token_service.get_snapshot().model
+        if model is None or not model.access_token:
+            raise ApiAuthenticationError("", 401)
+        return model.access_token
     
     def _should_retry(self, response: ApiResponse, attempt: int) -> bool:
         """Détermine si on doit retry une requête"""
@@ -459,13 +974,18 @@ class ApiProxyService:
             return ApiError(f"Request error: {exception}")
     
     def _add_to_history(self, response: ApiResponse) -> None:
-        """Ajoute une réponse à l'historique"""
-        with self._history_lock:
-            self._request_history.append(response)
-            
-            # Limiter la taille de l'historique
-            if len(self._request_history) > self._max_history_size:
-                self._request_history = self._request_history[-self._max_history_size:]
+        """Enregistre les métadonnées d'une réponse (historique, latences, octets)"""
+        request = response.request
+        self.metrics.record_call(RequestRecord(
+            method=request.method.value if request else "",
+            endpoint=request.endpoint if request else "",
+            status_code=response.status_code,
+            response_time=response.response_time,
+            bytes_in=response.bytes_in,
+            bytes_out=response.bytes_out,
+            error_message=response.error_message[:200] if response.error_message else None,
+            timestamp=response.timestamp
+        ))
     
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -474,31 +994,34 @@ class ApiProxyService:
         Returns:
             Dictionnaire avec les métriques
         """
-        avg_response_time = (
-            self._total_response_time / self._request_count 
-            if self._request_count > 0 else 0.0
-        )
-        
-        error_rate = (
-            self._error_count / self._request_count 
-            if self._request_count > 0 else 0.0
-        )
-        
         return {
-            'total_requests': self._request_count,
-            'total_errors': self._error_count,
-            'error_rate': error_rate,
-            'average_response_time': avg_response_time,
-            'last_request_time': self._last_request_time.isoformat() if self._last_request_time else None,
-            'rate_limiter': {
-                'max_requests': self.rate_limiter.max_requests,
-                'time_window': self.rate_limiter.time_window,
-                'current_requests': len(self.rate_limiter.requests),
-                'can_make_request': self.rate_limiter.can_make_request(),
-                'wait_time': self.rate_limiter.get_wait_time()
-            }
+            **self.metrics.get_summary(),
+            'endpoints': self.metrics.get_endpoint_stats(),
+            'rate_limiter': self.rate_limits.get_state(),
+            'response_cache': self.response_cache.get_stats() if self.response_cache else None,
+            'coalescing': self._single_flight.get_stats() if self._single_flight else None,
+            'circuit_breakers': {
+                group: dict(
+                    breaker.get_state(),
+                    timeout=self._get_adaptive_timeout(group).timeout
+                )
+                for group, breaker in list(self.circuit_breakers.items())
+            },
+            'retry_budget': self.retry_budget.get_state()
         }
     
+    def collect_metrics(self) -> List[MetricFamily]:
+        """
+        Retourne les métriques du proxy et du cache pour le registre de métriques
+        
+        Returns:
+            Familles de métriques exposées sur /metrics
+        """
+        families = self.metrics.collect_metrics('api_proxy')
+        if self.response_cache is not None:
+            families.extend(self.response_cache.collect_metrics('api_proxy_cache'))
+        return with_labels(families, {'proxy': self._proxy_id})
+    
     def get_request_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Retourne l'historique des requêtes
@@ -507,24 +1030,18 @@ class ApiProxyService:
             limit: Nombre maximum de requêtes à retourner
             
         Returns:
-            Liste des requêtes récentes
+            Liste des métadonnées des requêtes récentes (sans les payloads)
         """
-        with self._history_lock:
-            recent_requests = self._request_history[-limit:] if limit > 0 else self._request_history
-            return [response.to_dict() for response in recent_requests]
+        return self.metrics.get_history(limit)
     
     def clear_history(self) -> None:
         """Efface l'historique des requêtes"""
-        with self._history_lock:
-            self._request_history.clear()
+        self.metrics.clear_history()
         self.logger.info("Request history cleared")
     
     def reset_metrics(self) -> None:
         """Remet à zéro les métriques"""
-        self._request_count = 0
-        self._error_count = 0
-        self._total_response_time = 0.0
-        self._last_request_time = None
+        self.metrics.reset()
         self.logger.info("Metrics reset")
     
     def health_check(self) -> Dict[str, Any]:
@@ -561,7 +1078,14 @@ class ApiProxyService:
     def cleanup(self) -> None:
         """Nettoie les ressources du service"""
         try:
+            get_metrics_registry().unregister_collector(f'api_proxy:{self._proxy_id}', self.collect_metrics)
             self.session.close()
+            self.rate_limits.close()
+            if self.response_cache is not None:
+                self.response_cache.clear()
+            if self._batch_executor is not None:
+                self._batch_executor.shutdown(wait=False)
+                self._batch_executor = None
             self.logger.info("ApiProxyService cleanup completed")
         except Exception as e:
             self.logger.warning(f"Error during cleanup: {e}")
@@ -596,9 +1120,13 @@ def test_api_connection(config: Config, token_service: TokenService) -> bool:
     Returns:
         True si la connexion fonctionne
     """
+    proxy = None
     try:
         proxy = create_api_proxy(config, token_service)
         health_result = proxy.health_check()
         return health_result['status'] == 'healthy'
     except Exception:
-        return False
\ No newline at end of file
+        return False
+    finally:
+        if proxy is not None:
+            proxy.cleanup()
\ No newline at end of file
@@ -0,0 +1,602 @@
+"""
+Service proxy asynchrone pour l'API Axiom Trade
+"""
+import asyncio
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
+from urllib.parse import urljoin, urlparse
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401  (requis par httpx pour HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from ..core.config import Config, get_config
+from ..core.metrics_registry import MetricFamily, get_metrics_registry, with_labels
+from ..core.exceptions import (
+    ApiError, ApiConnectionError, ApiAuthenticationError, ApiDeadlineExceededError
+)
+from .api_proxy_service import ApiRequest, ApiResponse, RequestMethod
+from .rate_limiter import ApiRateLimits
+from .proxy_metrics import ProxyMetrics, RequestRecord
+from .token_service import TokenService
+
+
+# Échéance (time.monotonic) héritée par les requêtes de la tâche courante
+_current_deadline: ContextVar[Optional[float]] = ContextVar('api_request_deadline', default=None)
+
+# Identifiants des instances de proxy (label 'proxy' des métriques)
+_proxy_ids = itertools.count(1)
+
+
+@contextmanager
+def request_deadline(seconds: float):
+    """
+    Fixe une échéance pour toutes les requêtes émises dans le bloc
+
+    L'échéance est portée par une variable de contexte : elle suit les
+    coroutines appelées et les tâches créées dans le bloc. Une échéance
+    imbriquée ne peut que raccourcir l'échéance englobante.
+
+    Args:
+        seconds: Temps disponible à partir de maintenant
+    """
+    deadline = time.monotonic() + seconds
+    outer = _current_deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+class _AiohttpTransport:
+    """Transport HTTP/1.1 avec pool de connexions keep-alive (aiohttp)"""
+
+    protocol = "HTTP/1.1"
+
+    def __init__(self, max_connections: int, max_connections_per_host: int,
+                 keepalive_timeout: float, headers: Dict[str, str]):
+        connector = aiohttp.TCPConnector(
+            limit=max_connections,
+            limit_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(connector=connector, headers=headers)
+        self.errors: Tuple[type, ...] = (aiohttp.ClientError, asyncio.TimeoutError)
+
+    async def send(self, method: str, url: str, params: Optional[Dict[str, str]],
+                   body: Optional[bytes], headers: Dict[str, str],
+                   timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+        async with self._session.request(
+            method, url, params=params, data=body, headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            body = await response.read()
+            return response.status, dict(response.headers), body
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+class _HttpxTransport:
+    """Transport HTTP/2 multiplexé (httpx + h2)"""
+
+    protocol = "HTTP/2"
+
+    def __init__(self, max_connections: int, max_connections_per_host: int,
+                 keepalive_timeout: float, headers: Dict[str, str]):
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections_per_host,
+                keepalive_expiry=keepalive_timeout
+            )
+        )
+        self.errors: Tuple[type, ...] = (httpx.HTTPError, asyncio.TimeoutError)
+
+    async def send(self, method: str, url: str, params: Optional[Dict[str, str]],
+                   body: Optional[bytes], headers: Dict[str, str],
+                   timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+        response = await self._client.request(
+            method, url, params=params, content=body, headers=headers, timeout=timeout
+        )
+        return response.status_code, dict(response.headers), response.content
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class AsyncApiProxyService:
+    """
+    Service proxy asynchrone pour l'API Axiom Trade
+
+    Pendant asyncio d'ApiProxyService pour les bots et services
+    asynchrones : une seule boucle soutient des centaines de requêtes
+    simultanées sans thread par requête.
+
+    Fonctionnalités:
+    - Pool de connexions keep-alive partagé (HTTP/2 si httpx et h2 sont installés)
+    - Sémaphore de concurrence par hôte
+    - Limitation de taux (budgets global et par classe d'endpoint)
+    - Retry avec backoff exponentiel non bloquant et jitter
+    - Propagation d'échéance (paramètre `deadline` ou `request_deadline()`)
+
+    Les bots obtiennent l'instance partagée de leur boucle par
+    acquire_async_api_proxy().
+    """
+
+    def __init__(self, config: Config, token_service: TokenService,
+                 logger: Optional[logging.Logger] = None,
+                 sleep: Optional[Callable[[float], Awaitable[Any]]] = None):
+        """
+        Initialise le service proxy asynchrone
+
+        Args:
+            config: Configuration de l'application
+            token_service: Service de gestion des tokens
+            logger: Logger optionnel
+            sleep: Attente non bloquante des backoffs et limites de taux
+                (asyncio.sleep par défaut)
+        """
+        self.config = config
+        self.token_service = token_service
+        self.logger = logger or logging.getLogger(__name__)
+        self._sleep = sleep or asyncio.sleep
+
+        # Configuration API
+        self.base_url = config.AXIOM_API_BASE_URL
+        self.timeout = config.API_TIMEOUT
+
+        # Pool de connexions et concurrence
+        self.max_connections = config.API_ASYNC_MAX_CONNECTIONS
+        self.max_connections_per_host = config.API_ASYNC_MAX_CONNECTIONS_PER_HOST
+        self.keepalive_timeout = config.API_ASYNC_KEEPALIVE_TIMEOUT
+        self.use_http2 = config.API_ASYNC_HTTP2 and HTTP2_AVAILABLE
+        self._transport = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        if not self.use_http2 and not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncApiProxyService: pip install aiohttp")
+
+        # Limitation de taux (mêmes budgets que le proxy synchrone)
+        self.rate_limits = ApiRateLimits.from_config(config)
+
+        self.default_headers = {
+            'User-Agent': 'AxiomTrade-Client/2.0',
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
+
+        # Métriques (latences par endpoint) et historique limité aux métadonnées
+        self.metrics = ProxyMetrics(history_size=100)
+        # Un collecteur par instance (label 'proxy') : les proxys des
+        # différentes boucles coexistent dans le registre
+        self._proxy_id = str(next(_proxy_ids))
+        get_metrics_registry().register_collector(f'async_api_proxy:{self._proxy_id}', self.collect_metrics)
+        self._deadline_exceeded_count = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+        self.logger.info(f"AsyncApiProxyService initialized for base URL: {self.base_url}")
+
+    async def __aenter__(self) -> 'AsyncApiProxyService':
+        self._get_transport()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def _get_transport(self):
+        """Crée le pool de connexions à la première utilisation (dans la boucle courante)"""
+        if self._transport is None:
+            transport_class = _HttpxTransport if self.use_http2 else _AiohttpTransport
+            self._transport = transport_class(
+                self.max_connections,
+                self.max_connections_per_host,
+                self.keepalive_timeout,
+                self.default_headers
+            )
+            self.logger.debug(f"Async API transport opened ({self._transport.protocol})")
+        return self._transport
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Retourne le sémaphore de concurrence de l'hôte d'une URL"""
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def proxy_request(self, endpoint: str, method: str = "GET",
+                            data: Optional[Dict[str, Any]] = None,
+                            params: Optional[Dict[str, str]] = None,
+                            headers: Optional[Dict[str, str]] = None,
+                            timeout: Optional[float] = None,
+                            retry_count: int = 3,
+                            use_auth: bool = True,
+                            deadline: Optional[float] = None) -> ApiResponse:
+        """
+        Effectue une requête proxy asynchrone vers l'API Axiom Trade
+
+        Args:
+            endpoint: Endpoint de l'API (relatif à base_url)
+            method: Méthode HTTP
+            data: Données à envoyer (pour POST/PUT)
+            params: Paramètres de requête
+            headers: Headers additionnels
+            timeout: Timeout de chaque tentative
+            retry_count: Nombre de tentatives
+            use_auth: Utiliser l'authentification
+            deadline: Échéance absolue (time.monotonic) pour l'ensemble des
+                tentatives, combinée à celle de request_deadline()
+
+        Returns:
+            ApiResponse avec la réponse de l'API
+
+        Raises:
+            ApiDeadlineExceededError: Si l'échéance est dépassée
+            ApiError: Si la requête échoue définitivement
+        """
+        inherited = _current_deadline.get()
+        if inherited is not None:
+            deadline = inherited if deadline is None else min(deadline, inherited)
+
+        api_request = ApiRequest(
+            method=RequestMethod(method.upper()),
+            endpoint=endpoint,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=timeout or self.timeout,
+            retry_count=retry_count
+        )
+
+        start_time = time.monotonic()
+        self.metrics.requests.add()
+        self.metrics.last_request_time = datetime.utcnow()
+
+        try:
+            return await self._execute_request_with_retry(api_request, use_auth, deadline)
+        except ApiDeadlineExceededError:
+            self.metrics.errors.add()
+            self._deadline_exceeded_count += 1
+            raise
+        except Exception as e:
+            self.metrics.errors.add()
+            self.logger.error(f"API request failed: {e}")
+            raise
+        finally:
+            self.metrics.response_time.add(time.monotonic() - start_time)
+
+    async def _execute_request_with_retry(self, request: ApiRequest, use_auth: bool,
+                                          deadline: Optional[float]) -> ApiResponse:
+        """Exécute une requête avec retry et backoff non bloquants"""
+        last_exception: Optional[Exception] = None
+
+        for attempt in range(request.retry_count + 1):
+            # Réserver un jeton dans chaque budget concerné
+            wait_time = self.rate_limits.reserve(request.endpoint)
+            if wait_time > 0:
+                self._check_deadline(deadline, request.endpoint, wait_time)
+                self.logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
+                await self._sleep(wait_time)
+
+            response = None
+            try:
+                response = await self._execute_single_request(request, use_auth, deadline)
+            except ApiError:
+                raise
+            except self._get_transport().errors as e:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ApiDeadlineExceededError(request.endpoint)
+                last_exception = ApiConnectionError(request.endpoint, str(e) or e.__class__.__name__)
+            else:
+                self.metrics.record_call(RequestRecord(
+                    method=request.method.value,
+                    endpoint=request.endpoint,
+                    status_code=response.status_code,
+                    response_time=response.response_time,
+                    bytes_in=response.bytes_in,
+                    bytes_out=response.bytes_out,
+                    error_message=response.error_message[:200] if response.error_message else None,
+                    timestamp=response.timestamp
+                ))
+                if response.is_success() or not self._should_retry(response):
+                    return response
+                last_exception = ApiError(f"Request failed with status {response.status_code}")
+
+            if attempt < request.retry_count:
+                backoff = self._calculate_backoff_time(attempt, response)
+                if deadline is not None and time.monotonic() + backoff >= deadline:
+                    break
+                self.logger.warning(
+                    f"Request failed (attempt {attempt + 1}/{request.retry_count + 1}), "
+                    f"retrying in {backoff:.2f}s: {last_exception}"
+                )
+                await self._sleep(backoff)
+
+        if last_exception:
+            raise last_exception
+        raise ApiError("Request failed after all retry attempts")
+
+    async def _execute_single_request(self, request: ApiRequest, use_auth: bool,
+                                      deadline: Optional[float]) -> ApiResponse:
+        """Exécute une seule requête dans la limite de concurrence de l'hôte"""
+        url = urljoin(self.base_url, request.endpoint.lstrip('/'))
+
+        headers = dict(request.headers or {})
+        if use_auth:
+            headers.update(self._get_auth_headers())
+
+        # Corps encodé une seule fois (sa taille alimente les métriques)
+        request_body = None
+        if request.data and request.method in [RequestMethod.POST, RequestMethod.PUT, RequestMethod.PATCH]:
+            request_body = json.dumps(request.data).encode('utf-8')
+
+        transport = self._get_transport()
+        semaphore = self._get_host_semaphore(url)
+        if deadline is None:
+            await semaphore.acquire()
+        else:
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self._check_deadline(deadline, request.endpoint))
+            except asyncio.TimeoutError:
+                raise ApiDeadlineExceededError(request.endpoint)
+
+        try:
+            # L'échéance restante borne le timeout et est transmise en amont
+            timeout = float(request.timeout)
+            if deadline is not None:
+                remaining = self._check_deadline(deadline, request.endpoint)
+                timeout = min(timeout, remaining)
+                headers['X-Request-Timeout-Ms'] = str(int(remaining * 1000))
+
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            start_time = time.monotonic()
+            try:
+                status_code, response_headers, body = await transport.send(
+                    request.method.value, url, request.params, request_body, headers, timeout
+                )
+            finally:
+                self._in_flight -= 1
+        finally:
+            semaphore.release()
+
+        response_time = time.monotonic() - start_time
+
+        # Parser la réponse
+        response_data = None
+        error_message = None
+        content_type = next(
+            (value for name, value in response_headers.items() if name.lower() == 'content-type'), ''
+        )
+        if content_type.startswith('application/json') and body:
+            try:
+                response_data = json.loads(body)
+            except ValueError:
+                if status_code >= 400:
+                    error_message = f"Invalid JSON response: {body[:200]!r}"
+
+        if status_code >= 400 and error_message is None:
+            if isinstance(response_data, dict) and response_data.get('message'):
+                error_message = response_data['message']
+            else:
+                error_message = body[:200].decode('utf-8', errors='replace')
+
+        return ApiResponse(
+            status_code=status_code,
+            data=response_data,
+            headers=response_headers,
+            error_message=error_message,
+            response_time=response_time,
+            request=request,
+            bytes_in=len(body),
+            bytes_out=len(request_body) if request_body else 0
+        )
+
+    def _check_deadline(self, deadline: Optional[float], endpoint: str, needed: float = 0.0) -> float:
+        """
+        Vérifie qu'il reste assez de temps avant l'échéance
+
+        Returns:
+            Temps restant en secondes (inf sans échéance)
+
+        Raises:
+            ApiDeadlineExceededError: Si le temps restant est insuffisant
+        """
+        if deadline is None:
+            return float('inf')
+        remaining = deadline - time.monotonic()
+        if remaining <= needed:
+            raise ApiDeadlineExceededError(endpoint)
+        return remaining
+
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """
+        Récupère les headers d'authentification
+
+        Raises:
+            ApiAuthenticationError: Si les tokens ne sont pas disponibles
+        """
+        try:
+            tokens_info = self.token_service.get_current_tokens()
+            tokens = tokens_info.get('tokens') if tokens_info.get('success') else None
+            if not tokens or not tokens.get('access_token_preview'):
+                raise ApiAuthenticationError("", 401)
+
+            return {'Authorization': f'Bearer {self._get_full_access_token()}'}
+
+        except ApiAuthenticationError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to get auth headers: {e}")
+            raise ApiAuthenticationError("", 401)
+
+    def _get_full_access_token(self) -> str:
+        """Récupère le token d'accès du snapshot courant (voir ApiProxyService._get_full_access_token)"""
+        model = self.token_service.get_snapshot().model
+        if model is None or not model.access_token:
+            raise ApiAuthenticationError("", 401)
+        return model.access_token
+
+    def _should_retry(self, response: ApiResponse) -> bool:
+        """Détermine si on doit retry une requête (erreurs serveur et 429)"""
+        return response.is_server_error() or response.status_code == 429
+
+    def _calculate_backoff_time(self, attempt: int, response: Optional[ApiResponse] = None) -> float:
+        """
+        Calcule le temps d'attente avec backoff exponentiel et jitter
+
+        Le jitter évite que des centaines de requêtes concurrentes échouées
+        ensemble ne retentent toutes au même instant. Un header Retry-After
+        est respecté s'il est plus long.
+        """
+        base_delay = 1.0
+        max_delay = 60.0
+
+        delay = min(base_delay * (2 ** attempt), max_delay)
+        delay = random.uniform(delay / 2, delay)
+
+        retry_after = (response.headers or {}).get('Retry-After') if response else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), max_delay))
+            except ValueError:
+                pass
+        return delay
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Retourne les métriques du service
+
+        Returns:
+            Dictionnaire avec les métriques
+        """
+        return {
+            **self.metrics.get_summary(),
+            'endpoints': self.metrics.get_endpoint_stats(),
+            'deadline_exceeded': self._deadline_exceeded_count,
+            'in_flight': self._in_flight,
+            'max_in_flight': self._max_in_flight,
+            'protocol': self._transport.protocol if self._transport else None,
+            'max_connections': self.max_connections,
+            'max_connections_per_host': self.max_connections_per_host,
+            'rate_limiter': self.rate_limits.get_state()
+        }
+
+    def collect_metrics(self) -> List[MetricFamily]:
+        """
+        Retourne les métriques du proxy pour le registre de métriques
+
+        Returns:
+            Familles de métriques exposées sur /metrics
+        """
+        return with_labels(self.metrics.collect_metrics('async_api_proxy'), {'proxy': self._proxy_id})
+
+    def get_request_history(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Retourne l'historique des requêtes
+
+        Args:
+            limit: Nombre maximum de requêtes à retourner
+
+        Returns:
+            Liste des métadonnées des requêtes récentes (sans les payloads)
+        """
+        return self.metrics.get_history(limit)
+
+    async def close(self) -> None:
+        """Ferme le pool de connexions et libère les limiteurs"""
+        get_metrics_registry().unregister_collector(f'async_api_proxy:{self._proxy_id}', self.collect_metrics)
+        if self._transport is not None:
+            await self._transport.close()
+            self._transport = None
+        self._host_semaphores.clear()
+        self.rate_limits.close()
+        self.logger.info("AsyncApiProxyService closed")
+
+
+# Proxys partagés : un par boucle d'événements (transport et sémaphores y
+# sont liés), avec le nombre d'utilisateurs courants
+_shared_proxies: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Any]]' = \
+    weakref.WeakKeyDictionary()
+_shared_proxies_lock = threading.Lock()
+
+
+def acquire_async_api_proxy(config: Optional[Config] = None) -> AsyncApiProxyService:
+    """
+    Retourne le proxy asynchrone partagé de la boucle courante
+
+    Les bots d'un même processus partagent ainsi le pool de connexions, les
+    sémaphores par hôte et les budgets de débit. Les tokens sont lus dans le
+    cache écrit par le processus qui les rafraîchit, puis rechargés à chaque
+    modification. Chaque appel doit être suivi de release_async_api_proxy().
+
+    Args:
+        config: Configuration (configuration globale par défaut), utilisée
+            à la création du proxy
+
+    Returns:
+        Proxy asynchrone partagé
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_proxies_lock:
+        entry = _shared_proxies.get(loop)
+        if entry is None:
+            config = config or get_config()
+            token_service = TokenService(config)
+            if config.TOKEN_WATCH_ENABLED:
+                token_service.start_watching()
+            entry = _shared_proxies[loop] = [AsyncApiProxyService(config, token_service), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+async def release_async_api_proxy(proxy: AsyncApiProxyService) -> None:
+    """
+    Libère un proxy obtenu par acquire_async_api_proxy()
+
+    Le dernier utilisateur ferme le pool de connexions et la surveillance
+    des tokens.
+
+    Args:
+        proxy: Proxy à libérer
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_proxies_lock:
+        entry = _shared_proxies.get(loop)
+        if entry is None or entry[0] is not proxy:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_proxies[loop]
+
+    await proxy.close()
+    proxy.token_service.cleanup()
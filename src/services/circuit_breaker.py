@@ -0,0 +1,313 @@
+"""
+Disjoncteurs, timeouts adaptatifs et budget de retry pour les appels à l'API
+"""
+import math
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Optional, Dict, Any, Callable
+
+
+class CircuitState(Enum):
+    """États d'un disjoncteur"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur d'un groupe d'endpoints
+
+    Fermé, il laisse passer les appels et mémorise l'issue des
+    `window_size` derniers. Quand au moins `minimum_calls` issues sont
+    connues et que la proportion d'échecs atteint `failure_threshold`, il
+    s'ouvre : les appels échouent immédiatement pendant `open_duration`
+    secondes. Il passe ensuite en semi-ouvert et laisse passer
+    `half_open_max_calls` appels de sonde : un succès le referme, un échec
+    le rouvre.
+    """
+
+    def __init__(self, name: str, failure_threshold: float = 0.5, minimum_calls: int = 10,
+                 window_size: int = 50, open_duration: float = 30.0,
+                 half_open_max_calls: int = 1, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialise le disjoncteur
+
+        Args:
+            name: Nom du groupe d'endpoints
+            failure_threshold: Proportion d'échecs qui ouvre le disjoncteur
+            minimum_calls: Nombre d'issues nécessaires avant d'évaluer la proportion
+            window_size: Nombre d'issues récentes prises en compte
+            open_duration: Durée d'ouverture en secondes
+            half_open_max_calls: Appels de sonde simultanés en semi-ouvert
+            clock: Horloge en secondes (time.monotonic par défaut)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._outcomes: deque = deque(maxlen=window_size)
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._probe_started = 0.0
+
+        # Statistiques
+        self._rejected = 0
+        self._open_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """État courant (passe en semi-ouvert à la fin de l'ouverture)"""
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state == CircuitState.OPEN and now - self._opened_at >= self.open_duration:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Vérifie si un appel peut passer
+
+        Returns:
+            True si l'appel est autorisé (en semi-ouvert, il compte comme sonde)
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN:
+                # Sondes sans issue enregistrée (appel abandonné) : en relancer
+                if now - self._probe_started >= self.open_duration:
+                    self._half_open_calls = 0
+                if self._half_open_calls < self.half_open_max_calls:
+                    self._half_open_calls += 1
+                    self._probe_started = now
+                    return True
+            self._rejected += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Temps restant avant le passage en semi-ouvert"""
+        with self._lock:
+            if self._state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.open_duration - (self._clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Enregistre un appel réussi"""
+        with self._lock:
+            if self._current_state(self._clock()) == CircuitState.HALF_OPEN:
+                self._reset()
+                return
+            self._record(False)
+
+    def record_failure(self) -> None:
+        """Enregistre un appel en échec"""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == CircuitState.HALF_OPEN:
+                self._open(now)
+                return
+            if state == CircuitState.OPEN:
+                return
+
+            self._record(True)
+            if (len(self._outcomes) >= self.minimum_calls
+                    and self._failures >= self.failure_threshold * len(self._outcomes)):
+                self._open(now)
+
+    def _record(self, failed: bool) -> None:
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        if failed:
+            self._failures += 1
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._half_open_calls = 0
+        self._open_count += 1
+
+    def _reset(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+        self._half_open_calls = 0
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du disjoncteur
+
+        Returns:
+            Dictionnaire avec l'état et les statistiques
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            calls = len(self._outcomes)
+            return {
+                'name': self.name,
+                'state': state.value,
+                'failure_rate': self._failures / calls if calls else 0.0,
+                'recent_calls': calls,
+                'rejected': self._rejected,
+                'open_count': self._open_count,
+                'retry_after': (
+                    max(0.0, self.open_duration - (now - self._opened_at))
+                    if state == CircuitState.OPEN else 0.0
+                )
+            }
+
+
+class AdaptiveTimeout:
+    """
+    Timeout calculé à partir des latences observées
+
+    Le timeout vaut `multiplier` fois le percentile choisi des `window_size`
+    dernières latences réussies, borné entre `min_timeout` et
+    `max_timeout`. Tant que moins de `min_samples` latences sont connues,
+    `max_timeout` est utilisé. Le percentile n'est recalculé que toutes les
+    `recompute_every` mesures.
+    """
+
+    def __init__(self, max_timeout: float, min_timeout: float = 1.0, percentile: float = 99.0,
+                 multiplier: float = 2.0, window_size: int = 200, min_samples: int = 20,
+                 recompute_every: int = 10):
+        """
+        Initialise le timeout adaptatif
+
+        Args:
+            max_timeout: Timeout maximum (et initial) en secondes
+            min_timeout: Timeout minimum en secondes
+            percentile: Percentile des latences utilisé
+            multiplier: Marge appliquée au percentile
+            window_size: Nombre de latences conservées
+            min_samples: Nombre de latences avant adaptation
+            recompute_every: Fréquence de recalcul du percentile
+        """
+        self.max_timeout = max_timeout
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+
+        self._samples: deque = deque(maxlen=window_size)
+        self._since_recompute = 0
+        self._timeout = max_timeout
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """
+        Enregistre la latence d'un appel réussi
+
+        Args:
+            latency: Latence en secondes
+        """
+        with self._lock:
+            self._samples.append(latency)
+            self._since_recompute += 1
+            if len(self._samples) >= self.min_samples and self._since_recompute >= self.recompute_every:
+                self._since_recompute = 0
+                ordered = sorted(self._samples)
+                index = max(0, math.ceil(self.percentile / 100.0 * len(ordered)) - 1)
+                self._timeout = min(self.max_timeout, max(self.min_timeout, ordered[index] * self.multiplier))
+
+    @property
+    def timeout(self) -> float:
+        """Timeout courant en secondes"""
+        return self._timeout
+
+    def get_state(self) -> Dict[str, Any]:
+        """Retourne le timeout courant et le nombre de mesures"""
+        with self._lock:
+            return {
+                'timeout': self._timeout,
+                'samples': len(self._samples),
+                'percentile': self.percentile
+            }
+
+
+class RetryBudget:
+    """
+    Budget de retry proportionnel au trafic
+
+    Chaque requête dépose `ratio` jeton, chaque retry en consomme un : les
+    retries ne peuvent donc pas dépasser `ratio` fois le trafic. Un minimum
+    de `min_retries_per_second` retries reste disponible à faible trafic,
+    et le solde initial couvre `min_retries_per_second * 10` retries.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0,
+                 max_balance: float = 100.0, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialise le budget
+
+        Args:
+            ratio: Proportion de retries autorisée par rapport aux requêtes
+            min_retries_per_second: Retries toujours autorisés par seconde
+            max_balance: Solde maximum de jetons
+            clock: Horloge en secondes (time.monotonic par défaut)
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+
+        self._clock = clock or time.monotonic
+        self._balance = min(max_balance, min_retries_per_second * 10)
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._denied = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._balance = min(self.max_balance, self._balance + elapsed * self.min_retries_per_second)
+        self._updated = now
+
+    def record_request(self) -> None:
+        """Enregistre une requête initiale (dépôt)"""
+        with self._lock:
+            self._refill(self._clock())
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_retry(self) -> bool:
+        """
+        Consomme un jeton pour un retry
+
+        Returns:
+            True si le retry est autorisé
+        """
+        with self._lock:
+            self._refill(self._clock())
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                self._retries += 1
+                return True
+            self._denied += 1
+            return False
+
+    def get_state(self) -> Dict[str, Any]:
+        """Retourne le solde et les compteurs du budget"""
+        with self._lock:
+            self._refill(self._clock())
+            return {
+                'balance': self._balance,
+                'ratio': self.ratio,
+                'retries': self._retries,
+                'denied': self._denied
+            }
@@ -0,0 +1,222 @@
+"""
+Métriques du proxy API : compteurs par thread, histogrammes de latence et historique compact
+"""
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+from ..core.counters import ShardedCounter, LatencyHistogram, DEFAULT_LATENCY_BUCKETS
+from ..core.metrics_registry import MetricFamily, histogram_family
+
+# Segments de chemin variables (identifiants numériques, UUID, hashes)
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F-]{16,}|[0-9A-Za-z]{32,})$')
+
+OTHER_ENDPOINTS = "other"
+
+
+@dataclass
+class RequestRecord:
+    """Métadonnées d'un appel à l'API conservées dans l'historique"""
+    method: str
+    endpoint: str
+    status_code: int
+    response_time: Optional[float] = None
+    bytes_in: int = 0
+    bytes_out: int = 0
+    error_message: Optional[str] = None
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'enregistrement en dictionnaire"""
+        return {
+            'method': self.method,
+            'endpoint': self.endpoint,
+            'status_code': self.status_code,
+            'response_time': self.response_time,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'error_message': self.error_message,
+            'is_success': 200 <= self.status_code < 300,
+            'timestamp': self.timestamp.isoformat()
+        }
+
+
+def status_class(status_code: int) -> str:
+    """Retourne la classe d'un statut HTTP ('2xx', '4xx'...)"""
+    return f"{status_code // 100}xx" if status_code else "error"
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Remplace les segments variables d'un chemin par '{id}'
+
+    Limite le nombre de séries de métriques quand les endpoints contiennent
+    des identifiants (ex: /orders/123 -> /orders/{id}).
+    """
+    path = endpoint.split('?', 1)[0]
+    return '/'.join(
+        '{id}' if segment and _ID_SEGMENT.match(segment) else segment
+        for segment in path.split('/')
+    )
+
+
+class ProxyMetrics:
+    """
+    Métriques d'un proxy API
+
+    Regroupe les compteurs globaux, les histogrammes de latence par endpoint
+    normalisé et par classe de statut, les octets échangés et un historique
+    de taille fixe ne conservant que les métadonnées des appels.
+    """
+
+    def __init__(self, history_size: int = 100, max_endpoints: int = 200):
+        """
+        Initialise les métriques
+
+        Args:
+            history_size: Nombre d'appels conservés dans l'historique
+            max_endpoints: Nombre maximum d'endpoints suivis séparément
+        """
+        self.max_endpoints = max_endpoints
+
+        self.requests = ShardedCounter()
+        self.errors = ShardedCounter()
+        self.response_time = ShardedCounter()
+        self.bytes_in = ShardedCounter()
+        self.bytes_out = ShardedCounter()
+        self.last_request_time: Optional[datetime] = None
+
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._endpoints: set = set()
+        self._histograms_lock = threading.Lock()
+        self._history: deque = deque(maxlen=history_size)
+
+    def _histogram(self, endpoint: str, status: str) -> LatencyHistogram:
+        histogram = self._histograms.get((endpoint, status))
+        if histogram is None:
+            with self._histograms_lock:
+                # Au-delà de max_endpoints, les nouveaux endpoints sont regroupés
+                if endpoint not in self._endpoints and len(self._endpoints) >= self.max_endpoints:
+                    endpoint = OTHER_ENDPOINTS
+                histogram = self._histograms.get((endpoint, status))
+                if histogram is None:
+                    histogram = LatencyHistogram()
+                    self._histograms[(endpoint, status)] = histogram
+                    self._endpoints.add(endpoint)
+        return histogram
+
+    def record_call(self, record: RequestRecord) -> None:
+        """
+        Enregistre un appel à l'API amont
+
+        Args:
+            record: Métadonnées de l'appel
+        """
+        self.bytes_in.add(record.bytes_in)
+        self.bytes_out.add(record.bytes_out)
+        if record.response_time is not None:
+            endpoint = normalize_endpoint(record.endpoint)
+            self._histogram(endpoint, status_class(record.status_code)).record(record.response_time)
+        self._history.append(record)
+
+    def get_endpoint_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Retourne les percentiles de latence par endpoint et classe de statut
+
+        Returns:
+            Dictionnaire {endpoint: {classe de statut: statistiques}}
+        """
+        with self._histograms_lock:
+            histograms = list(self._histograms.items())
+
+        stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (endpoint, status), histogram in histograms:
+            stats.setdefault(endpoint, {})[status] = histogram.get_stats()
+        return stats
+
+    def get_history(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Retourne les derniers appels
+
+        Args:
+            limit: Nombre maximum d'appels à retourner (0 pour tous)
+
+        Returns:
+            Liste des métadonnées des appels récents
+        """
+        records = list(self._history)
+        if limit > 0:
+            records = records[-limit:]
+        return [record.to_dict() for record in records]
+
+    def clear_history(self) -> None:
+        """Efface l'historique"""
+        self._history.clear()
+
+    @property
+    def history_length(self) -> int:
+        """Nombre d'appels dans l'historique"""
+        return len(self._history)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Retourne les métriques globales
+
+        Returns:
+            Dictionnaire avec les compteurs, taux d'erreur et octets échangés
+        """
+        requests = self.requests.value
+        errors = self.errors.value
+        return {
+            'total_requests': requests,
+            'total_errors': errors,
+            'error_rate': errors / requests if requests else 0.0,
+            'average_response_time': self.response_time.value / requests if requests else 0.0,
+            'last_request_time': self.last_request_time.isoformat() if self.last_request_time else None,
+            'bytes_in': self.bytes_in.value,
+            'bytes_out': self.bytes_out.value
+        }
+
+    def collect_metrics(self, prefix: str) -> List[MetricFamily]:
+        """
+        Retourne les métriques du proxy pour le registre de métriques
+
+        Args:
+            prefix: Préfixe des noms de métriques (ex: 'api_proxy')
+
+        Returns:
+            Compteurs globaux et histogrammes de latence par endpoint et classe de statut
+        """
+        with self._histograms_lock:
+            histograms = list(self._histograms.items())
+
+        families = [
+            MetricFamily(f'{prefix}_{name}_total', 'counter', documentation,
+                         [(f'{prefix}_{name}_total', {}, counter.value)])
+            for name, documentation, counter in (
+                ('requests', 'Requests sent to the upstream API', self.requests),
+                ('errors', 'Failed upstream API requests', self.errors),
+                ('received_bytes', 'Bytes received from the upstream API', self.bytes_in),
+                ('sent_bytes', 'Bytes sent to the upstream API', self.bytes_out)
+            )
+        ]
+        families.append(histogram_family(
+            f'{prefix}_request_duration_seconds',
+            'Upstream API latency by normalized endpoint and status class',
+            DEFAULT_LATENCY_BUCKETS,
+            [({'endpoint': endpoint, 'status': status}, histogram.snapshot())
+             for (endpoint, status), histogram in histograms]
+        ))
+        return families
+
+    def reset(self) -> None:
+        """Remet à zéro les compteurs et les histogrammes"""
+        for counter in (self.requests, self.errors, self.response_time, self.bytes_in, self.bytes_out):
+            counter.reset()
+        with self._histograms_lock:
+            self._histograms.clear()
+            self._endpoints.clear()
+        self.last_request_time = None
@@ -0,0 +1,420 @@
+"""
+Limitation de taux à seau de jetons, partageable entre processus
+"""
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import msvcrt
+    MSVCRT_AVAILABLE = True
+except ImportError:
+    MSVCRT_AVAILABLE = False
+
+
+# Budgets par classe d'endpoint appliqués en plus du budget global
+DEFAULT_ENDPOINT_CLASSES: Dict[str, Dict[str, Any]] = {
+    'trading': {
+        'prefixes': ['/orders', '/trade', '/positions'],
+        'max_requests': 30,
+        'time_window': 60
+    },
+    'market_data': {
+        'prefixes': ['/market', '/ticker', '/pairs', '/tokens'],
+        'max_requests': 60,
+        'time_window': 60
+    },
+    'account': {
+        'prefixes': ['/account', '/portfolio', '/user'],
+        'max_requests': 30,
+        'time_window': 60
+    }
+}
+
+# État d'un seau : jetons disponibles, horodatage de la dernière mise à jour
+_STATE_FORMAT = struct.Struct('<dd')
+
+
+class _LocalBucketState:
+    """État d'un seau partagé entre les threads d'un processus"""
+
+    def __init__(self, tokens: float, updated: float):
+        self._tokens = tokens
+        self._updated = updated
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self):
+        """Donne accès exclusif à l'état (jetons, horodatage)"""
+        with self._lock:
+            state = [self._tokens, self._updated]
+            yield state
+            self._tokens, self._updated = state
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedBucketState:
+    """
+    État d'un seau partagé entre processus
+
+    Les deux valeurs sont stockées dans un petit fichier projeté en mémoire
+    et protégé par un verrou de fichier (fcntl sous Unix, msvcrt sous
+    Windows). Le verrou de fichier ne distingue pas les threads d'un même
+    processus, d'où le verrou de thread supplémentaire.
+    """
+
+    def __init__(self, path: str, tokens: float, updated: float):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        # Le premier processus initialise le seau plein
+        with self._file_lock():
+            if os.fstat(self._fd).st_size < _STATE_FORMAT.size:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, _STATE_FORMAT.pack(tokens, updated))
+
+        self._map = mmap.mmap(self._fd, _STATE_FORMAT.size)
+
+    @contextmanager
+    def _file_lock(self):
+        if FCNTL_AVAILABLE:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        elif MSVCRT_AVAILABLE:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK abandonne après 10 secondes de contention
+                    continue
+            try:
+                yield
+            finally:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            yield
+
+    @contextmanager
+    def locked(self):
+        """Donne accès exclusif à l'état (jetons, horodatage)"""
+        with self._lock, self._file_lock():
+            state = list(_STATE_FORMAT.unpack_from(self._map, 0))
+            yield state
+            _STATE_FORMAT.pack_into(self._map, 0, *state)
+
+    def close(self) -> None:
+        try:
+            self._map.close()
+        finally:
+            os.close(self._fd)
+
+
+class RateLimiter:
+    """
+    Limiteur de taux à seau de jetons (token bucket)
+
+    Le seau contient au plus `burst` jetons (max_requests par défaut) et se
+    remplit au rythme de max_requests jetons par time_window secondes.
+    Toutes les opérations sont en O(1) : seuls le nombre de jetons et
+    l'horodatage de la dernière mise à jour sont conservés.
+
+    Avec `shared_dir`, l'état est stocké dans un fichier projeté en mémoire
+    sous ce répertoire : tous les processus utilisant le même nom de seau
+    partagent alors le même budget.
+    """
+
+    def __init__(self, max_requests: int = 100, time_window: int = 60,
+                 burst: Optional[int] = None, name: str = "global",
+                 shared_dir: Optional[str] = None,
+                 clock: Optional[Callable[[], float]] = None):
+        """
+        Initialise le limiteur de taux
+
+        Args:
+            max_requests: Nombre maximum de requêtes
+            time_window: Fenêtre de temps en secondes
+            burst: Taille maximale d'une rafale (max_requests par défaut)
+            name: Nom du seau (identifie le budget partagé)
+            shared_dir: Répertoire de partage entre processus (optionnel)
+            clock: Horloge en secondes (time.time en mode partagé)
+        """
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.name = name
+        self.capacity = float(burst or max_requests)
+        self.rate = max_requests / float(time_window)
+        self.shared = bool(shared_dir)
+
+        # Seule l'horloge murale est comparable entre processus
+        self._clock = clock or (time.time if self.shared else time.monotonic)
+
+        if self.shared:
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+            path = os.path.join(shared_dir, f"{safe_name}.bucket")
+            self._state = _SharedBucketState(path, self.capacity, self._clock())
+        else:
+            self._state = _LocalBucketState(self.capacity, self._clock())
+
+    def _refill(self, state: List[float], now: float) -> float:
+        """Met à jour les jetons de l'état et retourne leur nombre"""
+        elapsed = max(0.0, now - state[1])
+        state[0] = min(self.capacity, state[0] + elapsed * self.rate)
+        state[1] = now
+        return state[0]
+
+    def can_make_request(self) -> bool:
+        """Vérifie si une requête peut être faite"""
+        return self.available_tokens >= 1.0
+
+    def record_request(self) -> None:
+        """Enregistre une nouvelle requête"""
+        with self._state.locked() as state:
+            self._refill(state, self._clock())
+            state[0] -= 1.0
+
+    def try_acquire(self) -> bool:
+        """
+        Consomme un jeton s'il est disponible
+
+        Returns:
+            True si la requête peut être faite immédiatement
+        """
+        with self._state.locked() as state:
+            if self._refill(state, self._clock()) < 1.0:
+                return False
+            state[0] -= 1.0
+            return True
+
+    def reserve(self) -> float:
+        """
+        Réserve un jeton et retourne le délai avant de pouvoir l'utiliser
+
+        La réservation est atomique : plusieurs threads ou processus qui
+        réservent en même temps obtiennent des délais échelonnés au lieu de
+        tous constater qu'un jeton est libre.
+
+        Returns:
+            Temps d'attente en secondes (0 si immédiat)
+        """
+        with self._state.locked() as state:
+            tokens = self._refill(state, self._clock())
+            state[0] = tokens - 1.0
+            return 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate
+
+    def get_wait_time(self) -> float:
+        """Retourne le temps d'attente avant la prochaine requête"""
+        tokens = self.available_tokens
+        return 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate
+
+    @property
+    def available_tokens(self) -> float:
+        """Nombre de jetons disponibles"""
+        with self._state.locked() as state:
+            return self._refill(state, self._clock())
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du limiteur
+
+        Returns:
+            Dictionnaire avec le budget et les jetons restants
+        """
+        tokens = self.available_tokens
+        return {
+            'name': self.name,
+            'max_requests': self.max_requests,
+            'time_window': self.time_window,
+            'available_tokens': tokens,
+            'current_requests': max(0, int(round(self.capacity - tokens))),
+            'can_make_request': tokens >= 1.0,
+            'wait_time': 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate,
+            'shared': self.shared
+        }
+
+    def close(self) -> None:
+        """Libère le fichier partagé éventuel"""
+        self._state.close()
+
+
+class EndpointClassifier:
+    """
+    Associe un endpoint à sa classe de budget par préfixe
+
+    Le préfixe le plus long l'emporte. Les résultats sont mémorisés, les
+    endpoints d'une API étant en nombre limité.
+    """
+
+    def __init__(self, endpoint_classes: Dict[str, Dict[str, Any]], max_cache_size: int = 1024):
+        """
+        Initialise le classificateur
+
+        Args:
+            endpoint_classes: Classes d'endpoints ({'classe': {'prefixes': [...]}})
+            max_cache_size: Nombre maximum d'endpoints mémorisés
+        """
+        self._prefixes: List[Tuple[str, str]] = sorted(
+            (
+                ('/' + prefix.strip('/'), name)
+                for name, settings in endpoint_classes.items()
+                for prefix in settings.get('prefixes', [])
+            ),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
+        self._cache: Dict[str, Optional[str]] = {}
+        self._max_cache_size = max_cache_size
+
+    def classify(self, endpoint: str) -> Optional[str]:
+        """
+        Retourne la classe d'un endpoint
+
+        Args:
+            endpoint: Endpoint relatif (ex: /orders/123)
+
+        Returns:
+            Nom de la classe ou None si aucune ne correspond
+        """
+        try:
+            return self._cache[endpoint]
+        except KeyError:
+            pass
+
+        path = '/' + endpoint.split('?', 1)[0].strip('/')
+        endpoint_class = None
+        for prefix, name in self._prefixes:
+            if path == prefix or path.startswith(prefix + '/'):
+                endpoint_class = name
+                break
+
+        if len(self._cache) >= self._max_cache_size:
+            self._cache.clear()
+        self._cache[endpoint] = endpoint_class
+        return endpoint_class
+
+
+class ApiRateLimits:
+    """
+    Budgets d'un client de l'API Axiom Trade
+
+    Regroupe le budget global et les budgets par classe d'endpoint, ainsi
+    que le classificateur qui associe un endpoint à sa classe. Les proxys
+    synchrone et asynchrone en construisent chacun un depuis la
+    configuration.
+    """
+
+    def __init__(self, max_requests: int, time_window: int,
+                 endpoint_classes: Optional[Dict[str, Dict[str, Any]]] = None,
+                 shared_dir: Optional[str] = None):
+        """
+        Initialise les budgets
+
+        Args:
+            max_requests: Nombre maximum de requêtes du budget global
+            time_window: Fenêtre de temps du budget global en secondes
+            endpoint_classes: Classes d'endpoints et leurs budgets
+                (DEFAULT_ENDPOINT_CLASSES par défaut)
+            shared_dir: Répertoire de partage entre processus (optionnel)
+        """
+        endpoint_classes = endpoint_classes or DEFAULT_ENDPOINT_CLASSES
+        self.rate_limiter = RateLimiter(
+            max_requests=max_requests,
+            time_window=time_window,
+            name="global",
+            shared_dir=shared_dir
+        )
+        self.endpoint_limiters: Dict[str, RateLimiter] = {
+            name: RateLimiter(
+                max_requests=settings['max_requests'],
+                time_window=settings.get('time_window', 60),
+                burst=settings.get('burst'),
+                name=name,
+                shared_dir=shared_dir
+            )
+            for name, settings in endpoint_classes.items()
+        }
+        self.classifier = EndpointClassifier(endpoint_classes)
+
+    @classmethod
+    def from_config(cls, config) -> 'ApiRateLimits':
+        """
+        Crée les budgets définis par la configuration
+
+        Args:
+            config: Configuration de l'application (API_RATE_LIMIT_*, API_RATE_LIMITS)
+
+        Returns:
+            Budgets partagés entre processus si API_RATE_LIMIT_SHARED_DIR est défini
+        """
+        return cls(
+            max_requests=config.API_RATE_LIMIT_REQUESTS,
+            time_window=config.API_RATE_LIMIT_WINDOW,
+            endpoint_classes=config.API_RATE_LIMITS,
+            shared_dir=config.API_RATE_LIMIT_SHARED_DIR or None
+        )
+
+    def classify(self, endpoint: str) -> Optional[str]:
+        """Retourne la classe d'un endpoint (None si aucune ne correspond)"""
+        return self.classifier.classify(endpoint)
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Réserve un jeton dans le budget global et dans celui de la classe de l'endpoint
+
+        Args:
+            endpoint: Endpoint de la requête
+
+        Returns:
+            Temps d'attente en secondes avant d'envoyer la requête
+        """
+        wait_time = self.rate_limiter.reserve()
+
+        endpoint_class = self.classifier.classify(endpoint)
+        limiter = self.endpoint_limiters.get(endpoint_class) if endpoint_class else None
+        if limiter is not None:
+            wait_time = max(wait_time, limiter.reserve())
+
+        return wait_time
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Retourne l'état des budgets
+
+        Returns:
+            État du budget global avec celui de chaque classe sous 'endpoint_classes'
+        """
+        return dict(
+            self.rate_limiter.get_state(),
+            endpoint_classes={
+                name: limiter.get_state() for name, limiter in self.endpoint_limiters.items()
+            }
+        )
+
+    def close(self) -> None:
+        """Libère les fichiers partagés éventuels"""
+        self.rate_limiter.close()
+        for limiter in self.endpoint_limiters.values():
+            limiter.close()
@@ -0,0 +1,458 @@
+"""
+Cache des réponses de l'API avec TTL, revalidation conditionnelle et LRU borné en mémoire
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Tuple, List
+from urllib.parse import urlencode
+
+from ..core.metrics_registry import MetricFamily
+from .rate_limiter import EndpointClassifier
+
+
+# Politiques par classe d'endpoint (les endpoints sans politique ne sont pas mis en cache)
+# ttl: durée de fraîcheur, stale_while_revalidate: durée pendant laquelle une entrée
+# périmée est encore servie pendant sa revalidation en arrière-plan
+DEFAULT_CACHE_POLICIES: Dict[str, Dict[str, Any]] = {
+    'market_data': {
+        'prefixes': ['/market', '/ticker', '/pairs', '/tokens'],
+        'ttl': 2,
+        'stale_while_revalidate': 10
+    }
+}
+
+# États possibles d'une entrée lors d'une consultation
+CACHE_FRESH = "fresh"
+CACHE_STALE = "stale"
+CACHE_EXPIRED = "expired"
+
+# Surcoût mémoire estimé d'une entrée en plus de ses données
+_ENTRY_OVERHEAD = 512
+
+
+@dataclass
+class CacheEntry:
+    """Réponse mise en cache"""
+    key: str
+    status_code: int
+    data: Optional[Dict[str, Any]]
+    headers: Dict[str, str]
+    stored_at: float
+    expires_at: float
+    stale_until: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    size: int = 0
+    hits: int = 0
+
+    @property
+    def negative(self) -> bool:
+        """Vérifie si l'entrée mémorise une absence (404)"""
+        return self.status_code == 404
+
+    def has_validators(self) -> bool:
+        """Vérifie si l'entrée peut être revalidée par une requête conditionnelle"""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Retourne les headers de revalidation conditionnelle"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit l'entrée en dictionnaire (sans les données)"""
+        return {
+            'key': self.key,
+            'status_code': self.status_code,
+            'stored_at': self.stored_at,
+            'expires_at': self.expires_at,
+            'stale_until': self.stale_until,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'size': self.size,
+            'hits': self.hits
+        }
+
+
+@dataclass
+class CacheStats:
+    """Compteurs du cache"""
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    revalidations: int = 0
+    not_modified: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit les compteurs en dictionnaire"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            'stores': self.stores,
+            'revalidations': self.revalidations,
+            'not_modified': self.not_modified,
+            'evictions': self.evictions
+        }
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Découpe un header Cache-Control en directives"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    """
+    Cache LRU des réponses de l'API
+
+    Les entrées sont indexées par méthode, endpoint, paramètres et identité
+    d'authentification, de sorte que deux comptes ne partagent jamais une
+    réponse. La mémoire occupée est estimée à partir de la taille JSON des
+    données et bornée : les entrées les moins récemment utilisées sont
+    évincées au-delà de `max_bytes` ou `max_entries`.
+
+    Une entrée passe par trois états :
+    - fraîche (ttl) : servie sans contacter l'API
+    - périmée (stale_while_revalidate) : servie immédiatement, revalidée en arrière-plan
+    - expirée : la requête part vers l'API, conditionnelle si l'entrée a un ETag
+      ou un Last-Modified, et une réponse 304 rafraîchit l'entrée existante
+    """
+
+    def __init__(self, policies: Optional[Dict[str, Dict[str, Any]]] = None,
+                 max_bytes: int = 16 * 1024 * 1024, max_entries: int = 1024,
+                 negative_ttl: float = 30, clock: Optional[Callable[[], float]] = None):
+        """
+        Initialise le cache
+
+        Args:
+            policies: Politiques par classe d'endpoint ({'classe': {'prefixes', 'ttl', 'stale_while_revalidate'}})
+            max_bytes: Taille mémoire maximale estimée
+            max_entries: Nombre maximum d'entrées
+            negative_ttl: Durée de mise en cache des réponses 404
+            clock: Horloge en secondes (time.monotonic par défaut)
+        """
+        self.policies = policies if policies is not None else DEFAULT_CACHE_POLICIES
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+
+        self._clock = clock or time.monotonic
+        self._classifier = EndpointClassifier(self.policies)
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._size = 0
+        self._revalidating: set = set()
+        self._lock = threading.RLock()
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                 identity: Optional[str] = None) -> str:
+        """
+        Construit la clé de cache d'une requête
+
+        Args:
+            method: Méthode HTTP
+            endpoint: Endpoint de la requête
+            params: Paramètres de requête (l'ordre n'importe pas, les valeurs
+                sont encodées comme dans l'URL envoyée)
+            identity: Identité d'authentification (None si anonyme)
+
+        Returns:
+            Clé de cache
+        """
+        query = urlencode(sorted(params.items()), doseq=True) if params else ''
+        return f"{method.upper()} {endpoint}?{query}#{identity or ''}"
+
+    @staticmethod
+    def make_identity(secret: Optional[str]) -> Optional[str]:
+        """
+        Dérive une identité de cache d'un secret d'authentification sans le conserver
+
+        Args:
+            secret: Token ou header d'authentification
+
+        Returns:
+            Empreinte courte du secret ou None
+        """
+        if not secret:
+            return None
+        return hashlib.sha256(secret.encode('utf-8')).hexdigest()[:16]
+
+    def get_policy(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne la politique de cache d'un endpoint
+
+        Args:
+            endpoint: Endpoint de la requête
+
+        Returns:
+            Politique ou None si l'endpoint n'est pas mis en cache
+        """
+        policy_name = self._classifier.classify(endpoint)
+        return self.policies.get(policy_name) if policy_name else None
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """Vérifie si un endpoint a une politique de cache"""
+        return self.get_policy(endpoint) is not None
+
+    def lookup(self, key: str) -> Tuple[Optional[CacheEntry], Optional[str]]:
+        """
+        Consulte le cache
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            Tuple (entrée, état) avec l'état CACHE_FRESH, CACHE_STALE ou
+            CACHE_EXPIRED, ou (None, None) si la clé est absente
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None, None
+
+            self._entries.move_to_end(key)
+            if now < entry.expires_at:
+                entry.hits += 1
+                self.stats.hits += 1
+                return entry, CACHE_FRESH
+            if now < entry.stale_until:
+                entry.hits += 1
+                self.stats.stale_hits += 1
+                return entry, CACHE_STALE
+
+            self.stats.misses += 1
+            if not entry.has_validators():
+                self._remove(key)
+                return None, None
+            return entry, CACHE_EXPIRED
+
+    def store(self, key: str, endpoint: str, status_code: int,
+              data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Optional[CacheEntry]:
+        """
+        Met une réponse en cache si sa politique et ses headers le permettent
+
+        Args:
+            key: Clé de cache
+            endpoint: Endpoint de la requête
+            status_code: Code de statut de la réponse
+            data: Données de la réponse
+            headers: Headers de la réponse
+
+        Returns:
+            Entrée créée ou None si la réponse n'est pas mise en cache
+        """
+        policy = self.get_policy(endpoint)
+        if policy is None or status_code not in (200, 404):
+            self.invalidate(key)
+            return None
+
+        headers = dict(headers or {})
+        lower_headers = {name.lower(): value for name, value in headers.items()}
+        cache_control = _parse_cache_control(lower_headers.get('cache-control'))
+        if 'no-store' in cache_control:
+            self.invalidate(key)
+            return None
+
+        if status_code == 404:
+            ttl, stale = float(policy.get('negative_ttl', self.negative_ttl)), 0.0
+        else:
+            ttl = float(policy.get('ttl', 0))
+            stale = float(policy.get('stale_while_revalidate', 0))
+            max_age = cache_control.get('max-age')
+            if max_age is not None and max_age.isdigit():
+                ttl = min(ttl, float(max_age))
+            if 'no-cache' in cache_control:
+                ttl, stale = 0.0, 0.0
+
+        etag = lower_headers.get('etag')
+        last_modified = lower_headers.get('last-modified')
+        if ttl <= 0 and stale <= 0 and not (etag or last_modified):
+            self.invalidate(key)
+            return None
+
+        try:
+            size = len(json.dumps(data, default=str)) + _ENTRY_OVERHEAD
+        except (TypeError, ValueError):
+            size = _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            self.invalidate(key)
+            return None
+
+        now = self._clock()
+        entry = CacheEntry(
+            key=key,
+            status_code=status_code,
+            data=data,
+            headers=headers,
+            stored_at=now,
+            expires_at=now + ttl,
+            stale_until=now + ttl + stale,
+            etag=etag,
+            last_modified=last_modified,
+            size=size
+        )
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += size
+            self.stats.stores += 1
+            self._evict()
+        return entry
+
+    def refresh(self, key: str, endpoint: str, headers: Optional[Dict[str, str]] = None) -> Optional[CacheEntry]:
+        """
+        Rafraîchit une entrée après une réponse 304 Not Modified
+
+        Args:
+            key: Clé de cache
+            endpoint: Endpoint de la requête
+            headers: Headers de la réponse 304
+
+        Returns:
+            Entrée rafraîchie ou None si elle a été évincée entre-temps
+        """
+        policy = self.get_policy(endpoint) or {}
+        lower_headers = {name.lower(): value for name, value in (headers or {}).items()}
+        cache_control = _parse_cache_control(lower_headers.get('cache-control'))
+
+        ttl = float(policy.get('ttl', 0))
+        stale = float(policy.get('stale_while_revalidate', 0))
+        max_age = cache_control.get('max-age')
+        if max_age is not None and max_age.isdigit():
+            ttl = min(ttl, float(max_age))
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.stored_at = now
+            entry.expires_at = now + ttl
+            entry.stale_until = now + ttl + stale
+            entry.etag = lower_headers.get('etag', entry.etag)
+            entry.last_modified = lower_headers.get('last-modified', entry.last_modified)
+            self._entries.move_to_end(key)
+            self.stats.not_modified += 1
+            return entry
+
+    def begin_revalidation(self, key: str) -> bool:
+        """
+        Réserve la revalidation d'une entrée périmée
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            True si l'appelant doit revalider, False si une revalidation est déjà en cours
+        """
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            self.stats.revalidations += 1
+            return True
+
+    def end_revalidation(self, key: str) -> None:
+        """Libère la revalidation d'une entrée"""
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Supprime une entrée
+
+        Args:
+            key: Clé de cache
+
+        Returns:
+            True si une entrée a été supprimée
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._size -= entry.size
+        return True
+
+    def _evict(self) -> None:
+        while self._entries and (self._size > self.max_bytes or len(self._entries) > self.max_entries):
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du cache
+
+        Returns:
+            Dictionnaire avec les compteurs et l'occupation mémoire
+        """
+        with self._lock:
+            stats = self.stats.to_dict()
+            stats.update({
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'revalidating': len(self._revalidating)
+            })
+            return stats
+
+    def collect_metrics(self, prefix: str) -> List[MetricFamily]:
+        """
+        Retourne les métriques du cache pour le registre de métriques
+
+        Args:
+            prefix: Préfixe des noms de métriques (ex: 'api_proxy_cache')
+
+        Returns:
+            Recherches par résultat, taux de succès et occupation du cache
+        """
+        stats = self.get_stats()
+        return [
+            MetricFamily(f'{prefix}_lookups_total', 'counter', 'Cache lookups by result', [
+                (f'{prefix}_lookups_total', {'result': result}, stats[key])
+                for result, key in (('hit', 'hits'), ('stale_hit', 'stale_hits'), ('miss', 'misses'))
+            ]),
+            MetricFamily(f'{prefix}_hit_ratio', 'gauge', 'Share of lookups served from the cache',
+                         [(f'{prefix}_hit_ratio', {}, stats['hit_rate'])]),
+            MetricFamily(f'{prefix}_evictions_total', 'counter', 'Entries evicted to respect the size limits',
+                         [(f'{prefix}_evictions_total', {}, stats['evictions'])]),
+            MetricFamily(f'{prefix}_entries', 'gauge', 'Entries in the cache',
+                         [(f'{prefix}_entries', {}, stats['entries'])]),
+            MetricFamily(f'{prefix}_size_bytes', 'gauge', 'Size of the cached responses',
+                         [(f'{prefix}_size_bytes', {}, stats['size_bytes'])])
+        ]
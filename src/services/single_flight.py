@@ -0,0 +1,102 @@
+"""
+Regroupement des appels identiques simultanés (single-flight)
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """Appel en cours partagé entre un meneur et ses suiveurs"""
+
+    __slots__ = ('event', 'result', 'error', 'duplicates')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.duplicates = 0
+
+
+class SingleFlight:
+    """
+    Exécute une seule fois les appels identiques simultanés
+
+    Le premier thread qui appelle `do` pour une clé devient le meneur et
+    exécute la fonction ; les threads qui arrivent avec la même clé pendant
+    l'exécution attendent son résultat (ou son exception) au lieu de refaire
+    l'appel. Une fois l'appel terminé, la clé est libérée : les appels
+    suivants repartent vers la source.
+    """
+
+    def __init__(self):
+        """Initialise le groupe d'appels"""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Exécute `fn` ou attend le résultat d'un appel identique en cours
+
+        Args:
+            key: Clé identifiant les appels équivalents
+            fn: Fonction à exécuter
+
+        Returns:
+            Tuple (résultat, partagé) où partagé indique que le résultat a
+            été servi à plusieurs appelants
+
+        Raises:
+            Exception: L'exception levée par `fn`, propagée à tous les appelants
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+                leader = True
+            else:
+                call.duplicates += 1
+                self._shared += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+        return call.result, call.duplicates > 0
+
+    def in_flight(self) -> int:
+        """Nombre d'appels en cours"""
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques de regroupement
+
+        Returns:
+            Dictionnaire avec les appels exécutés et partagés
+        """
+        with self._lock:
+            total = self._executed + self._shared
+            return {
+                'executed': self._executed,
+                'coalesced': self._shared,
+                'coalesce_rate': self._shared / total if total else 0.0,
+                'in_flight': len(self._calls)
+            }
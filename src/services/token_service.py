@@ -2,9 +2,13 @@
 Service de gestion des tokens Axiom Trade avec architecture améliorée
 """
 import json
+import os
+import queue
 import time
 import logging
-from datetime import datetime, timedelta
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from selenium import webdriver
@@ -21,6 +25,105 @@ from ..core.exceptions import (
 )
 from ..data_models.token_model import TokenModel
 from ..utils.file_utils import ensure_directory_exists, read_json_file, write_json_file
+from .single_flight import SingleFlight
+
+
+# Résultat de get_current_tokens quand aucun token n'est chargé
+_NO_CACHE_RESULT = {
+    'success': False,
+    'error': 'No tokens available in cache',
+    'tokens': None,
+    'status': 'no_cache'
+}
+
+# Champs de l'aperçu qui dépendent de l'heure : figés dans un résultat mis en
+# cache, ils deviendraient faux (get_token_status les calcule à chaque appel)
+_TIME_DEPENDENT_PREVIEW_FIELDS = ('is_expired', 'time_until_expiry_seconds')
+
+
+@dataclass(frozen=True)
+class TokenSnapshot:
+    """
+    Vue immuable des tokens courants
+    
+    Publiée par TokenService à chaque changement de tokens par simple
+    remplacement de référence : les lecteurs n'ont pas de verrou à prendre.
+    La validation structurelle, l'échéance et les résultats renvoyés par
+    get_current_tokens sont calculés une seule fois à la publication ;
+    leur aperçu des tokens omet donc les champs qui dépendent de l'heure.
+    """
+    model: Optional[TokenModel]
+    version: int
+    structurally_valid: bool
+    expires_at: float
+    valid_result: Dict[str, Any]
+    invalid_result: Dict[str, Any]
+    
+    @classmethod
+    def build(cls, model: Optional[TokenModel], version: int) -> 'TokenSnapshot':
+        """
+        Construit le snapshot d'un modèle de tokens
+        
+        Args:
+            model: Tokens à publier (None si aucun)
+            version: Numéro de version du snapshot
+        """
+        if model is None:
+            return cls(None, version, False, 0.0, _NO_CACHE_RESULT, _NO_CACHE_RESULT)
+        
+        try:
+            model.validate()
+            structurally_valid = True
+        except TokenValidationError:
+            structurally_valid = False
+        
+        # Même règle que TokenModel.is_expired (24h sans date d'expiration)
+        expiry = model.expires_at or model.last_update + timedelta(hours=24)
+        expires_at = expiry.replace(tzinfo=timezone.utc).timestamp()
+        
+        # is_valid découle du résultat servi, choisi à chaque lecture
+        preview = {
+            key: value for key, value in model.create_preview().items()
+            if key not in _TIME_DEPENDENT_PREVIEW_FIELDS
+        }
+        
+        return cls(
+            model=model,
+            version=version,
+            structurally_valid=structurally_valid,
+            expires_at=expires_at,
+            valid_result={
+                'success': True,
+                'tokens': dict(preview, is_valid=True),
+                'last_update': model.last_update.isoformat(),
+                'status': 'valid'
+            },
+            invalid_result={
+                'success': False,
+                'error': 'Cached tokens are invalid or expired',
+                'tokens': dict(preview, is_valid=False),
+                'status': 'invalid'
+            }
+        )
+    
+    @property
+    def access_token(self) -> Optional[str]:
+        """Token d'accès complet"""
+        return self.model.access_token if self.model else None
+    
+    def is_valid(self, now: Optional[float] = None) -> bool:
+        """Vérifie si les tokens sont valides et non expirés"""
+        return self.structurally_valid and (now or time.time()) <= self.expires_at
+    
+    def seconds_until_expiry(self, now: Optional[float] = None) -> Optional[float]:
+        """Secondes restantes avant expiration (None sans tokens)"""
+        if self.model is None:
+            return None
+        return self.expires_at - (now or time.time())
+    
+    def result(self) -> Dict[str, Any]:
+        """Résultat de get_current_tokens correspondant à ce snapshot"""
+        return self.valid_result if self.is_valid() else self.invalid_result
 
 
 class TokenService:
@@ -31,7 +134,10 @@ class TokenService:
     - Gestion centralisée des tokens avec cache persistant
     - Validation et expiration des tokens
     - Extraction depuis le navigateur (Selenium)
-    - Rafraîchissement automatique
+    - Rafraîchissement automatique en arrière-plan avant expiration
+    - Lectures sans verrou via un snapshot immuable (TokenSnapshot)
+    - Écriture atomique du cache, sauvegardes hors du chemin des requêtes
+    - Rechargement des tokens écrits par un autre processus (surveillance du cache)
     - Thread-safe operations
     """
     
@@ -57,14 +163,52 @@ class TokenService:
         
         # État interne
         self._driver: Optional[webdriver.Chrome] = None
-        self._cached_tokens: Optional[TokenModel] = None
+        self._snapshot = TokenSnapshot.build(None, 0)
         self._cache_lock = threading.RLock()
         self._last_refresh = datetime.utcnow()
         
+        # Rafraîchissement : un seul à la fois, planifié avant expiration
+        self._refresh_flight = SingleFlight()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_wakeup = threading.Event()
+        self._refresh_stop = threading.Event()
+        self._refresh_failures = 0
+        self._refresh_retry_at = 0.0
+        
+        # Sauvegardes écrites en arrière-plan ; liste connue pour l'élagage
+        self._backup_queue: Optional[queue.Queue] = None
+        self._backup_thread: Optional[threading.Thread] = None
+        self._known_backups: Optional[deque] = None
+        
+        # Surveillance du fichier de cache (modifications par d'autres processus)
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self._cache_signature: Optional[tuple] = None
+        
         # Initialisation
         self._ensure_directories()
         self._load_cached_tokens()
     
+    @property
+    def _cached_tokens(self) -> Optional[TokenModel]:
+        """Tokens courants (ceux du snapshot publié)"""
+        return self._snapshot.model
+    
+    @_cached_tokens.setter
+    def _cached_tokens(self, model: Optional[TokenModel]) -> None:
+        # Publication par remplacement atomique de la référence
+        self._snapshot = TokenSnapshot.build(model, self._snapshot.version + 1)
+        self._refresh_wakeup.set()
+    
+    def get_snapshot(self) -> TokenSnapshot:
+        """
+        Retourne le snapshot courant des tokens, sans verrou
+        
+        Returns:
+            TokenSnapshot immuable
+        """
+        return self._snapshot
+    
     def _ensure_directories(self) -> None:
         """Crée les répertoires nécessaires"""
         try:
@@ -78,6 +222,7 @@ class TokenService:
         """Charge les tokens depuis le cache"""
         with self._cache_lock:
             try:
+                self._cache_signature = self._get_cache_signature()
                 if self.cache_file.exists():
                     data = read_json_file(str(self.cache_file))
                     if data and 'tokens' in data:
@@ -96,43 +241,22 @@ class TokenService:
         """
         Récupère les tokens actuels depuis le cache
         
+        Lecture sans verrou du snapshot courant. Si les tokens ont expiré et
+        que le rafraîchissement automatique tourne, il est réveillé (une
+        rafale d'appels ne déclenche qu'un rafraîchissement).
+        
         Returns:
-            Dictionnaire avec les informations des tokens
+            Dictionnaire avec les informations des tokens (partagé entre les
+            appelants, ne doit pas être modifié)
         """
-        with self._cache_lock:
-            try:
-                if self._cached_tokens is None:
-                    return {
-                        'success': False,
-                        'error': 'No tokens available in cache',
-                        'tokens': None,
-                        'status': 'no_cache'
-                    }
-                
-                # Vérifier la validité
-                if not self._cached_tokens.is_valid():
-                    return {
-                        'success': False,
-                        'error': 'Cached tokens are invalid or expired',
-                        'tokens': self._cached_tokens.create_preview(),
-                        'status': 'invalid'
-                    }
-                
-                return {
-                    'success': True,
-                    'tokens': self._cached_tokens.create_preview(),
-                    'last_update': self._cached_tokens.last_update.isoformat(),
-                    'status': 'valid'
-                }
-                
-            except Exception as e:
-                self.logger.error(f"Error getting current tokens: {e}")
-                return {
-                    'success': False,
-                    'error': str(e),
-                    'tokens': None,
-                    'status': 'error'
-                }
+        snapshot = self._snapshot
+        if snapshot.is_valid():
+            return snapshot.valid_result
+        
+        if (self._refresh_thread is not None and not self._refresh_wakeup.is_set()
+                and self._refresh_retry_at <= time.monotonic()):
+            self._refresh_wakeup.set()
+        return snapshot.invalid_result
     
     def save_tokens(self, access_token: str, refresh_token: str, 
                    source: str = 'manual', expires_at: Optional[datetime] = None,
@@ -165,22 +289,25 @@ class TokenService:
                     metadata=metadata or {}
                 )
                 
-                # Backup des anciens tokens si ils existent
-                if self._cached_tokens is not None:
-                    self._backup_tokens()
+                previous_tokens = self._cached_tokens
                 
-                # Sauvegarder dans le fichier
+                # Sauvegarder dans le fichier (écriture atomique)
                 cache_data = {
                     'tokens': token_model.to_dict(),
                     'saved_at': datetime.utcnow().isoformat(),
                     'version': '2.0'
                 }
                 
-                write_json_file(str(self.cache_file), cache_data)
+                write_json_file(str(self.cache_file), cache_data, indent=None)
+                self._cache_signature = self._get_cache_signature()
                 
                 # Mettre à jour le cache en mémoire
                 self._cached_tokens = token_model
                 
+                # Backup des anciens tokens en arrière-plan
+                if previous_tokens is not None:
+                    self._schedule_backup(previous_tokens)
+                
                 self.logger.info(f"Tokens saved successfully from source: {source}")
                 return True
                 
@@ -188,55 +315,169 @@ class TokenService:
                 self.logger.error(f"Failed to save tokens: {e}")
                 raise TokenError(f"Failed to save tokens: {e}")
     
-    def _backup_tokens(self) -> None:
-        """Crée une sauvegarde des tokens actuels"""
+    def _backup_tokens(self, tokens: Optional[TokenModel] = None) -> None:
+        """
+        Crée une sauvegarde des tokens
+        
+        Args:
+            tokens: Tokens à sauvegarder (tokens actuels par défaut)
+        """
         try:
-            if self._cached_tokens is None:
+            tokens = tokens or self._cached_tokens
+            if tokens is None:
                 return
             
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
             backup_file = self.backup_dir / f"tokens_backup_{timestamp}.json"
             
             backup_data = {
-                'tokens': self._cached_tokens.to_dict(),
+                'tokens': tokens.to_dict(),
                 'backup_created': datetime.utcnow().isoformat(),
-                'original_source': self._cached_tokens.source
+                'original_source': tokens.source
             }
             
             write_json_file(str(backup_file), backup_data)
             self.logger.debug(f"Tokens backed up to: {backup_file}")
             
+            if self._known_backups is not None:
+                self._known_backups.append(backup_file)
+            
             # Nettoyer les anciens backups (garder seulement les 10 derniers)
             self._cleanup_old_backups()
             
         except Exception as e:
             self.logger.warning(f"Failed to backup tokens: {e}")
     
+    def _schedule_backup(self, tokens: TokenModel) -> None:
+        """Confie la sauvegarde de tokens au thread d'écriture en arrière-plan"""
+        with self._cache_lock:
+            if self._backup_thread is None or not self._backup_thread.is_alive():
+                self._backup_queue = queue.Queue()
+                self._backup_thread = threading.Thread(
+                    target=self._backup_worker, args=(self._backup_queue,),
+                    name="token-backup", daemon=True
+                )
+                self._backup_thread.start()
+            self._backup_queue.put(tokens)
+    
+    def _backup_worker(self, backups: queue.Queue) -> None:
+        """Écrit les sauvegardes en attente (None arrête le thread)"""
+        while True:
+            tokens = backups.get()
+            try:
+                if tokens is None:
+                    return
+                self._backup_tokens(tokens)
+            finally:
+                backups.task_done()
+    
+    def flush_backups(self, timeout: float = 5.0) -> None:
+        """Attend l'écriture des sauvegardes en attente et arrête le thread"""
+        thread = self._backup_thread
+        if thread is None:
+            return
+        self._backup_queue.put(None)
+        thread.join(timeout)
+        self._backup_thread = None
+    
     def _cleanup_old_backups(self, keep_count: int = 10) -> None:
-        """Nettoie les anciens backups"""
+        """
+        Nettoie les anciens backups
+        
+        Le répertoire n'est listé qu'une fois ; les sauvegardes suivantes
+        sont suivies en mémoire.
+        """
         try:
-            backup_files = list(self.backup_dir.glob("tokens_backup_*.json"))
-            if len(backup_files) > keep_count:
-                # Trier par date de modification et supprimer les plus anciens
-                backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                for old_backup in backup_files[keep_count:]:
+            if self._known_backups is None:
+                backup_files = list(self.backup_dir.glob("tokens_backup_*.json"))
+                backup_files.sort(key=lambda f: f.stat().st_mtime)
+                self._known_backups = deque(backup_files)
+            
+            # Supprimer les plus anciens
+            while len(self._known_backups) > keep_count:
+                old_backup = self._known_backups.popleft()
+                try:
                     old_backup.unlink()
                     self.logger.debug(f"Deleted old backup: {old_backup}")
+                except FileNotFoundError:
+                    pass
         except Exception as e:
             self.logger.warning(f"Failed to cleanup old backups: {e}")
     
-    def validate_tokens(self) -> bool:
+    def _get_cache_signature(self) -> Optional[tuple]:
+        """Signature du fichier de cache (mtime, taille, inode) ou None s'il n'existe pas"""
+        try:
+            stat = os.stat(self.cache_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def check_cache_file(self) -> bool:
         """
-        Valide les tokens actuels
+        Recharge les tokens si le fichier de cache a été modifié par un autre processus
+        
+        Un simple stat du fichier : il n'est relu que si sa signature a changé.
         
         Returns:
-            True si les tokens sont valides, False sinon
+            True si les tokens ont été rechargés
         """
+        signature = self._get_cache_signature()
+        if signature == self._cache_signature:
+            return False
+        
         with self._cache_lock:
-            if self._cached_tokens is None:
+            if signature == self._cache_signature:
                 return False
             
-            return self._cached_tokens.is_valid()
+            if signature is None:
+                # Cache supprimé par un autre processus
+                self._cache_signature = None
+                self._cached_tokens = None
+                self.logger.info("Token cache file removed, tokens cleared")
+                return True
+            
+            self._load_cached_tokens()
+            self.logger.info("Tokens reloaded from cache file")
+            return True
+    
+    def start_watching(self) -> None:
+        """Démarre la surveillance du fichier de cache"""
+        with self._cache_lock:
+            if self._watch_thread is not None and self._watch_thread.is_alive():
+                return
+            self._watch_stop.clear()
+            self._watch_thread = threading.Thread(
+                target=self._watch_loop, name="token-watch", daemon=True
+            )
+            self._watch_thread.start()
+        self.logger.info("Token cache watching started")
+    
+    def stop_watching(self, timeout: float = 5.0) -> None:
+        """Arrête la surveillance du fichier de cache"""
+        thread = self._watch_thread
+        if thread is None:
+            return
+        self._watch_stop.set()
+        thread.join(timeout)
+        self._watch_thread = None
+    
+    def _watch_loop(self) -> None:
+        """Boucle de surveillance du fichier de cache"""
+        interval = self.config.TOKEN_WATCH_INTERVAL
+        while not self._watch_stop.wait(interval):
+            try:
+                self.check_cache_file()
+            except Exception as e:
+                self.logger.warning(f"Failed to check token cache file: {e}")
+    
+    def validate_tokens(self) -> bool:
+        """
+        Valide les tokens actuels
+        
+        Returns:
+            True si les tokens sont valides, False sinon
+        """
+        return self._snapshot.is_valid()
     
     def clear_tokens(self) -> bool:
         """
@@ -254,6 +495,7 @@ class TokenService:
                 # Supprimer le fichier de cache
                 if self.cache_file.exists():
                     self.cache_file.unlink()
+                self._cache_signature = None
                 
                 # Vider le cache en mémoire
                 self._cached_tokens = None
@@ -355,9 +597,16 @@ class TokenService:
         """
         Actualise les tokens depuis le navigateur
         
+        Les appels simultanés partagent une seule extraction.
+        
         Returns:
             Dictionnaire avec le résultat de l'actualisation
         """
+        result, _ = self._refresh_flight.do('refresh', self._refresh_from_browser)
+        return result
+    
+    def _refresh_from_browser(self) -> Dict[str, Any]:
+        """Extrait et sauvegarde les tokens du navigateur"""
         try:
             self.logger.info("Starting token refresh from browser")
             
@@ -466,25 +715,79 @@ class TokenService:
         Returns:
             True si les tokens doivent être rafraîchis
         """
+        # Pas de tokens, tokens expirés ou invalides
+        if not self._snapshot.is_valid():
+            return True
+        
+        # Rafraîchissement périodique basé sur la configuration
+        time_since_refresh = datetime.utcnow() - self._last_refresh
+        if time_since_refresh.total_seconds() > self.config.TOKEN_REFRESH_INTERVAL:
+            return True
+        
+        return False
+    
+    def _next_refresh_delay(self) -> float:
+        """Délai avant le prochain rafraîchissement planifié, en secondes"""
+        snapshot = self._snapshot
+        if snapshot.is_valid():
+            # Avant expiration (avec marge), ou à l'échéance du rafraîchissement périodique
+            until_expiry = snapshot.seconds_until_expiry() - self.config.TOKEN_REFRESH_AHEAD_SECONDS
+            since_refresh = (datetime.utcnow() - self._last_refresh).total_seconds()
+            delay = min(until_expiry, self.config.TOKEN_REFRESH_INTERVAL - since_refresh)
+        else:
+            delay = 0.0
+        
+        # Backoff après un échec
+        return max(0.0, delay, self._refresh_retry_at - time.monotonic())
+    
+    def start_auto_refresh(self) -> None:
+        """Démarre le rafraîchissement automatique en arrière-plan"""
         with self._cache_lock:
-            # Pas de tokens en cache
-            if self._cached_tokens is None:
-                return True
-            
-            # Tokens expirés
-            if self._cached_tokens.is_expired():
-                return True
-            
-            # Tokens invalides
-            if not self._cached_tokens.is_valid():
-                return True
-            
-            # Rafraîchissement périodique basé sur la configuration
-            time_since_refresh = datetime.utcnow() - self._last_refresh
-            if time_since_refresh.total_seconds() > self.config.TOKEN_REFRESH_INTERVAL:
-                return True
-            
-            return False
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_stop.clear()
+            self._refresh_thread = threading.Thread(
+                target=self._auto_refresh_loop, name="token-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+        self.logger.info("Token auto-refresh started")
+    
+    def stop_auto_refresh(self, timeout: float = 5.0) -> None:
+        """Arrête le rafraîchissement automatique"""
+        thread = self._refresh_thread
+        if thread is None:
+            return
+        self._refresh_stop.set()
+        self._refresh_wakeup.set()
+        thread.join(timeout)
+        self._refresh_thread = None
+        self.logger.info("Token auto-refresh stopped")
+    
+    def _auto_refresh_loop(self) -> None:
+        """Boucle du rafraîchissement automatique"""
+        while not self._refresh_stop.is_set():
+            delay = self._next_refresh_delay()
+            if delay > 0:
+                # Réveillé plus tôt si les tokens changent ou expirent
+                self._refresh_wakeup.wait(delay)
+                self._refresh_wakeup.clear()
+                continue
+            
+            result = self.refresh_tokens()
+            if result.get('success'):
+                self._refresh_failures = 0
+                self._refresh_retry_at = 0.0
+            else:
+                self._refresh_failures += 1
+                retry = min(
+                    self.config.TOKEN_REFRESH_RETRY_SECONDS * 2 ** (self._refresh_failures - 1),
+                    self.config.TOKEN_REFRESH_INTERVAL
+                )
+                self._refresh_retry_at = time.monotonic() + retry
+                self.logger.warning(
+                    f"Background token refresh failed ({self._refresh_failures}), "
+                    f"retrying in {retry:.0f}s: {result.get('error')}"
+                )
     
     def get_backup_list(self) -> List[Dict[str, Any]]:
         """
@@ -542,11 +845,7 @@ class TokenService:
             restored_tokens.update_timestamp()
             restored_tokens.add_metadata('restored_from', backup_filename)
             
-            # Sauvegarder les tokens actuels avant restauration
-            if self._cached_tokens is not None:
-                self._backup_tokens()
-            
-            # Sauvegarder les tokens restaurés
+            # Sauvegarder les tokens restaurés (save_tokens sauvegarde les tokens actuels)
             self.save_tokens(
                 access_token=restored_tokens.access_token,
                 refresh_token=restored_tokens.refresh_token,
@@ -564,6 +863,9 @@ class TokenService:
     
     def cleanup(self) -> None:
         """Nettoie les ressources du service"""
+        self.stop_auto_refresh()
+        self.stop_watching()
+        self.flush_backups()
         with self._cache_lock:
             if self._driver:
                 try:
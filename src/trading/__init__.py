@@ -6,6 +6,8 @@ This module provides a complete trading framework including:
 - Strategy development and backtesting
 - Technical indicators and analysis tools
 - Performance measurement and optimization
+- Pooled exchange connectivity with a local mock exchange
+- Multi-process bot hosting with supervised workers
 """
 
 # Bots
@@ -19,6 +21,15 @@ from .strategies import TechnicalStrategy, MovingAverageStrategy, RSIStrategy
 from .backtesting import BacktestEngine, BacktestConfig, BacktestResult
 from .backtesting import StrategyTester, PerformanceAnalyzer, PerformanceMetrics
 
+# Journals
+from .journal import Journal, TradeRecord, SignalRecord, BacktestSummaryRecord
+
+# Exchanges
+from .exchanges import ExchangeConnector, ExchangeConfig, ConnectorPool, MockExchangeServer
+
+# Hosting
+from .hosting import BotHost, BotHostError
+
 # Indicators
 from .indicators import TechnicalIndicators, CustomIndicators
 from .indicators import sma, ema, rsi, macd, bollinger_bands, vwap, ichimoku_cloud
@@ -49,6 +60,22 @@ __all__ = [
     'PerformanceAnalyzer',
     'PerformanceMetrics',
     
+    # Journals
+    'Journal',
+    'TradeRecord',
+    'SignalRecord',
+    'BacktestSummaryRecord',
+    
+    # Exchanges
+    'ExchangeConnector',
+    'ExchangeConfig',
+    'ConnectorPool',
+    'MockExchangeServer',
+    
+    # Hosting
+    'BotHost',
+    'BotHostError',
+    
     # Indicators
     'TechnicalIndicators',
     'CustomIndicators',
@@ -4,11 +4,13 @@ Strategy tester for running multiple backtests and comparisons.
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
 from .backtest_engine import BacktestEngine, BacktestConfig, BacktestResult
 from ..strategies.base_strategy import BaseStrategy
+from ..journal import Journal, BacktestSummaryRecord, get_journal_path
 
 
 class StrategyTester:
@@ -22,15 +24,33 @@ class StrategyTester:
     - Strategy comparison and ranking
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        max_results: int = 100,
+        journal_dir: Optional[str] = None
+    ):
         """
         Initialize strategy tester.
         
         Args:
             logger: Optional logger instance
+            max_results: Number of full results kept in memory
+            journal_dir: Optional directory for the on-disk result journal
         """
         self.logger = logger or logging.getLogger(__name__)
-        self._results: Dict[str, BacktestResult] = {}
+        self.max_results = max_results
+        
+        # Full results for the most recent strategies, oldest first
+        self._results: 'OrderedDict[str, BacktestResult]' = OrderedDict()
+        
+        # Compact summaries of every run
+        self._result_journal = Journal(
+            BacktestSummaryRecord,
+            capacity=max_results,
+            path=get_journal_path(journal_dir, 'strategy_tester', 'results'),
+            logger=self.logger
+        )
     
     async def test_strategy(
         self,
@@ -53,7 +73,7 @@ class StrategyTester:
         result = await engine.run_backtest(strategy, market_data)
         
         # Store result
-        self._results[strategy.config.name] = result
+        self._store_result(strategy.config.name, result)
         
         return result
     
@@ -331,13 +351,42 @@ class StrategyTester:
         
         return combinations
     
+    def _store_result(self, name: str, result: BacktestResult):
+        """
+        Store a result, evicting the oldest full results beyond the limit.
+        
+        Args:
+            name: Strategy name
+            result: Backtest result
+        """
+        self._results.pop(name, None)
+        self._results[name] = result
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+        
+        self._result_journal.append(BacktestSummaryRecord.from_result(result))
+    
     def get_results(self) -> Dict[str, BacktestResult]:
-        """Get all stored results."""
-        return self._results.copy()
+        """Get the full results kept in memory."""
+        return dict(self._results)
+    
+    def get_result_history_page(self, page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+        """
+        Get one page of result summaries for every run, newest first.
+        
+        Args:
+            page: Page number, starting at 1
+            per_page: Summaries per page
+            
+        Returns:
+            Dictionary with summaries and pagination details
+        """
+        return self._result_journal.read_page(page, per_page)
     
     def clear_results(self):
         """Clear all stored results."""
         self._results.clear()
+        self._result_journal.clear()
     
     def export_results(self, filename: str):
         """
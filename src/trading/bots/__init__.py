@@ -5,6 +5,7 @@ Trading bots module for automated trading strategies.
 from .base_bot import BaseBot, BotConfig, BotStatus, BotPerformance
 from .scalping_bot import ScalpingBot
 from .arbitrage_bot import ArbitrageBot
+from .latency import LatencyHistogram, LatencyTracker
 
 __all__ = [
     'BaseBot',
@@ -12,5 +13,7 @@ __all__ = [
     'BotStatus',
     'BotPerformance',
     'ScalpingBot',
-    'ArbitrageBot'
+    'ArbitrageBot',
+    'LatencyHistogram',
+    'LatencyTracker'
 ]
\ No newline at end of file
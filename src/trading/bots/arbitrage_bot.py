@@ -4,10 +4,12 @@ Arbitrage bot implementation for cross-exchange trading opportunities.
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 from .base_bot import BaseBot, BotConfig, Order, OrderType, OrderSide
+from ..exchanges import ExchangeConnector, Subscription, get_connector_pool
 
 
 class ArbitrageBot(BaseBot):
@@ -34,6 +36,12 @@ class ArbitrageBot(BaseBot):
         self.execution_timeout = config.strategy_params.get('execution_timeout', 30)           # 30 seconds
         self.exchanges = config.strategy_params.get('exchanges', ['exchange_a', 'exchange_b'])
         
+        # Connection settings per exchange (exchanges without one are simulated)
+        self.exchange_configs: Dict[str, Dict[str, Any]] = config.strategy_params.get('exchange_configs', {})
+        self._connectors: Dict[str, ExchangeConnector] = {}
+        self._ticker_subscriptions: Dict[str, Subscription] = {}
+        self._order_exchanges: Dict[str, str] = {}
+        
         # Market data for multiple exchanges
         self._exchange_prices: Dict[str, Dict[str, float]] = {}
         self._exchange_volumes: Dict[str, float] = {}
@@ -71,6 +79,7 @@ class ArbitrageBot(BaseBot):
             
         except Exception as e:
             self.logger.error(f"Failed to initialize arbitrage bot: {e}")
+            await self._disconnect_exchanges()
             return False
     
     async def _execute_strategy(self) -> List[Order]:
@@ -84,7 +93,9 @@ class ArbitrageBot(BaseBot):
         
         try:
             # Update market data from all exchanges
+            started = time.perf_counter_ns()
             await self._update_all_exchange_data()
+            self._latency.record_since('update_market_data', started)
             
             # Scan for arbitrage opportunities
             opportunities = await self._scan_arbitrage_opportunities()
@@ -119,8 +130,18 @@ class ArbitrageBot(BaseBot):
     
     async def _connect_exchanges(self):
         """Connect to multiple exchanges."""
+        pool = get_connector_pool()
+        
         for exchange in self.exchanges:
-            # In a real implementation, establish connections to each exchange
+            exchange_config = self.exchange_configs.get(exchange)
+            if exchange_config:
+                # Shared connector: other bots on this exchange reuse its sessions and stream
+                connector = await pool.acquire(dict(exchange_config, name=exchange))
+                self._connectors[exchange] = connector
+                
+                if connector.config.stream_url:
+                    self._ticker_subscriptions[exchange] = await connector.subscribe('ticker', self.config.symbol)
+            
             self.logger.info(f"Connected to exchange: {exchange}")
             
             # Initialize exchange data structures
@@ -130,19 +151,32 @@ class ArbitrageBot(BaseBot):
     
     async def _disconnect_exchanges(self):
         """Disconnect from all exchanges."""
-        for exchange in self.exchanges:
+        for subscription in self._ticker_subscriptions.values():
+            await subscription.close()
+        self._ticker_subscriptions.clear()
+        
+        pool = get_connector_pool()
+        for exchange, connector in self._connectors.items():
+            await pool.release(connector)
             self.logger.info(f"Disconnected from exchange: {exchange}")
+        self._connectors.clear()
     
     async def _load_exchange_configs(self):
         """Load exchange-specific configurations."""
-        # Load trading fees for each exchange
+        # Fees reported by connected exchanges
+        for exchange, connector in self._connectors.items():
+            info = await connector.get_exchange_info()
+            self._exchange_fees[exchange] = info.get('taker_fee', connector.config.taker_fee)
+            self.logger.info(f"Loaded config for {exchange}: {info}")
+        
+        # Default trading fees for simulated exchanges
         exchange_configs = {
             'exchange_a': {'maker_fee': 0.001, 'taker_fee': 0.0015, 'withdrawal_fee': 0.0005},
             'exchange_b': {'maker_fee': 0.0008, 'taker_fee': 0.0012, 'withdrawal_fee': 0.0003},
         }
         
         for exchange, config in exchange_configs.items():
-            if exchange in self.exchanges:
+            if exchange in self.exchanges and exchange not in self._connectors:
                 self._exchange_fees[exchange] = config['taker_fee']  # Use taker fee for simplicity
                 self.logger.info(f"Loaded config for {exchange}: {config}")
     
@@ -152,6 +186,11 @@ class ArbitrageBot(BaseBot):
         base_price = 50000.0  # Mock BTC price
         
         for i, exchange in enumerate(self.exchanges):
+            connector = self._connectors.get(exchange)
+            if connector:
+                self._apply_ticker(exchange, await connector.get_ticker(self.config.symbol))
+                continue
+            
             # Add slight price differences between exchanges
             price_offset = (i - len(self.exchanges) / 2) * 0.001  # ±0.1% difference
             
@@ -166,6 +205,16 @@ class ArbitrageBot(BaseBot):
         import random
         
         for exchange in self.exchanges:
+            connector = self._connectors.get(exchange)
+            if connector:
+                # Prefer the latest streamed ticker, fall back to a REST snapshot
+                subscription = self._ticker_subscriptions.get(exchange)
+                ticker = subscription.latest if subscription else None
+                if ticker is None:
+                    ticker = await connector.get_ticker(self.config.symbol)
+                self._apply_ticker(exchange, ticker)
+                continue
+            
             # Simulate price updates with some randomness
             price_change = random.uniform(-0.002, 0.002)  # ±0.2% change
             
@@ -179,6 +228,30 @@ class ArbitrageBot(BaseBot):
             # Update volume
             self._exchange_volumes[exchange] = random.uniform(800, 1500)
     
+    def _apply_ticker(self, exchange: str, ticker: Dict[str, Any]):
+        """
+        Update market data for an exchange from its ticker.
+        
+        Args:
+            exchange: Exchange name
+            ticker: Ticker with bid, ask and volume
+        """
+        self._exchange_prices[exchange] = {'bid': ticker['bid'], 'ask': ticker['ask']}
+        self._exchange_volumes[exchange] = ticker.get('volume', 0.0)
+    
+    def _get_order_connector(self, order: Order) -> Optional[ExchangeConnector]:
+        """
+        Route an arbitrage leg to the exchange it was created for.
+        
+        Args:
+            order: Order to route
+            
+        Returns:
+            Connector of the order's exchange, or None to simulate execution
+        """
+        exchange = self._order_exchanges.get(order.id)
+        return self._connectors.get(exchange) if exchange else None
+    
     async def _scan_arbitrage_opportunities(self) -> List[Dict[str, Any]]:
         """
         Scan for arbitrage opportunities across exchanges.
@@ -346,6 +419,8 @@ class ArbitrageBot(BaseBot):
             )
             
             orders.extend([buy_order, sell_order])
+            self._order_exchanges[buy_order.id] = opportunity['buy_exchange']
+            self._order_exchanges[sell_order.id] = opportunity['sell_exchange']
             
             # Track active arbitrage
             arbitrage_id = f"arb_{datetime.now().timestamp()}"
@@ -405,7 +480,7 @@ class ArbitrageBot(BaseBot):
             await self._cancel_order(sell_order.id)
         
         # Remove from active arbitrages
-        del self._active_arbitrages[arbitrage_id]
+        self._forget_arbitrage(arbitrage_id)
     
     async def _complete_arbitrage(self, arbitrage_id: str, arbitrage: Dict[str, Any]):
         """
@@ -432,7 +507,18 @@ class ArbitrageBot(BaseBot):
                         f"Profit: {actual_profit:.2f} ({opportunity['profit_percentage']:.4f}%)")
         
         # Remove from active arbitrages
-        del self._active_arbitrages[arbitrage_id]
+        self._forget_arbitrage(arbitrage_id)
+    
+    def _forget_arbitrage(self, arbitrage_id: str):
+        """
+        Remove an arbitrage and the exchange routing of its orders.
+        
+        Args:
+            arbitrage_id: ID of the arbitrage
+        """
+        arbitrage = self._active_arbitrages.pop(arbitrage_id)
+        self._order_exchanges.pop(arbitrage['buy_order'].id, None)
+        self._order_exchanges.pop(arbitrage['sell_order'].id, None)
     
     async def _close_all_arbitrages(self):
         """Close all active arbitrage positions."""
@@ -4,12 +4,17 @@ Base trading bot class providing common functionality for all trading bots.
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
 from enum import Enum
 
+from ..journal import Journal, TradeRecord, get_journal_path
+from ..exchanges import ExchangeConnector
+from .latency import LatencyTracker
+
 
 class BotState(Enum):
     """Bot execution states."""
@@ -63,6 +68,16 @@ class BotConfig:
     # Strategy-specific parameters
     strategy_params: Dict[str, Any] = field(default_factory=dict)
     
+    # Trade journal
+    trade_history_size: int = 1000      # Trades kept in memory
+    journal_dir: Optional[str] = None   # Directory for on-disk trade journals
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BotConfig':
+        """Create config from dictionary, ignoring unknown keys."""
+        known = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        return cls(**known)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
         return {
@@ -80,7 +95,9 @@ class BotConfig:
             'execution_interval': self.execution_interval,
             'max_open_orders': self.max_open_orders,
             'enable_paper_trading': self.enable_paper_trading,
-            'strategy_params': self.strategy_params
+            'strategy_params': self.strategy_params,
+            'trade_history_size': self.trade_history_size,
+            'journal_dir': self.journal_dir
         }
 
 
@@ -98,6 +115,7 @@ class BotStatus:
     realized_pnl: float = 0.0
     daily_pnl: float = 0.0
     error_message: Optional[str] = None
+    latency: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert status to dictionary."""
@@ -113,7 +131,8 @@ class BotStatus:
             'unrealized_pnl': self.unrealized_pnl,
             'realized_pnl': self.realized_pnl,
             'daily_pnl': self.daily_pnl,
-            'error_message': self.error_message
+            'error_message': self.error_message,
+            'latency': self.latency
         }
 
 
@@ -215,9 +234,23 @@ class BaseBot(ABC):
         self._failed_trades = 0
         
         # Performance tracking
-        self._trade_history: List[Dict[str, Any]] = []
+        self._trade_journal = Journal(
+            TradeRecord,
+            capacity=config.trade_history_size,
+            path=get_journal_path(config.journal_dir, config.name, 'trades'),
+            logger=self.logger
+        )
+        self._total_pnl = 0.0
+        self._total_fees = 0.0
         self._pnl_history: List[float] = []
         
+        # Exchange connector for live orders (None: simulated fills)
+        self._connector: Optional[ExchangeConnector] = None
+        
+        # Tick-to-order latency tracing
+        self._latency = LatencyTracker()
+        self._tick_started_ns: Optional[int] = None
+        
         # Callbacks
         self._on_trade_callback: Optional[Callable] = None
         self._on_error_callback: Optional[Callable] = None
@@ -237,6 +270,9 @@ class BaseBot(ABC):
             self.logger.info(f"Starting bot: {self.config.name}")
             self._state = BotState.STARTING
             
+            # Reopen the trade journal closed by a previous stop
+            self._trade_journal.open()
+            
             # Initialize bot-specific components
             if not await self._initialize():
                 self._state = BotState.ERROR
@@ -284,6 +320,8 @@ class BaseBot(ABC):
             # Cleanup bot-specific components
             await self._cleanup()
             
+            self._trade_journal.close()
+            
             self._state = BotState.STOPPED
             self.logger.info(f"Bot {self.config.name} stopped successfully")
             return True
@@ -340,7 +378,8 @@ class BaseBot(ABC):
             successful_trades=self._successful_trades,
             failed_trades=self._failed_trades,
             current_position=self._position_size,
-            daily_pnl=self._daily_pnl
+            daily_pnl=self._daily_pnl,
+            latency=self._latency.to_dict()
         )
     
     def get_performance(self) -> BotPerformance:
@@ -350,20 +389,33 @@ class BaseBot(ABC):
         Returns:
             BotPerformance object with performance statistics
         """
-        # Calculate performance metrics from trade history
-        if not self._trade_history:
+        # Calculate performance metrics from running trade totals
+        if not self._total_trades:
             return BotPerformance()
         
-        total_return = sum(trade.get('pnl', 0) for trade in self._trade_history)
+        total_return = self._total_pnl
         win_rate = self._successful_trades / max(self._total_trades, 1)
         
         return BotPerformance(
             total_return=total_return,
             total_return_percentage=(total_return / 1000.0) * 100,  # Assuming 1000 initial capital
             win_rate=win_rate,
-            total_fees_paid=sum(trade.get('fee', 0) for trade in self._trade_history)
+            total_fees_paid=self._total_fees
         )
     
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get latency percentiles for each phase of the execution cycle.
+        
+        Returns:
+            Dictionary mapping phase names to latency summaries in microseconds
+        """
+        return self._latency.to_dict()
+    
+    def reset_latency_stats(self):
+        """Clear recorded latencies, e.g. after a warm-up period."""
+        self._latency.reset()
+    
     def set_callbacks(
         self, 
         on_trade: Optional[Callable] = None,
@@ -409,18 +461,13 @@ class BaseBot(ABC):
         while not self._shutdown_event.is_set():
             try:
                 if self._state == BotState.RUNNING:
-                    # Execute strategy
-                    orders = await self._execute_strategy()
-                    
-                    # Process orders
-                    for order in orders:
-                        await self._place_order(order)
-                    
-                    # Update last execution time
-                    self._last_execution = datetime.now()
+                    await self._run_cycle()
                 
-                # Wait for next execution interval
-                await asyncio.sleep(self.config.execution_interval)
+                # Wait for next execution interval (returns early on stop)
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), self.config.execution_interval)
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
                 self.logger.error(f"Error in execution loop: {e}")
@@ -431,6 +478,22 @@ class BaseBot(ABC):
                 self._state = BotState.ERROR
                 break
     
+    async def _run_cycle(self):
+        """Run one strategy cycle and place the resulting orders."""
+        self._tick_started_ns = time.perf_counter_ns()
+        
+        # Execute strategy
+        orders = await self._execute_strategy()
+        self._latency.record_since('execute_strategy', self._tick_started_ns)
+        
+        # Process orders
+        for order in orders:
+            if await self._place_order(order):
+                self._latency.record_since('tick_to_order', self._tick_started_ns)
+        
+        # Update last execution time
+        self._last_execution = datetime.now()
+    
     async def _place_order(self, order: Order) -> bool:
         """
         Place a trading order.
@@ -441,13 +504,19 @@ class BaseBot(ABC):
         Returns:
             True if order placed successfully, False otherwise
         """
+        started = time.perf_counter_ns()
         try:
             # Validate order
-            if not self._validate_order(order):
+            valid = self._validate_order(order)
+            self._latency.record_since('validate_order', started)
+            if not valid:
                 return False
             
             # Check risk limits
-            if not self._check_risk_limits(order):
+            risk_started = time.perf_counter_ns()
+            within_limits = self._check_risk_limits(order)
+            self._latency.record_since('check_risk_limits', risk_started)
+            if not within_limits:
                 self.logger.warning(f"Order rejected due to risk limits: {order.id}")
                 return False
             
@@ -461,6 +530,8 @@ class BaseBot(ABC):
             # Track order
             self._open_orders[order.id] = order
             
+            self._latency.record_since('place_order', started)
+            
             self.logger.info(f"Order placed: {order.id} - {order.side.value} {order.quantity} {order.symbol}")
             return True
             
@@ -555,25 +626,65 @@ class BaseBot(ABC):
         order.filled_quantity = order.quantity
         order.filled_price = order.price or 50000.0  # Mock price
         
-        # Update position
-        if order.side == OrderSide.BUY:
-            self._position_size += order.quantity
-        else:
-            self._position_size -= order.quantity
-        
-        # Record trade
-        await self._record_trade(order)
+        # Update position and record trade
+        await self._apply_fill(order)
     
     async def _execute_order(self, order: Order):
         """
         Execute order in live trading mode.
         
+        Orders are sent through the bot's exchange connector; bots without
+        a connector fall back to simulated execution.
+        
         Args:
             order: Order to execute
         """
-        # In a real implementation, this would interface with the exchange API
-        # For now, simulate execution
-        await self._simulate_order_execution(order)
+        connector = self._get_order_connector(order)
+        if connector is None:
+            await self._simulate_order_execution(order)
+            return
+        
+        ack = await connector.place_order(
+            symbol=order.symbol,
+            side=order.side.value,
+            order_type=order.type.value,
+            quantity=order.quantity,
+            price=order.price,
+            client_order_id=order.id
+        )
+        
+        order.status = ack.get('status', 'pending')
+        if order.status == 'filled':
+            order.filled_at = datetime.now()
+            order.filled_quantity = ack.get('filled_quantity', order.quantity)
+            order.filled_price = ack.get('filled_price', order.price)
+            await self._apply_fill(order)
+    
+    def _get_order_connector(self, order: Order) -> Optional[ExchangeConnector]:
+        """
+        Get the exchange connector that should receive an order.
+        
+        Args:
+            order: Order to route
+            
+        Returns:
+            Exchange connector, or None to simulate execution
+        """
+        return self._connector
+    
+    async def _apply_fill(self, order: Order):
+        """
+        Update position for a filled order and record the trade.
+        
+        Args:
+            order: Filled order
+        """
+        if order.side == OrderSide.BUY:
+            self._position_size += order.filled_quantity
+        else:
+            self._position_size -= order.filled_quantity
+        
+        await self._record_trade(order)
     
     async def _record_trade(self, order: Order):
         """
@@ -582,22 +693,25 @@ class BaseBot(ABC):
         Args:
             order: Completed order
         """
-        trade = {
-            'id': order.id,
-            'symbol': order.symbol,
-            'side': order.side.value,
-            'quantity': order.filled_quantity,
-            'price': order.filled_price,
-            'timestamp': order.filled_at,
-            'fee': order.filled_quantity * order.filled_price * self.config.trading_fee,
-            'pnl': 0.0  # Calculate based on position
-        }
+        record = TradeRecord(
+            id=order.id,
+            symbol=order.symbol,
+            side=order.side.value,
+            quantity=order.filled_quantity,
+            price=order.filled_price,
+            timestamp=order.filled_at,
+            fee=order.filled_quantity * order.filled_price * self.config.trading_fee,
+            pnl=0.0  # Calculate based on position
+        )
         
-        self._trade_history.append(trade)
+        self._trade_journal.append(record)
+        self._total_pnl += record.pnl
+        self._total_fees += record.fee
         self._total_trades += 1
         self._successful_trades += 1  # Assume success for now
         
         # Call trade callback
+        trade = record.to_dict()
         if self._on_trade_callback:
             await self._on_trade_callback(trade)
         
@@ -615,6 +729,29 @@ class BaseBot(ABC):
         """Get list of open orders."""
         return list(self._open_orders.values())
     
-    def get_trade_history(self) -> List[Dict[str, Any]]:
-        """Get trade history."""
-        return self._trade_history.copy()
\ No newline at end of file
+    def get_trade_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get recent trade history, oldest first.
+        
+        Args:
+            limit: Maximum number of trades (all in-memory trades if None)
+            
+        Returns:
+            List of trade dictionaries
+        """
+        return [record.to_dict() for record in self._trade_journal.tail(limit)]
+    
+    def get_trade_history_page(self, page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+        """
+        Get one page of the full trade history, newest first.
+        
+        Older pages are read from the on-disk journal when configured.
+        
+        Args:
+            page: Page number, starting at 1
+            per_page: Trades per page
+            
+        Returns:
+            Dictionary with trades and pagination details
+        """
+        return self._trade_journal.read_page(page, per_page)
\ No newline at end of file
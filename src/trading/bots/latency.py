@@ -0,0 +1,240 @@
+"""
+Latency histograms for tracing the bot tick-to-order pipeline.
+"""
+
+import math
+import time
+from typing import Dict, List, Optional, Any
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded as integer nanoseconds. Values below
+    ``2 ** precision_bits`` are counted exactly; above that, every power of
+    two is split into ``2 ** (precision_bits - 1)`` linear sub-buckets, so
+    any recorded value is reported with a relative error below
+    ``2 ** (1 - precision_bits)`` (0.8% with the default of 8 bits).
+    Recording is O(1) and never allocates.
+    """
+
+    def __init__(self, highest_value: int = 60 * 10 ** 9, precision_bits: int = 8):
+        """
+        Initialize latency histogram.
+
+        Args:
+            highest_value: Largest trackable value in nanoseconds; larger
+                values are clamped
+            precision_bits: Bits of precision per power of two
+        """
+        self.highest_value = highest_value
+        self._bits = precision_bits
+        self._sub_count = 1 << precision_bits
+        self._half_count = self._sub_count >> 1
+        self._counts: List[int] = [0] * (self._index(highest_value) + 1)
+
+        self.count = 0
+        self.total = 0
+        self._min = highest_value + 1
+        self._max = -1
+
+    @property
+    def min(self) -> Optional[int]:
+        """Smallest recorded value in nanoseconds."""
+        return self._min if self.count else None
+
+    @property
+    def max(self) -> Optional[int]:
+        """Largest recorded value in nanoseconds."""
+        return self._max if self.count else None
+
+    def _index(self, value: int) -> int:
+        """Get the bucket index of a value."""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._bits
+        return shift * self._half_count + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Get the largest value that falls into a bucket."""
+        if index < self._sub_count:
+            return index
+        shift = index // self._half_count - 1
+        sub_bucket = index - shift * self._half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int):
+        """
+        Record one latency.
+
+        Args:
+            value: Latency in nanoseconds
+        """
+        # Hot path: index computation inlined to keep tracing overhead low
+        if value < 0:
+            value = 0
+        elif value > self.highest_value:
+            value = self.highest_value
+
+        if value < self._sub_count:
+            self._counts[value] += 1
+        else:
+            shift = value.bit_length() - self._bits
+            self._counts[shift * self._half_count + (value >> shift)] += 1
+
+        self.count += 1
+        self.total += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Get the value at a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in nanoseconds (0 when empty)
+        """
+        if not self.count:
+            return 0
+
+        target = max(1, math.ceil(percentile / 100.0 * self.count))
+        cumulative = 0
+        for index in range(self._index(self._min), self._index(self._max) + 1):
+            cumulative += self._counts[index]
+            if cumulative >= target:
+                return min(self._highest_equivalent(index), self._max)
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in nanoseconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: 'LatencyHistogram'):
+        """
+        Add the counts of another histogram with the same layout.
+
+        Args:
+            other: Histogram to merge into this one
+        """
+        if (other._bits, len(other._counts)) != (self._bits, len(self._counts)):
+            raise ValueError("Cannot merge histograms with different layouts")
+        if not other.count:
+            return
+
+        for index in range(other._index(other._min), other._index(other._max) + 1):
+            self._counts[index] += other._counts[index]
+        self.count += other.count
+        self.total += other.total
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def reset(self):
+        """Clear all recorded values."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0
+        self._min = self.highest_value + 1
+        self._max = -1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the histogram in microseconds."""
+        return {
+            'count': self.count,
+            'min_us': (self.min or 0) / 1000.0,
+            'mean_us': self.mean / 1000.0,
+            'p50_us': self.percentile(50) / 1000.0,
+            'p90_us': self.percentile(90) / 1000.0,
+            'p99_us': self.percentile(99) / 1000.0,
+            'p999_us': self.percentile(99.9) / 1000.0,
+            'max_us': (self.max or 0) / 1000.0
+        }
+
+
+class LatencyTracker:
+    """
+    Latency histograms for the phases of a bot's execution cycle.
+
+    Phases:
+        update_market_data: Intake of the latest market data
+        execute_strategy: Whole strategy run (includes update_market_data)
+        validate_order: Order validation
+        check_risk_limits: Risk limit checks
+        place_order: Whole order placement (includes validation and risk checks)
+        tick_to_order: From the start of the cycle to an accepted order
+    """
+
+    PHASES = (
+        'update_market_data',
+        'execute_strategy',
+        'validate_order',
+        'check_risk_limits',
+        'place_order',
+        'tick_to_order'
+    )
+
+    def __init__(self, highest_value: int = 60 * 10 ** 9, precision_bits: int = 8):
+        """
+        Initialize latency tracker.
+
+        Args:
+            highest_value: Largest trackable latency in nanoseconds
+            precision_bits: Histogram precision bits
+        """
+        self._highest_value = highest_value
+        self._precision_bits = precision_bits
+        self._histograms: Dict[str, LatencyHistogram] = {
+            phase: LatencyHistogram(highest_value, precision_bits) for phase in self.PHASES
+        }
+
+    def record(self, phase: str, value: int):
+        """
+        Record a latency for a phase.
+
+        Args:
+            phase: Phase name
+            value: Latency in nanoseconds
+        """
+        histogram = self._histograms.get(phase)
+        if histogram is None:
+            histogram = LatencyHistogram(self._highest_value, self._precision_bits)
+            self._histograms[phase] = histogram
+        histogram.record(value)
+
+    def record_since(self, phase: str, started_ns: int):
+        """
+        Record the time elapsed since a ``time.perf_counter_ns()`` reading.
+
+        Args:
+            phase: Phase name
+            started_ns: Start of the phase
+        """
+        elapsed = time.perf_counter_ns() - started_ns
+        histogram = self._histograms.get(phase)
+        if histogram is None:
+            self.record(phase, elapsed)
+        else:
+            histogram.record(elapsed)
+
+    def get_histogram(self, phase: str) -> Optional[LatencyHistogram]:
+        """Get the histogram of a phase."""
+        return self._histograms.get(phase)
+
+    def reset(self):
+        """Clear every histogram."""
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize every phase that recorded at least one value."""
+        return {
+            phase: histogram.to_dict()
+            for phase, histogram in self._histograms.items()
+            if histogram.count
+        }
@@ -4,10 +4,12 @@ Scalping bot implementation for high-frequency trading strategies.
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
 from .base_bot import BaseBot, BotConfig, Order, OrderType, OrderSide
+from ..exchanges import Subscription, get_connector_pool
 
 
 class ScalpingBot(BaseBot):
@@ -34,6 +36,14 @@ class ScalpingBot(BaseBot):
         self.max_hold_time = config.strategy_params.get('max_hold_time', 300)         # 5 minutes
         self.volume_threshold = config.strategy_params.get('volume_threshold', 1000)   # Minimum volume
         
+        # Exchange connection (market data is simulated when not configured)
+        self.exchange_config: Optional[Dict[str, Any]] = config.strategy_params.get('exchange')
+        self._ticker_subscription: Optional[Subscription] = None
+        
+        # Axiom Trade API ticker endpoint, used when no exchange is configured
+        self.api_ticker_endpoint: Optional[str] = config.strategy_params.get('api_ticker_endpoint')
+        self._api_proxy = None
+        
         # Market data
         self._current_price = 0.0
         self._bid_price = 0.0
@@ -67,6 +77,7 @@ class ScalpingBot(BaseBot):
             
         except Exception as e:
             self.logger.error(f"Failed to initialize scalping bot: {e}")
+            await self._disconnect_market_data()
             return False
     
     async def _execute_strategy(self) -> List[Order]:
@@ -80,7 +91,9 @@ class ScalpingBot(BaseBot):
         
         try:
             # Update market data
+            started = time.perf_counter_ns()
             await self._update_market_data()
+            self._latency.record_since('update_market_data', started)
             
             # Check if we should trade
             if not self._should_trade():
@@ -120,26 +133,101 @@ class ScalpingBot(BaseBot):
     
     async def _connect_market_data(self):
         """Connect to market data feed."""
-        # In a real implementation, connect to exchange WebSocket or API
+        if self.exchange_config:
+            # Shared connector: bots on the same exchange reuse its sessions and stream
+            self._connector = await get_connector_pool().acquire(self.exchange_config)
+            
+            if self._connector.config.stream_url:
+                self._ticker_subscription = await self._connector.subscribe('ticker', self.config.symbol)
+        elif self.api_ticker_endpoint:
+            # Imported lazily: the services package loads the Windows service modules
+            from ...services.async_api_proxy_service import acquire_async_api_proxy
+            
+            # Shared async proxy: bots on this loop reuse its connections and rate limits
+            self._api_proxy = acquire_async_api_proxy()
+        
         self.logger.info(f"Connected to market data for {self.config.symbol}")
     
     async def _disconnect_market_data(self):
         """Disconnect from market data feed."""
+        if self._ticker_subscription:
+            await self._ticker_subscription.close()
+            self._ticker_subscription = None
+        
+        if self._connector:
+            await get_connector_pool().release(self._connector)
+            self._connector = None
+        
+        if self._api_proxy:
+            from ...services.async_api_proxy_service import release_async_api_proxy
+            
+            await release_async_api_proxy(self._api_proxy)
+            self._api_proxy = None
+        
         self.logger.info("Disconnected from market data")
     
     async def _load_initial_data(self):
         """Load initial market data."""
-        # Simulate loading initial market data
-        self._current_price = 50000.0  # Mock BTC price
-        self._bid_price = 49995.0
-        self._ask_price = 50005.0
-        self._volume = 1500.0
+        if self._connector:
+            self._apply_ticker(await self._connector.get_ticker(self.config.symbol))
+        elif self._api_proxy:
+            self._apply_ticker(await self._fetch_api_ticker())
+        else:
+            # Simulate loading initial market data
+            self._current_price = 50000.0  # Mock BTC price
+            self._bid_price = 49995.0
+            self._ask_price = 50005.0
+            self._volume = 1500.0
         
         # Initialize price history
         self._price_history = [self._current_price] * 20
     
+    def _apply_ticker(self, ticker: Dict[str, Any]):
+        """
+        Update market data from an exchange ticker.
+        
+        Args:
+            ticker: Ticker with bid, ask, last and volume
+        """
+        self._bid_price = ticker['bid']
+        self._ask_price = ticker['ask']
+        self._current_price = ticker.get('last') or (self._bid_price + self._ask_price) / 2
+        self._volume = ticker.get('volume', 0.0)
+    
+    async def _fetch_api_ticker(self) -> Dict[str, Any]:
+        """
+        Fetch the ticker from the Axiom Trade API.
+        
+        The request, retries included, must finish within one execution interval.
+        
+        Returns:
+            Ticker with bid, ask, last and volume
+        """
+        response = await self._api_proxy.proxy_request(
+            self.api_ticker_endpoint,
+            params={'symbol': self.config.symbol},
+            deadline=time.monotonic() + self.config.execution_interval
+        )
+        if not response.is_success() or not isinstance(response.data, dict):
+            raise RuntimeError(f"Ticker request failed with status {response.status_code}: "
+                               f"{response.error_message}")
+        return response.data
+    
     async def _update_market_data(self):
         """Update current market data."""
+        if self._connector or self._api_proxy:
+            # Prefer the latest streamed ticker, fall back to a REST snapshot
+            ticker = self._ticker_subscription.latest if self._ticker_subscription else None
+            if ticker is None:
+                ticker = (await self._connector.get_ticker(self.config.symbol) if self._connector
+                          else await self._fetch_api_ticker())
+            self._apply_ticker(ticker)
+            
+            self._price_history.append(self._current_price)
+            if len(self._price_history) > 100:
+                self._price_history.pop(0)
+            return
+        
         # Simulate market data updates
         import random
         
@@ -412,20 +500,21 @@ class ScalpingBot(BaseBot):
         Returns:
             Average entry price
         """
-        if not self._trade_history:
+        recent_trades = self._trade_journal.tail(10)  # Last 10 trades
+        if not recent_trades:
             return 0.0
         
         # Calculate weighted average of recent trades
         total_quantity = 0.0
         total_value = 0.0
         
-        for trade in reversed(self._trade_history[-10:]):  # Last 10 trades
-            if trade['side'] == 'buy':
-                total_quantity += trade['quantity']
-                total_value += trade['quantity'] * trade['price']
+        for trade in reversed(recent_trades):
+            if trade.side == 'buy':
+                total_quantity += trade.quantity
+                total_value += trade.quantity * trade.price
             else:
-                total_quantity -= trade['quantity']
-                total_value -= trade['quantity'] * trade['price']
+                total_quantity -= trade.quantity
+                total_value -= trade.quantity * trade.price
         
         if total_quantity > 0:
             return total_value / total_quantity
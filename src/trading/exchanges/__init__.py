@@ -0,0 +1,19 @@
+"""
+Exchange connectivity module with pooled async connectors.
+"""
+
+from .connector import ExchangeConnector, ExchangeConfig, ExchangeError, Subscription
+from .pool import ConnectorPool, get_connector_pool
+from .rate_limiter import AsyncTokenBucket
+from .mock_server import MockExchangeServer
+
+__all__ = [
+    'ExchangeConnector',
+    'ExchangeConfig',
+    'ExchangeError',
+    'Subscription',
+    'ConnectorPool',
+    'get_connector_pool',
+    'AsyncTokenBucket',
+    'MockExchangeServer'
+]
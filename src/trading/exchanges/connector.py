@@ -0,0 +1,501 @@
+"""
+Pooled asynchronous exchange connector with multiplexed market data streams.
+"""
+
+import asyncio
+import json
+import logging
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from .rate_limiter import AsyncTokenBucket
+
+# Methods that can be replayed without side effects once the exchange has seen them
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+class ExchangeError(Exception):
+    """Error returned by an exchange or raised by its connector."""
+
+    def __init__(self, exchange: str, message: str, status_code: Optional[int] = None):
+        self.exchange = exchange
+        self.status_code = status_code
+        super().__init__(f"[{exchange}] {message}")
+
+
+@dataclass
+class ExchangeConfig:
+    """Connection settings for one exchange."""
+    name: str
+    rest_url: str
+    stream_url: Optional[str] = None
+
+    # Fees
+    maker_fee: float = 0.001
+    taker_fee: float = 0.001
+
+    # Rate limiting
+    requests_per_second: float = 10.0
+    burst: int = 20
+
+    # Connection pool
+    max_connections: int = 10
+    keepalive_timeout: float = 30.0
+    request_timeout: float = 10.0
+    max_retries: int = 3
+
+    # Stream reconnection
+    reconnect_initial_delay: float = 0.5
+    reconnect_max_delay: float = 30.0
+    heartbeat: float = 15.0
+    subscription_queue_size: int = 100
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExchangeConfig':
+        """Create config from dictionary, ignoring unknown keys."""
+        known = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        return cls(**known)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert config to dictionary."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+class Subscription:
+    """
+    Consumer handle on a multiplexed market data stream.
+
+    Keeps the latest message for polling consumers and a bounded queue for
+    iterating consumers; when the queue is full the oldest message is
+    dropped so slow consumers never stall the shared stream.
+    """
+
+    def __init__(
+        self,
+        connector: 'ExchangeConnector',
+        channel: str,
+        symbol: str,
+        queue_size: int = 100,
+        callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ):
+        self.connector = connector
+        self.channel = channel
+        self.symbol = symbol
+        self.callback = callback
+        self.latest: Optional[Dict[str, Any]] = None
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._closed = False
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Stream key shared by all subscribers of the same channel and symbol."""
+        return (self.channel, self.symbol)
+
+    def _deliver(self, data: Dict[str, Any]):
+        """Deliver a stream message to this subscriber."""
+        self.latest = data
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(data)
+
+        if self.callback:
+            result = self.callback(data)
+            if asyncio.iscoroutine(result):
+                asyncio.ensure_future(result)
+
+    async def get(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the next message.
+
+        Args:
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Stream message payload
+        """
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if self._closed:
+            raise StopAsyncIteration
+        return await self._queue.get()
+
+    async def close(self):
+        """Unsubscribe from the stream."""
+        if not self._closed:
+            self._closed = True
+            await self.connector.unsubscribe(self)
+
+
+class ExchangeConnector:
+    """
+    Asynchronous connector for one exchange.
+
+    Owns a single pooled HTTP session and a single streaming connection.
+    All bots trading on the exchange share them: REST calls go through a
+    per-exchange token bucket and identical stream subscriptions are sent
+    upstream once and fanned out locally. The stream reconnects with
+    exponential backoff and replays active subscriptions.
+    """
+
+    def __init__(self, config: ExchangeConfig, logger: Optional[logging.Logger] = None):
+        """
+        Initialize exchange connector.
+
+        Args:
+            config: Exchange configuration
+            logger: Optional logger instance
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for exchange connectors: pip install aiohttp")
+
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.rate_limiter = AsyncTokenBucket(config.requests_per_second, config.burst)
+
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._ws: Optional['aiohttp.ClientWebSocketResponse'] = None
+        self._stream_task: Optional[asyncio.Task] = None
+        self._stream_connected = asyncio.Event()
+        self._closing = False
+
+        # Multiplexed subscriptions
+        self._subscribers: Dict[Tuple[str, str], Set[Subscription]] = {}
+
+        # Statistics
+        self._request_count = 0
+        self._reconnect_count = 0
+        self._message_count = 0
+
+    @property
+    def name(self) -> str:
+        """Exchange name."""
+        return self.config.name
+
+    async def connect(self):
+        """Open the pooled HTTP session and start the stream if configured."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                keepalive_timeout=self.config.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+                headers={'User-Agent': 'AxiomTrade-ExchangeConnector/1.0'}
+            )
+            self._closing = False
+            self.logger.info(f"Connected to exchange: {self.name}")
+
+        if self.config.stream_url and self._stream_task is None:
+            self._stream_task = asyncio.create_task(self._stream_loop())
+
+    async def close(self):
+        """Close the stream and the HTTP session."""
+        self._closing = True
+
+        if self._stream_task:
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
+
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        self._ws = None
+        self._stream_connected.clear()
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        self.logger.info(f"Disconnected from exchange: {self.name}")
+
+    async def wait_stream_ready(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until the streaming connection is established.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if connected, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._stream_connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    # REST API
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a rate-limited REST request with retry on transient failures.
+
+        Idempotent methods are retried on 429, 5xx, timeouts and connection
+        errors. Other methods (e.g. placing an order) may already have been
+        processed when a 5xx, a timeout or a dropped connection is seen, so
+        they are only retried when the exchange provably did not act on
+        them: connection refused or 429.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the exchange REST URL
+            params: Query parameters
+            data: JSON body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            ExchangeError: If the request fails after all retries
+        """
+        if self._session is None or self._session.closed:
+            await self.connect()
+
+        url = f"{self.config.rest_url.rstrip('/')}/{path.lstrip('/')}"
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        delay = self.config.reconnect_initial_delay
+        last_error = "unknown error"
+
+        for attempt in range(self.config.max_retries + 1):
+            await self.rate_limiter.acquire()
+            self._request_count += 1
+
+            try:
+                async with self._session.request(method, url, params=params, json=data) as response:
+                    if response.status == 429 or response.status >= 500:
+                        retry_after = response.headers.get('Retry-After')
+                        last_error = f"HTTP {response.status}"
+                        if response.status != 429 and not idempotent:
+                            raise ExchangeError(self.name, f"{method} {path} failed: {last_error} "
+                                                f"(not retried, may have been processed)", response.status)
+                        if retry_after:
+                            delay = max(delay, float(retry_after))
+                    elif response.status >= 400:
+                        raise ExchangeError(self.name, await response.text(), response.status)
+                    else:
+                        return await response.json()
+
+            except aiohttp.ClientConnectorError as e:
+                # Connection never established: the request was not sent
+                last_error = str(e) or e.__class__.__name__
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                last_error = str(e) or e.__class__.__name__
+                if not idempotent:
+                    raise ExchangeError(self.name, f"{method} {path} failed: {last_error} "
+                                        f"(not retried, may have been processed)") from e
+
+            if attempt < self.config.max_retries:
+                self.logger.warning(f"{self.name} {method} {path} failed ({last_error}), "
+                                    f"retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.config.reconnect_max_delay)
+
+        raise ExchangeError(self.name, f"{method} {path} failed: {last_error}")
+
+    async def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        """Get the current ticker (bid, ask, last, volume) for a symbol."""
+        return await self.request('GET', '/api/v1/ticker', params={'symbol': symbol})
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        """Get exchange information including trading fees."""
+        return await self.request('GET', '/api/v1/exchange_info')
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        client_order_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Place an order on the exchange.
+
+        Args:
+            symbol: Trading symbol
+            side: "buy" or "sell"
+            order_type: Order type value
+            quantity: Order quantity
+            price: Limit price
+            client_order_id: Optional client-side order ID
+
+        Returns:
+            Order acknowledgement from the exchange
+        """
+        return await self.request('POST', '/api/v1/orders', data={
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': quantity,
+            'price': price,
+            'client_order_id': client_order_id
+        })
+
+    # Streaming API
+
+    async def subscribe(
+        self,
+        channel: str,
+        symbol: str,
+        callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Subscription:
+        """
+        Subscribe to a market data stream.
+
+        The upstream subscription is only sent for the first local
+        subscriber of a channel and symbol.
+
+        Args:
+            channel: Stream channel (e.g. "ticker")
+            symbol: Trading symbol
+            callback: Optional callback invoked for each message
+
+        Returns:
+            Subscription handle
+        """
+        if not self.config.stream_url:
+            raise ExchangeError(self.name, "No stream URL configured")
+
+        await self.connect()
+
+        subscription = Subscription(self, channel, symbol, self.config.subscription_queue_size, callback)
+        subscribers = self._subscribers.setdefault(subscription.key, set())
+        subscribers.add(subscription)
+
+        if len(subscribers) == 1:
+            await self._send_stream({'op': 'subscribe', 'channel': channel, 'symbol': symbol})
+
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription):
+        """
+        Remove a subscriber, unsubscribing upstream after the last one.
+
+        Args:
+            subscription: Subscription to remove
+        """
+        subscribers = self._subscribers.get(subscription.key)
+        if not subscribers:
+            return
+
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.key]
+            await self._send_stream({
+                'op': 'unsubscribe',
+                'channel': subscription.channel,
+                'symbol': subscription.symbol
+            })
+
+    async def _send_stream(self, message: Dict[str, Any]):
+        """Send a control message if the stream is connected (replayed on reconnect otherwise)."""
+        if self._ws is not None and not self._ws.closed:
+            try:
+                await self._ws.send_str(json.dumps(message))
+            except ConnectionError as e:
+                self.logger.warning(f"{self.name} stream send failed: {e}")
+
+    async def _stream_loop(self):
+        """Maintain the streaming connection, reconnecting with backoff."""
+        delay = self.config.reconnect_initial_delay
+
+        while not self._closing:
+            try:
+                async with self._session.ws_connect(self.config.stream_url, heartbeat=self.config.heartbeat) as ws:
+                    self._ws = ws
+                    self._stream_connected.set()
+                    delay = self.config.reconnect_initial_delay
+                    self.logger.info(f"{self.name} stream connected")
+
+                    # Replay active subscriptions
+                    for channel, symbol in list(self._subscribers):
+                        await ws.send_str(json.dumps({'op': 'subscribe', 'channel': channel, 'symbol': symbol}))
+
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            self._dispatch(json.loads(message.data))
+                        elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"{self.name} stream error: {e}")
+            finally:
+                self._ws = None
+                self._stream_connected.clear()
+
+            if self._closing:
+                break
+
+            # Exponential backoff with jitter
+            self._reconnect_count += 1
+            wait = delay * (0.5 + random.random() / 2)
+            self.logger.info(f"{self.name} stream reconnecting in {wait:.2f}s")
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, self.config.reconnect_max_delay)
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """Fan a stream message out to local subscribers."""
+        key = (message.get('channel'), message.get('symbol'))
+        subscribers = self._subscribers.get(key)
+        if not subscribers:
+            return
+
+        self._message_count += 1
+        data = message.get('data', {})
+        for subscription in list(subscribers):
+            try:
+                subscription._deliver(data)
+            except Exception as e:
+                self.logger.error(f"{self.name} subscriber error on {key}: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get connector statistics.
+
+        Returns:
+            Dictionary with request, stream and subscription counters
+        """
+        return {
+            'exchange': self.name,
+            'requests': self._request_count,
+            'stream_connected': self._stream_connected.is_set(),
+            'stream_reconnects': self._reconnect_count,
+            'stream_messages': self._message_count,
+            'subscriptions': {
+                f"{channel}:{symbol}": len(subscribers)
+                for (channel, symbol), subscribers in self._subscribers.items()
+            },
+            'rate_limit_tokens': self.rate_limiter.available
+        }
+
+    def get_subscribed_streams(self) -> List[Tuple[str, str]]:
+        """Get the upstream streams currently subscribed."""
+        return list(self._subscribers)
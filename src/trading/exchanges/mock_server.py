@@ -0,0 +1,334 @@
+"""
+Local mock exchange server for offline connector and bot testing.
+
+Run standalone with:
+    python -m src.trading.exchanges.mock_server --port 8765 --name exchange_a
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import uuid
+from datetime import datetime
+from typing import Dict, Optional, Any, Set, Tuple
+
+try:
+    from aiohttp import web, WSMsgType
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+class MockExchangeServer:
+    """
+    Minimal exchange speaking the protocol expected by ``ExchangeConnector``.
+
+    REST endpoints:
+        GET  /api/v1/exchange_info
+        GET  /api/v1/ticker?symbol=...
+        POST /api/v1/orders
+    Stream endpoint:
+        GET  /ws  (JSON messages: {"op": "subscribe"|"unsubscribe", "channel", "symbol"})
+
+    Prices follow a seeded random walk so runs are reproducible.
+    """
+
+    def __init__(
+        self,
+        name: str = "mock_exchange",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        base_prices: Optional[Dict[str, float]] = None,
+        price_offset: float = 0.0,
+        spread: float = 0.0001,
+        volatility: float = 0.001,
+        tick_interval: float = 0.1,
+        maker_fee: float = 0.001,
+        taker_fee: float = 0.001,
+        seed: Optional[int] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize mock exchange server.
+
+        Args:
+            name: Exchange name reported by exchange_info
+            host: Bind address
+            port: Bind port (0 picks a free port)
+            base_prices: Initial mid price per symbol
+            price_offset: Relative offset applied to every price (e.g. 0.002)
+            spread: Relative bid/ask spread
+            volatility: Maximum relative price move per tick
+            tick_interval: Seconds between stream updates
+            maker_fee: Maker fee reported by exchange_info
+            taker_fee: Taker fee reported by exchange_info
+            seed: Random seed for reproducible prices
+            logger: Optional logger instance
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for the mock exchange server: pip install aiohttp")
+
+        self.name = name
+        self.host = host
+        self.port = port
+        self.spread = spread
+        self.volatility = volatility
+        self.tick_interval = tick_interval
+        self.maker_fee = maker_fee
+        self.taker_fee = taker_fee
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._random = random.Random(seed)
+        self._prices: Dict[str, float] = {
+            symbol: price * (1 + price_offset)
+            for symbol, price in (base_prices or {'BTC/USDT': 50000.0, 'ETH/USDT': 3000.0}).items()
+        }
+        self._volumes: Dict[str, float] = {symbol: 1500.0 for symbol in self._prices}
+
+        self._clients: Dict['web.WebSocketResponse', Set[Tuple[str, str]]] = {}
+        self._runner: Optional['web.AppRunner'] = None
+        self._ticker_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.request_count = 0
+        self.order_count = 0
+        self.stream_connections = 0
+
+    @property
+    def rest_url(self) -> str:
+        """Base URL for REST requests."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stream_url(self) -> str:
+        """URL of the streaming endpoint."""
+        return f"ws://{self.host}:{self.port}/ws"
+
+    def exchange_config(self, **overrides) -> Dict[str, Any]:
+        """
+        Build an ExchangeConfig dictionary pointing at this server.
+
+        Args:
+            **overrides: Extra ExchangeConfig fields
+
+        Returns:
+            Configuration dictionary
+        """
+        config = {
+            'name': self.name,
+            'rest_url': self.rest_url,
+            'stream_url': self.stream_url,
+            'maker_fee': self.maker_fee,
+            'taker_fee': self.taker_fee
+        }
+        config.update(overrides)
+        return config
+
+    async def start(self):
+        """Start serving REST and stream endpoints."""
+        app = web.Application()
+        app.router.add_get('/api/v1/exchange_info', self._handle_exchange_info)
+        app.router.add_get('/api/v1/ticker', self._handle_ticker)
+        app.router.add_post('/api/v1/orders', self._handle_order)
+        app.router.add_get('/ws', self._handle_stream)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        # Resolve the actual port when 0 was requested
+        self.port = self._runner.addresses[0][1]
+        self._ticker_task = asyncio.create_task(self._ticker_loop())
+
+        self.logger.info(f"Mock exchange {self.name} listening on {self.rest_url}")
+
+    async def stop(self):
+        """Stop the server and disconnect stream clients."""
+        if self._ticker_task:
+            self._ticker_task.cancel()
+            try:
+                await self._ticker_task
+            except asyncio.CancelledError:
+                pass
+            self._ticker_task = None
+
+        for ws in list(self._clients):
+            await ws.close()
+        self._clients.clear()
+
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+        self.logger.info(f"Mock exchange {self.name} stopped")
+
+    async def drop_stream_connections(self):
+        """Close every stream connection, e.g. to exercise client reconnection."""
+        for ws in list(self._clients):
+            await ws.close()
+
+    async def __aenter__(self) -> 'MockExchangeServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def ticker(self, symbol: str) -> Dict[str, Any]:
+        """
+        Build the current ticker for a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Ticker dictionary
+        """
+        mid = self._prices[symbol]
+        half_spread = mid * self.spread / 2
+        return {
+            'symbol': symbol,
+            'bid': mid - half_spread,
+            'ask': mid + half_spread,
+            'last': mid,
+            'volume': self._volumes[symbol],
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def _step_prices(self):
+        """Advance the random walk by one tick."""
+        for symbol in self._prices:
+            self._prices[symbol] *= 1 + self._random.uniform(-self.volatility, self.volatility)
+            self._volumes[symbol] = self._random.uniform(800, 2000)
+
+    async def _ticker_loop(self):
+        """Publish ticker updates to subscribed stream clients."""
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            self._step_prices()
+
+            for ws, streams in list(self._clients.items()):
+                for channel, symbol in list(streams):
+                    if channel != 'ticker' or symbol not in self._prices:
+                        continue
+                    try:
+                        await ws.send_str(json.dumps({
+                            'channel': channel,
+                            'symbol': symbol,
+                            'data': self.ticker(symbol)
+                        }))
+                    except ConnectionError:
+                        self._clients.pop(ws, None)
+                        break
+
+    async def _handle_exchange_info(self, request: 'web.Request') -> 'web.Response':
+        self.request_count += 1
+        return web.json_response({
+            'name': self.name,
+            'maker_fee': self.maker_fee,
+            'taker_fee': self.taker_fee,
+            'symbols': list(self._prices)
+        })
+
+    async def _handle_ticker(self, request: 'web.Request') -> 'web.Response':
+        self.request_count += 1
+        symbol = request.query.get('symbol')
+        if symbol not in self._prices:
+            return web.json_response({'error': f"Unknown symbol: {symbol}"}, status=404)
+        return web.json_response(self.ticker(symbol))
+
+    async def _handle_order(self, request: 'web.Request') -> 'web.Response':
+        self.request_count += 1
+        order = await request.json()
+        symbol = order.get('symbol')
+
+        if symbol not in self._prices:
+            return web.json_response({'error': f"Unknown symbol: {symbol}"}, status=404)
+        if order.get('side') not in ('buy', 'sell') or not order.get('quantity'):
+            return web.json_response({'error': 'Invalid order'}, status=400)
+
+        # Fill immediately at the touch
+        ticker = self.ticker(symbol)
+        filled_price = ticker['ask'] if order['side'] == 'buy' else ticker['bid']
+        self.order_count += 1
+
+        return web.json_response({
+            'id': uuid.uuid4().hex,
+            'client_order_id': order.get('client_order_id'),
+            'symbol': symbol,
+            'side': order['side'],
+            'status': 'filled',
+            'filled_quantity': order['quantity'],
+            'filled_price': filled_price,
+            'fee': order['quantity'] * filled_price * self.taker_fee,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    async def _handle_stream(self, request: 'web.Request') -> 'web.WebSocketResponse':
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+
+        self.stream_connections += 1
+        streams: Set[Tuple[str, str]] = set()
+        self._clients[ws] = streams
+
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+
+                control = json.loads(message.data)
+                key = (control.get('channel'), control.get('symbol'))
+                if control.get('op') == 'subscribe':
+                    streams.add(key)
+                elif control.get('op') == 'unsubscribe':
+                    streams.discard(key)
+        finally:
+            self._clients.pop(ws, None)
+
+        return ws
+
+
+async def _serve(args):
+    base_prices = json.loads(args.prices) if args.prices else None
+    server = MockExchangeServer(
+        name=args.name,
+        host=args.host,
+        port=args.port,
+        base_prices=base_prices,
+        price_offset=args.offset,
+        tick_interval=args.interval,
+        seed=args.seed
+    )
+    await server.start()
+    print(f"Mock exchange '{server.name}' on {server.rest_url} (stream: {server.stream_url})")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock exchange server")
+    parser.add_argument('--name', default='mock_exchange', help='Exchange name')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address')
+    parser.add_argument('--port', type=int, default=8765, help='Bind port')
+    parser.add_argument('--prices', help='JSON object of base prices per symbol')
+    parser.add_argument('--offset', type=float, default=0.0, help='Relative price offset')
+    parser.add_argument('--interval', type=float, default=0.1, help='Tick interval in seconds')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""
+Process-wide pool of shared exchange connectors.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Dict, Optional, Any, Tuple, Union
+
+from .connector import ExchangeConnector, ExchangeConfig
+
+
+class ConnectorPool:
+    """
+    Reference-counted registry of exchange connectors.
+
+    Bots acquire connectors by exchange name; the first acquisition opens
+    the connections and the last release closes them, so any number of
+    bots on the same exchange share one HTTP pool and one stream.
+
+    The pool is process-wide while connectors and asyncio locks are bound
+    to the loop they were created in, so connectors are pooled per
+    ``(event loop, exchange name)`` and one lock is created lazily per loop.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """
+        Initialize connector pool.
+
+        Args:
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._connectors: Dict[Tuple[asyncio.AbstractEventLoop, str], ExchangeConnector] = {}
+        self._ref_counts: Dict[Tuple[asyncio.AbstractEventLoop, str], int] = {}
+        self._locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = \
+            weakref.WeakKeyDictionary()
+        self._locks_guard = threading.Lock()
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        """Lock of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._locks_guard:
+            lock = self._locks.get(loop)
+            if lock is None:
+                lock = self._locks[loop] = asyncio.Lock()
+            return lock
+
+    async def acquire(self, config: Union[ExchangeConfig, Dict[str, Any]]) -> ExchangeConnector:
+        """
+        Get the shared connector for an exchange, creating it if needed.
+
+        Args:
+            config: Exchange configuration (dataclass or dictionary)
+
+        Returns:
+            Connected ExchangeConnector
+        """
+        if isinstance(config, dict):
+            config = ExchangeConfig.from_dict(config)
+
+        key = (asyncio.get_running_loop(), config.name)
+
+        async with self._lock:
+            connector = self._connectors.get(key)
+
+            if connector is None:
+                connector = ExchangeConnector(config, self.logger)
+                await connector.connect()
+                self._connectors[key] = connector
+                self._ref_counts[key] = 0
+            elif connector.config != config:
+                self.logger.warning(f"Exchange {config.name} already pooled with a different config; "
+                                    f"reusing existing connector")
+
+            self._ref_counts[key] += 1
+            return connector
+
+    async def release(self, connector: ExchangeConnector):
+        """
+        Release a connector, closing it when no bot uses it anymore.
+
+        Args:
+            connector: Connector obtained from ``acquire``
+        """
+        key = (asyncio.get_running_loop(), connector.name)
+
+        async with self._lock:
+            if self._connectors.get(key) is not connector:
+                return
+
+            self._ref_counts[key] -= 1
+            if self._ref_counts[key] <= 0:
+                del self._connectors[key]
+                del self._ref_counts[key]
+                await connector.close()
+
+    async def close_all(self):
+        """Close every connector pooled in the running event loop."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            for key in [key for key in self._connectors if key[0] is loop]:
+                await self._connectors.pop(key).close()
+                self._ref_counts.pop(key, None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics for pooled connectors.
+
+        Called from an event loop, only the connectors of that loop are
+        reported; otherwise connectors of every loop are.
+
+        Returns:
+            Dictionary mapping exchange names to connector statistics
+        """
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        return {
+            name: dict(connector.get_statistics(), users=self._ref_counts.get((loop, name), 0))
+            for (loop, name), connector in list(self._connectors.items())
+            if current_loop is None or loop is current_loop
+        }
+
+
+# Global instance
+_connector_pool: Optional[ConnectorPool] = None
+
+
+def get_connector_pool() -> ConnectorPool:
+    """Get the global connector pool instance."""
+    global _connector_pool
+    if _connector_pool is None:
+        _connector_pool = ConnectorPool()
+    return _connector_pool
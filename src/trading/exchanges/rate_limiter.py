@@ -0,0 +1,76 @@
+"""
+Asynchronous token-bucket rate limiter for exchange requests.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket shared by every caller of one exchange connector.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    ``acquire`` waits without blocking the event loop when the bucket is
+    empty, so bots sharing a connector also share its request budget.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum burst size (defaults to one second of traffic)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the tokens accumulated since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """
+        Wait until ``tokens`` are available and consume them.
+
+        Args:
+            tokens: Number of tokens to consume
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Consume tokens without waiting.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if the tokens were available, False otherwise
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
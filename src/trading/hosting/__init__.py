@@ -0,0 +1,17 @@
+"""
+Multi-process bot hosting with a supervising parent process.
+"""
+
+from .bot_host import BotHost, BotHostError, WorkerUnavailableError, get_bot_host
+from .worker import BotSpec, BotWorker, BOT_TYPES, resolve_bot_class
+
+__all__ = [
+    'BotHost',
+    'BotHostError',
+    'WorkerUnavailableError',
+    'get_bot_host',
+    'BotSpec',
+    'BotWorker',
+    'BOT_TYPES',
+    'resolve_bot_class'
+]
@@ -0,0 +1,626 @@
+"""
+Multi-process bot host: shards bots across worker processes under a supervisor.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Any, Union
+
+from ...core.metrics_registry import MetricFamily, get_metrics_registry
+from ..bots import BotConfig
+from .worker import (
+    BotSpec, run_worker,
+    COMMAND_ADD, COMMAND_REMOVE, COMMAND_START, COMMAND_STOP, COMMAND_PAUSE,
+    COMMAND_RESUME, COMMAND_STATUS, COMMAND_PERFORMANCE, COMMAND_TRADES, COMMAND_PING,
+    COMMAND_SHUTDOWN
+)
+
+# Percentiles reported by LatencyHistogram.to_dict(), exposed as summary quantiles
+_LATENCY_QUANTILES = (('0.5', 'p50_us'), ('0.9', 'p90_us'), ('0.99', 'p99_us'), ('0.999', 'p999_us'))
+
+
+class BotHostError(Exception):
+    """Error raised by the bot host or returned by a worker."""
+
+
+class WorkerUnavailableError(BotHostError):
+    """The worker hosting a bot crashed, hung or was given up on."""
+
+
+class _WorkerHandle:
+    """Supervisor-side handle on one worker process and its pipes."""
+
+    def __init__(self, worker_id: int):
+        self.worker_id = worker_id
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.bot_ids: set = set()
+        self.restarts: deque = deque()
+        self.failed = False
+        self.last_ping: Dict[str, Any] = {}
+
+        self._command_conn = None
+        self._result_conn = None
+        self._pending: Dict[int, Future] = {}
+        self._request_ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def spawn(self, context, log_level: int):
+        """Start the worker process and its reply reader."""
+        command_reader, command_writer = context.Pipe(duplex=False)
+        result_reader, result_writer = context.Pipe(duplex=False)
+
+        self.process = context.Process(
+            target=run_worker,
+            args=(self.worker_id, command_reader, result_writer, log_level),
+            name=f"bot-worker-{self.worker_id}",
+            daemon=True
+        )
+        self.process.start()
+
+        # The child owns these ends now
+        command_reader.close()
+        result_writer.close()
+
+        # Each process generation gets its own pending map, so the reader of a
+        # replaced process cannot fail requests sent to its successor
+        self._command_conn = command_writer
+        self._result_conn = result_reader
+        self._pending = {}
+        self._reader = threading.Thread(
+            target=self._read_results, args=(result_reader, self._pending),
+            name=f"bot-host-reader-{self.worker_id}", daemon=True
+        )
+        self._reader.start()
+
+    def submit(self, command: str, **payload) -> Future:
+        """Send a command without waiting for the reply."""
+        future: Future = Future()
+        if not self.is_alive():
+            future.set_exception(WorkerUnavailableError(f"Worker {self.worker_id} is not running"))
+            return future
+
+        request_id = next(self._request_ids)
+        self._pending[request_id] = future
+        try:
+            with self._send_lock:
+                self._command_conn.send((request_id, command, payload))
+        except (BrokenPipeError, EOFError, OSError) as e:
+            self._pending.pop(request_id, None)
+            future.set_exception(WorkerUnavailableError(f"Worker {self.worker_id} unreachable: {e}"))
+        return future
+
+    def call(self, command: str, timeout: float, **payload) -> Any:
+        """Send a command and wait for its result."""
+        try:
+            return self.submit(command, **payload).result(timeout)
+        except FutureTimeoutError:
+            raise WorkerUnavailableError(f"Worker {self.worker_id} did not answer '{command}' "
+                                         f"within {timeout}s")
+
+    def _read_results(self, conn, pending: Dict[int, Future]):
+        """Resolve pending futures from worker replies (runs on a thread)."""
+        while True:
+            try:
+                request_id, ok, result = conn.recv()
+            except (EOFError, OSError):
+                break
+
+            future = pending.pop(request_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(BotHostError(result))
+
+        self._fail_pending(pending, f"Worker {self.worker_id} exited")
+
+    @staticmethod
+    def _fail_pending(pending: Dict[int, Future], reason: str):
+        for request_id in list(pending):
+            future = pending.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_exception(WorkerUnavailableError(reason))
+
+    def terminate(self, timeout: float = 5.0):
+        """Kill the worker process and release its pipes."""
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(timeout)
+        self.close()
+
+    def close(self):
+        """Close the supervisor's pipe ends."""
+        for conn in (self._command_conn, self._result_conn):
+            if conn is not None:
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+        self._command_conn = None
+        self._result_conn = None
+        self._fail_pending(self._pending, f"Worker {self.worker_id} closed")
+
+
+class BotHost:
+    """
+    Supervisor sharding trading bots across worker processes.
+
+    Each worker runs its own asyncio event loop, so a CPU-heavy strategy
+    only stalls the bots sharing its worker and the host can use every core.
+    Bots are placed on the least loaded worker. A monitor thread pings the
+    workers; a worker that exits or stops answering is restarted and its
+    bots are recreated in the state they were last asked to be in. A worker
+    that keeps crashing is given up on after ``max_restarts`` restarts in
+    ``restart_window`` seconds, without affecting the other workers.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        request_timeout: float = 10.0,
+        health_check_interval: float = 2.0,
+        max_restarts: int = 5,
+        restart_window: float = 300.0,
+        start_method: str = 'spawn',
+        log_level: int = logging.INFO,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize bot host.
+
+        Args:
+            num_workers: Number of worker processes (defaults to the CPU count)
+            request_timeout: Seconds to wait for a worker reply
+            health_check_interval: Seconds between worker health checks
+            max_restarts: Restarts allowed per worker within restart_window
+            restart_window: Window in seconds for counting restarts
+            start_method: multiprocessing start method ('spawn' works everywhere)
+            log_level: Logging level inside worker processes
+            logger: Optional logger instance
+        """
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.request_timeout = request_timeout
+        self.health_check_interval = health_check_interval
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.log_level = log_level
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: List[_WorkerHandle] = []
+        self._specs: Dict[str, BotSpec] = {}
+        self._desired_states: Dict[str, str] = {}
+        self._placement: Dict[str, int] = {}
+
+        self._lock = threading.RLock()
+        self._running = False
+        self._shutdown_event = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start worker processes and the health monitor."""
+        with self._lock:
+            if self._running:
+                return
+
+            self._workers = [_WorkerHandle(i) for i in range(self.num_workers)]
+            for worker in self._workers:
+                worker.spawn(self._context, self.log_level)
+
+            self._running = True
+            self._shutdown_event.clear()
+            self._monitor = threading.Thread(target=self._monitor_loop, name="bot-host-monitor",
+                                             daemon=True)
+            self._monitor.start()
+
+        get_metrics_registry().register_collector('bot_host', self.collect_metrics)
+        self.logger.info(f"Bot host started with {self.num_workers} workers")
+
+    def shutdown(self, timeout: float = 30.0):
+        """
+        Stop every bot and worker process.
+
+        Args:
+            timeout: Seconds to wait for each worker to stop its bots
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._shutdown_event.set()
+
+        get_metrics_registry().unregister_collector('bot_host', self.collect_metrics)
+
+        if self._monitor:
+            self._monitor.join()
+            self._monitor = None
+
+        # Ask every worker at once, then wait
+        futures = [(worker, worker.submit(COMMAND_SHUTDOWN)) for worker in self._workers]
+        for worker, future in futures:
+            try:
+                future.result(timeout)
+            except Exception as e:
+                self.logger.warning(f"Worker {worker.worker_id} did not shut down cleanly: {e}")
+            worker.terminate()
+
+        self.logger.info("Bot host stopped")
+
+    def __enter__(self) -> 'BotHost':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def add_bot(
+        self,
+        bot_id: str,
+        bot_type: str,
+        config: Union[BotConfig, Dict[str, Any]],
+        start: bool = True
+    ) -> int:
+        """
+        Create a bot on the least loaded worker.
+
+        Args:
+            bot_id: Unique bot identifier
+            bot_type: Registered bot type ('scalping', 'arbitrage') or ``module:Class``
+            config: Bot configuration (dataclass or dictionary)
+            start: Start the bot immediately
+
+        Returns:
+            ID of the worker hosting the bot
+        """
+        if isinstance(config, BotConfig):
+            config = config.to_dict()
+        spec = BotSpec(bot_id=bot_id, bot_type=bot_type, config=config)
+
+        with self._lock:
+            self._require_running()
+            if bot_id in self._specs:
+                raise BotHostError(f"Bot {bot_id} already exists")
+
+            candidates = [w for w in self._workers if not w.failed]
+            if not candidates:
+                raise WorkerUnavailableError("No healthy worker available")
+            worker = min(candidates, key=lambda w: len(w.bot_ids))
+
+            self._specs[bot_id] = spec
+            self._desired_states[bot_id] = 'running' if start else 'stopped'
+            self._placement[bot_id] = worker.worker_id
+            worker.bot_ids.add(bot_id)
+
+        try:
+            worker.call(COMMAND_ADD, self.request_timeout, spec=spec.to_dict(), start=start)
+        except Exception:
+            self._forget_bot(bot_id)
+            raise
+
+        self.logger.info(f"Bot {bot_id} placed on worker {worker.worker_id}")
+        return worker.worker_id
+
+    def remove_bot(self, bot_id: str) -> bool:
+        """
+        Stop a bot and remove it from its worker.
+
+        Args:
+            bot_id: Bot identifier
+
+        Returns:
+            True if the bot was removed
+        """
+        worker = self._get_worker(bot_id)
+        try:
+            worker.call(COMMAND_REMOVE, self.request_timeout, bot_id=bot_id)
+        except WorkerUnavailableError:
+            # Nothing left to stop; just stop tracking it
+            pass
+        self._forget_bot(bot_id)
+        return True
+
+    def start_bot(self, bot_id: str) -> bool:
+        """Start a stopped bot."""
+        return self._control(bot_id, COMMAND_START, 'running')
+
+    def stop_bot(self, bot_id: str) -> bool:
+        """Stop a running or paused bot."""
+        return self._control(bot_id, COMMAND_STOP, 'stopped')
+
+    def pause_bot(self, bot_id: str) -> bool:
+        """Pause a running bot."""
+        return self._control(bot_id, COMMAND_PAUSE, 'paused')
+
+    def resume_bot(self, bot_id: str) -> bool:
+        """Resume a paused bot."""
+        return self._control(bot_id, COMMAND_RESUME, 'running')
+
+    def get_bot_ids(self) -> List[str]:
+        """Get identifiers of all hosted bots."""
+        with self._lock:
+            return list(self._specs)
+
+    def get_status(self, bot_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get bot statuses gathered from every worker.
+
+        Bots on an unavailable worker are reported in the ``error`` state.
+
+        Args:
+            bot_id: Only return this bot's status
+
+        Returns:
+            Dictionary mapping bot IDs to status dictionaries, or a single
+            status dictionary when bot_id is given
+        """
+        statuses = self._gather(COMMAND_STATUS, self._unavailable_status)
+        if bot_id is not None:
+            if bot_id not in statuses:
+                raise BotHostError(f"Unknown bot: {bot_id}")
+            return statuses[bot_id]
+        return statuses
+
+    def get_performance(self) -> Dict[str, Any]:
+        """
+        Get per-bot performance and host-wide totals.
+
+        Returns:
+            Dictionary with 'bots' (bot ID -> performance) and 'totals'
+        """
+        performance = self._gather(COMMAND_PERFORMANCE, lambda worker: None)
+        available = [p for p in performance.values() if p is not None]
+
+        return {
+            'bots': performance,
+            'totals': {
+                'bots': len(performance),
+                'reporting': len(available),
+                'total_return': sum(p['total_return'] for p in available),
+                'total_fees_paid': sum(p['total_fees_paid'] for p in available)
+            }
+        }
+
+    def get_trade_history_page(self, bot_id: str, page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+        """
+        Get one page of a bot's trade history, newest first.
+
+        Args:
+            bot_id: Bot identifier
+            page: Page number, starting at 1
+            per_page: Trades per page
+
+        Returns:
+            Dictionary with trades and pagination details
+        """
+        worker = self._get_worker(bot_id)
+        return worker.call(COMMAND_TRADES, self.request_timeout, bot_id=bot_id, page=page,
+                           per_page=per_page)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get host and worker statistics.
+
+        Returns:
+            Dictionary with worker health and placement details
+        """
+        with self._lock:
+            return {
+                'running': self._running,
+                'num_workers': self.num_workers,
+                'bots': len(self._specs),
+                'workers': [
+                    {
+                        'worker_id': worker.worker_id,
+                        'pid': worker.pid,
+                        'alive': worker.is_alive(),
+                        'failed': worker.failed,
+                        'bots': sorted(worker.bot_ids),
+                        'restarts': len(worker.restarts),
+                        'max_loop_lag': worker.last_ping.get('max_loop_lag', 0.0)
+                    }
+                    for worker in self._workers
+                ]
+            }
+
+    def collect_metrics(self) -> List[MetricFamily]:
+        """
+        Get bot and worker metrics for the metrics registry.
+
+        Phase latencies (strategy execution, order placement, ...) come from
+        the workers' last health check ping, so a scrape never waits on a
+        worker.
+
+        Returns:
+            Metric families exposed on /metrics
+        """
+        with self._lock:
+            workers = [(worker.worker_id, worker.is_alive() and not worker.failed, worker.last_ping)
+                       for worker in self._workers]
+
+        latency_samples = []
+        worker_up = []
+        loop_lag = []
+        for worker_id, alive, ping in workers:
+            labels = {'worker': str(worker_id)}
+            worker_up.append(('bot_worker_up', labels, 1 if alive else 0))
+            loop_lag.append(('bot_worker_loop_lag_seconds', labels, ping.get('max_loop_lag', 0.0)))
+            for bot_id, phases in ping.get('latency', {}).items():
+                for phase, stats in phases.items():
+                    phase_labels = {'bot_id': bot_id, 'phase': phase}
+                    for quantile, key in _LATENCY_QUANTILES:
+                        latency_samples.append(('bot_phase_latency_seconds',
+                                                dict(phase_labels, quantile=quantile),
+                                                stats[key] / 1e6))
+                    latency_samples.append(('bot_phase_latency_seconds_sum', phase_labels,
+                                            stats['mean_us'] * stats['count'] / 1e6))
+                    latency_samples.append(('bot_phase_latency_seconds_count', phase_labels,
+                                            stats['count']))
+
+        return [
+            MetricFamily('bot_worker_up', 'gauge', 'Whether a bot worker process is running',
+                         worker_up),
+            MetricFamily('bot_worker_loop_lag_seconds', 'gauge',
+                         'Largest event loop delay of a worker between health checks', loop_lag),
+            MetricFamily('bot_phase_latency_seconds', 'summary',
+                         'Latency of each bot execution phase, including strategy execution',
+                         latency_samples)
+        ]
+
+    def _require_running(self):
+        if not self._running:
+            raise BotHostError("Bot host is not running")
+
+    def _get_worker(self, bot_id: str) -> _WorkerHandle:
+        with self._lock:
+            self._require_running()
+            if bot_id not in self._placement:
+                raise BotHostError(f"Unknown bot: {bot_id}")
+            return self._workers[self._placement[bot_id]]
+
+    def _forget_bot(self, bot_id: str):
+        with self._lock:
+            worker_id = self._placement.pop(bot_id, None)
+            if worker_id is not None:
+                self._workers[worker_id].bot_ids.discard(bot_id)
+            self._specs.pop(bot_id, None)
+            self._desired_states.pop(bot_id, None)
+
+    def _control(self, bot_id: str, command: str, desired_state: str) -> bool:
+        """Send a lifecycle command and remember the requested state."""
+        worker = self._get_worker(bot_id)
+        result = worker.call(command, self.request_timeout, bot_id=bot_id)
+        if result:
+            with self._lock:
+                if bot_id in self._desired_states:
+                    self._desired_states[bot_id] = desired_state
+        return result
+
+    def _gather(self, command: str, unavailable) -> Dict[str, Any]:
+        """
+        Query every worker concurrently and merge per-bot results.
+
+        Args:
+            command: Command returning a bot ID -> value dictionary
+            unavailable: Function building the value for bots of a worker
+                that did not answer
+
+        Returns:
+            Merged dictionary for all known bots
+        """
+        with self._lock:
+            self._require_running()
+            requests = [(worker, worker.submit(command)) for worker in self._workers if worker.bot_ids]
+
+        merged: Dict[str, Any] = {}
+        deadline = time.monotonic() + self.request_timeout
+        for worker, future in requests:
+            try:
+                result = future.result(max(0.0, deadline - time.monotonic()))
+            except Exception as e:
+                self.logger.warning(f"Worker {worker.worker_id} did not answer '{command}': {e}")
+                result = {}
+
+            for bot_id in list(worker.bot_ids):
+                if bot_id in result:
+                    value = result[bot_id]
+                    if isinstance(value, dict):
+                        value['worker_id'] = worker.worker_id
+                    merged[bot_id] = value
+                else:
+                    merged[bot_id] = unavailable(worker)
+
+        return merged
+
+    def _unavailable_status(self, worker: _WorkerHandle) -> Dict[str, Any]:
+        reason = "failed" if worker.failed else "restarting"
+        return {
+            'state': 'error',
+            'worker_id': worker.worker_id,
+            'error_message': f"Worker {worker.worker_id} {reason}"
+        }
+
+    def _monitor_loop(self):
+        """Check worker health and restart crashed or hung workers."""
+        while not self._shutdown_event.wait(self.health_check_interval):
+            for worker in list(self._workers):
+                if worker.failed or self._shutdown_event.is_set():
+                    continue
+
+                healthy = worker.is_alive()
+                if healthy:
+                    try:
+                        worker.last_ping = worker.call(COMMAND_PING, self.request_timeout)
+                    except BotHostError as e:
+                        self.logger.error(f"Worker {worker.worker_id} unresponsive: {e}")
+                        healthy = False
+                else:
+                    self.logger.error(f"Worker {worker.worker_id} (pid {worker.pid}) exited "
+                                      f"with code {worker.process.exitcode}")
+
+                if not healthy:
+                    self._restart_worker(worker)
+
+    def _restart_worker(self, worker: _WorkerHandle):
+        """Replace a worker process and recreate its bots."""
+        worker.terminate()
+
+        now = time.monotonic()
+        while worker.restarts and now - worker.restarts[0] > self.restart_window:
+            worker.restarts.popleft()
+        if len(worker.restarts) >= self.max_restarts:
+            worker.failed = True
+            self.logger.error(f"Worker {worker.worker_id} restarted {len(worker.restarts)} times "
+                              f"in {self.restart_window}s; giving up on bots "
+                              f"{sorted(worker.bot_ids)}")
+            return
+        worker.restarts.append(now)
+
+        with self._lock:
+            if not self._running:
+                return
+            worker.spawn(self._context, self.log_level)
+            bots = [(self._specs[bot_id], self._desired_states[bot_id]) for bot_id in worker.bot_ids]
+
+        self.logger.warning(f"Worker {worker.worker_id} restarted (pid {worker.pid}), "
+                            f"restoring {len(bots)} bots")
+
+        for spec, state in bots:
+            try:
+                worker.call(COMMAND_ADD, self.request_timeout,
+                            spec=spec.to_dict(), start=state != 'stopped')
+                if state == 'paused':
+                    worker.call(COMMAND_PAUSE, self.request_timeout, bot_id=spec.bot_id)
+            except BotHostError as e:
+                self.logger.error(f"Failed to restore bot {spec.bot_id} on worker "
+                                  f"{worker.worker_id}: {e}")
+
+
+# Global instance
+_bot_host: Optional[BotHost] = None
+
+
+def get_bot_host() -> BotHost:
+    """Get the global bot host instance."""
+    global _bot_host
+    if _bot_host is None:
+        _bot_host = BotHost()
+    return _bot_host
@@ -0,0 +1,279 @@
+"""
+Worker process running a shard of trading bots on its own event loop.
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import threading
+import traceback
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any, Type
+
+from ..bots import BaseBot, BotConfig, ScalpingBot, ArbitrageBot
+
+
+# Bot types that can be referenced by short name in a BotSpec
+BOT_TYPES: Dict[str, Type[BaseBot]] = {
+    'scalping': ScalpingBot,
+    'arbitrage': ArbitrageBot
+}
+
+# Commands understood by workers
+COMMAND_ADD = 'add'
+COMMAND_REMOVE = 'remove'
+COMMAND_START = 'start'
+COMMAND_STOP = 'stop'
+COMMAND_PAUSE = 'pause'
+COMMAND_RESUME = 'resume'
+COMMAND_STATUS = 'status'
+COMMAND_PERFORMANCE = 'performance'
+COMMAND_TRADES = 'trades'
+COMMAND_PING = 'ping'
+COMMAND_SHUTDOWN = 'shutdown'
+
+
+@dataclass
+class BotSpec:
+    """Picklable description of a bot to run inside a worker."""
+    bot_id: str
+    bot_type: str
+    config: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert spec to dictionary."""
+        return {
+            'bot_id': self.bot_id,
+            'bot_type': self.bot_type,
+            'config': self.config
+        }
+
+
+def resolve_bot_class(bot_type: str) -> Type[BaseBot]:
+    """
+    Resolve a bot class from a registered name or an import path.
+
+    Args:
+        bot_type: Name from BOT_TYPES or ``package.module:ClassName``
+
+    Returns:
+        Bot class
+
+    Raises:
+        ValueError: If the type is unknown or not a BaseBot subclass
+    """
+    if bot_type in BOT_TYPES:
+        return BOT_TYPES[bot_type]
+
+    module_name, _, class_name = bot_type.partition(':')
+    if not class_name:
+        raise ValueError(f"Unknown bot type: {bot_type}")
+
+    bot_class = getattr(importlib.import_module(module_name), class_name, None)
+    if not isinstance(bot_class, type) or not issubclass(bot_class, BaseBot):
+        raise ValueError(f"{bot_type} is not a BaseBot subclass")
+    return bot_class
+
+
+class BotWorker:
+    """
+    Runs bots inside one process and serves supervisor commands.
+
+    Commands arrive on a one-way pipe as ``(request_id, command, payload)``
+    tuples and are dispatched as independent tasks, so a slow ``stop`` does
+    not delay status queries. Replies are sent on a second pipe as
+    ``(request_id, ok, result)``.
+    """
+
+    def __init__(self, worker_id: int, command_conn, result_conn,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize bot worker.
+
+        Args:
+            worker_id: Index of the worker in the host
+            command_conn: Pipe end receiving supervisor commands
+            result_conn: Pipe end sending replies
+            logger: Optional logger instance
+        """
+        self.worker_id = worker_id
+        self.logger = logger or logging.getLogger(f"{__name__}.{worker_id}")
+
+        self._command_conn = command_conn
+        self._result_conn = result_conn
+        self._bots: Dict[str, BaseBot] = {}
+        self._bot_types: Dict[str, str] = {}
+
+        # Largest event loop delay since the last ping
+        self._max_loop_lag = 0.0
+
+    async def run(self):
+        """Serve commands until shutdown or until the supervisor goes away."""
+        loop = asyncio.get_running_loop()
+        commands: asyncio.Queue = asyncio.Queue()
+
+        # Blocking pipe reads happen on a thread so the loop keeps running bots
+        reader = threading.Thread(
+            target=self._read_commands, args=(loop, commands),
+            name=f"bot-worker-{self.worker_id}-reader", daemon=True
+        )
+        reader.start()
+        lag_task = asyncio.create_task(self._monitor_loop_lag())
+        tasks = set()
+        message = None
+
+        try:
+            while True:
+                message = await commands.get()
+                if message is None or message[1] == COMMAND_SHUTDOWN:
+                    break
+
+                task = asyncio.create_task(self._dispatch(*message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            lag_task.cancel()
+            await self._stop_all()
+            if message is not None:
+                self._reply(message[0], True, {'stopped': len(self._bots)})
+
+    def _read_commands(self, loop: asyncio.AbstractEventLoop, commands: asyncio.Queue):
+        """Forward pipe messages to the event loop (runs on a thread)."""
+        while True:
+            try:
+                message = self._command_conn.recv()
+            except (EOFError, OSError):
+                # Supervisor died: shut down instead of running orphaned bots
+                message = None
+
+            loop.call_soon_threadsafe(commands.put_nowait, message)
+            if message is None or message[1] == COMMAND_SHUTDOWN:
+                return
+
+    async def _dispatch(self, request_id: int, command: str, payload: Dict[str, Any]):
+        """Run one command and send its reply."""
+        try:
+            handler = getattr(self, f"_handle_{command}", None)
+            if handler is None:
+                raise ValueError(f"Unknown command: {command}")
+            self._reply(request_id, True, await handler(**payload))
+        except Exception as e:
+            self.logger.debug(traceback.format_exc())
+            self._reply(request_id, False, f"{type(e).__name__}: {e}")
+
+    def _reply(self, request_id: int, ok: bool, result: Any):
+        """Send a reply, ignoring a supervisor that is already gone."""
+        try:
+            self._result_conn.send((request_id, ok, result))
+        except (BrokenPipeError, EOFError, OSError):
+            pass
+
+    def _get_bot(self, bot_id: str) -> BaseBot:
+        bot = self._bots.get(bot_id)
+        if bot is None:
+            raise KeyError(f"Bot {bot_id} is not hosted by worker {self.worker_id}")
+        return bot
+
+    async def _handle_add(self, spec: Dict[str, Any], start: bool = True) -> Dict[str, Any]:
+        bot_id = spec['bot_id']
+        if bot_id in self._bots:
+            raise ValueError(f"Bot {bot_id} already exists")
+
+        bot_class = resolve_bot_class(spec['bot_type'])
+        config = BotConfig.from_dict(spec['config'])
+        bot = bot_class(config, logging.getLogger(f"trading.bots.{bot_id}"))
+
+        self._bots[bot_id] = bot
+        self._bot_types[bot_id] = spec['bot_type']
+
+        started = await bot.start() if start else False
+        return {'bot_id': bot_id, 'started': started}
+
+    async def _handle_remove(self, bot_id: str) -> bool:
+        bot = self._get_bot(bot_id)
+        await bot.stop()
+        del self._bots[bot_id]
+        del self._bot_types[bot_id]
+        return True
+
+    async def _handle_start(self, bot_id: str) -> bool:
+        return await self._get_bot(bot_id).start()
+
+    async def _handle_stop(self, bot_id: str) -> bool:
+        return await self._get_bot(bot_id).stop()
+
+    async def _handle_pause(self, bot_id: str) -> bool:
+        return await self._get_bot(bot_id).pause()
+
+    async def _handle_resume(self, bot_id: str) -> bool:
+        return await self._get_bot(bot_id).resume()
+
+    async def _handle_status(self) -> Dict[str, Dict[str, Any]]:
+        statuses = {}
+        for bot_id, bot in self._bots.items():
+            status = bot.get_status().to_dict()
+            status.update(
+                name=bot.config.name,
+                symbol=bot.config.symbol,
+                bot_type=self._bot_types[bot_id]
+            )
+            statuses[bot_id] = status
+        return statuses
+
+    async def _handle_performance(self) -> Dict[str, Dict[str, Any]]:
+        return {bot_id: bot.get_performance().to_dict() for bot_id, bot in self._bots.items()}
+
+    async def _handle_trades(self, bot_id: str, page: int, per_page: int) -> Dict[str, Any]:
+        return self._get_bot(bot_id).get_trade_history_page(page, per_page)
+
+    async def _handle_ping(self) -> Dict[str, Any]:
+        max_loop_lag, self._max_loop_lag = self._max_loop_lag, 0.0
+        return {
+            'pid': os.getpid(),
+            'bots': len(self._bots),
+            'max_loop_lag': max_loop_lag,
+            'latency': {bot_id: bot.get_latency_stats() for bot_id, bot in self._bots.items()}
+        }
+
+    async def _monitor_loop_lag(self, interval: float = 0.25):
+        """Track how late the loop wakes up, i.e. how long bots block it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            lag = loop.time() - started - interval
+            if lag > self._max_loop_lag:
+                self._max_loop_lag = lag
+
+    async def _stop_all(self):
+        """Stop every hosted bot."""
+        for bot_id, bot in list(self._bots.items()):
+            try:
+                await bot.stop()
+            except Exception as e:
+                self.logger.error(f"Failed to stop bot {bot_id}: {e}")
+
+
+def run_worker(worker_id: int, command_conn, result_conn, log_level: int = logging.INFO):
+    """
+    Process entry point for a bot worker.
+
+    Args:
+        worker_id: Index of the worker in the host
+        command_conn: Pipe end receiving supervisor commands
+        result_conn: Pipe end sending replies
+        log_level: Logging level for the worker process
+    """
+    logging.basicConfig(
+        level=log_level,
+        format=f"%(asctime)s [worker {worker_id}] %(name)s %(levelname)s: %(message)s"
+    )
+
+    try:
+        asyncio.run(BotWorker(worker_id, command_conn, result_conn).run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        command_conn.close()
+        result_conn.close()
@@ -0,0 +1,15 @@
+"""
+Journal module for bounded, disk-backed trading histories.
+"""
+
+from .records import JournalRecord, TradeRecord, SignalRecord, BacktestSummaryRecord
+from .journal import Journal, get_journal_path
+
+__all__ = [
+    'JournalRecord',
+    'TradeRecord',
+    'SignalRecord',
+    'BacktestSummaryRecord',
+    'Journal',
+    'get_journal_path'
+]
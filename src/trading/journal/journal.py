@@ -0,0 +1,283 @@
+"""
+Bounded journal with an in-memory tail and an append-only file on disk.
+"""
+
+import json
+import logging
+import os
+import threading
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Any, Type
+
+from .records import JournalRecord
+
+
+class Journal:
+    """
+    Append-only journal of compact records.
+
+    The most recent ``capacity`` records are kept in a ring buffer. When a
+    ``path`` is given, every record is also appended to a JSON-lines file so
+    that the full history survives while memory stays flat. Older records
+    are read back from disk through a sparse offset index (one offset every
+    ``INDEX_STRIDE`` records).
+
+    Without a ``path`` the journal only retains its in-memory tail.
+    """
+
+    INDEX_STRIDE = 128
+
+    def __init__(
+        self,
+        record_type: Type[JournalRecord],
+        capacity: int = 1000,
+        path: Optional[str] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            record_type: Record class stored in this journal
+            capacity: Number of records kept in memory
+            path: Optional journal file; existing content is resumed
+            logger: Optional logger instance
+        """
+        if capacity <= 0:
+            raise ValueError("Journal capacity must be positive")
+
+        self.record_type = record_type
+        self.capacity = capacity
+        self.path = path
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._tail: deque = deque(maxlen=capacity)
+        self._count = 0
+        self._lock = threading.RLock()
+
+        # On-disk state
+        self._file = None
+        self._file_size = 0
+        self._index = array('Q')
+
+        if path:
+            self._open_file()
+
+    def append(self, record: JournalRecord):
+        """
+        Append a record to the journal.
+
+        Args:
+            record: Record to append
+        """
+        with self._lock:
+            if self._file is not None:
+                line = (json.dumps(record.to_json(), separators=(',', ':')) + '\n').encode('utf-8')
+                if self._count % self.INDEX_STRIDE == 0:
+                    self._index.append(self._file_size)
+                self._file.write(line)
+                self._file_size += len(line)
+
+            self._tail.append(record)
+            self._count += 1
+
+    def tail(self, n: Optional[int] = None) -> List[JournalRecord]:
+        """
+        Get the most recent in-memory records, oldest first.
+
+        Args:
+            n: Number of records (all in-memory records if None)
+
+        Returns:
+            List of records
+        """
+        with self._lock:
+            if n is None or n >= len(self._tail):
+                return list(self._tail)
+            if n <= 0:
+                return []
+            return list(self._tail)[-n:]
+
+    def read(self, start: int, stop: int) -> List[JournalRecord]:
+        """
+        Read records by position, oldest first.
+
+        Position 0 is the oldest record ever appended. Positions that are no
+        longer retained (memory-only journal) are skipped.
+
+        Args:
+            start: First position (inclusive)
+            stop: Last position (exclusive)
+
+        Returns:
+            List of records
+        """
+        with self._lock:
+            start = max(start, self.first_position)
+            stop = min(stop, self._count)
+            if start >= stop:
+                return []
+
+            tail_start = self._count - len(self._tail)
+            if start >= tail_start:
+                tail = list(self._tail)
+                return tail[start - tail_start:stop - tail_start]
+
+            return self._read_from_file(start, stop)
+
+    def read_page(self, page: int = 1, per_page: int = 50, newest_first: bool = True) -> Dict[str, Any]:
+        """
+        Read one page of records.
+
+        Args:
+            page: Page number, starting at 1
+            per_page: Records per page
+            newest_first: Whether page 1 holds the most recent records
+
+        Returns:
+            Dictionary with JSON-serializable items and pagination details
+        """
+        page = max(int(page), 1)
+        per_page = max(int(per_page), 1)
+
+        with self._lock:
+            total = len(self)
+            first = self.first_position
+            skip = (page - 1) * per_page
+
+            if newest_first:
+                stop = self._count - skip
+                start = max(stop - per_page, first)
+                records = list(reversed(self.read(start, stop)))
+            else:
+                start = first + skip
+                records = self.read(start, start + per_page)
+
+        return {
+            'items': [record.to_json() for record in records],
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': (total + per_page - 1) // per_page
+        }
+
+    @property
+    def total_appended(self) -> int:
+        """Number of records appended since the journal was created or resumed."""
+        return self._count
+
+    @property
+    def first_position(self) -> int:
+        """Position of the oldest record that can still be read."""
+        if self._file is not None:
+            return 0
+        return self._count - len(self._tail)
+
+    def flush(self):
+        """Flush pending writes to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def clear(self):
+        """Drop the in-memory tail and truncate the journal file."""
+        with self._lock:
+            self._tail.clear()
+            self._count = 0
+            self._index = array('Q')
+            if self._file is not None:
+                self._file.seek(0)
+                self._file.truncate()
+                self._file_size = 0
+
+    def open(self):
+        """Reopen the journal file after ``close``, resuming its content."""
+        with self._lock:
+            if self.path and self._file is None:
+                self._tail.clear()
+                self._count = 0
+                self._index = array('Q')
+                self._file_size = 0
+                self._open_file()
+
+    def close(self):
+        """Flush and close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self) -> int:
+        return self._count - self.first_position
+
+    def _open_file(self):
+        """Open the journal file, resuming existing content."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        recent_lines: deque = deque(maxlen=self.capacity)
+
+        if os.path.exists(self.path):
+            offset = 0
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Torn final write: drop the partial line
+                        break
+                    if self._count % self.INDEX_STRIDE == 0:
+                        self._index.append(offset)
+                    recent_lines.append(line)
+                    offset += len(line)
+                    self._count += 1
+            self._file_size = offset
+
+        self._file = open(self.path, 'a+b')
+        if self._file.seek(0, os.SEEK_END) != self._file_size:
+            self._file.truncate(self._file_size)
+            self._file.seek(self._file_size)
+
+        for line in recent_lines:
+            self._tail.append(self.record_type.from_json(json.loads(line)))
+
+        if self._count:
+            self.logger.info(f"Resumed journal {self.path} with {self._count} records")
+
+    def _read_from_file(self, start: int, stop: int) -> List[JournalRecord]:
+        """Read records [start, stop) from the journal file."""
+        self._file.flush()
+
+        block = start // self.INDEX_STRIDE
+        position = block * self.INDEX_STRIDE
+        records = []
+
+        with open(self.path, 'rb') as f:
+            f.seek(self._index[block])
+            for line in f:
+                if position >= stop:
+                    break
+                if position >= start:
+                    records.append(self.record_type.from_json(json.loads(line)))
+                position += 1
+
+        return records
+
+
+def get_journal_path(directory: Optional[str], owner: str, kind: str) -> Optional[str]:
+    """
+    Build the journal file path for an owner (bot, strategy or tester).
+
+    Args:
+        directory: Journal directory (None disables on-disk journals)
+        owner: Owner name, sanitized for use in a filename
+        kind: Journal kind, e.g. "trades" or "signals"
+
+    Returns:
+        Journal file path, or None if no directory is configured
+    """
+    if not directory:
+        return None
+
+    safe_owner = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in owner) or 'journal'
+    return os.path.join(directory, f"{safe_owner}.{kind}.jsonl")
@@ -0,0 +1,141 @@
+"""
+Compact journal records for trades, strategy signals and backtest summaries.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, Tuple
+
+
+class JournalRecord:
+    """
+    Base class for journal records.
+
+    Subclasses declare their fields in ``__slots__`` so that each record
+    carries no per-instance ``__dict__``. Fields listed in
+    ``_datetime_fields`` are stored as ``datetime`` objects in memory and
+    as ISO strings on disk.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+    _datetime_fields: Tuple[str, ...] = ('timestamp',)
+
+    def __init__(self, **kwargs):
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert record to a JSON-serializable dictionary."""
+        data = self.to_dict()
+        for name in self._datetime_fields:
+            value = data.get(name)
+            if isinstance(value, datetime):
+                data[name] = value.isoformat()
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'JournalRecord':
+        """
+        Rebuild a record from its JSON representation.
+
+        Args:
+            data: Dictionary produced by ``to_json``
+
+        Returns:
+            Record instance
+        """
+        values = {name: data.get(name) for name in cls.__slots__}
+        for name in cls._datetime_fields:
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = datetime.fromisoformat(value)
+        return cls(**values)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class TradeRecord(JournalRecord):
+    """Completed bot trade."""
+
+    __slots__ = ('id', 'symbol', 'side', 'quantity', 'price', 'timestamp', 'fee', 'pnl')
+
+
+class SignalRecord(JournalRecord):
+    """
+    Validated strategy signal.
+
+    The free-form ``metadata`` payload is kept in memory only: it is not
+    guaranteed to be JSON-serializable, so it is left out of the journal file.
+    """
+
+    __slots__ = (
+        'signal_type', 'confidence', 'price', 'timestamp',
+        'stop_loss', 'take_profit', 'position_size', 'reasoning', 'metadata'
+    )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert record to a JSON-serializable dictionary, without metadata."""
+        data = super().to_json()
+        del data['metadata']
+        return data
+
+    @classmethod
+    def from_signal(cls, signal) -> 'SignalRecord':
+        """
+        Build a record from a ``StrategySignal``.
+
+        Args:
+            signal: Strategy signal to record
+
+        Returns:
+            SignalRecord
+        """
+        return cls(
+            signal_type=signal.signal_type.value,
+            confidence=signal.confidence,
+            price=signal.price,
+            timestamp=signal.timestamp,
+            stop_loss=signal.stop_loss,
+            take_profit=signal.take_profit,
+            position_size=signal.position_size,
+            reasoning=signal.reasoning,
+            metadata=signal.metadata
+        )
+
+
+class BacktestSummaryRecord(JournalRecord):
+    """Headline metrics of a backtest run, without curves or trade lists."""
+
+    __slots__ = (
+        'strategy_name', 'total_return_percentage', 'annualized_return',
+        'sharpe_ratio', 'max_drawdown', 'win_rate', 'profit_factor',
+        'total_trades', 'timestamp'
+    )
+
+    @classmethod
+    def from_result(cls, result) -> 'BacktestSummaryRecord':
+        """
+        Build a record from a ``BacktestResult``.
+
+        Args:
+            result: Backtest result to summarize
+
+        Returns:
+            BacktestSummaryRecord
+        """
+        return cls(
+            strategy_name=result.strategy_name,
+            total_return_percentage=result.total_return_percentage,
+            annualized_return=result.annualized_return,
+            sharpe_ratio=result.sharpe_ratio,
+            max_drawdown=result.max_drawdown,
+            win_rate=result.win_rate,
+            profit_factor=result.profit_factor,
+            total_trades=result.total_trades,
+            timestamp=result.end_time or datetime.now()
+        )
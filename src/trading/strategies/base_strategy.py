@@ -9,6 +9,9 @@ from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from enum import Enum
 
+from ...core.tracing import traced
+from ..journal import Journal, SignalRecord, get_journal_path
+
 
 class SignalType(Enum):
     """Types of trading signals."""
@@ -47,6 +50,10 @@ class StrategyConfig:
     # Custom parameters
     parameters: Dict[str, Any] = field(default_factory=dict)
     
+    # Signal journal
+    signal_history_size: int = 1000     # Signals kept in memory
+    journal_dir: Optional[str] = None   # Directory for on-disk signal journals
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
         return {
@@ -59,7 +66,9 @@ class StrategyConfig:
             'risk_per_trade': self.risk_per_trade,
             'lookback_period': self.lookback_period,
             'confidence_threshold': self.confidence_threshold,
-            'parameters': self.parameters
+            'parameters': self.parameters,
+            'signal_history_size': self.signal_history_size,
+            'journal_dir': self.journal_dir
         }
 
 
@@ -142,7 +151,12 @@ class BaseStrategy(ABC):
         self._indicators: Dict[str, List[float]] = {}
         
         # Signal history
-        self._signal_history: List[StrategySignal] = []
+        self._signal_journal = Journal(
+            SignalRecord,
+            capacity=config.signal_history_size,
+            path=get_journal_path(config.journal_dir, config.name, 'signals'),
+            logger=self.logger
+        )
         self._performance_metrics: Dict[str, float] = {}
     
     async def initialize(self) -> bool:
@@ -172,6 +186,7 @@ class BaseStrategy(ABC):
             self._state = StrategyState.ERROR
             return False
     
+    @traced('strategy.analyze', tags=lambda self, *args, **kwargs: {'strategy': self.config.name})
     async def analyze(self, market_data: List[Dict[str, Any]]) -> StrategyResult:
         """
         Analyze market data and generate trading signals.
@@ -202,7 +217,8 @@ class BaseStrategy(ABC):
             market_analysis = await self._analyze_market_conditions()
             
             # Update signal history
-            self._signal_history.extend(validated_signals)
+            for signal in validated_signals:
+                self._signal_journal.append(SignalRecord.from_signal(signal))
             
             # Update last analysis time
             self._last_analysis = datetime.now()
@@ -229,19 +245,54 @@ class BaseStrategy(ABC):
         Returns:
             List of current signals
         """
-        # Return signals from the last analysis
-        if not self._signal_history:
-            return []
-        
-        # Get signals from the last hour
+        # Get signals from the last hour, scanning back from the newest
         current_time = datetime.now()
-        recent_signals = [
-            signal for signal in self._signal_history
-            if (current_time - signal.timestamp).total_seconds() < 3600
-        ]
+        recent_signals = []
         
+        for record in reversed(self._signal_journal.tail()):
+            if (current_time - record.timestamp).total_seconds() >= 3600:
+                break
+            recent_signals.append(self._signal_from_record(record))
+        
+        recent_signals.reverse()
         return recent_signals
     
+    def get_signal_history_page(self, page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+        """
+        Get one page of the signal history, newest first.
+        
+        Args:
+            page: Page number, starting at 1
+            per_page: Signals per page
+            
+        Returns:
+            Dictionary with signals and pagination details
+        """
+        return self._signal_journal.read_page(page, per_page)
+    
+    @staticmethod
+    def _signal_from_record(record: SignalRecord) -> StrategySignal:
+        """
+        Rebuild a signal from its journal record.
+        
+        Args:
+            record: Journaled signal
+            
+        Returns:
+            StrategySignal (metadata is only available for in-memory records)
+        """
+        return StrategySignal(
+            signal_type=SignalType(record.signal_type),
+            confidence=record.confidence,
+            price=record.price,
+            timestamp=record.timestamp,
+            stop_loss=record.stop_loss,
+            take_profit=record.take_profit,
+            position_size=record.position_size,
+            reasoning=record.reasoning,
+            metadata=record.metadata
+        )
+    
     def get_performance_metrics(self) -> Dict[str, float]:
         """
         Get strategy performance metrics.
@@ -482,7 +533,7 @@ class BaseStrategy(ABC):
             'state': self._state.value,
             'timeframe': self.config.timeframe,
             'last_analysis': self._last_analysis.isoformat() if self._last_analysis else None,
-            'signal_count': len(self._signal_history),
+            'signal_count': len(self._signal_journal),
             'current_signals': len(self.get_current_signals()),
             'config': self.config.to_dict()
         }
\ No newline at end of file
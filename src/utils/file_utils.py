@@ -4,6 +4,7 @@ Utilitaires pour les opérations sur les fichiers
 import json
 import os
 import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
@@ -55,13 +56,19 @@ def read_json_file(path: str) -> Dict[str, Any]:
         raise FileOperationError("read", path, str(e))
 
 
-def write_json_file(path: str, data: Dict[str, Any]) -> bool:
+def write_json_file(path: str, data: Dict[str, Any], indent: Optional[int] = 2) -> bool:
     """
     Écrit des données dans un fichier JSON
     
+    L'écriture est atomique : les données sont écrites dans un fichier
+    temporaire du même répertoire puis renommées sur le fichier cible, si
+    bien qu'un lecteur voit l'ancien ou le nouveau contenu, jamais un
+    fichier partiel.
+    
     Args:
         path: Chemin vers le fichier JSON
         data: Données à écrire
+        indent: Indentation (None pour un JSON compact)
         
     Returns:
         True si l'écriture a réussi
@@ -69,17 +76,29 @@ def write_json_file(path: str, data: Dict[str, Any]) -> bool:
     Raises:
         FileOperationError: Si l'écriture échoue
     """
+    temp_path = None
     try:
         # S'assurer que le répertoire parent existe
         parent_dir = os.path.dirname(path)
         if parent_dir:
             ensure_directory_exists(parent_dir)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=parent_dir or None
+        )
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False,
+                      separators=None if indent is not None else (',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        temp_path = None
         return True
     except Exception as e:
         raise FileOperationError("write", path, str(e))
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
 
 
 def backup_file(path: str, backup_suffix: str = ".backup") -> str:
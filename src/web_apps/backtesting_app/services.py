@@ -6,6 +6,8 @@ from typing import Dict, Any, List, Optional
 import logging
 from datetime import datetime, timedelta
 
+from ...core.tracing import get_traced_session
+
 
 def get_backend_status(backend_url: str, logger: logging.Logger) -> Dict[str, Any]:
     """
@@ -19,7 +21,7 @@ def get_backend_status(backend_url: str, logger: logging.Logger) -> Dict[str, An
         Dictionnaire avec le statut du backend
     """
     try:
-        response = requests.get(f"{backend_url}/health", timeout=5)
+        response = get_traced_session().get(f"{backend_url}/health", timeout=5)
         if response.status_code == 200:
             return response.json()
         else:
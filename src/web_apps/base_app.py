@@ -7,7 +7,9 @@ from typing import Optional, Dict, Any
 import logging
 
 from ..core.config import Config
-from ..core.logging_config import get_logger
+from ..core.logging_config import get_logger, add_log_handlers
+from ..core.metrics_registry import register_metrics_endpoint
+from ..core.tracing import configure_tracing, register_tracing
 
 
 def create_base_app(app_name: str, config: Config, template_folder: Optional[str] = None, 
@@ -48,6 +50,13 @@ def create_base_app(app_name: str, config: Config, template_folder: Optional[str
     logger = get_logger(app_name)
     app.logger = logger
     
+    # Expose /metrics and time every request
+    register_metrics_endpoint(app, app_name)
+    
+    # Trace every request; calls to the backend carry the trace context
+    configure_tracing(app_name, config)
+    register_tracing(app, app_name)
+    
     # Register shared error handlers
     register_error_handlers(app)
     
@@ -271,6 +280,6 @@ def setup_app_logging(app: Flask, config: Config) -> None:
         file_handler.setFormatter(logging.Formatter(config.LOG_FORMAT))
         file_handler.setLevel(getattr(logging, config.LOG_LEVEL.upper()))
         
-        app.logger.addHandler(file_handler)
+        add_log_handlers(app.logger, [file_handler], config)
         app.logger.setLevel(getattr(logging, config.LOG_LEVEL.upper()))
         app.logger.info(f'{app.config["APP_NAME"]} startup')
\ No newline at end of file
@@ -7,6 +7,7 @@ from typing import Dict, Any, List
 import logging
 
 from ....core.logging_config import get_logger
+from ....core.tracing import get_traced_session
 
 
 # Create blueprint for bot routes
@@ -154,7 +155,9 @@ def api_bot_status(bot_id: str):
                 'status': bot_data['status'],
                 'last_update': bot_data.get('last_update'),
                 'profit_loss': bot_data.get('profit_loss', 0.0),
-                'trades_today': bot_data.get('trades_today', 0)
+                'trades_today': bot_data.get('trades_today', 0),
+                # Percentiles par phase (p50/p99/p999 en µs), cf. BaseBot.get_latency_stats()
+                'latency': get_bot_latency_from_backend(backend_url, bot_id, logger)
             }
         })
     except Exception as e:
@@ -165,6 +168,36 @@ def api_bot_status(bot_id: str):
         }), 500
 
 
+@bot_bp.route('/api/<bot_id>/trades', methods=['GET'])
+def api_bot_trades(bot_id: str):
+    """API endpoint paginé pour l'historique des trades d'un bot"""
+    logger = get_logger("BotRoutes")
+    
+    try:
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+        
+        backend_url = current_app.config['BACKEND_API_URL']
+        trades_page = get_bot_trades_from_backend(backend_url, bot_id, page, per_page, logger)
+        
+        return jsonify({
+            'success': True,
+            'data': trades_page['items'],
+            'pagination': {
+                'page': trades_page['page'],
+                'per_page': trades_page['per_page'],
+                'total': trades_page['total'],
+                'pages': trades_page['pages']
+            }
+        })
+    except Exception as e:
+        logger.error(f"Error getting trades for bot {bot_id}: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 def get_bots_from_backend(backend_url: str, logger: logging.Logger) -> List[Dict[str, Any]]:
     """
     Récupère la liste des bots depuis le backend API
@@ -267,6 +300,69 @@ def get_bot_detail_from_backend(backend_url: str, bot_id: str, logger: logging.L
         return None
 
 
+def get_bot_latency_from_backend(backend_url: str, bot_id: str,
+                                 logger: logging.Logger) -> Dict[str, Dict[str, Any]]:
+    """
+    Récupère les latences par phase d'un bot depuis son statut dans le backend API
+    
+    Args:
+        backend_url: URL du backend API
+        bot_id: ID du bot
+        logger: Logger pour les erreurs
+        
+    Returns:
+        Résumé des latences par phase (count, p50_us, p99_us, p999_us...),
+        vide si le backend n'héberge pas le bot
+    """
+    try:
+        response = get_traced_session().get(f"{backend_url}/api/bots/{bot_id}/status", timeout=10)
+        if response.status_code == 200:
+            return response.json().get('data', {}).get('latency', {})
+        
+        logger.warning(f"Backend returned {response.status_code} for status of bot {bot_id}")
+        return {}
+    except Exception as e:
+        logger.error(f"Error getting latency for bot {bot_id} from backend: {e}")
+        return {}
+
+
+def get_bot_trades_from_backend(backend_url: str, bot_id: str, page: int, per_page: int,
+                                logger: logging.Logger) -> Dict[str, Any]:
+    """
+    Récupère une page de l'historique des trades d'un bot depuis le backend API
+    
+    Le backend sert l'historique des bots de son BotHost, lu par
+    BaseBot.get_trade_history_page() dans le journal de trades (tampon
+    mémoire borné + fichier sur disque) ; la page renvoyée a le même format.
+    
+    Args:
+        backend_url: URL du backend API
+        bot_id: ID du bot
+        page: Numéro de page (à partir de 1)
+        per_page: Nombre de trades par page
+        logger: Logger pour les erreurs
+        
+    Returns:
+        Page de trades (les plus récents en premier) avec les informations de pagination
+    """
+    empty_page = {'items': [], 'page': page, 'per_page': per_page, 'total': 0, 'pages': 0}
+    
+    try:
+        response = get_traced_session().get(
+            f"{backend_url}/api/bots/{bot_id}/trades",
+            params={'page': page, 'per_page': per_page},
+            timeout=10
+        )
+        if response.status_code == 200:
+            return response.json().get('data', empty_page)
+        
+        logger.warning(f"Backend returned {response.status_code} for trades of bot {bot_id}")
+        return empty_page
+    except Exception as e:
+        logger.error(f"Error getting trades for bot {bot_id} from backend: {e}")
+        return empty_page
+
+
 def control_bot_via_backend(backend_url: str, bot_id: str, action: str, logger: logging.Logger) -> Dict[str, Any]:
     """
     Contrôle un bot via le backend API
@@ -0,0 +1,182 @@
+"""
+Benchmarks du module de trading
+
+Chaque benchmark est une fonction de préparation qui reçoit une taille de
+données et retourne la fonction sans argument à chronométrer. Les données
+de marché sont synthétiques et générées avec une graine fixe.
+"""
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Tuple
+
+from src.trading.indicators import sma, ema, rsi, macd, bollinger_bands, atr, adx
+from src.trading.indicators.custom_indicators import vwap, ichimoku_cloud
+from src.trading.backtesting import BacktestEngine, BacktestConfig, StrategyTester, PerformanceAnalyzer
+from src.trading.strategies import MovingAverageStrategy, StrategyConfig
+from src.trading.bots import ScalpingBot, BotConfig
+
+
+# Logger silencieux pour que les benchmarks ne mesurent pas les E/S de logs
+_QUIET_LOGGER = logging.getLogger("benchmarks.trading")
+_QUIET_LOGGER.setLevel(logging.CRITICAL)
+_QUIET_LOGGER.propagate = False
+
+_BACKTEST_CONFIG = BacktestConfig(start_date=datetime(2020, 1, 1), end_date=datetime(2030, 1, 1))
+
+
+def generate_market_data(size: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Génère des bougies OHLCV synthétiques
+
+    Args:
+        size: Nombre de bougies
+        seed: Graine aléatoire
+
+    Returns:
+        Liste de bougies horaires
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    price = 100.0
+    candles = []
+
+    for i in range(size):
+        open_price = price
+        price *= 1 + rng.uniform(-0.01, 0.01)
+        candles.append({
+            'timestamp': start + timedelta(hours=i),
+            'open': open_price,
+            'high': max(open_price, price) * (1 + rng.uniform(0, 0.005)),
+            'low': min(open_price, price) * (1 - rng.uniform(0, 0.005)),
+            'close': price,
+            'volume': rng.uniform(500, 5000)
+        })
+
+    return candles
+
+
+def _series(size: int) -> Tuple[List[float], List[float], List[float], List[float]]:
+    """Retourne les séries highs, lows, closes et volumes"""
+    candles = generate_market_data(size)
+    return (
+        [c['high'] for c in candles],
+        [c['low'] for c in candles],
+        [c['close'] for c in candles],
+        [c['volume'] for c in candles]
+    )
+
+
+def _strategy(name: str = "bench_ma", **parameters) -> MovingAverageStrategy:
+    """Crée une stratégie de moyennes mobiles silencieuse"""
+    config = StrategyConfig(name=name, description="benchmark", parameters=parameters)
+    return MovingAverageStrategy(config, _QUIET_LOGGER)
+
+
+def bench_indicators(size: int) -> Callable[[], Any]:
+    """Indicateurs classiques sur une série de clôtures"""
+    highs, lows, closes, volumes = _series(size)
+
+    def run():
+        sma(closes, 20)
+        ema(closes, 20)
+        rsi(closes, 14)
+        macd(closes)
+        bollinger_bands(closes, 20)
+        atr(highs, lows, closes)
+        adx(highs, lows, closes)
+
+    return run
+
+
+def bench_custom_indicators(size: int) -> Callable[[], Any]:
+    """Indicateurs personnalisés (VWAP, Ichimoku)"""
+    highs, lows, closes, volumes = _series(size)
+
+    def run():
+        vwap(highs, lows, closes, volumes)
+        ichimoku_cloud(highs, lows, closes)
+
+    return run
+
+
+def bench_run_backtest(size: int) -> Callable[[], Any]:
+    """BacktestEngine.run_backtest avec une stratégie de moyennes mobiles"""
+    candles = generate_market_data(size)
+
+    def run():
+        engine = BacktestEngine(_BACKTEST_CONFIG, _QUIET_LOGGER)
+        asyncio.run(engine.run_backtest(_strategy(), [dict(c) for c in candles]))
+
+    return run
+
+
+def bench_optimize_parameters(size: int) -> Callable[[], Any]:
+    """StrategyTester.optimize_parameters sur une grille de 4 combinaisons"""
+    candles = generate_market_data(size)
+    parameter_ranges = {'fast_period': [5, 10], 'slow_period': [20, 30]}
+
+    def factory(params):
+        return _strategy(f"bench_ma_{params['fast_period']}_{params['slow_period']}", **params)
+
+    def run():
+        tester = StrategyTester(_QUIET_LOGGER)
+        asyncio.run(tester.optimize_parameters(
+            factory, parameter_ranges, [dict(c) for c in candles], _BACKTEST_CONFIG
+        ))
+
+    return run
+
+
+def bench_performance_analyzer(size: int) -> Callable[[], Any]:
+    """PerformanceAnalyzer sur le résultat d'un backtest"""
+    engine = BacktestEngine(_BACKTEST_CONFIG, _QUIET_LOGGER)
+    result = asyncio.run(engine.run_backtest(_strategy(), generate_market_data(size)))
+    analyzer = PerformanceAnalyzer(_QUIET_LOGGER)
+
+    def run():
+        analyzer.analyze_performance(result)
+        analyzer.analyze_trades(result.trades)
+        analyzer.calculate_risk_metrics(result.equity_curve)
+
+    return run
+
+
+def bench_bot_execution_loop(size: int) -> Callable[[], Any]:
+    """Itérations du cycle stratégie -> ordres d'un ScalpingBot simulé"""
+    def run():
+        random.seed(42)
+        config = BotConfig(
+            name="bench_scalper",
+            symbol="BTC/USDT",
+            base_currency="BTC",
+            quote_currency="USDT",
+            max_open_orders=10 ** 9,
+            max_position_size=10 ** 12
+        )
+        bot = ScalpingBot(config, _QUIET_LOGGER)
+
+        async def loop():
+            await bot._initialize()
+            for _ in range(size):
+                # Pas de délai minimal entre trades pour exercer le chemin d'ordre
+                bot._last_trade_time = None
+                for order in await bot._execute_strategy():
+                    await bot._place_order(order)
+            await bot._cleanup()
+
+        asyncio.run(loop())
+
+    return run
+
+
+# Nom -> (fonction de préparation, tailles complètes, tailles rapides)
+BENCHMARKS: Dict[str, Tuple[Callable[[int], Callable[[], Any]], List[int], List[int]]] = {
+    'indicators': (bench_indicators, [1_000, 10_000, 50_000], [1_000, 10_000]),
+    'custom_indicators': (bench_custom_indicators, [1_000, 10_000, 50_000], [1_000, 10_000]),
+    'run_backtest': (bench_run_backtest, [250, 1_000, 4_000], [250, 1_000]),
+    'optimize_parameters': (bench_optimize_parameters, [250, 1_000], [250]),
+    'performance_analyzer': (bench_performance_analyzer, [250, 1_000, 4_000], [250, 1_000]),
+    'bot_execution_loop': (bench_bot_execution_loop, [100, 1_000, 5_000], [100, 1_000]),
+}
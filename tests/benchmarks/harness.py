@@ -0,0 +1,244 @@
+"""
+Outils de mesure pour les benchmarks de performance
+
+Chaque benchmark est chronométré plusieurs fois. Pour que les baselines
+commitées restent comparables d'une machine à l'autre, sa durée minimale
+est aussi exprimée relativement à une boucle de calibration en pur Python
+mesurée juste avant lui : le minimum et la calibration adjacente écartent
+l'essentiel des interférences de la machine.
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any
+
+
+@dataclass
+class BenchmarkResult:
+    """Résultat d'un benchmark pour une taille de données"""
+    name: str
+    size: int
+    repeat: int
+    median: float
+    mean: float
+    min: float
+    max: float
+    calibration: float = 0.0
+    relative: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Identifiant unique du benchmark dans une baseline"""
+        return f"{self.name}[{self.size}]"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le résultat en dictionnaire"""
+        return asdict(self)
+
+
+@dataclass
+class Regression:
+    """Écart significatif par rapport à la baseline"""
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Rapport entre le coût actuel et le coût de référence"""
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+@dataclass
+class BenchmarkReport:
+    """Ensemble des résultats d'une exécution"""
+    results: List[BenchmarkResult] = field(default_factory=list)
+    calibration: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le rapport au format JSON des baselines"""
+        return {
+            'created_at': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'calibration': self.calibration,
+            'results': {result.key: result.to_dict() for result in self.results}
+        }
+
+
+def calibrate(repeat: int = 15) -> float:
+    """
+    Mesure une boucle de référence en pur Python
+
+    Le minimum est retenu plutôt que la médiane : la boucle est courte et
+    déterministe, seules les interférences de la machine la ralentissent.
+
+    Args:
+        repeat: Nombre de mesures
+
+    Returns:
+        Durée minimale de la boucle en secondes
+    """
+    def loop():
+        total = 0.0
+        values = {}
+        for i in range(200_000):
+            total += i * 0.5
+            values[i & 1023] = total
+        return total
+
+    return measure(loop, repeat=repeat, warmup=1)[2]
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> List[float]:
+    """
+    Chronomètre une fonction
+
+    Args:
+        func: Fonction sans argument à mesurer
+        repeat: Nombre de mesures
+        warmup: Nombre d'exécutions non mesurées
+
+    Returns:
+        [médiane, moyenne, min, max] en secondes
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return [statistics.median(timings), statistics.mean(timings), min(timings), max(timings)]
+
+
+def run_benchmark(name: str, size: int, func: Callable[[], Any], calibration: float,
+                  repeat: int = 5, warmup: int = 1) -> BenchmarkResult:
+    """
+    Exécute un benchmark
+
+    Args:
+        name: Nom du benchmark
+        size: Taille des données
+        func: Fonction sans argument à mesurer
+        calibration: Durée de la boucle de calibration
+        repeat: Nombre de mesures
+        warmup: Nombre d'exécutions non mesurées
+
+    Returns:
+        Résultat du benchmark
+    """
+    median, mean, minimum, maximum = measure(func, repeat=repeat, warmup=warmup)
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        repeat=repeat,
+        median=median,
+        mean=mean,
+        min=minimum,
+        max=maximum,
+        calibration=calibration,
+        relative=minimum / calibration if calibration else 0.0
+    )
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Charge une baseline JSON
+
+    Args:
+        path: Chemin de la baseline
+
+    Returns:
+        Contenu de la baseline ou None si absente
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_report(report: BenchmarkReport, path: str):
+    """
+    Écrit un rapport au format JSON
+
+    Args:
+        report: Rapport à écrire
+        path: Chemin du fichier
+    """
+    _write_json(path, report.to_dict())
+
+
+def update_baseline(report: BenchmarkReport, path: str, merge: bool = False):
+    """
+    Enregistre un rapport comme baseline
+
+    Args:
+        report: Rapport à enregistrer
+        path: Chemin de la baseline
+        merge: Conserver les entrées existantes absentes du rapport
+    """
+    data = report.to_dict()
+
+    existing = load_baseline(path) if merge else None
+    if existing:
+        for key, value in existing.get('results', {}).items():
+            data['results'].setdefault(key, value)
+
+    _write_json(path, data)
+
+
+def _write_json(path: str, data: Dict[str, Any]):
+    """Écrit un fichier JSON lisible et stable pour les diffs"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare_with_baseline(report: BenchmarkReport, baseline: Dict[str, Any],
+                          threshold: float = 0.25, min_duration: float = 0.0005) -> List[Regression]:
+    """
+    Compare un rapport à une baseline
+
+    La comparaison porte sur les durées minimales relatives à la calibration. Les
+    benchmarks trop courts pour être mesurés de façon fiable sont ignorés.
+
+    Args:
+        report: Rapport de l'exécution courante
+        baseline: Baseline chargée avec load_baseline
+        threshold: Régression tolérée (0.25 = 25% plus lent)
+        min_duration: Durée médiane minimale pour comparer un benchmark
+
+    Returns:
+        Liste des régressions au-delà du seuil
+    """
+    regressions = []
+    baseline_results = baseline.get('results', {})
+
+    for result in report.results:
+        reference = baseline_results.get(result.key)
+        if not reference or reference.get('median', 0) < min_duration:
+            continue
+
+        if result.relative > reference['relative'] * (1 + threshold):
+            regressions.append(Regression(result.key, reference['relative'], result.relative))
+
+    return regressions
@@ -0,0 +1,165 @@
+"""
+Exécute les benchmarks de performance et les compare aux baselines commitées
+
+Exemples:
+    python tests/benchmarks/run_benchmarks.py
+    python tests/benchmarks/run_benchmarks.py --quick --output bench_output.json
+    python tests/benchmarks/run_benchmarks.py --update-baseline
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Permettre l'exécution directe depuis la racine du projet
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.benchmarks.harness import (
+    BenchmarkReport, calibrate, run_benchmark, load_baseline, save_report, update_baseline,
+    compare_with_baseline
+)
+from tests.benchmarks.bench_trading import BENCHMARKS
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "trading.json")
+
+
+def measure_benchmark(name, size, repeat=5):
+    """
+    Mesure un benchmark après une calibration adjacente
+
+    Args:
+        name: Nom du benchmark
+        size: Taille des données
+        repeat: Nombre de mesures
+
+    Returns:
+        Résultat du benchmark
+    """
+    setup = BENCHMARKS[name][0]
+    func = setup(size)
+    # Recalibrer juste avant chaque mesure suit les variations de vitesse de la machine
+    calibration = calibrate(repeat=7)
+    return run_benchmark(name, size, func, calibration, repeat=repeat)
+
+
+def confirm_regressions(report, baseline, threshold, repeat=5, attempts=2):
+    """
+    Re-mesure les benchmarks en régression pour écarter les faux positifs
+
+    Seules les régressions observées à chaque nouvelle mesure sont retenues ;
+    le meilleur résultat remplace la mesure initiale dans le rapport.
+
+    Args:
+        report: Rapport de l'exécution courante
+        baseline: Baseline chargée avec load_baseline
+        threshold: Régression tolérée
+        repeat: Nombre de mesures par benchmark
+        attempts: Nombre de nouvelles mesures au maximum
+
+    Returns:
+        Liste des régressions confirmées
+    """
+    regressions = compare_with_baseline(report, baseline, threshold)
+
+    for _ in range(attempts):
+        if not regressions:
+            break
+
+        suspects = {regression.key for regression in regressions}
+        for index, result in enumerate(report.results):
+            if result.key in suspects:
+                retry = measure_benchmark(result.name, result.size, repeat)
+                if retry.relative < result.relative:
+                    report.results[index] = retry
+
+        regressions = compare_with_baseline(report, baseline, threshold)
+
+    return regressions
+
+
+def run_all(selected=None, quick=False, repeat=5) -> BenchmarkReport:
+    """
+    Exécute les benchmarks sélectionnés
+
+    Args:
+        selected: Noms des benchmarks à exécuter (tous si None)
+        quick: Utiliser les tailles réduites
+        repeat: Nombre de mesures par benchmark
+
+    Returns:
+        Rapport des résultats
+    """
+    report = BenchmarkReport(calibration=calibrate())
+    print(f"⚙️  Calibration: {report.calibration * 1000:.2f} ms")
+
+    for name, (setup, sizes, quick_sizes) in BENCHMARKS.items():
+        if selected and name not in selected:
+            continue
+
+        for size in (quick_sizes if quick else sizes):
+            result = measure_benchmark(name, size, repeat)
+            report.results.append(result)
+            print(f"   {result.key:<32} médiane {result.median * 1000:10.2f} ms"
+                  f"   (x{result.relative:.2f} calibration)")
+
+    return report
+
+
+def main():
+    """Point d'entrée principal"""
+    parser = argparse.ArgumentParser(description="Benchmarks de performance Axiom Trade")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Fichier de baseline JSON")
+    parser.add_argument("--output", "-o",
+                        help="Fichier JSON de sortie des résultats")
+    parser.add_argument("--threshold", "-t", type=float, default=0.25,
+                        help="Régression tolérée (0.25 = 25%% plus lent)")
+    parser.add_argument("--repeat", "-r", type=int, default=5,
+                        help="Nombre de mesures par benchmark")
+    parser.add_argument("--benchmark", "-b", action="append", choices=sorted(BENCHMARKS),
+                        help="Benchmark à exécuter (répétable)")
+    parser.add_argument("--quick", "-q", action="store_true",
+                        help="Tailles de données réduites")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Enregistrer les résultats comme nouvelle baseline")
+
+    args = parser.parse_args()
+
+    print("🏎️  BENCHMARKS AXIOM TRADE")
+    print("=" * 60)
+
+    report = run_all(args.benchmark, args.quick, args.repeat)
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"\n💾 Résultats écrits dans {args.output}")
+
+    if args.update_baseline:
+        # Une exécution partielle ne remplace que les entrées mesurées
+        update_baseline(report, args.baseline, merge=bool(args.quick or args.benchmark))
+        print(f"📌 Baseline mise à jour: {args.baseline}")
+        sys.exit(0)
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\n⚠️  Aucune baseline trouvée ({args.baseline}), comparaison ignorée")
+        sys.exit(0)
+
+    regressions = confirm_regressions(report, baseline, args.threshold, args.repeat)
+
+    print(f"\n📊 Comparaison avec la baseline (seuil {args.threshold:.0%})")
+    if not regressions:
+        print("✅ Aucune régression de performance")
+        sys.exit(0)
+
+    for regression in regressions:
+        print(f"❌ {regression.key}: x{regression.ratio:.2f} "
+              f"({regression.baseline:.3f} -> {regression.current:.3f} unités de calibration)")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -98,6 +98,37 @@ def run_test_category(category_name, test_paths, verbose=False):
     return total_passed, total_failed, total_time
 
 
+def run_benchmarks(threshold=0.25, quick=False, verbose=False):
+    """Exécute les benchmarks et les compare aux baselines commitées"""
+    print(f"\n{'='*60}")
+    print("🏎️  BENCHMARKS DE PERFORMANCE")
+    print(f"{'='*60}")
+
+    cmd = [
+        sys.executable,
+        os.path.join("tests", "benchmarks", "run_benchmarks.py"),
+        "--threshold", str(threshold)
+    ]
+    if quick:
+        cmd.append("--quick")
+
+    start_time = time.time()
+    success, stdout, stderr = run_command(" ".join(cmd), timeout=1800)
+    bench_time = time.time() - start_time
+
+    if verbose or not success:
+        print(stdout)
+    if stderr and not success:
+        print("Erreur:", stderr[-300:])
+
+    if success:
+        print(f"✅ Aucune régression de performance ({bench_time:.1f}s)")
+    else:
+        print(f"❌ Régression de performance détectée ({bench_time:.1f}s)")
+
+    return success, bench_time
+
+
 def main():
     """Point d'entrée principal"""
     parser = argparse.ArgumentParser(description="Exécute tous les tests du projet Axiom Trade")
@@ -109,6 +140,10 @@ def main():
                        help="Mode verbose")
     parser.add_argument("--fast", "-f", action="store_true",
                        help="Mode rapide (skip les tests lents)")
+    parser.add_argument("--benchmarks", "-b", action="store_true",
+                       help="Exécuter aussi les benchmarks de performance")
+    parser.add_argument("--benchmark-threshold", type=float, default=0.25,
+                       help="Régression de performance tolérée (0.25 = 25%%)")
     
     args = parser.parse_args()
     
@@ -182,6 +217,17 @@ def main():
             total_failed += failed
             total_time += test_time
     
+    # Benchmarks (tailles réduites en mode rapide)
+    if args.benchmarks:
+        bench_success, bench_time = run_benchmarks(
+            args.benchmark_threshold,
+            quick=args.fast,
+            verbose=args.verbose
+        )
+        total_time += bench_time
+        if not bench_success:
+            total_failed += 1
+    
     # Résumé final
     print(f"\n{'='*60}")
     print("📈 RÉSUMÉ FINAL")
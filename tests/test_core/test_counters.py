@@ -0,0 +1,165 @@
+"""
+Tests pour les compteurs par thread et le tampon circulaire
+"""
+import threading
+
+import pytest
+
+from src.core.counters import ShardedCounterMap, RingBuffer, RollingAggregates
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests"""
+
+    def __init__(self, now=1700000000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def run_threads(target, count=8):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestShardedCounterMap:
+    """Tests pour la classe ShardedCounterMap"""
+
+    def test_concurrent_increments_not_lost(self):
+        """Test des incréments simultanés depuis plusieurs threads"""
+        counters = ShardedCounterMap()
+
+        def work():
+            for index in range(5000):
+                counters.add('INFO')
+                if index % 10 == 0:
+                    counters.add('ERROR')
+
+        run_threads(work)
+
+        assert counters.snapshot() == {'INFO': 40000, 'ERROR': 4000}
+
+    def test_dead_thread_cells_collected(self):
+        """Test du report des cellules des threads terminés"""
+        counters = ShardedCounterMap()
+
+        for _ in range(20):
+            thread = threading.Thread(target=counters.add, args=('WARNING', 2))
+            thread.start()
+            thread.join()
+
+        assert counters.snapshot() == {'WARNING': 40}
+        assert len(counters._cells) <= 1
+
+    def test_reset(self):
+        """Test de la remise à zéro"""
+        counters = ShardedCounterMap()
+        counters.add('INFO', 3)
+
+        counters.reset()
+
+        assert counters.snapshot() == {'INFO': 0}
+
+
+class TestRingBuffer:
+    """Tests pour la classe RingBuffer"""
+
+    def test_keeps_most_recent_in_order(self):
+        """Test de la conservation des derniers éléments dans l'ordre"""
+        ring = RingBuffer(3)
+
+        for item in range(5):
+            ring.append(item)
+
+        assert ring.items() == [2, 3, 4]
+        assert len(ring) == 3
+
+    def test_concurrent_appends(self):
+        """Test des écritures simultanées"""
+        ring = RingBuffer(100)
+
+        run_threads(lambda: [ring.append(index) for index in range(1000)])
+
+        assert len(ring.items()) == 100
+
+    def test_clear(self):
+        """Test du vidage"""
+        ring = RingBuffer(2)
+        ring.append("a")
+
+        ring.clear()
+
+        assert ring.items() == []
+
+
+class TestRollingAggregates:
+    """Tests pour la classe RollingAggregates"""
+
+    def test_window_summary(self):
+        """Test du résumé limité à la fenêtre demandée"""
+        clock = FakeClock()
+        rolling = RollingAggregates(clock=clock)
+
+        rolling.record(2.0, success=False, key="refresh")
+        clock.advance(120)
+        for _ in range(9):
+            rolling.record(0.1, key="status")
+        rolling.record(0.3, key="status")
+
+        last_minute = rolling.summary(60)
+        assert last_minute['count'] == 10
+        assert last_minute['average'] == pytest.approx(0.12)
+        assert last_minute['min'] == 0.1
+        assert last_minute['max'] == 0.3
+        assert last_minute['success_rate'] == 1.0
+        assert last_minute['p50'] <= 0.1
+        assert set(last_minute['operations']) == {"status"}
+
+        last_hour = rolling.summary(3600)
+        assert last_hour['count'] == 11
+        assert last_hour['operations']['refresh']['success_rate'] == 0.0
+
+    def test_old_buckets_expire(self):
+        """Test de l'expiration des tranches sorties de la roue"""
+        clock = FakeClock()
+        rolling = RollingAggregates(second_slots=10, minute_slots=5, clock=clock)
+
+        rolling.record(1.0)
+        clock.advance(11)
+        assert rolling.summary(10)['count'] == 0
+        assert rolling.summary(300)['count'] == 1
+
+        clock.advance(600)
+        rolling.record(1.0)
+        assert rolling.summary(300)['count'] == 1
+
+    def test_threads_share_striped_wheels(self):
+        """Test des mesures de nombreux threads réparties sur des roues partagées"""
+        clock = FakeClock()
+        rolling = RollingAggregates(clock=clock, stripes=4)
+        wheels = [stripe.seconds for stripe in rolling._stripes]
+
+        for _ in range(5):
+            run_threads(lambda: [rolling.record(0.01, key="op") for _ in range(20)], count=4)
+
+        summary = rolling.summary(60)
+        assert summary['count'] == 400
+        assert summary['operations']['op']['count'] == 400
+        assert [stripe.seconds for stripe in rolling._stripes] == wheels
+
+    def test_reset(self):
+        """Test de l'effacement des mesures"""
+        rolling = RollingAggregates(clock=FakeClock())
+        rolling.record(1.0)
+
+        rolling.reset()
+        rolling.record(2.0)
+
+        assert rolling.summary(60)['count'] == 1
@@ -0,0 +1,126 @@
+"""
+Tests unitaires pour le registre de sondes de santé
+"""
+import threading
+import time
+
+import pytest
+
+from src.core.health import HealthRegistry, HealthStatus, ProbeResult
+
+
+def wait_for(predicate, timeout=5.0):
+    """Attend qu'une condition soit vraie"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestHealthRegistry:
+    """Tests pour la classe HealthRegistry"""
+
+    @pytest.fixture
+    def registry(self):
+        registry = HealthRegistry(default_interval=60, default_timeout=1)
+        yield registry
+        registry.stop()
+
+    def test_results_and_overall_status(self, registry):
+        """Test des résultats des sondes et de l'état agrégé"""
+        registry.register('db', lambda: {'connections': 3})
+        registry.register('tokens', lambda: {'status': 'degraded', 'tokens_valid': False})
+
+        results = registry.run_once()
+
+        assert results['db'].status == HealthStatus.HEALTHY
+        assert results['db'].details == {'connections': 3}
+        assert results['tokens'].status == HealthStatus.DEGRADED
+        assert registry.overall_status() == HealthStatus.DEGRADED
+
+    def test_critical_probe_failure(self, registry):
+        """Test d'une sonde critique en échec rendant l'application UNHEALTHY"""
+        def failing():
+            raise RuntimeError("service manager unreachable")
+
+        registry.register('optional', failing)
+        registry.run_once()
+        assert registry.overall_status() == HealthStatus.DEGRADED
+        assert registry.get('optional').error == "service manager unreachable"
+
+        registry.register('required', failing, critical=True)
+        registry.run_once()
+        assert registry.overall_status() == HealthStatus.UNHEALTHY
+
+    def test_report_before_first_run(self, registry):
+        """Test du rapport d'une sonde jamais exécutée"""
+        registry.register('db', lambda: {})
+
+        report = registry.report()
+
+        assert report['status'] == 'degraded'
+        assert report['checks']['db']['status'] == 'unknown'
+        assert report['checks']['db']['age_seconds'] is None
+
+    def test_background_refresh(self, registry):
+        """Test de l'exécution périodique des sondes en arrière-plan"""
+        calls = []
+        registry.register('db', lambda: calls.append(1) or {}, interval=0.05)
+        registry.start()
+
+        assert wait_for(lambda: len(calls) >= 3)
+        assert registry.get('db').status == HealthStatus.HEALTHY
+        assert registry.report()['checks']['db']['age_seconds'] < 1
+
+    def test_timeout_does_not_block(self, registry):
+        """Test d'une sonde bloquée : marquée en échec sans être relancée"""
+        release = threading.Event()
+        calls = []
+
+        def hanging():
+            calls.append(1)
+            release.wait(10)
+            return {'recovered': True}
+
+        registry.register('service', hanging, interval=0.05, timeout=0.1)
+        registry.start()
+
+        assert wait_for(lambda: registry.get('service').status == HealthStatus.UNHEALTHY)
+        assert 'Timed out' in registry.get('service').error
+        started = time.perf_counter()
+        registry.report()
+        assert time.perf_counter() - started < 0.05
+        time.sleep(0.2)
+        assert len(calls) == 1
+
+        release.set()
+        assert wait_for(lambda: registry.get('service').status == HealthStatus.HEALTHY)
+        assert registry.get('service').details == {'recovered': True}
+
+    def test_collect_metrics(self, registry):
+        """Test des métriques exposées pour chaque sonde"""
+        registry.register('db', lambda: {})
+        registry.register('cache', lambda: 1 / 0)
+        registry.run_once()
+
+        families = {family.name: family for family in registry.collect_metrics()}
+
+        assert ('health_probe_up', {'probe': 'db'}, 1) in families['health_probe_up'].samples
+        assert ('health_probe_up', {'probe': 'cache'}, 0) in families['health_probe_up'].samples
+
+
+class TestProbeResult:
+    """Tests pour la classe ProbeResult"""
+
+    def test_stale_result(self):
+        """Test d'un résultat trop ancien ramené à UNKNOWN"""
+        now = time.time()
+        result = ProbeResult('db', HealthStatus.HEALTHY, checked_at=now - 100, stale_after=50)
+
+        data = result.to_dict(now)
+
+        assert data['status'] == 'unknown'
+        assert data['stale'] is True
+        assert data['age_seconds'] == pytest.approx(100)
@@ -0,0 +1,310 @@
+"""
+Tests pour le pipeline de logging asynchrone
+"""
+import json
+import logging
+import sys
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.core.config import Config
+from src.core.logging_config import (
+    AsyncLogListener, AsyncLogHandler, BatchedRotatingFileHandler, add_log_handlers,
+    JsonFormatter, JsonLinesRotatingFileHandler, ContextFilter, format_timestamp,
+    MetricsCollector, PerformanceMetric, operation_label
+)
+from src.core import logging_config
+
+
+class RecordingHandler(logging.Handler):
+    """Handler qui conserve les enregistrements reçus"""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.flushes = 0
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+    def flush(self):
+        self.flushes += 1
+
+
+class BlockingHandler(RecordingHandler):
+    """Handler bloqué jusqu'à ce que l'événement soit levé"""
+
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+
+    def emit(self, record):
+        self.unblock.wait(5)
+        super().emit(record)
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = []
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+class TestAsyncLogging:
+    """Tests pour AsyncLogListener et AsyncLogHandler"""
+
+    @pytest.fixture
+    def listener(self):
+        listener = AsyncLogListener(queue_size=100, batch_size=50)
+        listener.start()
+        yield listener
+        listener.stop()
+
+    def test_records_written_by_listener_thread(self, listener):
+        """Test de l'écriture hors du thread appelant"""
+        target = RecordingHandler()
+        logger = make_logger("test_async.thread", AsyncLogHandler([target], listener))
+
+        logger.info("hello %s", "world")
+
+        assert listener.flush()
+        assert [record.getMessage() for record in target.records] == ["hello world"]
+        assert target.threads == {"log-writer"}
+        # Nom du thread d'origine conservé
+        assert target.records[0].threadName == threading.current_thread().name
+
+    def test_handler_levels_respected(self, listener):
+        """Test des niveaux des handlers cibles"""
+        everything = RecordingHandler()
+        errors = RecordingHandler(logging.ERROR)
+        logger = make_logger("test_async.levels", AsyncLogHandler([everything, errors], listener))
+
+        logger.info("info")
+        logger.error("error")
+
+        assert listener.flush()
+        assert len(everything.records) == 2
+        assert [record.getMessage() for record in errors.records] == ["error"]
+
+    def test_exception_formatted_in_caller(self, listener):
+        """Test de la trace d'exception calculée avant la mise en file"""
+        target = RecordingHandler()
+        target.setFormatter(logging.Formatter("%(message)s"))
+        logger = make_logger("test_async.exc", AsyncLogHandler([target], listener))
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+        assert listener.flush()
+        record = target.records[0]
+        assert record.exc_info is None
+        assert "ValueError: boom" in target.format(record)
+
+    def test_overflow_dropped_and_counted(self):
+        """Test de l'abandon sans blocage quand la file est pleine"""
+        listener = AsyncLogListener(queue_size=5, batch_size=1)
+        listener.start()
+        target = BlockingHandler()
+        logger = make_logger("test_async.overflow", AsyncLogHandler([target], listener))
+
+        try:
+            for index in range(50):
+                logger.info("message %d", index)
+            assert listener.get_stats()['dropped'] > 0
+        finally:
+            target.unblock.set()
+            listener.stop()
+
+        stats = listener.get_stats()
+        assert len(target.records) + stats['dropped'] == 50
+
+    def test_batched_flush(self, listener):
+        """Test du flush une fois par lot"""
+        target = BlockingHandler()
+        logger = make_logger("test_async.batch", AsyncLogHandler([target], listener))
+
+        for index in range(20):
+            logger.info("message %d", index)
+        target.unblock.set()
+
+        assert listener.flush()
+        assert len(target.records) == 20
+        assert target.flushes < 20
+
+    def test_stop_flushes_and_falls_back_to_sync(self):
+        """Test de l'écriture des logs restants puis directe après l'arrêt"""
+        listener = AsyncLogListener()
+        listener.start()
+        target = RecordingHandler()
+        logger = make_logger("test_async.stop", AsyncLogHandler([target], listener))
+
+        logger.info("before")
+        listener.stop()
+        assert len(target.records) == 1
+
+        logger.info("after")
+        assert listener.is_running is False
+        assert len(target.records) == 2
+        assert target.threads == {"log-writer", threading.current_thread().name}
+
+
+class TestAddLogHandlers:
+    """Tests pour add_log_handlers"""
+
+    def test_sync_mode(self):
+        """Test des handlers attachés directement si LOG_ASYNC est désactivé"""
+        config = Config()
+        config.LOG_ASYNC = False
+        logger = logging.getLogger("test_add_handlers.sync")
+        logger.handlers = []
+        target = RecordingHandler()
+
+        add_log_handlers(logger, [target], config)
+
+        assert logger.handlers == [target]
+
+    def test_batched_file_handler_rotation(self, tmp_path):
+        """Test de la rotation du handler de fichier par lots"""
+        log_file = tmp_path / "app.log"
+        handler = BatchedRotatingFileHandler(str(log_file), maxBytes=100, backupCount=2, encoding='utf-8')
+        logger = make_logger("test_async.rotation", handler)
+
+        for index in range(10):
+            logger.info("line %02d with some padding", index)
+        handler.close()
+
+        assert (tmp_path / "app.log.1").exists()
+        assert "line 09" in log_file.read_text(encoding='utf-8')
+
+
+def make_record(message="hello %s", args=("world",), level=logging.INFO, exc_info=None):
+    return logging.LogRecord("axiom_trade.test", level, __file__, 42, message, args, exc_info, func="handler")
+
+
+class TestJsonFormatter:
+    """Tests pour JsonFormatter et JsonLinesRotatingFileHandler"""
+
+    def test_format_fields(self):
+        """Test des champs dynamiques et statiques"""
+        formatter = JsonFormatter(static_fields={"app": "backend"})
+        record = make_record()
+        record.request_id = "req-1"
+
+        entry = json.loads(formatter.format(record))
+
+        assert entry["message"] == "hello world"
+        assert entry["level"] == "INFO"
+        assert entry["line"] == 42
+        assert entry["request_id"] == "req-1"
+        assert entry["app"] == "backend"
+        assert entry["process_id"] == record.process
+        assert entry["thread_name"] == threading.current_thread().name
+
+    def test_timestamp_matches_isoformat(self):
+        """Test de l'horodatage avec préfixe mis en cache"""
+        for created in (1700000000.25, 1700000000.5, 1700000001.000001):
+            expected = datetime.utcfromtimestamp(created).strftime('%Y-%m-%dT%H:%M:%S.%f')
+            assert format_timestamp(created) == expected
+
+    def test_exception_and_non_ascii(self):
+        """Test de la trace d'exception et des caractères non ASCII"""
+        formatter = JsonFormatter()
+        try:
+            raise ValueError("échec")
+        except ValueError:
+            record = make_record("opération %s", ("échouée",), logging.ERROR, sys.exc_info())
+
+        entry = json.loads(formatter.format(record))
+
+        assert entry["message"] == "opération échouée"
+        assert "ValueError: échec" in entry["exception"]
+
+    def test_json_lines_file(self, tmp_path):
+        """Test de l'écriture des lignes encodées"""
+        log_file = tmp_path / "structured.log"
+        handler = JsonLinesRotatingFileHandler(str(log_file), maxBytes=0, encoding='utf-8')
+        handler.setFormatter(JsonFormatter())
+        logger = make_logger("test_json.lines", handler)
+
+        logger.info("première")
+        logger.warning("seconde")
+        handler.close()
+
+        lines = log_file.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["première", "seconde"]
+
+    def test_context_filter(self):
+        """Test des champs de contexte ajoutés au record"""
+        record = make_record()
+
+        assert ContextFilter().filter(record) is True
+        assert record.process_id == record.process
+        assert record.thread_name == record.threadName
+        assert record.precise_time == format_timestamp(record.created)
+
+
+class TestMetricsCollector:
+    """Tests pour la classe MetricsCollector"""
+
+    def test_concurrent_record_log(self):
+        """Test des compteurs de logs alimentés par plusieurs threads"""
+        collector = MetricsCollector()
+
+        def work():
+            for _ in range(2000):
+                collector.record_log('INFO')
+            collector.record_log('ERROR')
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = collector.get_metrics_summary()
+        assert summary['total_logs'] == 8004
+        assert summary['errors_count'] == 4
+        assert collector.metrics.logs_by_level['INFO'] == 8000
+
+    def test_performance_history_bounded(self):
+        """Test de l'historique de performance borné"""
+        collector = MetricsCollector(max_metrics=5)
+
+        for index in range(12):
+            collector.record_performance(PerformanceMetric(
+                operation=f"op{index}", duration=0.1, timestamp=datetime.utcnow(), success=True
+            ))
+
+        assert [m.operation for m in collector.performance_history] == [f"op{i}" for i in range(7, 12)]
+        # Les agrégats glissants couvrent toutes les mesures, pas seulement l'historique
+        performance = collector.get_metrics_summary()['performance']
+        assert performance['recent_operations'] == 12
+        assert performance['windows']['1m']['count'] == 12
+        assert performance['operations']['op0']['count'] == 1
+
+    def test_operation_labels_bounded(self, monkeypatch):
+        """Test des labels d'opération bornés sur /metrics"""
+        monkeypatch.setattr(logging_config, 'MAX_OPERATION_LABELS', 2)
+        collector = MetricsCollector()
+        collector._operation_durations.clear()
+
+        operations = [f"HTTP GET https://api.test.com/orders/{index}" for index in range(50)]
+        operations += ["Installing service", "database_query"]
+        for operation in operations:
+            collector.record_performance(PerformanceMetric(
+                operation=operation, duration=0.1, timestamp=datetime.utcnow(), success=True
+            ))
+
+        assert operation_label("HTTP GET https://api.test.com/orders/42") == "HTTP GET"
+        assert {key[0] for key in collector._operation_durations._children} == \
+            {"HTTP GET", "Installing service", "other"}
+        # Le détail par opération reste disponible dans le résumé
+        assert len(collector.get_performance_summary()['operations']) == 52
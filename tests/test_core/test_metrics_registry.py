@@ -0,0 +1,162 @@
+"""
+Tests unitaires pour le registre de métriques et son exposition texte
+"""
+import pytest
+from flask import Flask
+
+from src.core.counters import LatencyHistogram
+from src.core.metrics_registry import (
+    MetricsRegistry, MetricFamily, CONTENT_TYPE_LATEST,
+    format_value, histogram_family, register_metrics_endpoint, with_labels
+)
+
+
+class TestMetricsRegistry:
+    """Tests pour la classe MetricsRegistry"""
+
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_counter_and_gauge_exposition(self, registry):
+        """Test de l'exposition des compteurs et jauges avec labels"""
+        requests = registry.counter('jobs_total', 'Jobs processed', ('queue',))
+        requests.labels('default').inc()
+        requests.labels(queue='default').inc(2)
+        registry.gauge('queue_depth', 'Jobs waiting').set(7)
+
+        text = registry.render()
+
+        assert '# TYPE jobs_total counter' in text
+        assert 'jobs_total{queue="default"} 3' in text
+        assert 'queue_depth 7' in text
+        assert text.endswith('\n')
+
+    def test_get_or_create(self, registry):
+        """Test du même objet retourné pour un même nom"""
+        first = registry.counter('jobs_total', 'Jobs processed')
+
+        assert registry.counter('jobs_total', 'Jobs processed') is first
+        with pytest.raises(ValueError):
+            registry.gauge('jobs_total', 'Jobs processed')
+
+    def test_label_validation(self, registry):
+        """Test des labels manquants et des valeurs échappées"""
+        counter = registry.counter('events_total', 'Events', ('kind',))
+
+        with pytest.raises(ValueError):
+            counter.inc()
+        with pytest.raises(ValueError):
+            counter.labels('a', 'b')
+
+        counter.labels('say "hi"\n').inc()
+        assert 'events_total{kind="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_histogram_cumulative_buckets(self, registry):
+        """Test des buckets cumulés, de la somme et du nombre"""
+        histogram = registry.histogram('job_seconds', 'Job duration', buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'job_seconds_bucket{le="0.1"} 1' in text
+        assert 'job_seconds_bucket{le="1"} 3' in text
+        assert 'job_seconds_bucket{le="+Inf"} 4' in text
+        assert 'job_seconds_sum 4.05' in text
+        assert 'job_seconds_count 4' in text
+
+    def test_collectors(self, registry):
+        """Test des collecteurs appelés à l'exposition et de leur remplacement"""
+        registry.register_collector('cache', lambda: [
+            MetricFamily('cache_entries', 'gauge', 'Entries', [('cache_entries', {}, 1)])
+        ])
+        registry.register_collector('cache', lambda: [
+            ('cache_entries', 'gauge', 'Entries', [('cache_entries', {}, 2)])
+        ])
+        registry.register_collector('broken', lambda: 1 / 0)
+
+        text = registry.render()
+
+        assert 'cache_entries 2' in text
+        assert text.count('# TYPE cache_entries gauge') == 1
+
+    def test_unregister_collector_checks_identity(self, registry):
+        """Test du retrait d'un collecteur remplacé entre-temps sous le même nom"""
+        def old():
+            return [MetricFamily('cache_entries', 'gauge', 'Entries', [('cache_entries', {}, 1)])]
+
+        def new():
+            return [MetricFamily('cache_entries', 'gauge', 'Entries', [('cache_entries', {}, 2)])]
+
+        registry.register_collector('cache', old)
+        registry.register_collector('cache', new)
+        registry.unregister_collector('cache', old)
+
+        assert 'cache_entries 2' in registry.render()
+
+        registry.unregister_collector('cache', new)
+
+        assert 'cache_entries' not in registry.render()
+
+    def test_families_merged_across_collectors(self, registry):
+        """Test de la fusion des familles de même nom produites par plusieurs collecteurs"""
+        for instance in ('1', '2'):
+            registry.register_collector(f'proxy:{instance}', lambda instance=instance: with_labels([
+                MetricFamily('proxy_requests_total', 'counter', 'Requests', [('proxy_requests_total', {}, 3)])
+            ], {'proxy': instance}))
+
+        text = registry.render()
+
+        assert text.count('# HELP proxy_requests_total Requests') == 1
+        assert text.count('# TYPE proxy_requests_total counter') == 1
+        assert 'proxy_requests_total{proxy="1"} 3' in text
+        assert 'proxy_requests_total{proxy="2"} 3' in text
+
+    def test_histogram_family(self):
+        """Test de la conversion d'instantanés de LatencyHistogram"""
+        histogram = LatencyHistogram(buckets=(0.1,))
+        histogram.record(0.05)
+        histogram.record(0.2)
+
+        family = histogram_family('call_seconds', 'Calls', (0.1,), [({'endpoint': '/a'}, histogram.snapshot())])
+
+        assert ('call_seconds_bucket', {'endpoint': '/a', 'le': '0.1'}, 1) in family.samples
+        assert ('call_seconds_bucket', {'endpoint': '/a', 'le': '+Inf'}, 2) in family.samples
+        assert ('call_seconds_count', {'endpoint': '/a'}, 2) in family.samples
+
+    def test_format_value(self):
+        """Test du formatage des valeurs"""
+        assert format_value(3) == '3'
+        assert format_value(2.0) == '2'
+        assert format_value(0.25) == '0.25'
+        assert format_value(float('inf')) == '+Inf'
+        assert format_value(float('nan')) == 'NaN'
+
+
+class TestMetricsEndpoint:
+    """Tests pour l'endpoint /metrics d'une application Flask"""
+
+    def test_request_durations_exposed(self):
+        """Test de la mesure des requêtes par règle de route et statut"""
+        registry = MetricsRegistry()
+        app = Flask(__name__)
+        register_metrics_endpoint(app, 'test_app', registry)
+
+        @app.route('/items/<int:item_id>')
+        def get_item(item_id):
+            return {'id': item_id}
+
+        client = app.test_client()
+        client.get('/items/1')
+        client.get('/items/2')
+        client.get('/missing')
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == CONTENT_TYPE_LATEST
+        text = response.get_data(as_text=True)
+        assert ('http_request_duration_seconds_count{app="test_app",method="GET",'
+                'endpoint="/items/<int:item_id>",status="200"} 2') in text
+        assert 'endpoint="unmatched",status="404"' in text
+        assert 'http_requests_in_progress{app="test_app"} 1' in text
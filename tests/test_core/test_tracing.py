@@ -0,0 +1,209 @@
+"""
+Tests unitaires pour le traçage distribué
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+from flask import Flask, jsonify
+
+from src.core import tracing
+from src.core.config import Config
+from src.core.tracing import (
+    FileSpanExporter, SpanContext, SpanExporter, Tracer, SPAN_KIND_SERVER,
+    configure_tracing, current_trace_id, get_traced_session, register_tracing, traced
+)
+from src.core.wsgi_server import PooledWSGIServer
+
+
+class ListExporter(SpanExporter):
+    """Exporteur conservant les spans en mémoire"""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter():
+    return ListExporter()
+
+
+@pytest.fixture
+def tracer(exporter, monkeypatch):
+    """Traceur global échantillonnant toutes les traces"""
+    tracer = Tracer('test', sample_rate=1.0, exporter=exporter)
+    monkeypatch.setattr(tracing, '_tracer', tracer)
+    yield tracer
+    tracer.shutdown()
+
+
+class TestSpanContext:
+    """Tests pour l'en-tête traceparent"""
+
+    def test_round_trip(self):
+        """Test de la sérialisation et de l'analyse de traceparent"""
+        context = SpanContext('4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7', True)
+
+        assert context.to_traceparent() == '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'
+        assert SpanContext.from_traceparent(context.to_traceparent()) == context
+
+    @pytest.mark.parametrize('value', [
+        None, '', 'garbage',
+        '00-00000000000000000000000000000000-00f067aa0ba902b7-01',
+        '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7',
+    ])
+    def test_invalid_headers(self, value):
+        """Test des en-têtes absents ou invalides"""
+        assert SpanContext.from_traceparent(value) is None
+
+
+class TestTracer:
+    """Tests pour la classe Tracer"""
+
+    def test_nested_spans(self, tracer, exporter):
+        """Test des spans enfants rattachés au span courant"""
+        with tracer.start_span('parent') as parent:
+            assert current_trace_id() == parent.trace_id
+            with tracer.start_span('child', tags={'attempt': 1}):
+                pass
+        assert current_trace_id() is None
+        assert tracer.flush()
+
+        child, root = exporter.spans
+        assert child['parentId'] == root['id']
+        assert child['traceId'] == root['traceId']
+        assert child['tags'] == {'attempt': '1'}
+        assert 'parentId' not in root
+        assert root['localEndpoint'] == {'serviceName': 'test'}
+
+    def test_head_based_sampling(self, exporter):
+        """Test de la décision d'échantillonnage prise à la racine"""
+        tracer = Tracer('test', sample_rate=0.0, exporter=exporter)
+        with tracer.start_span('unsampled') as span:
+            assert not span.sampled
+            assert tracer.inject()['traceparent'].endswith('-00')
+        sampled_parent = SpanContext('4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7', True)
+        with tracer.start_span('remote child', parent=sampled_parent) as span:
+            span.set_tag('kept', True)
+        assert tracer.flush()
+
+        assert [span['name'] for span in exporter.spans] == ['remote child']
+        assert exporter.spans[0]['parentId'] == '00f067aa0ba902b7'
+
+    def test_error_recorded(self, tracer, exporter):
+        """Test d'une exception marquant le span en erreur"""
+        with pytest.raises(ValueError):
+            with tracer.start_span('failing'):
+                raise ValueError("boom")
+        tracer.flush()
+
+        assert exporter.spans[0]['tags']['error'] == 'boom'
+
+    def test_traced_decorator(self, tracer, exporter):
+        """Test du décorateur sur une fonction et une coroutine"""
+        @traced('sync', tags=lambda value: {'value': value})
+        def double(value):
+            return value * 2
+
+        @traced('async')
+        async def fail():
+            raise ValueError("boom")
+
+        with tracer.start_span('parent') as parent:
+            assert double(21) == 42
+            with pytest.raises(ValueError):
+                asyncio.run(fail())
+        assert tracer.flush()
+
+        sync_span, async_span, root = exporter.spans
+        assert sync_span['tags'] == {'value': '21'}
+        assert async_span['tags']['error'] == 'boom'
+        assert sync_span['parentId'] == async_span['parentId'] == parent.context.span_id
+
+    def test_file_exporter(self, tmp_path):
+        """Test de l'export des spans au format JSON lines"""
+        path = tmp_path / 'traces' / 'spans.jsonl'
+        tracer = Tracer('test', exporter=FileSpanExporter(str(path)))
+        for name in ('a', 'b'):
+            with tracer.start_span(name):
+                pass
+        assert tracer.flush()
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)['name'] for line in lines] == ['a', 'b']
+
+    def test_configure_tracing(self, monkeypatch, tmp_path):
+        """Test du traceur configuré depuis la configuration"""
+        monkeypatch.setattr(tracing, '_tracer', None)
+        config = Config(TRACE_SAMPLE_RATE=0.5, TRACE_EXPORT_FILE=str(tmp_path / 'spans.jsonl'))
+
+        tracer = configure_tracing('backend_api', config)
+
+        assert tracer.service_name == 'backend_api'
+        assert tracer.sample_rate == 0.5
+        assert configure_tracing('backend_api', Config(TRACING_ENABLED=False)).sample_rate == 0.0
+
+
+class TestFlaskTracing:
+    """Tests de la propagation entre applications Flask"""
+
+    def test_server_span_continues_remote_trace(self, tracer, exporter):
+        """Test d'un span serveur rattaché au traceparent entrant"""
+        app = Flask(__name__)
+        register_tracing(app, 'backend_api')
+
+        @app.route('/items/<int:item_id>')
+        def get_item(item_id):
+            return jsonify({'trace_id': current_trace_id()})
+
+        response = app.test_client().get('/items/1', headers={
+            'traceparent': '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'
+        })
+        tracer.flush()
+
+        assert response.json['trace_id'] == '4bf92f3577b34da6a3ce929d0e0e4736'
+        assert response.headers['X-Trace-ID'] == '4bf92f3577b34da6a3ce929d0e0e4736'
+        span = exporter.spans[0]
+        assert span['name'] == 'GET /items/<int:item_id>'
+        assert span['kind'] == SPAN_KIND_SERVER
+        assert span['parentId'] == '00f067aa0ba902b7'
+        assert span['tags']['http.status_code'] == '200'
+
+    def test_trace_propagated_across_apps(self, tracer, exporter, monkeypatch):
+        """Test d'une trace couvrant deux applications reliées par HTTP"""
+        monkeypatch.setattr(tracing, '_traced_session', None)
+        backend = Flask('backend')
+        register_tracing(backend, 'backend_api')
+
+        @backend.route('/health')
+        def health():
+            return jsonify({'status': 'healthy'})
+
+        server = PooledWSGIServer('127.0.0.1', 0, backend, threads=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        dashboard = Flask('dashboard')
+        register_tracing(dashboard, 'dashboard')
+
+        @dashboard.route('/')
+        def index():
+            return get_traced_session().get(f'http://127.0.0.1:{server.port}/health', timeout=5).json()
+
+        try:
+            assert dashboard.test_client().get('/').json == {'status': 'healthy'}
+        finally:
+            server.stop()
+            thread.join(5)
+        tracer.flush()
+
+        spans = {span['name']: span for span in exporter.spans}
+        page, call, backend_span = spans['GET /'], spans['HTTP GET'], spans['GET /health']
+        assert len({page['traceId'], call['traceId'], backend_span['traceId']}) == 1
+        assert call['parentId'] == page['id']
+        assert backend_span['parentId'] == call['id']
+        assert backend_span['tags']['app'] == 'backend_api'
@@ -0,0 +1,242 @@
+"""
+Tests du serveur WSGI de production
+"""
+import http.client
+import os
+import signal
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import Config
+from src.core.wsgi_server import (
+    PooledWSGIServer, PreforkServer, ServerOptions, load_app_factory, release_app
+)
+
+
+def pid_app(environ, start_response):
+    """Application WSGI retournant le pid du worker et le port du client"""
+    body = f"{os.getpid()} {environ['REMOTE_PORT']}".encode()
+    start_response('200 OK', [('Content-Type', 'text/plain'), ('Content-Length', str(len(body)))])
+    return [body]
+
+
+def create_pid_app():
+    """Fabrique de l'application de test"""
+    return pid_app
+
+
+def get(port, connection=None):
+    """Effectue un GET / et retourne (pid, port client)"""
+    conn = connection or http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('GET', '/')
+    pid, client_port = conn.getresponse().read().decode().split()
+    if connection is None:
+        conn.close()
+    return int(pid), client_port
+
+
+class TestServerOptions:
+    """Tests des options du serveur"""
+
+    def test_from_config(self):
+        """Test des options déduites de la configuration"""
+        config = Config(SERVER_WORKERS=0, SERVER_THREADS=4, SERVER_MAX_REQUESTS=1000)
+
+        options = ServerOptions.from_config(config)
+
+        assert options.workers == (os.cpu_count() or 1)
+        assert options.threads == 4
+        assert options.max_requests == 1000
+        assert options.to_dict()['port'] == config.FLASK_PORT
+
+    def test_load_app_factory(self):
+        """Test de la résolution d'une fabrique par son chemin"""
+        assert load_app_factory('tests.test_core.test_wsgi_server:create_pid_app') is create_pid_app
+        with pytest.raises(ValueError):
+            load_app_factory('tests.test_core.test_wsgi_server')
+
+
+class TestPooledWSGIServer:
+    """Tests du serveur à pool de threads"""
+
+    def test_concurrent_requests_in_pool(self):
+        """Test des requêtes simultanées traitées par le pool de threads"""
+        server = PooledWSGIServer('127.0.0.1', 0, pid_app, threads=4)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        results = []
+        try:
+            clients = [threading.Thread(target=lambda: results.append(get(server.port))) for _ in range(16)]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join(10)
+        finally:
+            server.stop()
+            thread.join(5)
+
+        assert len(results) == 16
+        assert {pid for pid, _ in results} == {os.getpid()}
+        assert server.drain(5)
+
+    def test_excess_connections_not_accepted(self):
+        """Test des connexions laissées dans le backlog tant qu'aucun thread n'est libre"""
+        release = threading.Event()
+
+        def blocking_app(environ, start_response):
+            release.wait(10)
+            return pid_app(environ, start_response)
+
+        server = PooledWSGIServer('127.0.0.1', 0, blocking_app, threads=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        results = []
+        try:
+            clients = [threading.Thread(target=lambda: results.append(get(server.port))) for _ in range(6)]
+            for client in clients:
+                client.start()
+            time.sleep(0.3)
+
+            # Deux connexions en cours de traitement, aucune en file dans le pool
+            assert server._executor._work_queue.qsize() == 0
+            assert not server._slots.acquire(blocking=False)
+
+            release.set()
+            for client in clients:
+                client.join(10)
+        finally:
+            release.set()
+            server.stop()
+            thread.join(5)
+
+        assert len(results) == 6
+        assert server.drain(5)
+
+    def test_swap_app_waits_for_previous_requests(self):
+        """Test de la substitution d'application attendant les connexions en cours"""
+        release = threading.Event()
+
+        def previous_app(environ, start_response):
+            release.wait(10)
+            return pid_app(environ, start_response)
+
+        server = PooledWSGIServer('127.0.0.1', 0, previous_app, threads=4)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        results = []
+        try:
+            client = threading.Thread(target=lambda: results.append(get(server.port)))
+            client.start()
+            time.sleep(0.2)
+
+            assert not server.swap_app(pid_app, timeout=0.2)
+            # La nouvelle application sert les connexions suivantes
+            assert get(server.port)[0] == os.getpid()
+
+            release.set()
+            client.join(10)
+            assert server.swap_app(pid_app, timeout=5)
+        finally:
+            release.set()
+            server.stop()
+            thread.join(5)
+
+        assert len(results) == 1
+
+    def test_release_app(self):
+        """Test de la libération des sondes et des services d'une application remplacée"""
+        app = Mock(services={
+            'token_service': Mock(),
+            'api_proxy': Mock(cleanup=Mock(side_effect=RuntimeError("boom"))),
+            'settings': {}
+        })
+
+        release_app(app)
+        release_app(pid_app)
+
+        app.health.stop.assert_called_once_with()
+        app.services['token_service'].cleanup.assert_called_once_with()
+        app.services['api_proxy'].cleanup.assert_called_once_with()
+
+    def test_stops_after_max_requests(self):
+        """Test de l'arrêt du serveur après max_requests requêtes"""
+        server = PooledWSGIServer('127.0.0.1', 0, pid_app, threads=2, max_requests=3)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        for _ in range(3):
+            get(server.port)
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert server.draining
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="Pre-fork mode requires os.fork")
+class TestPreforkServer:
+    """Tests du serveur pré-forké"""
+
+    @pytest.fixture
+    def start_master(self):
+        """Lance un maître dans un processus forké, arrêté par SIGTERM"""
+        masters = []
+
+        def start(**options):
+            server = PreforkServer(create_pid_app, ServerOptions(port=0, threads=2, graceful_timeout=5, **options))
+            server.bind()
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    code = server.run()
+                finally:
+                    os._exit(code)
+            server._socket.close()
+            masters.append(pid)
+            return pid, server.address[1]
+
+        yield start
+        for pid in masters:
+            os.kill(pid, signal.SIGTERM)
+            _, status = os.waitpid(pid, 0)
+            assert os.waitstatus_to_exitcode(status) == 0
+
+    @pytest.fixture
+    def master(self, start_master):
+        return start_master(workers=2)
+
+    def test_workers_share_socket(self, master):
+        """Test des requêtes servies par les workers et non par le maître"""
+        master_pid, port = master
+
+        pids = {get(port)[0] for _ in range(20)}
+
+        assert master_pid not in pids
+        assert 1 <= len(pids) <= 2
+
+    def test_reload_without_downtime(self, master):
+        """Test du remplacement des workers sans requête en échec"""
+        master_pid, port = master
+        before = {get(port)[0] for _ in range(10)}
+
+        os.kill(master_pid, signal.SIGHUP)
+        pids = set()
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            pids.add(get(port)[0])
+            if pids - before and len({get(port)[0] for _ in range(10)} & before) == 0:
+                break
+
+        assert pids - before
+        assert not {get(port)[0] for _ in range(10)} & before
+
+    def test_workers_recycled(self, start_master):
+        """Test du remplacement des workers après max_requests requêtes"""
+        _, port = start_master(workers=2, max_requests=5)
+
+        pids = {get(port)[0] for _ in range(30)}
+
+        assert len(pids) >= 4
@@ -18,6 +18,7 @@ from core.logging_config import (
     get_metrics_collector, 
     log_performance,
     log_function_call,
+    flush_logging,
     MetricsCollector,
     PerformanceMetric
 )
@@ -49,6 +50,9 @@ def test_basic_logging():
         logger.warning("Message de warning")
         logger.error("Message d'erreur")
         
+        # Attendre l'écriture par le thread de logging asynchrone
+        assert flush_logging(), "Les logs en attente n'ont pas été écrits"
+        
         # Vérifier que le fichier de log existe
         assert os.path.exists(config.LOG_FILE), "Le fichier de log n'a pas été créé"
         
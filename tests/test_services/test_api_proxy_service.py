@@ -7,18 +7,51 @@ from datetime import datetime, timedelta
 import requests
 import json
 import time
+import threading
+import gzip
+import io
+import urllib3
 
+from src.core import tracing
 from src.core.config import Config
+from src.core.metrics_registry import get_metrics_registry
 from src.core.exceptions import (
     ApiError, ApiConnectionError, ApiAuthenticationError, 
-    ApiRateLimitError
+    ApiRateLimitError, ApiCircuitOpenError, ValidationError
 )
 from src.services.api_proxy_service import (
     ApiProxyService, RequestMethod, ApiRequest, ApiResponse, RateLimiter
 )
+from src.services.rate_limiter import EndpointClassifier
+from src.services.response_cache import ResponseCache
 from src.services.token_service import TokenService
 
 
+def make_streamed_upstream(body, headers, status=200):
+    """Réponse amont non lue, comme renvoyée avec stream=True"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.raw = urllib3.response.HTTPResponse(
+        body=io.BytesIO(body), headers=headers, status=status,
+        preload_content=False, decode_content=False
+    )
+    return response
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests du limiteur"""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
 class TestRateLimiter:
     """Tests pour la classe RateLimiter"""
     
@@ -28,7 +61,9 @@ class TestRateLimiter:
         
         assert limiter.max_requests == 10
         assert limiter.time_window == 60
-        assert limiter.requests == []
+        assert limiter.capacity == 10
+        assert limiter.available_tokens == 10
+        assert limiter.shared is False
     
     def test_can_make_request_empty(self):
         """Test de vérification avec aucune requête"""
@@ -38,7 +73,7 @@ class TestRateLimiter:
     
     def test_can_make_request_under_limit(self):
         """Test de vérification sous la limite"""
-        limiter = RateLimiter(max_requests=5, time_window=60)
+        limiter = RateLimiter(max_requests=5, time_window=60, clock=FakeClock())
         
         # Ajouter quelques requêtes
         for _ in range(3):
@@ -48,66 +83,107 @@ class TestRateLimiter:
     
     def test_can_make_request_at_limit(self):
         """Test de vérification à la limite"""
-        limiter = RateLimiter(max_requests=3, time_window=60)
+        limiter = RateLimiter(max_requests=3, time_window=60, clock=FakeClock())
         
         # Ajouter le maximum de requêtes
         for _ in range(3):
             limiter.record_request()
         
         assert limiter.can_make_request() is False
+        assert limiter.try_acquire() is False
     
-    @patch('src.services.api_proxy_service.datetime')
-    def test_can_make_request_old_requests_cleaned(self, mock_datetime):
-        """Test de nettoyage des anciennes requêtes"""
-        # Simuler le temps
-        now = datetime.utcnow()
-        old_time = now - timedelta(seconds=120)  # Plus ancien que la fenêtre
-        
-        mock_datetime.utcnow.side_effect = [old_time, old_time, old_time, now]
+    def test_tokens_refilled_over_time(self):
+        """Test du remplissage du seau avec le temps"""
+        clock = FakeClock()
+        limiter = RateLimiter(max_requests=2, time_window=60, clock=clock)
         
-        limiter = RateLimiter(max_requests=2, time_window=60)
-        
-        # Ajouter des requêtes anciennes
         limiter.record_request()
         limiter.record_request()
+        assert limiter.can_make_request() is False
         
-        # Vérifier maintenant (les anciennes requêtes devraient être nettoyées)
+        # Un jeton toutes les 30 secondes, plafonné à la capacité
+        clock.advance(30)
         assert limiter.can_make_request() is True
+        clock.advance(600)
+        assert limiter.available_tokens == 2
     
     def test_record_request(self):
         """Test d'enregistrement de requête"""
-        limiter = RateLimiter(max_requests=5, time_window=60)
+        limiter = RateLimiter(max_requests=5, time_window=60, clock=FakeClock())
         
-        initial_count = len(limiter.requests)
         limiter.record_request()
         
-        assert len(limiter.requests) == initial_count + 1
+        assert limiter.available_tokens == 4
+        assert limiter.get_state()['current_requests'] == 1
     
-    @patch('src.services.api_proxy_service.datetime')
-    def test_get_wait_time_no_wait(self, mock_datetime):
+    def test_get_wait_time_no_wait(self):
         """Test de calcul du temps d'attente - pas d'attente"""
-        mock_datetime.utcnow.return_value = datetime.utcnow()
-        
-        limiter = RateLimiter(max_requests=5, time_window=60)
+        limiter = RateLimiter(max_requests=5, time_window=60, clock=FakeClock())
         limiter.record_request()
         
-        wait_time = limiter.get_wait_time()
-        assert wait_time == 0.0
+        assert limiter.get_wait_time() == 0.0
     
-    @patch('src.services.api_proxy_service.datetime')
-    def test_get_wait_time_with_wait(self, mock_datetime):
+    def test_get_wait_time_with_wait(self):
         """Test de calcul du temps d'attente - avec attente"""
-        now = datetime.utcnow()
-        mock_datetime.utcnow.return_value = now
-        
-        limiter = RateLimiter(max_requests=1, time_window=60)
+        clock = FakeClock()
+        limiter = RateLimiter(max_requests=1, time_window=60, clock=clock)
         
         # Simuler une requête il y a 30 secondes
-        old_request_time = now - timedelta(seconds=30)
-        limiter.requests = [old_request_time]
+        limiter.record_request()
+        clock.advance(30)
+        
+        assert limiter.get_wait_time() == pytest.approx(30.0)  # Doit attendre 30s de plus
+    
+    def test_reserve_staggers_waits(self):
+        """Test des réservations successives échelonnées"""
+        limiter = RateLimiter(max_requests=2, time_window=60, clock=FakeClock())
         
-        wait_time = limiter.get_wait_time()
-        assert wait_time == 30.0  # Doit attendre 30s de plus
+        waits = [limiter.reserve() for _ in range(4)]
+        
+        assert waits == pytest.approx([0.0, 0.0, 30.0, 60.0])
+    
+    def test_burst_capacity(self):
+        """Test d'une rafale plus petite que le budget"""
+        limiter = RateLimiter(max_requests=60, time_window=60, burst=5, clock=FakeClock())
+        
+        assert sum(limiter.try_acquire() for _ in range(10)) == 5
+        assert limiter.get_wait_time() == pytest.approx(1.0)
+    
+    def test_shared_state_between_instances(self, tmp_path):
+        """Test du budget partagé entre deux limiteurs (processus distincts)"""
+        clock = FakeClock()
+        first = RateLimiter(max_requests=3, time_window=60, name="shared/test",
+                            shared_dir=str(tmp_path), clock=clock)
+        second = RateLimiter(max_requests=3, time_window=60, name="shared/test",
+                             shared_dir=str(tmp_path), clock=clock)
+        try:
+            assert first.shared is True
+            assert first.try_acquire() is True
+            assert second.try_acquire() is True
+            assert first.try_acquire() is True
+            assert second.try_acquire() is False
+            assert first.available_tokens == pytest.approx(0.0)
+            assert (tmp_path / "shared_test.bucket").exists()
+        finally:
+            first.close()
+            second.close()
+
+
+class TestEndpointClassifier:
+    """Tests pour la classe EndpointClassifier"""
+    
+    def test_classify(self):
+        """Test du préfixe le plus long et des endpoints inconnus"""
+        classifier = EndpointClassifier({
+            'orders': {'prefixes': ['/orders']},
+            'history': {'prefixes': ['/orders/history/']},
+        })
+        
+        assert classifier.classify("/orders/123") == 'orders'
+        assert classifier.classify("orders") == 'orders'
+        assert classifier.classify("/orders/history?page=2") == 'history'
+        assert classifier.classify("/ordersx") is None
+        assert classifier.classify("/health") is None
 
 
 class TestApiRequest:
@@ -253,7 +329,7 @@ class TestApiProxyService:
         assert proxy.logger == mock_logger
         assert proxy.base_url == config.AXIOM_API_BASE_URL
         assert proxy.timeout == config.API_TIMEOUT
-        assert isinstance(proxy.rate_limiter, RateLimiter)
+        assert isinstance(proxy.rate_limits.rate_limiter, RateLimiter)
         assert isinstance(proxy.session, requests.Session)
     
     @patch('requests.Session.request')
@@ -335,6 +411,32 @@ class TestApiProxyService:
         assert result.is_success() is True
         assert mock_request.call_count == 2
     
+    @patch('requests.Session.request')
+    def test_retry_attempts_traced(self, mock_request, api_proxy, monkeypatch):
+        """Test des spans de la requête proxy, de chaque tentative et du backoff"""
+        spans = []
+        exporter = Mock(export=spans.extend)
+        tracer = tracing.Tracer('backend_api', sample_rate=1.0, exporter=exporter)
+        monkeypatch.setattr(tracing, '_tracer', tracer)
+        
+        error_response = Mock(status_code=503, ok=False, text="unavailable", headers={})
+        success_response = Mock(status_code=200, ok=True, headers={"Content-Type": "application/json"})
+        success_response.json.return_value = {"result": "success"}
+        mock_request.side_effect = [error_response, success_response]
+        
+        with patch('time.sleep'):
+            result = api_proxy.proxy_request("/test", "GET", use_auth=False, retry_count=2)
+        tracer.flush()
+        
+        assert result.status_code == 200
+        names = [span['name'] for span in spans]
+        assert names.count('HTTP GET') == 2
+        assert 'proxy.backoff' in names
+        root = next(span for span in spans if span['name'].startswith('proxy GET'))
+        assert root['tags']['retries'] == '1'
+        assert all(span['parentId'] == root['id'] for span in spans if span is not root)
+        assert [span['tags']['http.status_code'] for span in spans if span['name'] == 'HTTP GET'] == ['503', '200']
+    
     @patch('requests.Session.request')
     def test_proxy_request_connection_error(self, mock_request, api_proxy):
         """Test de requête avec erreur de connexion"""
@@ -446,10 +548,15 @@ class TestApiProxyService:
     def test_get_metrics(self, api_proxy):
         """Test de récupération des métriques"""
         # Simuler quelques requêtes
-        api_proxy._request_count = 10
-        api_proxy._error_count = 2
-        api_proxy._total_response_time = 5.0
-        api_proxy._last_request_time = datetime.utcnow()
+        api_proxy.metrics.requests.add(10)
+        api_proxy.metrics.errors.add(2)
+        api_proxy.metrics.response_time.add(5.0)
+        api_proxy.metrics.last_request_time = datetime.utcnow()
+        
+        request = ApiRequest(method=RequestMethod.GET, endpoint="/orders/42")
+        api_proxy._add_to_history(ApiResponse(
+            status_code=200, response_time=0.2, request=request, bytes_in=512, bytes_out=64
+        ))
         
         metrics = api_proxy.get_metrics()
         
@@ -457,6 +564,9 @@ class TestApiProxyService:
         assert metrics['total_errors'] == 2
         assert metrics['error_rate'] == 0.2
         assert metrics['average_response_time'] == 0.5
+        assert metrics['bytes_in'] == 512
+        assert metrics['bytes_out'] == 64
+        assert metrics['endpoints']['/orders/{id}']['2xx']['count'] == 1
         assert 'rate_limiter' in metrics
     
     def test_get_request_history(self, api_proxy):
@@ -470,6 +580,8 @@ class TestApiProxyService:
         
         assert len(history) == 3
         assert all('status_code' in item for item in history)
+        # Seules les métadonnées sont conservées
+        assert all('data' not in item for item in history)
     
     def test_clear_history(self, api_proxy):
         """Test d'effacement de l'historique"""
@@ -477,26 +589,27 @@ class TestApiProxyService:
         response = ApiResponse(status_code=200)
         api_proxy._add_to_history(response)
         
-        assert len(api_proxy._request_history) == 1
+        assert api_proxy.metrics.history_length == 1
         
         api_proxy.clear_history()
         
-        assert len(api_proxy._request_history) == 0
+        assert api_proxy.metrics.history_length == 0
     
     def test_reset_metrics(self, api_proxy):
         """Test de remise à zéro des métriques"""
         # Définir quelques métriques
-        api_proxy._request_count = 10
-        api_proxy._error_count = 2
-        api_proxy._total_response_time = 5.0
-        api_proxy._last_request_time = datetime.utcnow()
+        api_proxy.metrics.requests.add(10)
+        api_proxy.metrics.errors.add(2)
+        api_proxy.metrics.response_time.add(5.0)
+        api_proxy.metrics.last_request_time = datetime.utcnow()
         
         api_proxy.reset_metrics()
         
-        assert api_proxy._request_count == 0
-        assert api_proxy._error_count == 0
-        assert api_proxy._total_response_time == 0.0
-        assert api_proxy._last_request_time is None
+        metrics = api_proxy.get_metrics()
+        assert metrics['total_requests'] == 0
+        assert metrics['total_errors'] == 0
+        assert metrics['average_response_time'] == 0.0
+        assert metrics['last_request_time'] is None
     
     @patch('requests.Session.request')
     def test_health_check_success(self, mock_request, api_proxy):
@@ -527,8 +640,30 @@ class TestApiProxyService:
     
     def test_cleanup(self, api_proxy):
         """Test du nettoyage des ressources"""
+        series = f'api_proxy_requests_total{{proxy="{api_proxy._proxy_id}"}}'
+        assert series in get_metrics_registry().render()
+        
         # Ne devrait pas lever d'exception
         api_proxy.cleanup()
+        
+        # Le collecteur de métriques n'est plus exposé
+        assert series not in get_metrics_registry().render()
+    
+    def test_cleanup_keeps_other_instances_metrics(self, config, mock_token_service, mock_logger):
+        """Test des collecteurs par instance : le nettoyage d'un proxy ne retire pas les autres"""
+        service = ApiProxyService(config, mock_token_service, mock_logger)
+        temporary = ApiProxyService(config, mock_token_service, mock_logger)
+        
+        text = get_metrics_registry().render()
+        assert f'api_proxy_requests_total{{proxy="{service._proxy_id}"}}' in text
+        assert f'api_proxy_requests_total{{proxy="{temporary._proxy_id}"}}' in text
+        
+        temporary.cleanup()
+        
+        text = get_metrics_registry().render()
+        assert f'api_proxy_requests_total{{proxy="{service._proxy_id}"}}' in text
+        assert f'proxy="{temporary._proxy_id}"' not in text
+        service.cleanup()
 
 
 class TestApiProxyServiceIntegration:
@@ -548,7 +683,7 @@ class TestApiProxyServiceIntegration:
         
         # Créer un proxy avec une limite très basse
         proxy = ApiProxyService(config, token_service)
-        proxy.rate_limiter = RateLimiter(max_requests=1, time_window=60)
+        proxy.rate_limits.rate_limiter = RateLimiter(max_requests=1, time_window=60)
         
         with patch('requests.Session.request') as mock_request:
             mock_response = Mock()
@@ -569,6 +704,358 @@ class TestApiProxyServiceIntegration:
                     assert result2.status_code == 200
                     # Vérifier qu'il y a eu une attente
                     mock_sleep.assert_called()
+
+    def test_endpoint_class_rate_limiting(self):
+        """Test des budgets par classe d'endpoint"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        config.API_RATE_LIMITS = {
+            'trading': {'prefixes': ['/orders'], 'max_requests': 1, 'time_window': 60}
+        }
+
+        proxy = ApiProxyService(config, Mock())
+
+        # Le budget global n'est pas épuisé, seul celui des ordres l'est
+        assert proxy.rate_limits.reserve("/orders/1") == 0.0
+        assert proxy.rate_limits.reserve("/market/ticker") == 0.0
+        assert proxy.rate_limits.reserve("/orders/2") > 0
+
+        state = proxy.get_metrics()['rate_limiter']
+        assert set(state['endpoint_classes']) == {'trading'}
+        assert state['endpoint_classes']['trading']['can_make_request'] is False
+        assert state['can_make_request'] is True
+
+        proxy.cleanup()
+
+    def test_response_cache_integration(self):
+        """Test du cache des GET avec revalidation conditionnelle"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+
+        token_service = Mock()
+        token_service.get_current_tokens.return_value = {
+            'success': True,
+            'tokens': {'access_token_preview': 'token123...'}
+        }
+        
+        now = [1000.0]
+        proxy = ApiProxyService(config, token_service)
+        proxy.response_cache = ResponseCache(
+            policies={'market_data': {'prefixes': ['/market'], 'ttl': 5}},
+            clock=lambda: now[0]
+        )
+
+        ok_response = Mock(status_code=200, ok=True)
+        ok_response.json.return_value = {"price": 100}
+        ok_response.headers = {"content-type": "application/json", "ETag": '"v1"'}
+        not_modified = Mock(status_code=304, ok=True)
+        not_modified.headers = {"ETag": '"v1"'}
+
+        with patch('requests.Session.request', side_effect=[ok_response, not_modified]) as mock_request, \
+                patch.object(proxy, '_get_full_access_token', return_value='token'):
+            first = proxy.proxy_request("/market/btc", "GET", params={"depth": "1"})
+            second = proxy.proxy_request("/market/btc", "GET", params={"depth": "1"})
+
+            assert first.data == second.data == {"price": 100}
+            assert second.headers['X-Cache'] == "HIT"
+            assert mock_request.call_count == 1
+
+            # Après expiration, requête conditionnelle et réponse 304
+            now[0] += 10
+            third = proxy.proxy_request("/market/btc", "GET", params={"depth": "1"})
+
+            assert mock_request.call_count == 2
+            assert mock_request.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+            assert third.status_code == 200
+            assert third.data == {"price": 100}
+            assert third.headers['X-Cache'] == "REVALIDATED"
+
+        cache_stats = proxy.get_metrics()['response_cache']
+        assert cache_stats['hits'] == 1
+        assert cache_stats['not_modified'] == 1
+
+    def test_response_cache_keyed_by_access_token(self, tmp_path):
+        """Test du cache des réponses authentifiées propre à chaque token d'accès"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        config.TOKEN_CACHE_FILE = str(tmp_path / "tokens.json")
+        
+        token_service = TokenService(config)
+        expires_at = datetime.utcnow() + timedelta(hours=1)
+        token_service.save_tokens("access-token-a", "refresh-token", expires_at=expires_at)
+        
+        proxy = ApiProxyService(config, token_service)
+        proxy.response_cache = ResponseCache(policies={'market_data': {'prefixes': ['/market'], 'ttl': 60}})
+        
+        def upstream_response(method, url, **kwargs):
+            response = Mock(status_code=200, ok=True)
+            response.json.return_value = {"authorization": kwargs['headers']['Authorization']}
+            response.headers = {"content-type": "application/json"}
+            return response
+        
+        with patch('requests.Session.request', side_effect=upstream_response) as mock_request:
+            first = proxy.proxy_request("/market/btc", "GET")
+            assert proxy.proxy_request("/market/btc", "GET").headers['X-Cache'] == "HIT"
+            
+            # Un autre token ne reçoit pas la réponse mise en cache pour le premier
+            token_service.save_tokens("access-token-b", "refresh-token", expires_at=expires_at)
+            second = proxy.proxy_request("/market/btc", "GET")
+        
+        assert mock_request.call_count == 2
+        assert first.data == {"authorization": "Bearer access-token-a"}
+        assert second.data == {"authorization": "Bearer access-token-b"}
+    
+    def test_concurrent_requests_coalesced(self):
+        """Test du regroupement des GET identiques simultanés"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+
+        proxy = ApiProxyService(config, Mock())
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(**kwargs):
+            started.set()
+            release.wait(5)
+            response = Mock(status_code=200, ok=True)
+            response.json.return_value = {"result": "success"}
+            response.headers = {"content-type": "application/json"}
+            return response
+
+        results = []
+
+        def call(endpoint):
+            results.append(proxy.proxy_request(endpoint, "GET", use_auth=False))
+
+        with patch('requests.Session.request', side_effect=slow_request) as mock_request:
+            threads = [threading.Thread(target=call, args=("/positions",)) for _ in range(4)]
+            threads.append(threading.Thread(target=call, args=("/balances",)))
+            for thread in threads:
+                thread.start()
+            started.wait(5)
+            while proxy.get_metrics()['coalescing']['coalesced'] < 3:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert len(results) == 5
+        assert mock_request.call_count == 2
+        assert proxy.get_metrics()['total_requests'] == 2
+
+    def test_custom_coalesce_key(self):
+        """Test d'une fonction de clé personnalisée"""
+        config = Config()
+        keys = []
+
+        def no_coalescing(request, use_auth):
+            keys.append((request.endpoint, use_auth))
+            return None
+
+        proxy = ApiProxyService(config, Mock(), coalesce_key=no_coalescing)
+
+        with patch.object(proxy, '_fetch', return_value=ApiResponse(status_code=200)) as mock_fetch:
+            proxy.proxy_request("/positions", "GET", use_auth=False)
+            proxy.proxy_request("/orders", "POST", data={"side": "buy"}, use_auth=False)
+
+        assert keys == [("/positions", False)]
+        assert mock_fetch.call_count == 2
+
+    def test_proxy_batch_concurrent_with_partial_failure(self):
+        """Test des requêtes groupées exécutées en parallèle"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        config.API_CACHE_ENABLED = False
+        
+        proxy = ApiProxyService(config, Mock())
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def upstream(method, url, **kwargs):
+            barrier.wait()  # Les trois requêtes sont en vol en même temps
+            if url.endswith('/down'):
+                raise requests.exceptions.ConnectionError("refused")
+            response = Mock(status_code=200, ok=True)
+            response.json.return_value = {"url": url}
+            response.headers = {"content-type": "application/json"}
+            return response
+        
+        items = [
+            {"id": "a", "endpoint": "/market/btc", "params": {"depth": "5"}},
+            {"endpoint": "/market/eth"},
+            {"id": "c", "endpoint": "/down"},
+            {"id": "d", "endpoint": "//evil.example.com/x"},
+            {"id": "e", "endpoint": "/market/btc", "method": "TRACE"},
+        ]
+        
+        with patch('requests.Session.request', side_effect=upstream), \
+                patch.object(proxy, '_calculate_backoff_time', return_value=0), \
+                patch.object(proxy, '_get_full_access_token', return_value='token'):
+            proxy.token_service.get_current_tokens.return_value = {
+                'success': True, 'tokens': {'access_token_preview': 'token...'}
+            }
+            items[2]['retry_count'] = 0
+            results = proxy.proxy_batch(items)
+        
+        assert [r['id'] for r in results] == ["a", 1, "c", "d", "e"]
+        assert results[0]['status'] == 'ok'
+        assert results[0]['data'] == {"url": "https://api.test.com/market/btc"}
+        assert results[1]['status'] == 'ok'
+        assert results[2]['status'] == 'error'
+        assert results[2]['error']['code'] == 'API_CONNECTION_ERROR'
+        assert results[3]['error']['code'] == 'INVALID_REQUEST'
+        assert results[4]['error']['code'] == 'INVALID_REQUEST'
+        
+        proxy.cleanup()
+    
+    def test_proxy_batch_keeps_trace_context(self, monkeypatch):
+        """Test du rattachement des éléments d'un lot à la trace de l'appelant"""
+        spans = []
+        tracer = tracing.Tracer('backend_api', sample_rate=1.0, exporter=Mock(export=spans.extend))
+        monkeypatch.setattr(tracing, '_tracer', tracer)
+        
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        config.API_CACHE_ENABLED = False
+        proxy = ApiProxyService(config, Mock())
+        proxy.token_service.get_current_tokens.return_value = {
+            'success': True, 'tokens': {'access_token_preview': 'token...'}
+        }
+        
+        response = Mock(status_code=200, ok=True, headers={"content-type": "application/json"})
+        response.json.return_value = {}
+        items = [{"id": name, "endpoint": f"/market/{name}"} for name in ("btc", "eth", "sol")]
+        
+        with patch('requests.Session.request', return_value=response), \
+                patch.object(proxy, '_get_full_access_token', return_value='token'):
+            with tracer.start_span('POST /api/proxy/batch') as root:
+                results = proxy.proxy_batch(items)
+        tracer.flush()
+        proxy.cleanup()
+        
+        assert all(result['status'] == 'ok' for result in results)
+        item_spans = [span for span in spans if span['name'].startswith('proxy GET')]
+        assert len(item_spans) == 3
+        assert {span['traceId'] for span in item_spans} == {root.context.trace_id}
+        assert {span['parentId'] for span in item_spans} == {root.context.span_id}
+    
+    def test_circuit_breaker_fails_fast(self):
+        """Test du disjoncteur qui refuse les appels sans attendre l'API"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        config.API_CIRCUIT_MINIMUM_CALLS = 2
+        config.API_RATE_LIMITS = {
+            'market_data': {'prefixes': ['/market'], 'max_requests': 100, 'time_window': 60}
+        }
+
+        proxy = ApiProxyService(config, Mock())
+
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = requests.exceptions.ConnectionError("down")
+
+            with patch('time.sleep') as mock_sleep:
+                with pytest.raises(ApiConnectionError):
+                    proxy.proxy_request("/market/ticker", "GET", use_auth=False, retry_count=3)
+
+                # Le disjoncteur s'ouvre après deux échecs : plus de retry
+                assert mock_request.call_count == 2
+                assert mock_sleep.call_count == 1
+
+                with pytest.raises(ApiCircuitOpenError):
+                    proxy.proxy_request("/market/ticker", "GET", use_auth=False)
+                assert mock_request.call_count == 2
+
+            # Les autres groupes d'endpoints ne sont pas touchés
+            mock_request.side_effect = None
+            mock_request.return_value = Mock(status_code=200, ok=True, headers={}, content=b"")
+            mock_request.return_value.json.return_value = {}
+            assert proxy.proxy_request("/orders", "GET", use_auth=False).status_code == 200
+
+        metrics = proxy.get_metrics()
+        assert metrics['circuit_breakers']['market_data']['state'] == 'open'
+        assert metrics['circuit_breakers']['default']['state'] == 'closed'
+        assert metrics['retry_budget']['retries'] == 1
+
+        proxy.cleanup()
+
+    def test_proxy_stream_passthrough(self):
+        """Test de la transmission en flux d'une réponse compressée"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        config.API_STREAM_CHUNK_SIZE = 1024
+        
+        payload = json.dumps({"orders": list(range(5000))}).encode()
+        compressed = gzip.compress(payload)
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "Content-Length": str(len(compressed)),
+            "X-Internal": "hidden"
+        }
+        
+        proxy = ApiProxyService(config, Mock())
+        
+        with patch('requests.Session.request') as mock_request:
+            # Client acceptant gzip : octets relayés tels quels
+            mock_request.return_value = make_streamed_upstream(compressed, headers)
+            streamed = proxy.proxy_stream("/orders/history", use_auth=False, accept_encoding="gzip, br")
+            
+            assert mock_request.call_args[1]['stream'] is True
+            assert mock_request.call_args[1]['headers']['Accept-Encoding'] == "gzip, br"
+            assert streamed.headers["Content-Encoding"] == "gzip"
+            assert "X-Internal" not in streamed.headers
+            
+            chunks = list(streamed.chunks)
+            assert len(chunks) > 1
+            assert b"".join(chunks) == compressed
+            
+            # Client sans Accept-Encoding : corps décompressé
+            mock_request.return_value = make_streamed_upstream(compressed, headers)
+            streamed = proxy.proxy_stream("/orders/history", use_auth=False)
+            
+            assert "Content-Encoding" not in streamed.headers
+            assert "Content-Length" not in streamed.headers
+            assert b"".join(streamed.chunks) == payload
+        
+        metrics = proxy.get_metrics()
+        assert metrics['total_requests'] == 2
+        assert metrics['bytes_in'] == len(compressed) + len(payload)
+        assert proxy.get_request_history()[0]['bytes_in'] == len(compressed)
+        
+        proxy.cleanup()
+    
+    @pytest.mark.parametrize("endpoint", [
+        "/http://evil.com/x", "//evil.com/x", "/https://evil.com", "orders"
+    ])
+    def test_proxy_stream_rejects_foreign_hosts(self, endpoint):
+        """Test du refus des endpoints sortant de l'URL de base (SSRF)"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        proxy = ApiProxyService(config, Mock())
+        
+        with patch('requests.Session.request') as mock_request:
+            with pytest.raises(ValidationError):
+                proxy.proxy_stream(endpoint)
+            mock_request.assert_not_called()
+        
+        proxy.cleanup()
+    
+    def test_proxy_stream_error_status_counted(self):
+        """Test des réponses amont en erreur comptées dans les métriques"""
+        config = Config()
+        config.AXIOM_API_BASE_URL = "https://api.test.com"
+        proxy = ApiProxyService(config, Mock())
+        
+        with patch('requests.Session.request',
+                   return_value=make_streamed_upstream(b'{"error": "missing"}', {}, status=404)):
+            streamed = proxy.proxy_stream("/orders/missing", use_auth=False)
+            assert b"".join(streamed.chunks) == b'{"error": "missing"}'
+            streamed.close()
+        
+        metrics = proxy.get_metrics()
+        assert metrics['total_requests'] == 1
+        assert metrics['total_errors'] == 1
+        
+        proxy.cleanup()
     
     def test_full_request_lifecycle(self):
         """Test du cycle de vie complet d'une requête"""
@@ -0,0 +1,232 @@
+"""
+Tests du service proxy asynchrone contre un serveur HTTP local
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core import config as config_module
+from src.core.config import Config
+from src.core.exceptions import ApiDeadlineExceededError
+from src.core.metrics_registry import get_metrics_registry
+from src.services import async_api_proxy_service
+from src.services.async_api_proxy_service import (
+    AsyncApiProxyService, request_deadline, acquire_async_api_proxy
+)
+from src.services.token_service import TokenService
+from src.trading.bots import BotConfig, ScalpingBot
+
+
+class UpstreamState:
+    """État partagé du serveur amont simulé"""
+    
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self.failures_left = 0
+        self.timeout_headers = []
+        self.ticker_requests = []
+
+
+def make_app(state):
+    """Application aiohttp simulant l'API Axiom"""
+    async def slow(request):
+        state.calls += 1
+        state.active += 1
+        state.max_active = max(state.max_active, state.active)
+        state.timeout_headers.append(request.headers.get('X-Request-Timeout-Ms'))
+        try:
+            await asyncio.sleep(float(request.query.get('delay', '0.05')))
+        finally:
+            state.active -= 1
+        return web.json_response({"value": request.query.get('id')})
+    
+    async def flaky(request):
+        state.calls += 1
+        if state.failures_left > 0:
+            state.failures_left -= 1
+            return web.json_response({"message": "unavailable"}, status=503)
+        return web.json_response({"ok": True})
+    
+    async def ticker(request):
+        state.ticker_requests.append((request.query.get('symbol'), request.headers.get('Authorization')))
+        return web.json_response({"bid": 99.5, "ask": 100.5, "last": 100.0, "volume": 1200.0})
+    
+    app = web.Application()
+    app.router.add_get('/slow', slow)
+    app.router.add_get('/flaky', flaky)
+    app.router.add_get('/market/ticker', ticker)
+    return app
+
+
+def make_config(server, per_host=50):
+    """Configuration pointant vers le serveur de test"""
+    config = Config()
+    config.AXIOM_API_BASE_URL = str(server.make_url('/'))
+    config.API_RATE_LIMIT_REQUESTS = 10000
+    config.API_ASYNC_MAX_CONNECTIONS_PER_HOST = per_host
+    config.API_ASYNC_HTTP2 = False
+    return config
+
+
+def make_proxy(server, per_host=50, sleep=None):
+    """Proxy asynchrone pointant vers le serveur de test"""
+    return AsyncApiProxyService(make_config(server, per_host), Mock(), sleep=sleep)
+
+
+def run(scenario):
+    """Exécute un scénario avec un serveur amont démarré"""
+    async def main():
+        state = UpstreamState()
+        server = TestServer(make_app(state))
+        await server.start_server()
+        try:
+            return await scenario(server, state)
+        finally:
+            await server.close()
+    
+    return asyncio.run(main())
+
+
+class TestAsyncApiProxyService:
+    """Tests pour AsyncApiProxyService"""
+    
+    def test_concurrency_bounded_per_host(self):
+        """Les requêtes simultanées sont bornées par le sémaphore de l'hôte"""
+        async def scenario(server, state):
+            async with make_proxy(server, per_host=8) as proxy:
+                responses = await asyncio.gather(*[
+                    proxy.proxy_request("/slow", params={"id": str(i)}, use_auth=False)
+                    for i in range(40)
+                ])
+                return responses, proxy.get_metrics()
+        
+        responses, metrics = run(scenario)
+        
+        assert [r.data["value"] for r in responses] == [str(i) for i in range(40)]
+        assert all(r.status_code == 200 for r in responses)
+        assert metrics['max_in_flight'] == 8
+        assert metrics['in_flight'] == 0
+        assert metrics['total_requests'] == 40
+        assert metrics['protocol'] == "HTTP/1.1"
+        assert metrics['endpoints']['/slow']['2xx']['count'] == 40
+        assert metrics['bytes_in'] > 0
+    
+    def test_retry_does_not_block_loop(self):
+        """Le backoff laisse la boucle servir les autres requêtes"""
+        async def scenario(server, state):
+            state.failures_left = 2
+            backing_off = asyncio.Event()
+            resume = asyncio.Event()
+            
+            async def gated_sleep(seconds):
+                backing_off.set()
+                await resume.wait()
+            
+            async with make_proxy(server, sleep=gated_sleep) as proxy:
+                flaky = asyncio.create_task(proxy.proxy_request("/flaky", use_auth=False))
+                await asyncio.wait_for(backing_off.wait(), 5)
+                
+                # La requête en backoff n'empêche pas les autres d'aboutir
+                other = await proxy.proxy_request("/slow", params={"delay": "0"}, use_auth=False)
+                flaky_pending = not flaky.done()
+                
+                resume.set()
+                return await flaky, other, flaky_pending, state.calls
+        
+        flaky, other, flaky_pending, calls = run(scenario)
+        
+        assert flaky.status_code == 200
+        assert other.status_code == 200
+        assert flaky_pending
+        assert calls == 4
+    
+    def test_deadline_propagated(self):
+        """L'échéance borne la requête et est transmise en amont"""
+        async def scenario(server, state):
+            async with make_proxy(server) as proxy:
+                started = time.monotonic()
+                with request_deadline(0.3):
+                    with pytest.raises(ApiDeadlineExceededError):
+                        await proxy.proxy_request("/slow", params={"delay": "2"}, use_auth=False)
+                elapsed = time.monotonic() - started
+                return elapsed, state.timeout_headers, proxy.get_metrics()
+        
+        elapsed, timeout_headers, metrics = run(scenario)
+        
+        assert elapsed < 1.0
+        assert 0 < int(timeout_headers[0]) <= 300
+        assert metrics['deadline_exceeded'] == 1
+
+    
+    def test_metrics_collected_per_instance(self):
+        """Les proxys de plusieurs boucles sont exposés côte à côte, et retirés un par un"""
+        async def scenario(server, state):
+            async with make_proxy(server) as first:
+                second = make_proxy(server)
+                await second.close()
+                return first._proxy_id, second._proxy_id, get_metrics_registry().render()
+        
+        first_id, second_id, text = run(scenario)
+        
+        assert first_id != second_id
+        assert f'async_api_proxy_requests_total{{proxy="{first_id}"}}' in text
+        assert f'async_api_proxy_requests_total{{proxy="{second_id}"}}' not in text
+        assert f'async_api_proxy_requests_total{{proxy="{first_id}"}}' not in get_metrics_registry().render()
+
+
+class TestSharedAsyncApiProxy:
+    """Tests du proxy asynchrone partagé par les bots"""
+    
+    def test_bots_share_proxy(self, tmp_path, monkeypatch):
+        """Les bots d'une boucle interrogent l'API par un seul proxy, fermé au dernier départ"""
+        async def scenario(server, state):
+            config = make_config(server)
+            config.TOKEN_CACHE_FILE = str(tmp_path / 'tokens.json')
+            config.TOKEN_WATCH_ENABLED = False
+            monkeypatch.setattr(config_module, '_config_instance', config)
+            TokenService(config).save_tokens(
+                'access-token', 'refresh-token', expires_at=datetime.utcnow() + timedelta(hours=1)
+            )
+            
+            bots = [
+                ScalpingBot(BotConfig(
+                    name=f'scalper-{i}', symbol='BTCUSDT', base_currency='BTC', quote_currency='USDT',
+                    journal_dir=str(tmp_path / 'journals'),
+                    strategy_params={'api_ticker_endpoint': '/market/ticker'}
+                ))
+                for i in range(2)
+            ]
+            for bot in bots:
+                assert await bot._initialize()
+            shared = bots[0]._api_proxy
+            same_proxy = bots[1]._api_proxy is shared
+            
+            await bots[0]._update_market_data()
+            price = bots[0]._current_price
+            
+            await bots[0]._cleanup()
+            open_after_first = shared._transport is not None
+            await bots[1]._cleanup()
+            
+            return same_proxy, price, open_after_first, shared, state.ticker_requests
+        
+        same_proxy, price, open_after_first, shared, ticker_requests = run(scenario)
+        
+        assert same_proxy
+        assert price == 100.0
+        assert len(ticker_requests) == 3
+        assert ticker_requests[0][0] == 'BTCUSDT'
+        assert ticker_requests[0][1].startswith('Bearer ')
+        assert open_after_first
+        assert shared._transport is None
+        assert not async_api_proxy_service._shared_proxies
@@ -0,0 +1,180 @@
+"""
+Tests unitaires pour les disjoncteurs, timeouts adaptatifs et budgets de retry
+"""
+import pytest
+
+from src.services.circuit_breaker import (
+    CircuitBreaker, CircuitState, AdaptiveTimeout, RetryBudget
+)
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestCircuitBreaker:
+    """Tests pour la classe CircuitBreaker"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker("market_data", failure_threshold=0.5, minimum_calls=4,
+                              open_duration=30, clock=clock)
+
+    def test_stays_closed_below_minimum_calls(self, breaker):
+        """Test du disjoncteur fermé tant que trop peu d'appels sont connus"""
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_opens_on_failure_rate(self, breaker):
+        """Test de l'ouverture quand la proportion d'échecs atteint le seuil"""
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.retry_after() == 30
+        state = breaker.get_state()
+        assert state['rejected'] == 1
+        assert state['open_count'] == 1
+
+    def test_half_open_probe_closes_on_success(self, breaker, clock):
+        """Test de la sonde semi-ouverte qui referme le disjoncteur"""
+        for _ in range(4):
+            breaker.record_failure()
+
+        clock.advance(30)
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        # Une seule sonde à la fois
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_state()['recent_calls'] == 0
+
+    def test_half_open_probe_reopens_on_failure(self, breaker, clock):
+        """Test de la sonde semi-ouverte qui rouvre le disjoncteur"""
+        for _ in range(4):
+            breaker.record_failure()
+        clock.advance(30)
+
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.get_state()['open_count'] == 2
+
+    def test_abandoned_probe_released(self, breaker, clock):
+        """Test de la relance d'une sonde dont l'issue n'est jamais connue"""
+        for _ in range(4):
+            breaker.record_failure()
+        clock.advance(30)
+        assert breaker.allow_request() is True
+
+        clock.advance(30)
+        assert breaker.allow_request() is True
+
+    def test_window_forgets_old_failures(self, clock):
+        """Test de la fenêtre glissante des issues"""
+        breaker = CircuitBreaker("orders", minimum_calls=4, window_size=4, clock=clock)
+
+        breaker.record_failure()
+        for _ in range(6):
+            breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.get_state()['failure_rate'] == 0.25
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestAdaptiveTimeout:
+    """Tests pour la classe AdaptiveTimeout"""
+
+    def test_max_timeout_until_enough_samples(self):
+        """Test du timeout maximum avant adaptation"""
+        adaptive = AdaptiveTimeout(max_timeout=30, min_samples=20, recompute_every=1)
+
+        for _ in range(19):
+            adaptive.record(0.5)
+
+        assert adaptive.timeout == 30
+
+    def test_timeout_follows_percentile(self):
+        """Test du timeout déduit du percentile des latences"""
+        adaptive = AdaptiveTimeout(max_timeout=30, min_timeout=0.1, percentile=99,
+                                   multiplier=2, min_samples=10, recompute_every=10)
+
+        for _ in range(99):
+            adaptive.record(0.5)
+        adaptive.record(2.0)
+
+        assert adaptive.timeout == 1.0
+        assert adaptive.get_state()['samples'] == 100
+
+    def test_timeout_bounded(self):
+        """Test des bornes du timeout"""
+        fast = AdaptiveTimeout(max_timeout=30, min_timeout=1, min_samples=10, recompute_every=10)
+        slow = AdaptiveTimeout(max_timeout=30, min_timeout=1, min_samples=10, recompute_every=10)
+
+        for _ in range(10):
+            fast.record(0.01)
+            slow.record(60)
+
+        assert fast.timeout == 1
+        assert slow.timeout == 30
+
+
+class TestRetryBudget:
+    """Tests pour la classe RetryBudget"""
+
+    def test_initial_reserve(self):
+        """Test du solde initial à faible trafic"""
+        budget = RetryBudget(ratio=0.2, min_retries_per_second=1, clock=FakeClock())
+
+        granted = sum(budget.try_retry() for _ in range(15))
+
+        assert granted == 10
+        assert budget.get_state()['denied'] == 5
+
+    def test_retries_proportional_to_traffic(self):
+        """Test des retries limités à une fraction du trafic"""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, clock=FakeClock())
+
+        for _ in range(4):
+            budget.record_request()
+
+        assert budget.try_retry() is True
+        assert budget.try_retry() is True
+        assert budget.try_retry() is False
+
+    def test_refill_over_time(self):
+        """Test du minimum de retries par seconde"""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.2, min_retries_per_second=1, max_balance=10, clock=clock)
+        while budget.try_retry():
+            pass
+
+        clock.advance(3)
+
+        assert sum(budget.try_retry() for _ in range(5)) == 3
@@ -0,0 +1,142 @@
+"""
+Tests unitaires pour les métriques du proxy API
+"""
+import threading
+
+import pytest
+
+from src.services.proxy_metrics import (
+    ShardedCounter, LatencyHistogram, ProxyMetrics, RequestRecord,
+    normalize_endpoint, status_class, OTHER_ENDPOINTS
+)
+
+
+class TestShardedCounter:
+    """Tests pour la classe ShardedCounter"""
+
+    def test_concurrent_increments_not_lost(self):
+        """Test des incréments simultanés depuis plusieurs threads"""
+        counter = ShardedCounter()
+
+        def work():
+            for _ in range(10000):
+                counter.add()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 80000
+
+    def test_dead_thread_cells_collected(self):
+        """Test du report des cellules des threads terminés"""
+        counter = ShardedCounter()
+
+        for _ in range(20):
+            thread = threading.Thread(target=counter.add, args=(2,))
+            thread.start()
+            thread.join()
+
+        assert counter.value == 40
+        assert len(counter._cells) <= 1
+
+    def test_reset(self):
+        """Test de la remise à zéro"""
+        counter = ShardedCounter()
+        counter.add(3.5)
+
+        counter.reset()
+
+        assert counter.value == 0
+
+
+class TestLatencyHistogram:
+    """Tests pour la classe LatencyHistogram"""
+
+    def test_percentiles(self):
+        """Test des percentiles estimés à partir des buckets"""
+        histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.5, 1.0))
+
+        for _ in range(90):
+            histogram.record(0.05)
+        for _ in range(10):
+            histogram.record(0.8)
+
+        stats = histogram.get_stats()
+        assert stats['count'] == 100
+        assert stats['max'] == 0.8
+        assert stats['p50'] <= 0.1
+        assert 0.5 <= stats['p95'] <= 0.8
+        assert 0.5 <= stats['p99'] <= 0.8
+
+    def test_overflow_bucket_bounded_by_max(self):
+        """Test du dernier bucket borné par la latence maximale"""
+        histogram = LatencyHistogram(buckets=(0.1,))
+
+        histogram.record(5.0)
+
+        assert histogram.percentile(99) <= 5.0
+
+    def test_empty(self):
+        """Test d'un histogramme vide"""
+        assert LatencyHistogram().get_stats()['p99'] == 0.0
+
+
+class TestProxyMetrics:
+    """Tests pour la classe ProxyMetrics"""
+
+    def test_normalize_endpoint(self):
+        """Test de la normalisation des endpoints"""
+        assert normalize_endpoint("/orders/12345") == "/orders/{id}"
+        assert normalize_endpoint("/tokens/550e8400-e29b-41d4-a716-446655440000/price") == "/tokens/{id}/price"
+        assert normalize_endpoint("/market/ticker?symbol=SOL") == "/market/ticker"
+        assert status_class(503) == "5xx"
+
+    def test_record_call(self):
+        """Test de l'enregistrement d'un appel"""
+        metrics = ProxyMetrics(history_size=2)
+
+        for status in (200, 200, 503):
+            metrics.record_call(RequestRecord(
+                method="GET", endpoint="/orders/1", status_code=status,
+                response_time=0.1, bytes_in=100, bytes_out=10
+            ))
+
+        stats = metrics.get_endpoint_stats()
+        assert stats['/orders/{id}']['2xx']['count'] == 2
+        assert stats['/orders/{id}']['5xx']['count'] == 1
+        assert metrics.get_summary()['bytes_in'] == 300
+
+        # Historique de taille fixe
+        history = metrics.get_history(limit=0)
+        assert [item['status_code'] for item in history] == [200, 503]
+
+    def test_endpoint_cardinality_capped(self):
+        """Test du regroupement des endpoints au-delà de la limite"""
+        metrics = ProxyMetrics(max_endpoints=2)
+
+        for endpoint in ("/a", "/b", "/c", "/d"):
+            metrics.record_call(RequestRecord(
+                method="GET", endpoint=endpoint, status_code=200, response_time=0.1
+            ))
+
+        stats = metrics.get_endpoint_stats()
+        assert set(stats) == {"/a", "/b", OTHER_ENDPOINTS}
+        assert stats[OTHER_ENDPOINTS]['2xx']['count'] == 2
+
+    def test_collect_metrics(self):
+        """Test des métriques exposées pour le registre"""
+        metrics = ProxyMetrics()
+        metrics.requests.add()
+        metrics.record_call(RequestRecord(
+            method="GET", endpoint="/orders/1", status_code=200, response_time=0.1, bytes_in=50
+        ))
+
+        families = {family.name: family for family in metrics.collect_metrics('proxy')}
+
+        assert families['proxy_requests_total'].samples == [('proxy_requests_total', {}, 1)]
+        assert families['proxy_received_bytes_total'].samples[0][2] == 50
+        assert ('proxy_request_duration_seconds_count', {'endpoint': '/orders/{id}', 'status': '2xx'}, 1) \
+            in families['proxy_request_duration_seconds'].samples
@@ -0,0 +1,155 @@
+"""
+Tests unitaires pour le cache des réponses de l'API
+"""
+import pytest
+
+from src.services.response_cache import (
+    ResponseCache, CACHE_FRESH, CACHE_STALE, CACHE_EXPIRED
+)
+
+
+POLICIES = {
+    'market_data': {'prefixes': ['/market'], 'ttl': 5, 'stale_while_revalidate': 10}
+}
+
+
+class FakeClock:
+    """Horloge manuelle pour les tests du cache"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Horloge contrôlée"""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Cache avec une politique pour /market"""
+    return ResponseCache(policies=POLICIES, negative_ttl=30, clock=clock)
+
+
+class TestResponseCache:
+    """Tests pour la classe ResponseCache"""
+
+    def test_make_key(self):
+        """Test de la clé : paramètres triés, identité incluse"""
+        key1 = ResponseCache.make_key("get", "/market/btc", {"b": "2", "a": "1"}, "user1")
+        key2 = ResponseCache.make_key("GET", "/market/btc", {"a": "1", "b": "2"}, "user1")
+        key3 = ResponseCache.make_key("GET", "/market/btc", {"a": "1", "b": "2"}, "user2")
+
+        assert key1 == key2
+        assert key1 != key3
+        # Les valeurs sont échappées : pas de collision entre paramètres distincts
+        assert (ResponseCache.make_key("GET", "/market/btc", {"a": "1&b=2"})
+                != ResponseCache.make_key("GET", "/market/btc", {"a": "1", "b": "2"}))
+        assert ResponseCache.make_identity("secret") != ResponseCache.make_identity("other")
+        assert "secret" not in ResponseCache.make_identity("secret")
+        assert ResponseCache.make_identity(None) is None
+
+    def test_uncacheable_endpoint(self, cache):
+        """Test d'un endpoint sans politique"""
+        assert cache.is_cacheable("/orders") is False
+        assert cache.store("k", "/orders", 200, {"a": 1}, {}) is None
+        assert len(cache) == 0
+
+    def test_fresh_stale_expired(self, cache, clock):
+        """Test du cycle fraîche -> périmée -> expirée"""
+        cache.store("k", "/market/btc", 200, {"price": 1}, {"ETag": '"v1"'})
+
+        entry, state = cache.lookup("k")
+        assert state == CACHE_FRESH
+        assert entry.data == {"price": 1}
+
+        clock.advance(6)
+        assert cache.lookup("k")[1] == CACHE_STALE
+
+        clock.advance(10)
+        entry, state = cache.lookup("k")
+        assert state == CACHE_EXPIRED
+        assert entry.conditional_headers() == {'If-None-Match': '"v1"'}
+
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['stale_hits'], stats['misses']) == (1, 1, 1)
+
+    def test_expired_without_validators_dropped(self, cache, clock):
+        """Test d'une entrée expirée sans ETag ni Last-Modified"""
+        cache.store("k", "/market/btc", 200, {"price": 1}, {})
+        clock.advance(20)
+
+        assert cache.lookup("k") == (None, None)
+        assert len(cache) == 0
+
+    def test_refresh_after_not_modified(self, cache, clock):
+        """Test du rafraîchissement après une réponse 304"""
+        cache.store("k", "/market/btc", 200, {"price": 1}, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        clock.advance(20)
+
+        entry = cache.refresh("k", "/market/btc", {"ETag": '"v2"'})
+
+        assert entry.etag == '"v2"'
+        assert cache.lookup("k")[1] == CACHE_FRESH
+        assert cache.get_stats()['not_modified'] == 1
+
+    def test_cache_control(self, cache):
+        """Test du respect de no-store et max-age"""
+        assert cache.store("a", "/market/a", 200, {}, {"Cache-Control": "no-store"}) is None
+
+        entry = cache.store("b", "/market/b", 200, {}, {"Cache-Control": "public, max-age=1"})
+        assert entry.expires_at - entry.stored_at == 1
+
+    def test_negative_caching(self, cache, clock):
+        """Test de la mise en cache des 404"""
+        entry = cache.store("k", "/market/unknown", 404, {"message": "Not found"}, {})
+
+        assert entry.negative is True
+        clock.advance(29)
+        assert cache.lookup("k")[1] == CACHE_FRESH
+        clock.advance(2)
+        assert cache.lookup("k") == (None, None)
+
+        # Les autres erreurs ne sont pas mises en cache
+        assert cache.store("k2", "/market/btc", 500, None, {}) is None
+
+    def test_lru_eviction_by_size(self, clock):
+        """Test de l'éviction LRU quand la taille maximale est dépassée"""
+        cache = ResponseCache(policies=POLICIES, max_bytes=3000, clock=clock)
+        payload = {"data": "x" * 500}
+
+        cache.store("a", "/market/a", 200, payload, {})
+        cache.store("b", "/market/b", 200, payload, {})
+        cache.lookup("a")
+        cache.store("c", "/market/c", 200, payload, {})
+
+        assert cache.lookup("a")[1] == CACHE_FRESH
+        assert cache.lookup("b") == (None, None)
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['size_bytes'] <= 3000
+
+    def test_single_revalidation_per_key(self, cache):
+        """Test d'une seule revalidation en cours par clé"""
+        assert cache.begin_revalidation("k") is True
+        assert cache.begin_revalidation("k") is False
+        cache.end_revalidation("k")
+        assert cache.begin_revalidation("k") is True
+
+    def test_collect_metrics(self, cache):
+        """Test des métriques exposées pour le registre"""
+        cache.store("k", "/market/btc", 200, {"price": 1}, {})
+        cache.lookup("k")
+        cache.lookup("other")
+
+        families = {family.name: family for family in cache.collect_metrics('proxy_cache')}
+
+        assert ('proxy_cache_lookups_total', {'result': 'hit'}, 1) in families['proxy_cache_lookups_total'].samples
+        assert families['proxy_cache_hit_ratio'].samples[0][2] == 0.5
+        assert families['proxy_cache_entries'].samples[0][2] == 1
@@ -0,0 +1,95 @@
+"""
+Tests unitaires pour le regroupement des appels simultanés
+"""
+import threading
+import time
+
+import pytest
+
+from src.services.single_flight import SingleFlight
+
+
+def run_concurrently(count, target):
+    """Lance `count` threads sur `target` et attend leur fin"""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+class TestSingleFlight:
+    """Tests pour la classe SingleFlight"""
+
+    def test_concurrent_calls_share_result(self):
+        """Test des appels simultanés servis par une seule exécution"""
+        group = SingleFlight()
+        executions = []
+        results = []
+        release = threading.Event()
+
+        def slow_call():
+            executions.append(1)
+            release.wait(5)
+            return {"value": 42}
+
+        def caller():
+            results.append(group.do("key", slow_call))
+
+        threads = [threading.Thread(target=caller) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while group.get_stats()['coalesced'] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(executions) == 1
+        assert len(results) == 5
+        assert all(result is results[0][0] for result, _ in results)
+        assert all(shared for _, shared in results)
+        assert group.get_stats() == {
+            'executed': 1, 'coalesced': 4, 'coalesce_rate': 0.8, 'in_flight': 0
+        }
+
+    def test_exception_propagated_to_all_callers(self):
+        """Test de la propagation de l'exception du meneur"""
+        group = SingleFlight()
+        errors = []
+        release = threading.Event()
+
+        def failing_call():
+            release.wait(5)
+            raise ValueError("upstream down")
+
+        def caller():
+            try:
+                group.do("key", failing_call)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while group.get_stats()['coalesced'] < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(errors) == 3
+        assert group.in_flight() == 0
+
+    def test_sequential_calls_not_shared(self):
+        """Test des appels successifs exécutés séparément"""
+        group = SingleFlight()
+        counter = iter(range(10))
+
+        assert group.do("key", lambda: next(counter)) == (0, False)
+        assert group.do("key", lambda: next(counter)) == (1, False)
+        assert group.do("other", lambda: next(counter)) == (2, False)
+
+        with pytest.raises(KeyError):
+            group.do("key", lambda: {}["missing"])
+        assert group.in_flight() == 0
@@ -7,6 +7,8 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import json
+import threading
+import time
 from pathlib import Path
 
 from src.core.config import Config
@@ -392,6 +394,196 @@ class TestTokenService:
         assert token_service._driver is None
 
 
+class TestTokenSnapshot:
+    """Tests pour le snapshot des tokens et le rafraîchissement automatique"""
+    
+    @pytest.fixture
+    def token_service(self, temp_dir):
+        """Instance de TokenService avec un cache temporaire"""
+        config = Config()
+        config.TOKEN_CACHE_FILE = os.path.join(temp_dir, "snapshot_tokens.json")
+        config.TOKEN_REFRESH_AHEAD_SECONDS = 300
+        service = TokenService(config, Mock())
+        yield service
+        service.cleanup()
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Répertoire temporaire pour les tests"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+    
+    def make_tokens(self, expires_in):
+        """Tokens valides expirant dans `expires_in` secondes"""
+        return TokenModel(
+            access_token="snapshot_access_token_123456789",
+            refresh_token="snapshot_refresh_token_987654321",
+            last_update=datetime.utcnow(),
+            source="manual",
+            expires_at=datetime.utcnow() + timedelta(seconds=expires_in)
+        )
+    
+    def test_snapshot_published_on_change(self, token_service):
+        """Test de la publication d'un nouveau snapshot à chaque changement"""
+        assert token_service.get_current_tokens()['status'] == 'no_cache'
+        version = token_service.get_snapshot().version
+        
+        token_service._cached_tokens = self.make_tokens(3600)
+        
+        snapshot = token_service.get_snapshot()
+        assert snapshot.version == version + 1
+        assert snapshot.access_token == "snapshot_access_token_123456789"
+        # Résultat précalculé : pas de reconstruction à chaque lecture
+        assert token_service.get_current_tokens() is token_service.get_current_tokens()
+        assert token_service.get_current_tokens()['status'] == 'valid'
+    
+    def test_expired_snapshot(self, token_service):
+        """Test d'un snapshot dont les tokens ont expiré depuis la publication"""
+        token_service._cached_tokens = self.make_tokens(3600)
+        snapshot = token_service.get_snapshot()
+        
+        assert snapshot.is_valid(now=snapshot.expires_at + 1) is False
+        assert snapshot.invalid_result['tokens']['is_valid'] is False
+        assert token_service.validate_tokens() is True
+    
+    def test_cached_preview_has_no_time_dependent_fields(self, token_service):
+        """Test d'un aperçu mis en cache sans champs figés à l'heure de publication"""
+        token_service._cached_tokens = self.make_tokens(3600)
+        snapshot = token_service.get_snapshot()
+        
+        for result in (snapshot.valid_result, snapshot.invalid_result):
+            assert 'time_until_expiry_seconds' not in result['tokens']
+            assert 'is_expired' not in result['tokens']
+        assert token_service.get_current_tokens()['tokens']['is_valid'] is True
+        
+        # Les champs dépendant de l'heure restent fournis par get_token_status
+        with patch.object(token_service, '_is_brave_running_with_debug', return_value=False):
+            assert 3500 < token_service.get_token_status()['time_until_expiry_seconds'] <= 3600
+    
+    def test_concurrent_refresh_single_extraction(self, token_service):
+        """Test d'une rafale de rafraîchissements servie par une seule extraction"""
+        calls = []
+        release = threading.Event()
+        
+        def extract():
+            calls.append(1)
+            release.wait(5)
+            return "browser_access_token_123456789", "browser_refresh_token_987654321"
+        
+        results = []
+        with patch.object(token_service, '_extract_tokens_from_browser', side_effect=extract):
+            threads = [
+                threading.Thread(target=lambda: results.append(token_service.refresh_tokens()))
+                for _ in range(10)
+            ]
+            for thread in threads:
+                thread.start()
+            while token_service._refresh_flight.get_stats()['coalesced'] < 9:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join(timeout=5)
+        
+        assert len(calls) == 1
+        assert len(results) == 10
+        assert all(result['success'] for result in results)
+        assert token_service.get_snapshot().access_token == "browser_access_token_123456789"
+    
+    def test_auto_refresh_before_expiry(self, token_service):
+        """Test du rafraîchissement en arrière-plan avant l'expiration"""
+        # Expire dans 60s, soit dans la marge de 300s : rafraîchissement immédiat
+        token_service._cached_tokens = self.make_tokens(60)
+        
+        with patch.object(token_service, '_extract_tokens_from_browser',
+                          return_value=("browser_access_token_123456789",
+                                        "browser_refresh_token_987654321")) as mock_extract:
+            token_service.start_auto_refresh()
+            deadline = time.time() + 5
+            while token_service.get_snapshot().model.source != 'browser' and time.time() < deadline:
+                time.sleep(0.01)
+            token_service.stop_auto_refresh()
+        
+        assert token_service.get_snapshot().model.source == 'browser'
+        assert mock_extract.call_count == 1
+        # Prochain rafraîchissement planifié avant la nouvelle échéance
+        assert token_service._next_refresh_delay() > 0
+
+
+class TestTokenPersistence:
+    """Tests pour la persistance des tokens et la surveillance du cache"""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Répertoire temporaire pour les tests"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+    
+    @pytest.fixture
+    def config(self, temp_dir):
+        """Configuration avec un cache temporaire"""
+        config = Config()
+        config.TOKEN_CACHE_FILE = os.path.join(temp_dir, "shared_tokens.json")
+        config.TOKEN_WATCH_INTERVAL = 0.01
+        return config
+    
+    def save(self, service, suffix):
+        """Sauvegarde des tokens valides distincts"""
+        service.save_tokens(
+            access_token=f"access_token_{suffix}_123456789",
+            refresh_token=f"refresh_token_{suffix}_987654321",
+            source="manual",
+            expires_at=datetime.utcnow() + timedelta(hours=1)
+        )
+    
+    def test_backups_written_in_background_and_pruned(self, config):
+        """Test des sauvegardes écrites hors du chemin des requêtes"""
+        service = TokenService(config, Mock())
+        
+        for i in range(13):
+            self.save(service, i)
+        service.flush_backups()
+        
+        backups = list(service.backup_dir.glob("tokens_backup_*.json"))
+        assert len(backups) == 10
+        # Le cache est écrit en JSON compact
+        with open(config.TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            assert json.load(f)['tokens']['access_token'] == "access_token_12_123456789"
+    
+    def test_reload_tokens_saved_by_other_process(self, config):
+        """Test du rechargement des tokens écrits par une autre instance"""
+        writer = TokenService(config, Mock())
+        reader = TokenService(config, Mock())
+        assert reader.check_cache_file() is False
+        
+        self.save(writer, "writer")
+        
+        assert reader.check_cache_file() is True
+        assert reader.get_snapshot().access_token == "access_token_writer_123456789"
+        assert reader.check_cache_file() is False
+        
+        writer.clear_tokens()
+        assert reader.check_cache_file() is True
+        assert reader.get_current_tokens()['status'] == 'no_cache'
+        writer.cleanup()
+    
+    def test_watcher_picks_up_changes(self, config):
+        """Test de la surveillance du fichier en arrière-plan"""
+        writer = TokenService(config, Mock())
+        reader = TokenService(config, Mock())
+        reader.start_watching()
+        try:
+            self.save(writer, "watched")
+            
+            deadline = time.time() + 2
+            while reader.get_snapshot().access_token is None and time.time() < deadline:
+                time.sleep(0.005)
+            
+            assert reader.get_snapshot().access_token == "access_token_watched_123456789"
+        finally:
+            reader.cleanup()
+            writer.cleanup()
+
+
 class TestTokenServiceIntegration:
     """Tests d'intégration pour TokenService"""
     
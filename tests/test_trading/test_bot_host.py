@@ -0,0 +1,135 @@
+"""
+Tests de l'hôte multi-processus des bots de trading
+"""
+import os
+import signal
+import time
+
+import pytest
+
+from src.trading.bots import BotConfig
+from src.trading.hosting import BotHost, BotHostError
+
+
+def make_config(name):
+    """Configuration d'un bot de scalping simulé"""
+    return BotConfig(
+        name=name,
+        symbol="BTC/USDT",
+        base_currency="BTC",
+        quote_currency="USDT",
+        execution_interval=1
+    )
+
+
+def wait_for(predicate, timeout=15.0, interval=0.1):
+    """Attend qu'une condition devienne vraie"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return False
+
+
+@pytest.fixture
+def host():
+    """Hôte avec deux workers et une surveillance rapide"""
+    bot_host = BotHost(num_workers=2, health_check_interval=0.2, request_timeout=10.0)
+    bot_host.start()
+    yield bot_host
+    bot_host.shutdown()
+
+
+class TestBotHost:
+    """Tests pour BotHost"""
+
+    def test_bots_sharded_and_status_aggregated(self, host):
+        """Les bots sont répartis sur les workers et leurs états agrégés"""
+        workers = [host.add_bot(f"bot{i}", "scalping", make_config(f"bot{i}")) for i in range(4)]
+
+        assert sorted(workers) == [0, 0, 1, 1]
+
+        status = host.get_status()
+        assert set(status) == {"bot0", "bot1", "bot2", "bot3"}
+        assert all(s["state"] == "running" for s in status.values())
+        assert {s["worker_id"] for s in status.values()} == {0, 1}
+
+        assert host.pause_bot("bot1")
+        assert host.get_status("bot1")["state"] == "paused"
+        assert host.resume_bot("bot1")
+        assert host.stop_bot("bot2")
+        assert host.get_status("bot2")["state"] == "stopped"
+
+        performance = host.get_performance()
+        assert set(performance["bots"]) == set(status)
+        assert performance["totals"]["reporting"] == 4
+
+        pids = {w["pid"] for w in host.get_statistics()["workers"]}
+        assert len(pids) == 2 and os.getpid() not in pids
+
+    def test_crashed_worker_restarted_with_bot_states(self, host):
+        """Un worker tué est relancé et ses bots retrouvent leur état"""
+        host.add_bot("a", "scalping", make_config("a"))
+        host.add_bot("b", "scalping", make_config("b"))
+        host.pause_bot("b")
+
+        stats = host.get_statistics()["workers"]
+        victim = next(w for w in stats if "b" in w["bots"])
+        survivor = next(w for w in stats if w["worker_id"] != victim["worker_id"])
+
+        os.kill(victim["pid"], signal.SIGKILL if hasattr(signal, "SIGKILL") else signal.SIGTERM)
+
+        def restored():
+            worker = host.get_statistics()["workers"][victim["worker_id"]]
+            return (worker["restarts"] == 1 and worker["alive"]
+                    and host.get_status().get("b", {}).get("state") == "paused")
+
+        assert wait_for(restored)
+        assert host.get_status("a")["state"] == "running"
+        assert host.get_statistics()["workers"][survivor["worker_id"]]["pid"] == survivor["pid"]
+
+    def test_invalid_bot_is_not_tracked(self, host):
+        """Un type de bot inconnu lève une erreur sans être enregistré"""
+        with pytest.raises(BotHostError):
+            host.add_bot("bad", "unknown_type", make_config("bad"))
+
+        with pytest.raises(BotHostError):
+            host.add_bot("bad2", "os:path", make_config("bad2"))
+
+        assert host.get_bot_ids() == []
+        with pytest.raises(BotHostError):
+            host.start_bot("bad")
+
+    def test_status_reports_phase_latency(self, host):
+        """Le statut d'un bot inclut les percentiles de latence par phase"""
+        host.add_bot("a", "scalping", make_config("a"))
+
+        assert wait_for(lambda: host.get_status("a")["latency"])
+        for stats in host.get_status("a")["latency"].values():
+            assert {"p50_us", "p99_us", "p999_us"} <= set(stats)
+
+    def test_trade_history_page(self, host):
+        """L'historique des trades d'un bot est lu dans son worker"""
+        host.add_bot("a", "scalping", make_config("a"))
+
+        page = host.get_trade_history_page("a", page=1, per_page=10)
+
+        assert page["page"] == 1 and page["per_page"] == 10
+        assert page["total"] == len(page["items"]) == 0
+        with pytest.raises(BotHostError):
+            host.get_trade_history_page("unknown")
+
+    def test_metrics_collected_from_pings(self, host):
+        """Les latences par phase remontent par les pings de surveillance"""
+        host.add_bot("a", "scalping", make_config("a"))
+
+        def phase_samples():
+            families = {family.name: family for family in host.collect_metrics()}
+            return [labels for _, labels, _ in families['bot_phase_latency_seconds'].samples
+                    if labels.get('bot_id') == "a"]
+
+        assert wait_for(phase_samples)
+        families = {family.name: family for family in host.collect_metrics()}
+        assert [value for _, _, value in families['bot_worker_up'].samples] == [1, 1]
+        assert any(labels['phase'] == 'execute_strategy' for labels in phase_samples())
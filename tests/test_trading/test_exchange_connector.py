@@ -0,0 +1,215 @@
+"""
+Tests du connecteur d'exchange asynchrone contre le serveur d'exchange simulé
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from src.trading.exchanges import (
+    ConnectorPool, ExchangeConfig, ExchangeConnector, ExchangeError, MockExchangeServer, AsyncTokenBucket
+)
+
+
+def run(coro):
+    """Exécute une coroutine dans une nouvelle boucle"""
+    return asyncio.run(coro)
+
+
+class TestExchangeConnector:
+    """Tests pour ExchangeConnector"""
+    
+    def test_rest_requests(self):
+        """Ticker, infos d'exchange et ordres via REST"""
+        async def scenario():
+            async with MockExchangeServer(name="ex_a", seed=1) as server:
+                connector = ExchangeConnector(ExchangeConfig.from_dict(server.exchange_config()))
+                await connector.connect()
+                try:
+                    ticker = await connector.get_ticker("BTC/USDT")
+                    info = await connector.get_exchange_info()
+                    ack = await connector.place_order("BTC/USDT", "buy", "market", 0.5)
+                    with pytest.raises(ExchangeError):
+                        await connector.get_ticker("UNKNOWN")
+                finally:
+                    await connector.close()
+                return ticker, info, ack
+        
+        ticker, info, ack = run(scenario())
+        
+        assert ticker['bid'] < ticker['ask']
+        assert info['name'] == "ex_a"
+        assert ack['status'] == "filled"
+        assert ack['filled_price'] == pytest.approx(ticker['ask'], rel=0.01)
+    
+    def test_subscriptions_are_multiplexed(self):
+        """Les abonnements identiques partagent un seul flux amont"""
+        async def scenario():
+            async with MockExchangeServer(seed=1, tick_interval=0.02) as server:
+                pool = ConnectorPool()
+                connectors = [await pool.acquire(server.exchange_config()) for _ in range(3)]
+                subscriptions = [await c.subscribe("ticker", "BTC/USDT") for c in connectors]
+                
+                messages = [await s.get(timeout=2) for s in subscriptions]
+                streams = connectors[0].get_subscribed_streams()
+                connections = server.stream_connections
+                
+                for subscription in subscriptions:
+                    await subscription.close()
+                for connector in connectors:
+                    await pool.release(connector)
+                return connectors, messages, streams, connections, pool.get_statistics()
+        
+        connectors, messages, streams, connections, statistics = run(scenario())
+        
+        assert connectors[0] is connectors[1] is connectors[2]
+        assert connections == 1
+        assert streams == [("ticker", "BTC/USDT")]
+        assert all('bid' in message for message in messages)
+        assert statistics == {}
+    
+    def test_stream_reconnects_and_resubscribes(self):
+        """Le flux se reconnecte et rejoue les abonnements"""
+        async def scenario():
+            async with MockExchangeServer(seed=1, tick_interval=0.02) as server:
+                config = ExchangeConfig.from_dict(server.exchange_config(reconnect_initial_delay=0.05))
+                connector = ExchangeConnector(config)
+                await connector.connect()
+                subscription = await connector.subscribe("ticker", "BTC/USDT")
+                await subscription.get(timeout=2)
+                
+                await server.drop_stream_connections()
+                await asyncio.sleep(0.3)
+                while not subscription._queue.empty():
+                    subscription._queue.get_nowait()
+                message = await subscription.get(timeout=2)
+                
+                statistics = connector.get_statistics()
+                await connector.close()
+                return message, statistics, server.stream_connections
+        
+        message, statistics, connections = run(scenario())
+        
+        assert message['symbol'] == "BTC/USDT"
+        assert statistics['stream_reconnects'] >= 1
+        assert connections >= 2
+
+    
+    def test_orders_not_retried_after_server_error(self):
+        """Un ordre n'est pas rejoué après une 5xx, contrairement à une lecture"""
+        from aiohttp import web
+        
+        hits = {'GET': 0, 'POST': 0}
+        
+        async def unavailable(request):
+            hits[request.method] += 1
+            return web.json_response({'error': 'unavailable'}, status=503)
+        
+        async def scenario():
+            app = web.Application()
+            app.router.add_route('*', '/api/v1/{tail:.*}', unavailable)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            
+            connector = ExchangeConnector(ExchangeConfig(
+                name="ex_down", rest_url=f"http://127.0.0.1:{port}",
+                max_retries=2, reconnect_initial_delay=0.01
+            ))
+            try:
+                with pytest.raises(ExchangeError) as order_error:
+                    await connector.place_order("BTC/USDT", "buy", "market", 0.5)
+                with pytest.raises(ExchangeError):
+                    await connector.get_ticker("BTC/USDT")
+            finally:
+                await connector.close()
+                await runner.cleanup()
+            return order_error.value
+        
+        order_error = run(scenario())
+        
+        assert order_error.status_code == 503
+        assert hits == {'GET': 3, 'POST': 1}
+
+
+class TestConnectorPool:
+    """Tests pour ConnectorPool"""
+    
+    def test_successive_event_loops(self):
+        """Le pool global reste utilisable d'une boucle à l'autre"""
+        pool = ConnectorPool()
+        
+        async def scenario():
+            async with MockExchangeServer(seed=1) as server:
+                config = server.exchange_config(stream_url=None)
+                first = await pool.acquire(config)
+                # Acquisition concurrente : le verrou attend dans cette boucle
+                async with pool._lock:
+                    pending = asyncio.ensure_future(pool.acquire(config))
+                    await asyncio.sleep(0)
+                second = await pending
+                await pool.release(first)
+                await pool.release(second)
+                return first is second
+        
+        assert run(scenario())
+        assert run(scenario())
+        assert pool.get_statistics() == {}
+    
+    def test_concurrent_event_loops(self):
+        """Deux boucles actives en même temps ont chacune leur connecteur"""
+        pool = ConnectorPool()
+        
+        async def use_connector(config):
+            connector = await pool.acquire(config)
+            ticker = await connector.get_ticker("BTC/USDT")
+            statistics = pool.get_statistics()
+            await pool.release(connector)
+            return connector, ticker, statistics
+        
+        async def scenario():
+            async with MockExchangeServer(seed=1) as server:
+                config = server.exchange_config(stream_url=None)
+                first = await pool.acquire(config)
+                # Une autre boucle, dans un thread, pendant que celle-ci garde son connecteur
+                other, ticker, statistics = await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: asyncio.run(use_connector(config))
+                )
+                await pool.release(first)
+                return first, other, ticker, statistics
+        
+        first, other, ticker, statistics = run(scenario())
+        
+        assert other is not first
+        assert ticker['bid'] < ticker['ask']
+        assert [entry['users'] for entry in statistics.values()] == [1]
+        assert pool.get_statistics() == {}
+
+
+class TestAsyncTokenBucket:
+    """Tests pour AsyncTokenBucket"""
+    
+    def test_burst_then_throttle(self):
+        """Le burst est immédiat puis les requêtes sont espacées"""
+        async def scenario():
+            bucket = AsyncTokenBucket(rate=50, burst=5)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(10):
+                await bucket.acquire()
+            return loop.time() - start
+        
+        elapsed = run(scenario())
+        
+        assert elapsed >= 0.08
+    
+    def test_try_acquire(self):
+        """try_acquire ne dépasse pas le burst"""
+        async def scenario():
+            bucket = AsyncTokenBucket(rate=1, burst=2)
+            return [bucket.try_acquire() for _ in range(3)]
+        
+        assert run(scenario()) == [True, True, False]
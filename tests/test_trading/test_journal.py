@@ -0,0 +1,138 @@
+"""
+Tests unitaires pour le journal de trading borné
+"""
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.trading.journal import Journal, SignalRecord, TradeRecord, get_journal_path
+
+
+def make_trade(i: int) -> TradeRecord:
+    """Crée un trade de test"""
+    return TradeRecord(
+        id=f"trade_{i}",
+        symbol="BTC/USDT",
+        side="buy" if i % 2 == 0 else "sell",
+        quantity=10.0 + i,
+        price=50000.0,
+        timestamp=datetime(2025, 1, 1) + timedelta(seconds=i),
+        fee=0.5,
+        pnl=0.0
+    )
+
+
+class TestJournal:
+    """Tests pour Journal"""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Répertoire temporaire pour les tests"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+    
+    def test_records_have_no_instance_dict(self):
+        """Les enregistrements utilisent __slots__"""
+        record = make_trade(1)
+        
+        assert not hasattr(record, '__dict__')
+        assert record.to_dict()['id'] == "trade_1"
+    
+    def test_memory_only_journal_is_bounded(self):
+        """Sans fichier, seul le tampon mémoire est conservé"""
+        journal = Journal(TradeRecord, capacity=10)
+        
+        for i in range(25):
+            journal.append(make_trade(i))
+        
+        assert len(journal) == 10
+        assert journal.total_appended == 25
+        assert [r.id for r in journal.tail(2)] == ["trade_23", "trade_24"]
+        assert journal.read(0, 5) == []
+    
+    def test_disk_journal_keeps_full_history(self, temp_dir):
+        """Avec fichier, tout l'historique reste lisible"""
+        path = os.path.join(temp_dir, "bot.trades.jsonl")
+        journal = Journal(TradeRecord, capacity=10, path=path)
+        
+        for i in range(300):
+            journal.append(make_trade(i))
+        
+        assert len(journal) == 300
+        assert len(journal.tail()) == 10
+        assert [r.id for r in journal.read(129, 132)] == ["trade_129", "trade_130", "trade_131"]
+        assert journal.read(0, 1)[0].timestamp == datetime(2025, 1, 1)
+        journal.close()
+    
+    def test_read_page_newest_first(self, temp_dir):
+        """La pagination renvoie les trades les plus récents en premier"""
+        path = os.path.join(temp_dir, "bot.trades.jsonl")
+        journal = Journal(TradeRecord, capacity=5, path=path)
+        
+        for i in range(23):
+            journal.append(make_trade(i))
+        
+        first_page = journal.read_page(page=1, per_page=10)
+        last_page = journal.read_page(page=3, per_page=10)
+        
+        assert first_page['total'] == 23
+        assert first_page['pages'] == 3
+        assert first_page['items'][0]['id'] == "trade_22"
+        assert [item['id'] for item in last_page['items']] == ["trade_2", "trade_1", "trade_0"]
+        assert isinstance(last_page['items'][0]['timestamp'], str)
+        journal.close()
+    
+    def test_journal_resumes_from_file(self, temp_dir):
+        """Un journal rouvert reprend l'historique existant"""
+        path = os.path.join(temp_dir, "bot.trades.jsonl")
+        journal = Journal(TradeRecord, capacity=5, path=path)
+        for i in range(12):
+            journal.append(make_trade(i))
+        journal.close()
+        
+        with open(path, 'ab') as f:
+            f.write(b'{"id": "torn')
+        
+        resumed = Journal(TradeRecord, capacity=5, path=path)
+        resumed.append(make_trade(12))
+        
+        assert len(resumed) == 13
+        assert [r.id for r in resumed.tail(2)] == ["trade_11", "trade_12"]
+        assert resumed.read(0, 1)[0].id == "trade_0"
+        resumed.close()
+    
+    def test_reopen_after_close(self, temp_dir):
+        """Un journal fermé puis rouvert (arrêt puis redémarrage d'un bot) reprend son fichier"""
+        path = os.path.join(temp_dir, "bot.trades.jsonl")
+        journal = Journal(TradeRecord, capacity=5, path=path)
+        for i in range(3):
+            journal.append(make_trade(i))
+        journal.close()
+        
+        journal.open()
+        journal.append(make_trade(3))
+        
+        assert len(journal) == 4
+        assert [r.id for r in journal.read(0, 4)] == ["trade_0", "trade_1", "trade_2", "trade_3"]
+        journal.close()
+    
+    def test_signal_metadata_kept_in_memory_only(self, temp_dir):
+        """Les métadonnées des signaux restent en mémoire sans être écrites sur disque"""
+        path = os.path.join(temp_dir, "strategy.signals.jsonl")
+        journal = Journal(SignalRecord, capacity=5, path=path)
+        journal.append(SignalRecord(
+            signal_type="buy", confidence=0.9, price=50000.0, timestamp=datetime(2025, 1, 1),
+            metadata={'spread': object()}
+        ))
+        journal.close()
+        
+        assert 'spread' in journal.tail()[0].metadata
+        assert Journal(SignalRecord, capacity=5, path=path).tail()[0].metadata is None
+    
+    def test_get_journal_path(self, temp_dir):
+        """Le nom du propriétaire est nettoyé pour le nom de fichier"""
+        assert get_journal_path(None, "bot", "trades") is None
+        assert get_journal_path(temp_dir, "Scalping Bot/1", "trades") == \
+            os.path.join(temp_dir, "Scalping_Bot_1.trades.jsonl")
@@ -0,0 +1,99 @@
+"""
+Tests des histogrammes de latence des bots
+"""
+import asyncio
+import random
+
+import pytest
+
+from src.trading.bots import BotConfig, ScalpingBot, LatencyHistogram, LatencyTracker
+
+
+class TestLatencyHistogram:
+    """Tests pour LatencyHistogram"""
+
+    def test_percentiles_within_precision(self):
+        """Les percentiles respectent l'erreur relative annoncée"""
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(11, 1.5)) for _ in range(20_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50, 90, 99, 99.9):
+            exact = values[max(0, int(percentile / 100 * len(values) + 0.5) - 1)]
+            assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.01)
+
+        assert histogram.count == len(values)
+        assert histogram.min == values[0]
+        assert histogram.max == values[-1]
+        assert histogram.percentile(100) == values[-1]
+
+    def test_small_values_exact_and_clamping(self):
+        """Petites valeurs exactes, valeurs hors bornes bornées"""
+        histogram = LatencyHistogram(highest_value=10 ** 6)
+        for value in (1, 2, 3, -5, 10 ** 9):
+            histogram.record(value)
+
+        assert histogram.min == 0
+        assert histogram.max == 10 ** 6
+        assert histogram.percentile(40) == 1
+        assert histogram.percentile(60) == 2
+
+    def test_merge_and_reset(self):
+        """Fusion de deux histogrammes puis remise à zéro"""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(1000, 2000):
+            first.record(value)
+        for value in range(5000, 6000):
+            second.record(value)
+
+        first.merge(second)
+        assert first.count == 2000
+        assert first.percentile(25) == pytest.approx(1500, rel=0.01)
+        assert first.percentile(75) == pytest.approx(5500, rel=0.01)
+
+        with pytest.raises(ValueError):
+            first.merge(LatencyHistogram(precision_bits=5))
+
+        first.reset()
+        assert first.count == 0
+        assert first.percentile(99) == 0
+        assert first.to_dict()['p99_us'] == 0
+
+
+class TestBotLatencyTracing:
+    """Tests du traçage tick-to-order des bots"""
+
+    def test_cycle_records_every_phase(self):
+        """Un cycle de ScalpingBot alimente chaque phase du pipeline"""
+        random.seed(3)
+        config = BotConfig(
+            name="latency_bot",
+            symbol="BTC/USDT",
+            base_currency="BTC",
+            quote_currency="USDT",
+            max_open_orders=10 ** 6,
+            max_position_size=10 ** 9
+        )
+        bot = ScalpingBot(config)
+
+        async def scenario():
+            await bot._initialize()
+            for _ in range(300):
+                bot._last_trade_time = None
+                await bot._run_cycle()
+            await bot._cleanup()
+
+        asyncio.run(scenario())
+
+        latency = bot.get_status().to_dict()['latency']
+        assert set(latency) == set(LatencyTracker.PHASES)
+        assert latency['update_market_data']['count'] == 300
+        assert latency['tick_to_order']['count'] == latency['place_order']['count'] > 0
+
+        for phase in latency.values():
+            assert 0 < phase['p50_us'] <= phase['p99_us'] <= phase['p999_us'] <= phase['max_us']
+
+        bot.reset_latency_stats()
+        assert bot.get_latency_stats() == {}
@@ -95,6 +95,20 @@ class TestFileUtils:
         assert os.path.exists(file_path)
         assert os.path.isdir(os.path.dirname(file_path))
     
+    def test_write_json_file_atomic(self, temp_dir, test_json_data):
+        """Test du remplacement atomique d'un fichier JSON existant"""
+        file_path = os.path.join(temp_dir, "test.json")
+        write_json_file(file_path, {"old": True})
+        
+        write_json_file(file_path, test_json_data, indent=None)
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        assert json.loads(content) == test_json_data
+        assert "\n" not in content
+        # Aucun fichier temporaire ne reste dans le répertoire
+        assert os.listdir(temp_dir) == ["test.json"]
+    
     def test_write_json_file_invalid_data(self, temp_dir):
         """Test d'écriture JSON avec données non sérialisables"""
         file_path = os.path.join(temp_dir, "test.json")
@@ -0,0 +1 @@
+# Web apps tests
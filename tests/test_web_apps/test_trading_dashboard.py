@@ -0,0 +1,87 @@
+"""
+Tests des routes de bots du Trading Dashboard
+
+Le blueprint est monté sur une application Flask nue ; les appels au
+backend API passent par la session tracée, remplacée par un mock.
+"""
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from flask import Flask
+
+from src.web_apps.trading_dashboard.routes.bot_routes import bot_bp
+
+
+BACKEND_URL = 'http://backend.test'
+
+
+def backend_response(status_code, payload):
+    """Réponse du backend API"""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def client():
+    """Client de test du blueprint des bots"""
+    app = Flask(__name__)
+    app.config['TESTING'] = True
+    app.config['BACKEND_API_URL'] = BACKEND_URL
+    app.register_blueprint(bot_bp)
+    return app.test_client()
+
+
+class TestBotStatus:
+    """Tests du statut des bots"""
+
+    def test_latency_from_backend_status(self, client):
+        """Test des percentiles de latence repris du statut du bot dans le backend"""
+        latency = {'tick_to_order': {'count': 12, 'p50_us': 95.0, 'p99_us': 380.0, 'p999_us': 402.0}}
+        session = Mock()
+        session.get.return_value = backend_response(200, {
+            'success': True,
+            'data': {'state': 'running', 'latency': latency}
+        })
+
+        with patch('src.web_apps.trading_dashboard.routes.bot_routes.get_traced_session',
+                   return_value=session):
+            response = client.get('/bots/api/scalping_bot_1/status')
+
+        assert response.status_code == 200
+        stats = json.loads(response.data)['data']['latency']['tick_to_order']
+        assert {'p50_us', 'p99_us', 'p999_us'} <= set(stats)
+        assert stats['p99_us'] == 380.0
+        assert session.get.call_args[0][0] == f"{BACKEND_URL}/api/bots/scalping_bot_1/status"
+
+    def test_latency_empty_when_backend_unavailable(self, client):
+        """Test d'un statut sans latences quand le backend n'héberge pas le bot"""
+        session = Mock()
+        session.get.return_value = backend_response(404, {'success': False})
+
+        with patch('src.web_apps.trading_dashboard.routes.bot_routes.get_traced_session',
+                   return_value=session):
+            response = client.get('/bots/api/scalping_bot_1/status')
+
+        assert response.status_code == 200
+        assert json.loads(response.data)['data']['latency'] == {}
+
+
+class TestBotTrades:
+    """Tests de l'historique des trades"""
+
+    def test_trades_page_from_backend(self, client):
+        """Test de la page de trades servie par le backend, sans trades inventés"""
+        page = {'items': [{'trade_id': 't1'}], 'page': 1, 'per_page': 50, 'total': 1, 'pages': 1}
+        session = Mock()
+        session.get.return_value = backend_response(200, {'success': True, 'data': page})
+
+        with patch('src.web_apps.trading_dashboard.routes.bot_routes.get_traced_session',
+                   return_value=session):
+            data = json.loads(client.get('/bots/api/scalping_bot_1/trades').data)
+
+        assert data['data'] == page['items']
+        assert data['pagination']['total'] == 1
+        assert session.get.call_args[1]['params'] == {'page': 1, 'per_page': 50}